@@ -36,6 +36,12 @@ def pytest_addoption(parser):
         default=False,
         help="Run system tests that provision real cloud compute (implies --run-system)",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run performance benchmarks",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -69,6 +75,12 @@ def pytest_collection_modifyitems(config, items):
             if "system_compute" in item.keywords:
                 item.add_marker(skipper)
 
+    if not config.getoption("--run-benchmarks"):
+        skipper = pytest.mark.skip(reason="Only run when '--run-benchmarks' is given")
+        for item in items:
+            if "benchmarks" in item.keywords:
+                item.add_marker(skipper)
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -143,3 +155,7 @@ def pytest_configure(config):
         "markers",
         "system_compute: mark test to run only when '--run-system-compute' is specified",
     )
+    config.addinivalue_line(
+        "markers",
+        "benchmarks: mark test to run only when '--run-benchmarks' is specified",
+    )
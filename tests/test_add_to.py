@@ -211,7 +211,8 @@ class TestAddToTerminalStatusRejection:
             ),
             patch.object(submit_module, "RcloneUploadedFiles"),
             patch.object(submit_module, "create_task_group") as mock_ctg,
-            patch.object(submit_module, "add_tasks_to_task_group"),
+            patch.object(submit_module, "prepare_task_group_batches"),
+            patch.object(submit_module, "add_tasks_to_task_groups"),
             patch.object(
                 submit_module.CLIENT.work_client,
                 "update_work_requirement",
@@ -236,7 +237,7 @@ class TestAddToTerminalStatusRejection:
 class TestAddToPartitioning:
     """
     Verify that spec TGs are correctly partitioned into 'new' vs 'matched',
-    and that the right offsets are passed to add_tasks_to_task_group.
+    and that the right offsets are passed to prepare_task_group_batches.
     """
 
     def _run(
@@ -265,7 +266,6 @@ class TestAddToPartitioning:
             task_group,
             wr_data,
             task_count,
-            work_requirement,
             files_directory,
             tg_number_offset,
             total_num_task_groups,
@@ -320,8 +320,9 @@ class TestAddToPartitioning:
                 submit_module, "create_task_group", side_effect=fake_create_tg
             ),
             patch.object(
-                submit_module, "add_tasks_to_task_group", side_effect=fake_add_tasks
+                submit_module, "prepare_task_group_batches", side_effect=fake_add_tasks
             ),
+            patch.object(submit_module, "add_tasks_to_task_groups"),
             patch.object(
                 submit_module.CLIENT.work_client,
                 "update_work_requirement",
@@ -0,0 +1,289 @@
+"""
+Performance benchmarks, run only when '--run-benchmarks' is given.
+
+Timings are printed; use 'pytest -s' to see them.
+"""
+
+import json
+from copy import deepcopy
+from dataclasses import replace
+from time import perf_counter
+
+import pytest
+
+import yellowdog_cli.utils.csv_data as csv_module
+import yellowdog_cli.utils.variables as var_module
+from yellowdog_cli.utils.compact_json import CompactJSONEncoder
+from yellowdog_cli.utils.event_log import EventRecorder, replay_event_log
+from yellowdog_cli.utils.progress_dashboard import ProgressDashboard
+from yellowdog_cli.utils.ydid_utils import YDIDType
+
+BENCHMARK_TASKS = 100_000
+BENCHMARK_EVENTS = 5_000
+
+# The template parser, without its cache
+_parse_template = var_module._compile_template.__wrapped__
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+# A representative Task, using the lazy variables set for every Task
+TASK_TEMPLATE = {
+    "name": "{{wr_name}}_{{task_group_name}}_{{task_number}}",
+    "taskType": "{{task_type:=bash}}",
+    "arguments": ["{{script}}", "--index", "{{task_number}}", "{{region::}}"],
+    "environment": {
+        "TASK_NAME": "{{task_name}}",
+        "OUTPUT": "{{output_prefix}}/{{username}}/{{task_number}}",
+        "HOME_DIR": "{{env:HOME:=/root}}",
+    },
+    "timeout": "{{num:timeout}}",
+}
+
+
+def _user_variables(count: int) -> dict:
+    variables = {f"user_var_{index}": f"value_{index}" for index in range(count)}
+    variables.update(
+        {
+            "wr_name": "benchmark-wr",
+            "task_group_name": "tg",
+            "script": "run.sh",
+            "output_prefix": "results",
+            "timeout": "30",
+        }
+    )
+    return variables
+
+
+def _uncompiled_template(input_string: str, prefix: str, postfix: str) -> tuple:
+    """
+    Re-parse every call and route every element through the general
+    algorithm, i.e., the behaviour before templates were compiled.
+    """
+    return tuple(
+        (
+            segment
+            if isinstance(segment, str)
+            else replace(segment, kind=var_module._ELEMENT_FALLBACK)
+        )
+        for segment in _parse_template(input_string, prefix, postfix)
+    )
+
+
+def _generate_tasks(num_tasks: int) -> float:
+    """
+    Time the variable processing for 'num_tasks' Tasks.
+    """
+    start = perf_counter()
+    for task_number in range(num_tasks):
+        var_module.add_or_update_substitution("task_number", str(task_number))
+        var_module.add_or_update_substitution("task_name", f"task_{task_number}")
+        var_module.process_variable_substitutions_insitu(deepcopy(TASK_TEMPLATE))
+    return perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Variable substitutions
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.benchmarks
+class TestVariableSubstitutionBenchmark:
+    @pytest.fixture(autouse=True)
+    def user_variables(self, monkeypatch):
+        monkeypatch.setattr(
+            var_module, "VARIABLE_SUBSTITUTIONS", _user_variables(count=50)
+        )
+
+    def test_compiled_templates_vs_uncompiled(self, monkeypatch):
+        var_module._compile_template.cache_clear()
+        compiled_time = _generate_tasks(BENCHMARK_TASKS)
+
+        monkeypatch.setattr(var_module, "_compile_template", _uncompiled_template)
+        uncompiled_time = _generate_tasks(BENCHMARK_TASKS)
+
+        print(
+            f"\n{BENCHMARK_TASKS:,d} Tasks: compiled {compiled_time:.2f}s, "
+            f"uncompiled {uncompiled_time:.2f}s, "
+            f"speedup {uncompiled_time / compiled_time:.1f}x"
+        )
+        assert compiled_time < uncompiled_time
+
+
+# ---------------------------------------------------------------------------
+# Task prototypes
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.benchmarks
+class TestTaskPrototypeBenchmark:
+    @pytest.fixture(autouse=True)
+    def user_variables(self, monkeypatch):
+        monkeypatch.setattr(
+            var_module, "VARIABLE_SUBSTITUTIONS", _user_variables(count=50)
+        )
+
+    def test_prototype_vs_deepcopy(self):
+        # Add a larger constant subtree, as found in e.g. taskData inputs
+        task = deepcopy(TASK_TEMPLATE)
+        task["taskDataInputs"] = [
+            {"source": f"bucket/input_{index}", "destination": f"in_{index}"}
+            for index in range(20)
+        ]
+
+        start = perf_counter()
+        for task_number in range(BENCHMARK_TASKS):
+            var_module.add_or_update_substitution("task_number", str(task_number))
+            var_module.process_variable_substitutions_insitu(deepcopy(task))
+        deepcopy_time = perf_counter() - start
+
+        start = perf_counter()
+        prototype = var_module.SubstitutionPrototype(task)
+        for task_number in range(BENCHMARK_TASKS):
+            var_module.add_or_update_substitution("task_number", str(task_number))
+            prototype.render()
+        prototype_time = perf_counter() - start
+
+        print(
+            f"\n{BENCHMARK_TASKS:,d} Tasks: prototype {prototype_time:.2f}s, "
+            f"deepcopy {deepcopy_time:.2f}s, "
+            f"speedup {deepcopy_time / prototype_time:.1f}x"
+        )
+        assert prototype_time < deepcopy_time
+
+
+# ---------------------------------------------------------------------------
+# CSV Task expansion
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.benchmarks
+class TestCSVExpansionBenchmark:
+    def test_streaming_vs_string_substitution(self, tmp_path):
+        csv_file = tmp_path / "tasks.csv"
+        with open(csv_file, "w") as f:
+            f.write("id,count,label\n")
+            for index in range(BENCHMARK_TASKS):
+                f.write(f"{index},{index % 100},Label {index}\n")
+        task = deepcopy(TASK_TEMPLATE)
+        task["arguments"] += ["<<id>>", "<<num:count>>"]
+        task["environment"]["LABEL"] = "<<format_name:label>>"
+
+        start = perf_counter()
+        csv_data = csv_module.CSVTaskData(str(csv_file))
+        for task_data in csv_data:
+            csv_module.csv_variables_substitution(task, csv_data.var_names, task_data)
+        substitution_time = perf_counter() - start
+
+        start = perf_counter()
+        for _ in csv_module.CSVTaskList(csv_module.CSVTaskData(str(csv_file)), task):
+            pass
+        streaming_time = perf_counter() - start
+
+        print(
+            f"\n{BENCHMARK_TASKS:,d} CSV Tasks: streaming {streaming_time:.2f}s, "
+            f"string substitution {substitution_time:.2f}s, "
+            f"speedup {substitution_time / streaming_time:.1f}x"
+        )
+        assert streaming_time < substitution_time
+
+
+# ---------------------------------------------------------------------------
+# Event processing and progress rendering
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.benchmarks
+class TestEventReplayBenchmark:
+    def test_coalesced_vs_per_event_rendering(self, tmp_path):
+        ydid = "ydid:workreq:000000:11111111-2222-3333-4444-555555555555"
+        event_log = str(tmp_path / "events.log.gz")
+        with EventRecorder(event_log) as recorder:
+            for index in range(BENCHMARK_EVENTS):
+                task_groups = [
+                    {
+                        "name": f"tg-{tg}",
+                        "taskSummary": {
+                            "taskCount": 1000,
+                            "statusCounts": {"COMPLETED": index % 1000},
+                        },
+                    }
+                    for tg in range(100)
+                ]
+                recorder.record(
+                    ydid,
+                    "data:"
+                    + json.dumps(
+                        {"name": "wr", "status": "RUNNING", "taskGroups": task_groups}
+                    ),
+                )
+
+        def replay(events_per_frame: int) -> float:
+            dashboard = ProgressDashboard()
+            on_event = dashboard.add_stream(ydid, YDIDType.WORK_REQUIREMENT).on_event
+            assert on_event is not None
+            count = 0
+
+            def on_record(record):
+                nonlocal count
+                on_event(record.line, YDIDType.WORK_REQUIREMENT)
+                count += 1
+                if count % events_per_frame == 0:
+                    list(dashboard.get_renderables())
+
+            start = perf_counter()
+            replay_event_log(event_log, 0, on_record)
+            return perf_counter() - start
+
+        per_event_time = replay(events_per_frame=1)
+        coalesced_time = replay(events_per_frame=50)
+
+        print(
+            f"\n{BENCHMARK_EVENTS:,d} events: coalesced {coalesced_time:.2f}s, "
+            f"per-event {per_event_time:.2f}s, "
+            f"speedup {per_event_time / coalesced_time:.1f}x"
+        )
+        assert coalesced_time < per_event_time
+
+
+# ---------------------------------------------------------------------------
+# Compact JSON encoding
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.benchmarks
+class TestCompactJSONBenchmark:
+    def test_compact_vs_standard_indented(self):
+        task = {
+            **TASK_TEMPLATE,
+            "inputs": [{"source": "TASK_NAMESPACE", "objectNamePattern": "*.txt"}],
+            "timeout": 30.5,
+        }
+        data = {
+            "name": "benchmark-wr",
+            "taskGroups": [
+                {
+                    "name": "tg",
+                    "tasks": [
+                        {**task, "name": f"task_{index}"}
+                        for index in range(BENCHMARK_TASKS)
+                    ],
+                }
+            ],
+        }
+
+        start = perf_counter()
+        compact = json.dumps(data, indent=2, cls=CompactJSONEncoder)
+        compact_time = perf_counter() - start
+
+        start = perf_counter()
+        json.dumps(data, indent=2)
+        standard_time = perf_counter() - start
+
+        print(
+            f"\n{BENCHMARK_TASKS:,d} Tasks: compact {compact_time:.2f}s, "
+            f"standard indented {standard_time:.2f}s"
+        )
+        assert json.loads(compact) == data
+        assert compact_time < standard_time
@@ -0,0 +1,140 @@
+"""
+Tests for concurrent bulk lifecycle operations in
+yellowdog_cli.utils.bulk_operations.
+"""
+
+from threading import Lock
+from time import sleep
+from unittest.mock import MagicMock, patch
+
+from requests.exceptions import ConnectionError, HTTPError
+from yellowdog_client.model.exceptions import InvalidRequestException
+
+import yellowdog_cli.utils.bulk_operations as bulk_module
+from yellowdog_cli.utils.bulk_operations import (
+    BulkOperationResult,
+    is_transient_error,
+    run_bulk_operation,
+)
+from yellowdog_cli.utils.retry_utils import TokenBucket
+
+
+def _http_error(status_code: int) -> HTTPError:
+    response = MagicMock(status_code=status_code, headers={})
+    return HTTPError(f"{status_code} Error", response=response)
+
+
+def _run(items, operation, **kwargs) -> tuple[BulkOperationResult, list, list]:
+    """
+    Run a bulk operation without retry delays, recording the callbacks.
+    """
+    successes: list = []
+    failures: list = []
+    with patch.object(bulk_module, "get_retry_delay", return_value=0):
+        result = run_bulk_operation(
+            items,
+            operation,
+            on_success=lambda item, value: successes.append((item, value)),
+            on_failure=lambda item, e: failures.append((item, str(e))),
+            **kwargs,
+        )
+    return result, successes, failures
+
+
+class TestRunBulkOperation:
+    def test_empty(self):
+        result, successes, failures = _run([], lambda x: x)
+        assert result.succeeded == result.failed == successes == failures == []
+
+    def test_all_succeed(self):
+        result, successes, failures = _run(list(range(20)), lambda x: x * 10)
+        assert sorted(successes) == [(x, x * 10) for x in range(20)]
+        assert sorted(result.succeeded) == sorted(successes)
+        assert failures == []
+
+    def test_concurrency_is_bounded(self):
+        lock = Lock()
+        in_flight = max_in_flight = 0
+
+        def operation(item: int):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        _run(list(range(20)), operation, max_workers=3)
+        assert 1 < max_in_flight <= 3
+
+    def test_transient_failures_retried(self):
+        attempts: dict[str, int] = {}
+
+        def operation(item: str) -> str:
+            attempts[item] = attempts.get(item, 0) + 1
+            if item == "b" and attempts[item] < 3:
+                raise _http_error(503)
+            return item.upper()
+
+        result, successes, failures = _run(["a", "b"], operation)
+        assert sorted(successes) == [("a", "A"), ("b", "B")]
+        assert failures == []
+        assert attempts == {"a": 1, "b": 3}
+        assert result.retries == 2
+
+    def test_permanent_failures_not_retried(self):
+        attempts = []
+
+        def operation(item: str):
+            attempts.append(item)
+            raise RuntimeError("invalid state")
+
+        result, successes, failures = _run(["a"], operation)
+        assert successes == []
+        assert failures == [("a", "invalid state")]
+        assert attempts == ["a"]
+        assert result.retries == 0
+
+    def test_retries_exhausted(self):
+        attempts = []
+
+        def operation(item: str):
+            attempts.append(item)
+            raise ConnectionError("connection refused")
+
+        result, _, failures = _run(["a"], operation, max_attempts=3)
+        assert failures == [("a", "connection refused")]
+        assert len(attempts) == 3
+        assert result.retries == 2
+
+    def test_report(self):
+        result = BulkOperationResult(
+            succeeded=[("a", None)] * 3, failed=[], retries=2, elapsed=1.25
+        )
+        with patch.object(bulk_module, "print_info") as mock_info:
+            result.report("Cancelled Tasks")
+        mock_info.assert_called_once_with(
+            "Cancelled Tasks: 3 succeeded, 0 failed (2 retries) in 1.2s"
+        )
+
+
+class TestIsTransientError:
+    def test_transient(self):
+        assert is_transient_error(_http_error(429))
+        assert is_transient_error(_http_error(503))
+        assert is_transient_error(ConnectionError())
+
+    def test_permanent(self):
+        assert not is_transient_error(_http_error(404))
+        assert not is_transient_error(InvalidRequestException("bad request"))
+        assert not is_transient_error(ValueError())
+
+
+class TestRateLimit:
+    def test_shared_by_operations(self):
+        result, successes, _ = _run(
+            list(range(15)), lambda x: x, rate_limiter=TokenBucket(rate=100, burst=5)
+        )
+        assert len(successes) == 15
+        assert result.elapsed >= 0.09
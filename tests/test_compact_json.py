@@ -3,10 +3,12 @@ Unit tests for yellowdog_cli.utils.compact_json
 """
 
 import json
+from unittest.mock import patch
 
 import pytest
 
-from yellowdog_cli.utils.compact_json import CompactJSONEncoder
+import yellowdog_cli.utils.compact_json as compact_json_module
+from yellowdog_cli.utils.compact_json import CompactJSONEncoder, to_json_line
 
 
 def _enc(data, **kwargs) -> str:
@@ -154,6 +156,77 @@ class TestDefaultIndent:
         assert "\t" in result
 
 
+class TestLayout:
+    """
+    The complete layout of a nested structure.
+    """
+
+    def test_nested_layout(self):
+        data = {
+            "name": "wr",
+            "taskGroups": [
+                {
+                    "name": "tg",
+                    "tags": [],
+                    "env": {"A": "1", "B": 2.50},
+                    "tasks": [{"args": list(range(12)), "flags": [True, None]}],
+                }
+            ],
+        }
+        args = "".join(f"            {i},\n" for i in range(11))
+        assert _enc(data, indent=2) == (
+            "{\n"
+            '  "name": "wr",\n'
+            '  "taskGroups": [\n'
+            "    {\n"
+            '      "name": "tg",\n'
+            '      "tags": [],\n'
+            '      "env": {"A": "1", "B": 2.5},\n'
+            '      "tasks": [\n'
+            "        {\n"
+            '          "args": [\n'
+            f"{args}"
+            "            11\n"
+            "          ],\n"
+            '          "flags": [true, null]\n'
+            "        }\n"
+            "      ]\n"
+            "    }\n"
+            "  ]\n"
+            "}"
+        )
+
+    def test_width_uses_python_repr(self):
+        # str() of a 1-tuple includes a trailing comma
+        assert _enc(("x" * 97,)) == '["' + "x" * 97 + '"]'
+        assert _enc(("x" * 98,)).startswith("[\n")
+        assert _enc(["x" * 98]) == '["' + "x" * 98 + '"]'
+
+    def test_non_ascii_escaped(self):
+        assert _enc(["é"]) == '["\\u00e9"]'
+
+    def test_invalid_indent(self):
+        with pytest.raises(ValueError):
+            CompactJSONEncoder(indent=2.5)
+
+
+class TestToJsonLine:
+    def test_single_line(self):
+        data = {"a": [1, 2, {"b": None}], "c": "x y"}
+        line = to_json_line(data)
+        assert "\n" not in line
+        assert " " not in line.replace("x y", "")
+        assert json.loads(line) == data
+
+    def test_without_orjson(self):
+        with patch.object(compact_json_module, "orjson", None):
+            assert to_json_line({"a": [1, True]}) == '{"a":[1,true]}'
+
+    def test_falls_back_for_unsupported_objects(self):
+        # orjson doesn't support non-string keys by default
+        assert to_json_line({1: "a"}) == '{"1":"a"}'
+
+
 class TestIterencode:
     def test_iterencode_matches_encode(self):
         enc = CompactJSONEncoder()
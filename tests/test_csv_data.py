@@ -6,12 +6,18 @@ Functions that require API calls or full Work Requirement pipelines are
 out of scope for unit tests.
 """
 
+from copy import copy, deepcopy
+from unittest.mock import patch
+
 import pytest
 
 import yellowdog_cli.utils.csv_data as csv_module
 from yellowdog_cli.utils.csv_data import (
     CSVDataCache,
     CSVTaskData,
+    CSVTaskList,
+    CSVTaskPrototype,
+    csv_variables_substitution,
     make_string_substitutions,
     substitutions_present,
 )
@@ -37,6 +43,15 @@ def simple_csv(tmp_path):
     return str(csv_file)
 
 
+@pytest.fixture()
+def numbered_csv(tmp_path, monkeypatch):
+    """A CSV file with 25 data rows, with row positions recorded every 4 rows."""
+    monkeypatch.setattr(csv_module, "CSV_ROW_INDEX_INTERVAL", 4)
+    csv_file = tmp_path / "numbered.csv"
+    csv_file.write_text("id,label\n" + "".join(f"{i},Label {i}\n" for i in range(25)))
+    return str(csv_file)
+
+
 @pytest.fixture()
 def single_row_csv(tmp_path):
     """A CSV file with header and one data row."""
@@ -234,6 +249,210 @@ class TestCSVTaskData:
         assert data.total_tasks == 0
         assert list(data) == []
 
+    def test_empty_file_no_tasks(self, tmp_path):
+        csv_file = tmp_path / "empty.csv"
+        csv_file.write_text("")
+        data = CSVTaskData(str(csv_file))
+        assert data.total_tasks == 0
+        assert data.var_names == []
+
+    def test_multiline_quoted_values(self, tmp_path):
+        csv_file = tmp_path / "multiline.csv"
+        csv_file.write_text('a,b\n"line 1\nline 2",x\n3,4\n')
+        data = CSVTaskData(str(csv_file))
+        assert data.total_tasks == 2
+        assert data.get_row(1) == ["3", "4"]
+        assert data.get_row(0) == ["line 1\nline 2", "x"]
+
+    @pytest.mark.parametrize("index", [0, 3, 4, 5, 13, 24])
+    def test_get_row_random_access(self, numbered_csv, index):
+        data = CSVTaskData(numbered_csv)
+        assert data.get_row(index) == [str(index), f"Label {index}"]
+
+    def test_get_row_out_of_order(self, numbered_csv):
+        data = CSVTaskData(numbered_csv)
+        indexes = [9, 10, 2, 24, 0, 1, 17]
+        assert [data.get_row(i)[0] for i in indexes] == [str(i) for i in indexes]
+
+    def test_get_row_out_of_range_raises(self, numbered_csv):
+        data = CSVTaskData(numbered_csv)
+        with pytest.raises(IndexError):
+            data.get_row(25)
+
+    def test_file_closed_after_last_row(self, numbered_csv):
+        data = CSVTaskData(numbered_csv)
+        list(data)
+        assert data._csv_file is None
+
+    def test_rows_not_stored(self, numbered_csv):
+        data = CSVTaskData(numbered_csv)
+        assert data.total_tasks == 25
+        assert len(data._row_positions) == 7  # Every 4th row, and the end
+
+    def test_copy_reads_independently(self, numbered_csv):
+        data = CSVTaskData(numbered_csv)
+        next(data)
+        data_copy = copy(data)
+        assert next(data_copy) == ["0", "Label 0"]
+        assert next(data) == ["1", "Label 1"]
+
+
+# ---------------------------------------------------------------------------
+# CSVTaskPrototype
+# ---------------------------------------------------------------------------
+
+TASK_PROTOTYPE = {
+    "name": "task_<<id>>_<<format_name:label>>",
+    "arguments": ["<<id>>", "<<num:count>>", "<<bool:flag>>", "x<<num:count>>"],
+    "environment": {"LABEL": "<<label>>", "<<id>>_KEY": "value", "C": "const"},
+    "timeout": "<<num:count>>",
+    "other": "<<not_a_column>>",
+    "taskDataInputs": [{"source": "bucket/input", "destination": "in"}],
+    "number": 5,
+}
+
+VAR_NAMES = ["id", "count", "flag", "label"]
+
+
+class TestCSVTaskPrototype:
+    @pytest.mark.parametrize(
+        "task_data",
+        [
+            ["1", "10", "true", "My Job"],
+            ["job_2", "2.5", "FALSE", "a/b"],
+            ["3", "1e3", "True", "x"],
+            ["4", "-7", "false", "Label 4"],
+        ],
+    )
+    def test_equivalent_to_string_substitution(self, task_data):
+        expected = csv_variables_substitution(TASK_PROTOTYPE, VAR_NAMES, task_data)
+        rendered = CSVTaskPrototype(TASK_PROTOTYPE, VAR_NAMES).render(task_data)
+        assert rendered == expected
+        assert list(rendered) == list(expected)
+        assert [type(x) for x in rendered["arguments"]] == [
+            type(x) for x in expected["arguments"]
+        ]
+
+    def test_typed_variables(self):
+        rendered = CSVTaskPrototype(TASK_PROTOTYPE, VAR_NAMES).render(
+            ["1", "10", "true", "label"]
+        )
+        assert rendered["timeout"] == 10
+        assert rendered["arguments"][1:] == [10, True, "x<<num:count>>"]
+
+    def test_values_inserted_verbatim(self):
+        # Quotes and backslashes would break a Python repr round trip
+        rendered = CSVTaskPrototype({"path": "<<p>>"}, ["p"]).render(["C:\\temp\\it's"])
+        assert rendered == {"path": "C:\\temp\\it's"}
+
+    @pytest.mark.parametrize("value", ["ten", "nan", "inf"])
+    def test_invalid_number_raises(self, value):
+        prototype = CSVTaskPrototype(TASK_PROTOTYPE, VAR_NAMES)
+        with pytest.raises(ValueError, match="Invalid number"):
+            prototype.render(["1", value, "true", "label"])
+
+    def test_invalid_number_in_larger_string_raises(self):
+        prototype = CSVTaskPrototype({"a": "x<<num:n>>"}, ["n"])
+        with pytest.raises(ValueError, match="Invalid number"):
+            prototype.render(["ten"])
+
+    def test_invalid_bool_raises(self):
+        prototype = CSVTaskPrototype(TASK_PROTOTYPE, VAR_NAMES)
+        with pytest.raises(ValueError, match="Invalid Boolean"):
+            prototype.render(["1", "10", "yes", "label"])
+
+    def test_constant_subtrees_shared(self):
+        prototype = CSVTaskPrototype(TASK_PROTOTYPE, VAR_NAMES)
+        first = prototype.render(["1", "10", "true", "a"])
+        second = prototype.render(["2", "20", "false", "b"])
+        assert first["taskDataInputs"] is TASK_PROTOTYPE["taskDataInputs"]
+        assert second["taskDataInputs"] is TASK_PROTOTYPE["taskDataInputs"]
+        assert first["arguments"] is not second["arguments"]
+
+    def test_non_csv_variable_subtrees_copied(self):
+        task_prototype = {"env": {"NAME": "{{task_name}}"}, "args": ["<<a>>"]}
+        prototype = CSVTaskPrototype(task_prototype, ["a"])
+        rendered = prototype.render(["1"])
+        rendered["env"]["NAME"] = "changed"
+        assert task_prototype["env"]["NAME"] == "{{task_name}}"
+
+    def test_no_variables_returns_prototype(self):
+        task_prototype = {"args": ["constant"]}
+        prototype = CSVTaskPrototype(task_prototype, ["a"])
+        assert prototype.render(["1"]) is task_prototype
+
+    def test_repeated_variable_name_uses_last_column(self):
+        rendered = CSVTaskPrototype({"a": "<<x>>"}, ["x", "x"]).render(["1", "2"])
+        assert rendered == {"a": "2"}
+
+
+# ---------------------------------------------------------------------------
+# CSVTaskList
+# ---------------------------------------------------------------------------
+
+LIST_PROTOTYPE = {"name": "task_<<id>>", "environment": {"L": "<<label>>"}}
+
+
+class TestCSVTaskList:
+    def test_len(self, numbered_csv):
+        tasks = CSVTaskList(CSVTaskData(numbered_csv), LIST_PROTOTYPE)
+        assert len(tasks) == 25
+
+    def test_getitem(self, numbered_csv):
+        tasks = CSVTaskList(CSVTaskData(numbered_csv), LIST_PROTOTYPE)
+        assert tasks[7] == {"name": "task_7", "environment": {"L": "Label 7"}}
+        assert tasks[-1]["name"] == "task_24"
+        assert [task["name"] for task in tasks[2:4]] == ["task_2", "task_3"]
+
+    def test_getitem_out_of_range_raises(self, numbered_csv):
+        tasks = CSVTaskList(CSVTaskData(numbered_csv), LIST_PROTOTYPE)
+        with pytest.raises(IndexError):
+            tasks[25]
+
+    def test_iteration(self, numbered_csv):
+        tasks = CSVTaskList(CSVTaskData(numbered_csv), LIST_PROTOTYPE)
+        assert [task["name"] for task in tasks] == [f"task_{i}" for i in range(25)]
+
+    def test_iteration_does_not_disturb_indexing(self, numbered_csv):
+        tasks = CSVTaskList(CSVTaskData(numbered_csv), LIST_PROTOTYPE)
+        assert tasks[0]["name"] == "task_0"
+        list(tasks)
+        assert tasks[1]["name"] == "task_1"
+
+    def test_deepcopy(self, numbered_csv):
+        tasks = CSVTaskList(CSVTaskData(numbered_csv), LIST_PROTOTYPE)
+        task_group = {"tasks": tasks}
+        task_group_copy = deepcopy(task_group)
+        assert task_group_copy["tasks"] is not tasks
+        assert list(task_group_copy["tasks"]) == list(tasks)
+
+    def test_property_values(self, numbered_csv):
+        tasks = CSVTaskList(
+            CSVTaskData(numbered_csv), {**LIST_PROTOTYPE, "taskType": "bash"}
+        )
+        with patch.object(CSVTaskPrototype, "render") as mock_render:
+            assert tasks.property_values("taskType") == {"bash"}
+            assert tasks.property_values("taskData") == set()
+        mock_render.assert_not_called()
+
+    def test_property_values_from_csv(self, numbered_csv):
+        tasks = CSVTaskList(
+            CSVTaskData(numbered_csv), {"taskType": "type_<<id>>", "name": "<<id>>"}
+        )
+        with patch.object(CSVTaskPrototype, "render") as mock_render:
+            assert tasks.property_values("taskType") == {f"type_{i}" for i in range(25)}
+        mock_render.assert_not_called()
+
+    def test_shared_csv_data_read_independently(self, numbered_csv):
+        csv_data = CSVTaskData(numbered_csv)
+        tasks_1 = CSVTaskList(csv_data, LIST_PROTOTYPE)
+        tasks_2 = CSVTaskList(csv_data, {"id": "<<id>>"})
+        assert [(tasks_1[i]["name"], tasks_2[i]["id"]) for i in range(3)] == [
+            ("task_0", "0"),
+            ("task_1", "1"),
+            ("task_2", "2"),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # CSVDataCache
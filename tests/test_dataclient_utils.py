@@ -2,10 +2,20 @@
 Unit tests for yellowdog_cli.utils.dataclient_utils
 """
 
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 
+import yellowdog_cli.utils.dataclient_utils as dataclient_module
 from yellowdog_cli.utils.config_types import ConfigDataClient
-from yellowdog_cli.utils.dataclient_utils import resolve_remote_path
+from yellowdog_cli.utils.dataclient_utils import (
+    download_files,
+    flatten_names,
+    resolve_remote_path,
+    upload_directory,
+)
 from yellowdog_cli.utils.variables import VARIABLE_SUBSTITUTIONS
 
 
@@ -136,3 +146,167 @@ class TestResolveRemotePathVariableSubstitution:
         # username is always set; just check it resolved to something
         assert "{{username}}" not in result
         assert result.startswith("r:b/")
+
+
+class TestFlattenNames:
+    def test_unique_names(self):
+        assert flatten_names(["a/x.txt", "b/y.txt", "z.txt"]) == {
+            "a/x.txt": "x.txt",
+            "b/y.txt": "y.txt",
+            "z.txt": "z.txt",
+        }
+
+    def test_collision_error(self):
+        with pytest.raises(ValueError, match=r"'x\.txt' \(a/x\.txt, b/x\.txt\)"):
+            flatten_names(["b/x.txt", "a/x.txt", "y.txt"], on_collision="error")
+
+    def test_collision_rename(self):
+        assert flatten_names(
+            ["c/x.txt", "a/x.txt", "b/x.txt", "x_1.txt"], on_collision="rename"
+        ) == {
+            "a/x.txt": "x.txt",
+            "b/x.txt": "x_2.txt",
+            "c/x.txt": "x_3.txt",
+            "x_1.txt": "x_1.txt",
+        }
+
+    def test_collision_overwrite_by_default(self):
+        assert flatten_names(["a/x.txt", "c/x.txt", "b/x.txt", "y"]) == {
+            "c/x.txt": "x.txt",
+            "y": "y",
+        }
+
+
+class FakeBackend:
+    """
+    Emulates the rclone backend operations used by flattened transfers,
+    treating 'remote:' paths as paths under a local directory.
+    """
+
+    def __init__(self, remote_root: Path):
+        self.remote_root = remote_root
+        self.commands: list[tuple[str, dict]] = []
+
+    def _path(self, path: str) -> Path:
+        return self.remote_root / path.split(":", 1)[1] if ":" in path else Path(path)
+
+    def stat(self, path: str):
+        self.commands.append(("stat", {"path": path}))
+        target = self._path(path)
+        if not target.exists():
+            return None
+        return {"Path": target.name, "Name": target.name, "IsDir": target.is_dir()}
+
+    def list_json(self, path: str, recursive: bool = False, files_only: bool = False):
+        self.commands.append(("list_json", {"path": path}))
+        root = self._path(path)
+        files = [root] if root.is_file() else root.rglob("*")
+        return [
+            {"Path": f.name if f == root else f.relative_to(root).as_posix()}
+            for f in files
+            if f.is_file()
+        ]
+
+    def copy(self, src: str, dst: str, **kwargs):
+        self.commands.append(("copy", kwargs))
+        for path in kwargs["files_from"]:
+            (self._path(dst) / path).parent.mkdir(parents=True, exist_ok=True)
+            (self._path(dst) / path).write_bytes((self._path(src) / path).read_bytes())
+        return SimpleNamespace(returncode=0, stderr="")
+
+    def ls(self, path: str, max_depth: int):
+        exists = self._path(path).exists()
+        return SimpleNamespace(dirs=[], files=[path] if exists else [])
+
+    def copy_file(self, src: str, dst: str):
+        self.commands.append(("copy_file", {}))
+        Path(dst).write_bytes(self._path(src).read_bytes())
+        return SimpleNamespace(returncode=0, stderr="")
+
+
+class TestFlatTransfers:
+    @pytest.fixture
+    def rclone(self, tmp_path):
+        rclone = FakeBackend(tmp_path / "remote")
+        with (
+            patch.object(
+                dataclient_module, "_rclone_for_config", return_value=("r", rclone)
+            ),
+            patch.object(dataclient_module, "print_info"),
+        ):
+            yield rclone
+
+    @staticmethod
+    def _make_tree(root: Path, files: dict[str, str]):
+        for path, content in files.items():
+            (root / path).parent.mkdir(parents=True, exist_ok=True)
+            (root / path).write_text(content)
+
+    def test_upload_single_invocation(self, rclone, tmp_path):
+        local = tmp_path / "local"
+        self._make_tree(
+            local, {f"d{i}/f{i}.txt": str(i) for i in range(50)} | {"top": "t"}
+        )
+        upload_directory(ConfigDataClient(), local, "r:out/", flatten=True)
+        assert len(rclone.commands) == 1
+        assert rclone.commands[0][1]["copy_links"]
+        remote = rclone.remote_root / "out"
+        assert sorted(f.name for f in remote.iterdir()) == sorted(
+            [f"f{i}.txt" for i in range(50)] + ["top"]
+        )
+        assert (remote / "f7.txt").read_text() == "7"
+
+    def test_upload_collision_error_before_transfer(self, rclone, tmp_path):
+        local = tmp_path / "local"
+        self._make_tree(local, {"a/x": "a", "b/x": "b"})
+        with pytest.raises(ValueError, match="collide"):
+            upload_directory(
+                ConfigDataClient(), local, "r:out", flatten=True, on_collision="error"
+            )
+        assert rclone.commands == []
+
+    def test_upload_collision_rename(self, rclone, tmp_path):
+        local = tmp_path / "local"
+        self._make_tree(local, {"a/x.txt": "a", "b/x.txt": "b"})
+        upload_directory(
+            ConfigDataClient(), local, "r:out", flatten=True, on_collision="rename"
+        )
+        remote = rclone.remote_root / "out"
+        assert (remote / "x.txt").read_text() == "a"
+        assert (remote / "x_1.txt").read_text() == "b"
+
+    def test_download(self, rclone, tmp_path):
+        self._make_tree(
+            rclone.remote_root / "data",
+            {"a/x.txt": "a", "b/c/x.txt": "c", "y.txt": "y"},
+        )
+        local = tmp_path / "local"
+        with patch.object(dataclient_module, "print_warning") as mock_warning:
+            download_files(
+                ConfigDataClient(remote="r"),
+                "r:data",
+                local,
+                flatten=True,
+                on_collision="overwrite",
+            )
+        mock_warning.assert_called_once()
+        assert [c[0] for c in rclone.commands] == ["stat", "list_json", "copy"]
+        assert sorted(f.name for f in local.iterdir()) == ["x.txt", "y.txt"]
+        assert (local / "x.txt").read_text() == "c"
+
+    def test_download_single_file(self, rclone, tmp_path):
+        self._make_tree(rclone.remote_root, {"data/y.txt": "y"})
+        local = tmp_path / "local"
+        download_files(
+            ConfigDataClient(remote="r"), "r:data/y.txt", local, flatten=True
+        )
+        assert [c[0] for c in rclone.commands] == ["stat", "copy_file"]
+        assert [f.name for f in local.iterdir()] == ["y.txt"]
+
+    def test_download_directory_holding_file_of_same_name(self, rclone, tmp_path):
+        self._make_tree(rclone.remote_root, {"out/out": "x"})
+        local = tmp_path / "local"
+        download_files(ConfigDataClient(remote="r"), "r:out", local, flatten=True)
+        assert [c[0] for c in rclone.commands] == ["stat", "list_json", "copy"]
+        assert [f.name for f in local.iterdir()] == ["out"]
+        assert (local / "out").read_text() == "x"
@@ -0,0 +1,136 @@
+"""
+Tests for recording and replaying event streams, in
+yellowdog_cli.utils.event_log.
+"""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+
+import yellowdog_cli.utils.event_log as event_log_module
+from yellowdog_cli.utils.event_log import (
+    EventRecord,
+    EventRecorder,
+    read_event_log,
+    replay_event_log,
+)
+from yellowdog_cli.utils.event_streams import EventStream
+from yellowdog_cli.utils.ydid_utils import YDIDType
+
+WR_ID = "ydid:workreq:000000:11111111-2222-3333-4444-555555555555"
+WP_ID = "ydid:wrkrpool:000000:11111111-2222-3333-4444-555555555555"
+
+
+def _write_log(filename, records: list[tuple[float, str, str]]):
+    times = iter([t for t, _, _ in records])
+    with patch.object(event_log_module, "time", lambda: next(times)):
+        with EventRecorder(filename) as recorder:
+            for _, ydid, line in records:
+                recorder.record(ydid, line)
+
+
+class TestEventRecorder:
+    def test_wrapped_stream_records_and_handles(self, tmp_path):
+        filename = str(tmp_path / "events.log.gz")
+        received = []
+        with EventRecorder(filename) as recorder:
+            event_stream = recorder.wrap(
+                EventStream(
+                    WR_ID, YDIDType.WORK_REQUIREMENT, lambda e, t: received.append(e)
+                )
+            )
+            assert event_stream.on_event is not None
+            event_stream.on_event("data: 1", YDIDType.WORK_REQUIREMENT)
+
+        assert received == ["data: 1"]
+        records = list(read_event_log(filename))
+        assert [(x.ydid, x.line) for x in records] == [(WR_ID, "data: 1")]
+
+    def test_wrapped_stream_prints_by_default(self, tmp_path):
+        with (
+            EventRecorder(str(tmp_path / "events.log.gz")) as recorder,
+            patch.object(event_log_module, "print_event") as mock_print,
+        ):
+            event_stream = recorder.wrap(EventStream(WR_ID, YDIDType.WORK_REQUIREMENT))
+            assert event_stream.on_event is not None
+            event_stream.on_event("data: 1", YDIDType.WORK_REQUIREMENT)
+        mock_print.assert_called_once_with("data: 1", YDIDType.WORK_REQUIREMENT)
+
+    def test_log_is_gzipped_and_appended(self, tmp_path):
+        filename = str(tmp_path / "events.log.gz")
+        _write_log(filename, [(1.0, WR_ID, "data: 1")])
+        _write_log(filename, [(2.0, WP_ID, "data: 2")])
+
+        with gzip.open(filename, "rt") as f:
+            assert len(f.readlines()) == 2
+        assert list(read_event_log(filename)) == [
+            EventRecord(1.0, WR_ID, "data: 1"),
+            EventRecord(2.0, WP_ID, "data: 2"),
+        ]
+
+    def test_flushed_periodically(self, tmp_path):
+        now = [0.0]
+        with (
+            patch.object(event_log_module, "monotonic", lambda: now[0]),
+            EventRecorder(str(tmp_path / "events.log.gz")) as recorder,
+            patch.object(recorder, "flush", wraps=recorder.flush) as mock_flush,
+        ):
+            recorder.record(WR_ID, "data: 1")
+            now[0] = 0.5
+            recorder.record(WR_ID, "data: 2")
+            mock_flush.assert_not_called()
+            now[0] = 1.0
+            recorder.record(WR_ID, "data: 3")
+            mock_flush.assert_called_once()
+
+    def test_truncated_log_read_to_last_flush(self, tmp_path):
+        filename = str(tmp_path / "events.log.gz")
+        truncated = str(tmp_path / "truncated.log.gz")
+        with EventRecorder(filename) as recorder:
+            recorder.record(WR_ID, "data: 1")
+            recorder.record(WR_ID, "data: 2")
+            recorder.flush()
+            recorder.record(WR_ID, "data: 3")
+            # The log as left by a recorder killed at this point
+            with open(filename, "rb") as src, open(truncated, "wb") as dst:
+                dst.write(src.read())
+
+        with patch.object(event_log_module, "print_warning") as mock_warning:
+            records = list(read_event_log(truncated))
+        assert [x.line for x in records] == ["data: 1", "data: 2"]
+        mock_warning.assert_called_once()
+
+
+class TestReplayEventLog:
+    @pytest.fixture
+    def filename(self, tmp_path):
+        filename = str(tmp_path / "events.log.gz")
+        _write_log(
+            filename,
+            [(10.0, WR_ID, "data: 1"), (12.0, WP_ID, "data: 2"), (13.0, WR_ID, "x")],
+        )
+        return filename
+
+    def test_replay_preserves_intervals(self, filename):
+        received = []
+        with patch.object(event_log_module, "sleep") as mock_sleep:
+            replay_event_log(filename, 1.0, lambda x: received.append(x.line))
+        assert received == ["data: 1", "data: 2", "x"]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 1.0]
+
+    def test_replay_speed_multiplier(self, filename):
+        with patch.object(event_log_module, "sleep") as mock_sleep:
+            replay_event_log(filename, 4.0, lambda x: None)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.25]
+
+    def test_replay_max_speed(self, filename):
+        received = []
+        with patch.object(event_log_module, "sleep") as mock_sleep:
+            replay_event_log(filename, 0, lambda x: received.append(x))
+        mock_sleep.assert_not_called()
+        assert len(received) == 3
+
+    def test_negative_speed(self, filename):
+        with pytest.raises(ValueError):
+            replay_event_log(filename, -1.0, lambda x: None)
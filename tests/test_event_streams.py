@@ -0,0 +1,328 @@
+"""
+Tests for the asyncio event stream engine in yellowdog_cli.utils.event_streams.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from aiohttp import ClientConnectorError, ClientPayloadError, ServerDisconnectedError
+
+import yellowdog_cli.utils.event_streams as event_streams_module
+from yellowdog_cli.utils.event_streams import (
+    EventLineParser,
+    EventStream,
+    StreamPosition,
+    get_event_url,
+)
+from yellowdog_cli.utils.retry_utils import TokenBucket
+from yellowdog_cli.utils.ydid_utils import YDIDType
+
+WR_ID = "ydid:workreq:000000:11111111-2222-3333-4444-555555555555"
+
+# ---------------------------------------------------------------------------
+# Fakes
+# ---------------------------------------------------------------------------
+
+
+class _FakeContent:
+    def __init__(self, chunks: list[bytes], error: Exception | None = None):
+        self._chunks = chunks
+        self._error = error
+
+    async def iter_any(self):
+        for chunk in self._chunks:
+            yield chunk
+        if self._error is not None:
+            raise self._error
+
+
+class _FakeResponse:
+    def __init__(self, status=200, chunks=(), error=None, json_body=None, headers=None):
+        self.status = status
+        self.headers = {} if headers is None else headers
+        self.content = _FakeContent(list(chunks), error)
+        self._json_body = json_body
+
+    async def json(self, content_type=None):
+        return self._json_body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    """Returns (or raises) the given responses in order, one per get()."""
+
+    def __init__(self, *responses: _FakeResponse | Exception):
+        self._responses = list(responses)
+        self.urls: list[str] = []
+        self.headers: list[dict | None] = []
+
+    def get(self, url, headers=None):
+        self.urls.append(url)
+        self.headers.append(headers)
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _follow(session, event_stream, reconnect_budget=None):
+    with patch.object(event_streams_module, "EVENT_STREAM_RETRY_INTERVAL", 0):
+        asyncio.run(
+            event_streams_module._follow_event_stream(
+                session,
+                event_stream,
+                (
+                    TokenBucket(rate=10.0, burst=20)
+                    if reconnect_budget is None
+                    else reconnect_budget
+                ),
+            )
+        )
+
+
+# ---------------------------------------------------------------------------
+# EventLineParser
+# ---------------------------------------------------------------------------
+
+
+class TestEventLineParser:
+    def test_complete_lines(self):
+        assert EventLineParser().feed(b"a\nb\n") == ["a", "b"]
+
+    def test_line_split_across_chunks(self):
+        parser = EventLineParser()
+        assert parser.feed(b'data: {"x') == []
+        assert parser.feed(b'": 1}\nda') == ['data: {"x": 1}']
+        assert parser.feed(b"ta: 2\n") == ["data: 2"]
+
+    def test_crlf_and_blank_lines(self):
+        assert EventLineParser().feed(b"a\r\n\r\nb\r\n") == ["a", "", "b"]
+
+    def test_multibyte_character_split_across_chunks(self):
+        parser = EventLineParser()
+        encoded = "é\n".encode()
+        assert parser.feed(encoded[:1]) == []
+        assert parser.feed(encoded[1:]) == ["é"]
+
+    def test_line_too_long(self):
+        parser = EventLineParser(max_line_bytes=4)
+        assert parser.feed(b"abcd") == []
+        with pytest.raises(ValueError):
+            parser.feed(b"e")
+
+
+# ---------------------------------------------------------------------------
+# _follow_event_stream
+# ---------------------------------------------------------------------------
+
+
+class TestFollowEventStream:
+    def test_events_passed_to_callback(self):
+        received = []
+        session = _FakeSession(_FakeResponse(chunks=[b"event: x\ndata: 1\n\n"]))
+        _follow(
+            session,
+            EventStream(
+                WR_ID, YDIDType.WORK_REQUIREMENT, lambda e, t: received.append((e, t))
+            ),
+        )
+        assert received == [
+            ("event: x", YDIDType.WORK_REQUIREMENT),
+            ("data: 1", YDIDType.WORK_REQUIREMENT),
+        ]
+        assert session.urls[0].endswith(f"/work/requirements/{WR_ID}/updates")
+
+    def test_events_printed_by_default(self):
+        session = _FakeSession(_FakeResponse(chunks=[b"data: 1\n"]))
+        with patch.object(event_streams_module, "print_event") as mock_print:
+            _follow(session, EventStream(WR_ID, YDIDType.WORK_REQUIREMENT))
+        mock_print.assert_called_once_with("data: 1", YDIDType.WORK_REQUIREMENT)
+
+    def test_retries_after_interruption(self):
+        received = []
+        session = _FakeSession(
+            _FakeResponse(chunks=[b"data: 1\n"], error=ClientPayloadError("broken")),
+            _FakeResponse(chunks=[b"data: 2\n"]),
+        )
+        with patch.object(event_streams_module, "print_warning") as mock_warning:
+            _follow(
+                session,
+                EventStream(
+                    WR_ID, YDIDType.WORK_REQUIREMENT, lambda e, t: received.append(e)
+                ),
+            )
+        assert received == ["data: 1", "data: 2"]
+        assert len(session.urls) == 2
+        mock_warning.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ClientConnectorError(MagicMock(), OSError("Connection refused")),
+            ServerDisconnectedError(),
+        ],
+    )
+    def test_retries_after_connection_error(self, error):
+        received = []
+        session = _FakeSession(error, _FakeResponse(chunks=[b"data: 1\n"]))
+        with patch.object(event_streams_module, "print_warning") as mock_warning:
+            _follow(
+                session,
+                EventStream(
+                    WR_ID, YDIDType.WORK_REQUIREMENT, lambda e, t: received.append(e)
+                ),
+            )
+        assert received == ["data: 1"]
+        assert len(session.urls) == 2
+        mock_warning.assert_called_once()
+
+    @pytest.mark.parametrize("status", [429, 502, 503, 504])
+    def test_retries_after_transient_status(self, status):
+        received = []
+        session = _FakeSession(
+            _FakeResponse(status=status), _FakeResponse(chunks=[b"data: 1\n"])
+        )
+        with patch.object(event_streams_module, "print_warning") as mock_warning:
+            _follow(
+                session,
+                EventStream(
+                    WR_ID, YDIDType.WORK_REQUIREMENT, lambda e, t: received.append(e)
+                ),
+            )
+        assert received == ["data: 1"]
+        assert len(session.urls) == 2
+        mock_warning.assert_called_once()
+
+    def test_retry_after_pauses_reconnect_budget(self):
+        session = _FakeSession(
+            _FakeResponse(status=503, headers={"Retry-After": "0"}),
+            _FakeResponse(chunks=[b"data: 1\n"]),
+        )
+        budget = TokenBucket(rate=10.0, burst=20)
+        with (
+            patch.object(event_streams_module, "print_warning"),
+            patch.object(budget, "pause", wraps=budget.pause) as mock_pause,
+        ):
+            _follow(
+                session,
+                EventStream(WR_ID, YDIDType.WORK_REQUIREMENT, lambda e, t: None),
+                budget,
+            )
+        mock_pause.assert_called_once_with(0.0)
+        assert len(session.urls) == 2
+
+    def test_resumes_from_last_event_id(self):
+        session = _FakeSession(
+            _FakeResponse(
+                chunks=[b"id: 41\ndata: 1\n\nid: 42\ndata: 2\n\n"],
+                error=ClientPayloadError("broken"),
+            ),
+            _FakeResponse(chunks=[b"data: 3\n"]),
+        )
+        with patch.object(event_streams_module, "print_warning"):
+            _follow(
+                session,
+                EventStream(WR_ID, YDIDType.WORK_REQUIREMENT, lambda e, t: None),
+            )
+        assert session.headers == [None, {"Last-Event-ID": "42"}]
+
+    def test_error_status_stops(self):
+        session = _FakeSession(
+            _FakeResponse(status=404, json_body={"message": "Not found"})
+        )
+        with patch.object(event_streams_module, "print_error") as mock_error:
+            _follow(session, EventStream(WR_ID, YDIDType.WORK_REQUIREMENT))
+        mock_error.assert_called_once_with(f"'{WR_ID}': Not found")
+        assert len(session.urls) == 1
+
+    def test_other_error_stops(self):
+        session = _FakeSession(_FakeResponse(error=RuntimeError("bad")))
+        with patch.object(event_streams_module, "print_error") as mock_error:
+            _follow(session, EventStream(WR_ID, YDIDType.WORK_REQUIREMENT))
+        mock_error.assert_called_once_with("Event stream error: bad")
+        assert len(session.urls) == 1
+
+
+# ---------------------------------------------------------------------------
+# StreamPosition
+# ---------------------------------------------------------------------------
+
+
+class TestStreamPosition:
+    def test_observe_fields(self):
+        position = StreamPosition()
+        position.observe("id: abc")
+        position.observe("retry: 2500")
+        position.observe("data: {}")
+        assert position.last_event_id == "abc"
+        assert position.retry_interval == 2.5
+        assert position.get_headers() == {"Last-Event-ID": "abc"}
+
+    def test_invalid_retry_ignored(self):
+        position = StreamPosition()
+        position.observe("retry: soon")
+        assert position.retry_interval is None
+
+    def test_empty_id_resets(self):
+        position = StreamPosition(last_event_id="abc")
+        position.observe("id")
+        assert position.get_headers() is None
+
+    @pytest.mark.parametrize("attempt, low, high", [(0, 2.5, 5), (2, 10, 20)])
+    def test_retry_delay_backoff(self, attempt, low, high):
+        delay = StreamPosition().get_retry_delay(attempt)
+        assert low <= delay <= high
+
+    def test_retry_delay_uses_server_interval_and_cap(self):
+        position = StreamPosition(retry_interval=1.0)
+        assert 0.5 <= position.get_retry_delay(0) <= 1.0
+        assert position.get_retry_delay(100) <= 60.0
+
+
+class TestFollowEventStreams:
+    def test_no_streams(self):
+        with patch.object(event_streams_module, "ClientSession") as mock_session:
+            event_streams_module.follow_event_streams([])
+        mock_session.assert_not_called()
+
+    def test_streams_share_one_session(self):
+        session = _FakeSession(
+            _FakeResponse(chunks=[b"data: 1\n"]), _FakeResponse(chunks=[b"data: 2\n"])
+        )
+        received = []
+        on_event = lambda e, t: received.append(e)  # noqa: E731
+        session_cm = MagicMock()
+        session_cm.__aenter__.return_value = session
+        with (
+            patch.object(
+                event_streams_module, "ClientSession", return_value=session_cm
+            ) as mock_session,
+            patch.object(event_streams_module, "TCPConnector"),
+        ):
+            event_streams_module.follow_event_streams(
+                [
+                    EventStream(WR_ID, YDIDType.WORK_REQUIREMENT, on_event),
+                    EventStream(WR_ID, YDIDType.WORK_REQUIREMENT, on_event),
+                ]
+            )
+        mock_session.assert_called_once()
+        assert sorted(received) == ["data: 1", "data: 2"]
+
+
+class TestGetEventUrl:
+    @pytest.mark.parametrize(
+        "ydid_type, path",
+        [
+            (YDIDType.WORK_REQUIREMENT, "/work/requirements/x/updates"),
+            (YDIDType.WORKER_POOL, "/workerPools/x/updates"),
+            (YDIDType.COMPUTE_REQUIREMENT, "/compute/requirements/x/updates"),
+        ],
+    )
+    def test_urls(self, ydid_type, path):
+        assert get_event_url("x", ydid_type).endswith(path)
@@ -0,0 +1,64 @@
+"""
+Tests for concurrent detail fetching in yellowdog_cli.utils.fetch_utils.
+"""
+
+from threading import Lock
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+
+import yellowdog_cli.utils.fetch_utils as fetch_utils_module
+from yellowdog_cli.utils.fetch_utils import check_fetch_failures, fetch_concurrently
+
+
+class TestFetchConcurrently:
+    def test_empty(self):
+        assert fetch_concurrently([], lambda x: x) == []
+
+    def test_results_keep_item_order(self):
+        # Later items finish first
+        def fetch(item: int) -> int:
+            sleep((10 - item) / 1000)
+            return item * 10
+
+        assert fetch_concurrently(list(range(10)), fetch) == [x * 10 for x in range(10)]
+
+    def test_concurrency_is_bounded(self):
+        lock = Lock()
+        in_flight = max_in_flight = 0
+
+        def fetch(item: int) -> int:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return item
+
+        assert fetch_concurrently(list(range(20)), fetch, max_workers=3) == list(
+            range(20)
+        )
+        assert 1 < max_in_flight <= 3
+
+    def test_failures_reported_and_omitted(self):
+        def fetch(item: str) -> str:
+            if item == "b":
+                raise RuntimeError("not found")
+            return item.upper()
+
+        with patch.object(fetch_utils_module, "print_error") as mock_error:
+            results = fetch_concurrently(
+                ["a", "b", "c"], fetch, lambda x: f"item '{x}'"
+            )
+        assert results == ["A", "C"]
+        mock_error.assert_called_once_with("Unable to fetch item 'b': not found")
+        with pytest.raises(RuntimeError, match=r"Unable to fetch 1 item\(s\)"):
+            check_fetch_failures()
+        check_fetch_failures()  # Reset by the previous check
+
+    def test_no_failures(self):
+        fetch_concurrently(["a"], str.upper)
+        check_fetch_failures()
@@ -0,0 +1,173 @@
+"""
+Tests for lazy, paginated listing of work requirements and tasks in
+yellowdog_cli.utils.entity_utils and yd-list.
+"""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from yellowdog_client.common import SearchClient
+from yellowdog_client.model import (
+    Slice,
+    SliceReference,
+    TaskStatus,
+    WorkRequirementStatus,
+)
+
+import yellowdog_cli.list as list_module
+from yellowdog_cli.utils.entity_utils import (
+    iterate_filtered_work_requirement_summaries,
+    iterate_search,
+    iterate_tasks_in_task_group,
+)
+from yellowdog_cli.utils.settings import SEARCH_PAGE_SIZE
+
+
+class FakeSearchClient(SearchClient[int]):
+    """
+    A search client that serves 'count' integers, recording the slice
+    references requested.
+    """
+
+    def __init__(self, count: int):
+        super().__init__(self._get_next_slice)
+        self.count = count
+        self.requests: list[SliceReference] = []
+
+    def _get_next_slice(self, slice_reference: SliceReference) -> Slice[int]:
+        self.requests.append(slice_reference)
+        assert slice_reference.size is not None
+        start = int(slice_reference.sliceId or 0)
+        end = min(start + slice_reference.size, self.count)
+        return Slice(
+            items=list(range(start, end)),
+            nextSliceId=str(end) if end < self.count else None,
+        )
+
+
+class TestIterateSearch:
+    def test_all_items(self):
+        search_client = FakeSearchClient(2500)
+        assert list(iterate_search(search_client)) == list(range(2500))
+        assert [r.size for r in search_client.requests] == [SEARCH_PAGE_SIZE] * 3
+
+    def test_pages_fetched_lazily(self):
+        search_client = FakeSearchClient(2500)
+        items = iterate_search(search_client)
+        assert next(items) == 0
+        assert len(search_client.requests) == 1
+        for _ in range(SEARCH_PAGE_SIZE):
+            next(items)
+        assert len(search_client.requests) == 2
+
+    def test_max_items_limits_page_size(self):
+        search_client = FakeSearchClient(2500)
+        items = iterate_search(search_client, max_items=5)
+        assert [next(items) for _ in range(5)] == list(range(5))
+        assert [r.size for r in search_client.requests] == [5]
+
+    def test_empty(self):
+        search_client = FakeSearchClient(0)
+        assert list(iterate_search(search_client)) == []
+        assert len(search_client.requests) == 1
+
+
+class TestServerSideFilters:
+    def test_exclude_filter_sent_as_statuses(self):
+        client = MagicMock()
+        client.work_client.get_work_requirements.return_value = FakeSearchClient(0)
+        list(
+            iterate_filtered_work_requirement_summaries(
+                client,
+                exclude_filter=[
+                    WorkRequirementStatus.COMPLETED,
+                    WorkRequirementStatus.CANCELLED,
+                    WorkRequirementStatus.FAILED,
+                ],
+            )
+        )
+        (search,), _ = client.work_client.get_work_requirements.call_args
+        assert search.statuses == [
+            WorkRequirementStatus.RUNNING,
+            WorkRequirementStatus.HELD,
+            WorkRequirementStatus.FINISHING,
+            WorkRequirementStatus.CANCELLING,
+        ]
+
+    def test_everything_excluded(self):
+        client = MagicMock()
+        assert (
+            list(
+                iterate_filtered_work_requirement_summaries(
+                    client,
+                    include_filter=[WorkRequirementStatus.HELD],
+                    exclude_filter=[WorkRequirementStatus.HELD],
+                )
+            )
+            == []
+        )
+        client.work_client.get_work_requirements.assert_not_called()
+
+    def test_active_tasks(self):
+        client = MagicMock()
+        client.work_client.get_tasks.return_value = FakeSearchClient(0)
+        list(iterate_tasks_in_task_group(client, "tg-id", active_only=True))
+        (search,), _ = client.work_client.get_tasks.call_args
+        assert search.taskGroupId == "tg-id"
+        assert TaskStatus.EXECUTING in search.statuses
+        assert not any(status.finished for status in search.statuses)
+
+
+class TestListStreamedObjects:
+    @staticmethod
+    def _list(offset: int | None, limit: int | None, count: int = 2500):
+        search_client = FakeSearchClient(count)
+        # The items are integers, in place of Work Requirements or Tasks
+        objects: Iterator[Any] = iterate_search(
+            search_client,
+            max_items=None if limit is None else (offset or 0) + limit,
+        )
+        args = SimpleNamespace(
+            offset=offset, limit=limit, details=False, ids_only=False
+        )
+        with (
+            patch.object(list_module, "ARGS_PARSER", args),
+            patch.object(list_module, "print_numbered_object_stream") as mock_print,
+            patch.object(list_module, "print_info") as mock_info,
+        ):
+            list_module.list_streamed_objects(objects, "Items")
+        printed = list(mock_print.call_args.args[1]) if mock_print.called else None
+        return printed, search_client.requests, mock_info
+
+    def test_offset_and_limit(self):
+        printed, requests, _ = self._list(offset=10, limit=5)
+        assert printed == list(range(10, 15))
+        assert len(requests) == 1
+
+    def test_limit_stops_early(self):
+        printed, requests, _ = self._list(offset=None, limit=1500)
+        assert printed == list(range(1500))
+        assert [r.size for r in requests] == [1000, 1000]
+
+    def test_no_matches(self):
+        printed, _, mock_info = self._list(offset=3000, limit=None)
+        assert printed is None
+        mock_info.assert_called_once_with("No matching Items")
+
+    def test_details_fetched_in_order(self):
+        args = SimpleNamespace(offset=None, limit=25, details=True, ids_only=False)
+        with (
+            patch.object(list_module, "ARGS_PARSER", args),
+            patch.object(list_module, "print_yd_object_list") as mock_print,
+        ):
+            objects: Iterator[Any] = iterate_search(FakeSearchClient(100), max_items=25)
+            list_module.list_streamed_objects(
+                objects,
+                "Items",
+                lambda item: (item * 10, None),
+            )
+        assert list(mock_print.call_args.args[0]) == [
+            (item * 10, None) for item in range(25)
+        ]
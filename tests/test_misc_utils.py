@@ -13,6 +13,7 @@ from yellowdog_client.model import (
     ConfiguredWorkerPool,
     ProvisionedWorkerPool,
     WorkRequirement,
+    WorkRequirementSummary,
 )
 
 from yellowdog_cli.utils.misc_utils import (
@@ -21,10 +22,13 @@ from yellowdog_cli.utils.misc_utils import (
     camel_case_split,
     entities,
     format_yd_name,
+    fq_name,
     generate_id,
+    get_cache_dir,
     get_delimited_string_boundaries,
     link,
     link_entity,
+    link_entity_id,
     pathname_relative_to_config_file,
     split_delimited_string,
 )
@@ -223,6 +227,21 @@ class TestEntities:
         result = link_entity("https://app.yellowdog.ai", entity)
         assert f"#/{expected_segment}/test-id-123" in result
 
+    def test_link_entity_id_matches_link_entity(self):
+        entity = object.__new__(WorkRequirement)
+        entity.id = "test-id-123"
+        assert link_entity_id(
+            "https://app.yellowdog.ai", "WorkRequirement", "test-id-123"
+        ) == link_entity("https://app.yellowdog.ai", entity)
+
+
+class TestFqName:
+    def test_namespace_qualified(self):
+        summary = WorkRequirementSummary()
+        summary.namespace = "ns"
+        summary.name = "wr"
+        assert fq_name(summary) == "ns/wr"
+
 
 class TestLink:
     def test_url_and_suffix(self):
@@ -248,6 +267,17 @@ class TestLink:
         assert result == url  # text == url → no parens
 
 
+class TestGetCacheDir:
+    def test_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_cache_dir() == str(tmp_path / "yellowdog")
+
+    def test_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert get_cache_dir() == str(tmp_path / ".cache" / "yellowdog")
+
+
 class TestPathnameRelativeToConfigFile:
     def test_basic_join(self):
         result = pathname_relative_to_config_file("/configs", "myfile.toml")
@@ -6,26 +6,42 @@ console output (print_info, print_warning, etc.) are exercised indirectly
 by the rest of the test suite.
 """
 
+import json
 import re
 from types import SimpleNamespace
+from typing import cast
 from unittest.mock import patch
 
-from yellowdog_client.model import KeyringSummary, Task, WorkRequirementSummary
+import pytest
+from yellowdog_client.common.json import Json
+from yellowdog_client.model import (
+    KeyringSummary,
+    RunSpecification,
+    Task,
+    TaskGroup,
+    WorkRequirement,
+    WorkRequirementSummary,
+)
 
 import yellowdog_cli.utils.printing as printing_module
+from yellowdog_cli.utils.compact_json import CompactJSONEncoder
 from yellowdog_cli.utils.printing import (
     StatusCount,
+    WorkRequirementSnapshot,
     _truncate_text,
     _yes_or_no,
+    close_output_file,
     get_type_name,
     indent,
     keyring_table,
+    print_numbered_object_stream,
     print_string,
+    print_yd_object_list,
     status_counts_msg,
     task_table,
     work_requirement_table,
 )
-from yellowdog_cli.utils.settings import MAX_TABLE_DESCRIPTION
+from yellowdog_cli.utils.settings import JSON_INDENT, MAX_TABLE_DESCRIPTION
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -369,3 +385,203 @@ class TestWorkRequirementTable:
         _, rows_no = work_requirement_table([self._wr(healthy=False)])
         assert rows_yes[0][6] == "Yes"
         assert rows_no[0][6] == "No"
+
+
+# ---------------------------------------------------------------------------
+# print_yd_object_list / print_to_file
+# ---------------------------------------------------------------------------
+
+
+class TestPrintYdObjectList:
+    def _print(
+        self,
+        tmp_path,
+        capsys,
+        count: int,
+        json_lines: bool = False,
+        lazy: bool = False,
+    ):
+        output_file = str(tmp_path / "out.json")
+        args = _mock_args(
+            output_file=output_file, json_lines=json_lines, strip_ids=False
+        )
+        tasks = ((Task(name=f"task-{i}"), {"index": i}) for i in range(count))
+        with (
+            patch("yellowdog_cli.utils.printing.ARGS_PARSER", args),
+            patch.object(printing_module, "print_info"),
+        ):
+            print_yd_object_list(tasks if lazy else list(tasks))
+            close_output_file()
+        with open(output_file) as f:
+            return f.read(), capsys.readouterr().out
+
+    def test_json_list(self, tmp_path, capsys):
+        file_output, console_output = self._print(tmp_path, capsys, 3)
+        data = json.loads(file_output)
+        assert [x["name"] for x in data] == ["task-0", "task-1", "task-2"]
+        assert [x["index"] for x in data] == [0, 1, 2]
+        assert json.loads(console_output) == data
+
+    def test_single_object(self, tmp_path, capsys):
+        file_output, _ = self._print(tmp_path, capsys, 1)
+        assert json.loads(file_output)["name"] == "task-0"
+
+    def test_json_lines(self, tmp_path, capsys):
+        file_output, console_output = self._print(tmp_path, capsys, 3, True)
+        lines = file_output.splitlines()
+        assert [json.loads(x)["name"] for x in lines] == ["task-0", "task-1", "task-2"]
+        assert console_output == file_output
+
+    @pytest.mark.parametrize("count", [1, 2, 5])
+    def test_lazy_objects(self, tmp_path, capsys, count):
+        assert self._print(tmp_path, capsys, count, lazy=True) == self._print(
+            tmp_path, capsys, count
+        )
+
+    def test_no_objects(self, capsys):
+        args = _mock_args(output_file=None, json_lines=False)
+        with patch("yellowdog_cli.utils.printing.ARGS_PARSER", args):
+            print_yd_object_list(iter([]))
+        assert capsys.readouterr().out == ""
+
+    def test_file_opened_once_and_truncated(self, tmp_path, capsys):
+        (tmp_path / "out.json").write_text("previous contents\n" * 100)
+        with patch("builtins.open", wraps=open) as mock_open:
+            file_output, _ = self._print(tmp_path, capsys, 50, True)
+        assert mock_open.call_count == 2  # Once to write, once to read back
+        assert len(file_output.splitlines()) == 50
+        assert "previous" not in file_output
+
+
+# ---------------------------------------------------------------------------
+# print_numbered_object_stream
+# ---------------------------------------------------------------------------
+
+
+class TestPrintNumberedObjectStream:
+    def test_batches_numbered_consecutively(self, capsys):
+        received = []
+
+        def tasks():
+            for i in range(5):
+                received.append(i)
+                yield Task(name=f"task-{i}")
+
+        def print_table(table: str):
+            # Each batch is printed before the next is received
+            print(f"{table}\nreceived: {len(received)}")
+
+        with (
+            patch("yellowdog_cli.utils.printing.ARGS_PARSER", _mock_args()),
+            patch.object(printing_module, "print_info"),
+            patch.object(printing_module, "print_table_core", print_table),
+        ):
+            count = print_numbered_object_stream(
+                None,  # type: ignore[arg-type]
+                tasks(),
+                batch_size=2,
+            )
+
+        output = capsys.readouterr().out
+        assert count == 5
+        assert re.findall(r"│\s+(\d+) │ task-(\d)", output) == [
+            (str(i + 1), str(i)) for i in range(5)
+        ]
+        assert re.findall(r"received: (\d)", output) == ["2", "4", "5"]
+
+    def test_empty(self, capsys):
+        with patch.object(printing_module, "print_info") as mock_info:
+            assert print_numbered_object_stream(None, iter([])) == 0  # type: ignore[arg-type]
+        mock_info.assert_not_called()
+        assert capsys.readouterr().out == ""
+
+
+# ---------------------------------------------------------------------------
+# WorkRequirementSnapshot
+# ---------------------------------------------------------------------------
+
+
+class TestWorkRequirementSnapshot:
+    @staticmethod
+    def _wr(num_task_groups: int = 3) -> WorkRequirement:
+        return WorkRequirement(
+            namespace="ns",
+            name="wr",
+            taskGroups=[
+                TaskGroup(
+                    name=f"tg{index}",
+                    runSpecification=RunSpecification(taskTypes=["bash"]),
+                )
+                for index in range(num_task_groups)
+            ],
+            tag="tag",
+        )
+
+    @staticmethod
+    def _tasks(prefix: str, count: int) -> list[Task]:
+        return [
+            Task(name=f"{prefix}-{i}", taskType="bash", arguments=["-c", str(i)])
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _expected(wr: WorkRequirement, tasks: dict[str, list[Task]]) -> str:
+        """
+        The complete Work Requirement, formatted in one go.
+        """
+        wr_data = cast(dict, Json.dump(wr))
+        for task_group in wr_data["taskGroups"]:
+            if task_group["name"] in tasks:
+                task_group["tasks"] = [Json.dump(x) for x in tasks[task_group["name"]]]
+        return json.dumps(wr_data, indent=JSON_INDENT, cls=CompactJSONEncoder) + "\n"
+
+    def _print(self, tmp_path, capsys, wr, batches) -> tuple[str, str]:
+        output_file = str(tmp_path / "wr.json")
+        args = _mock_args(output_file=output_file, quiet=True, json_lines=False)
+        with patch("yellowdog_cli.utils.printing.ARGS_PARSER", args):
+            snapshot = WorkRequirementSnapshot()
+            snapshot.set_work_requirement(wr)
+            try:
+                for task_group_name, tasks in batches:
+                    snapshot.add_tasks(task_group_name, tasks)
+                snapshot.print()
+            finally:
+                close_output_file()
+        with open(output_file) as f:
+            return capsys.readouterr().out, f.read()
+
+    @pytest.mark.parametrize("num_tasks", [0, 1, 5, 1000])
+    def test_output_matches_complete_work_requirement(
+        self, tmp_path, capsys, num_tasks
+    ):
+        wr = self._wr()
+        tasks = {"tg0": self._tasks("a", num_tasks), "tg2": self._tasks("b", 3)}
+        batches = [
+            ("tg0", tasks["tg0"][:2]),
+            ("tg0", tasks["tg0"][2:]),
+            ("tg2", tasks["tg2"]),
+        ]
+        console_output, file_output = self._print(tmp_path, capsys, wr, batches)
+        assert console_output == self._expected(wr, tasks)
+        assert file_output == console_output
+
+    def test_no_tasks(self, tmp_path, capsys):
+        wr = self._wr()
+        console_output, file_output = self._print(tmp_path, capsys, wr, [])
+        assert console_output == self._expected(wr, {})
+        assert file_output == console_output
+
+    def test_no_task_groups(self, tmp_path, capsys):
+        wr = self._wr(num_task_groups=0)
+        console_output, _ = self._print(tmp_path, capsys, wr, [])
+        assert json.loads(console_output) == Json.dump(wr)
+
+    def test_tasks_out_of_order(self, tmp_path, capsys):
+        wr = self._wr()
+        with pytest.raises(ValueError):
+            self._print(
+                tmp_path,
+                capsys,
+                wr,
+                [("tg1", self._tasks("a", 1)), ("tg0", self._tasks("b", 1))],
+            )
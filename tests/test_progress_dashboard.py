@@ -0,0 +1,218 @@
+"""
+Tests for the coalescing progress dashboard in
+yellowdog_cli.utils.progress_dashboard.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+from yellowdog_client.model import TaskStatus, WorkRequirementStatus
+
+import yellowdog_cli.utils.progress_dashboard as dashboard_module
+from yellowdog_cli.utils.event_streams import EventStream
+from yellowdog_cli.utils.progress_dashboard import EventCoalescer, ProgressDashboard
+from yellowdog_cli.utils.ydid_utils import YDIDType
+
+WR_ID = "ydid:workreq:000000:11111111-2222-3333-4444-555555555555"
+WP_ID = "ydid:wrkrpool:000000:11111111-2222-3333-4444-555555555555"
+CR_ID = "ydid:compreq:000000:11111111-2222-3333-4444-555555555555"
+
+
+@pytest.fixture(autouse=True)
+def no_output():
+    with patch.object(dashboard_module, "CONSOLE", Console(file=StringIO())):
+        yield
+
+
+def _event(payload: dict) -> str:
+    return "data:" + json.dumps(payload)
+
+
+def _wr_event(status="RUNNING", **counts) -> str:
+    return _event(
+        {
+            "name": "my-wr",
+            "status": status,
+            "taskGroups": [
+                {"taskSummary": {"taskCount": 10, "statusCounts": counts}},
+                {"taskSummary": {"taskCount": 5, "statusCounts": {}}},
+            ],
+        }
+    )
+
+
+def _task(dashboard: ProgressDashboard):
+    return dashboard.tasks[0]
+
+
+def _feed(stream: EventStream, event: str):
+    assert stream.on_event is not None
+    stream.on_event(event, stream.ydid_type)
+
+
+# ---------------------------------------------------------------------------
+# EventCoalescer
+# ---------------------------------------------------------------------------
+
+
+class TestEventCoalescer:
+    def test_keeps_latest_payload_per_key(self):
+        coalescer = EventCoalescer()
+        coalescer.add("a", "data:1")
+        coalescer.add("a", "data:2")
+        coalescer.add("b", "data:3")
+        assert coalescer.take() == {"a": "2", "b": "3"}
+
+    def test_take_clears(self):
+        coalescer = EventCoalescer()
+        coalescer.add("a", "data:1")
+        coalescer.take()
+        assert coalescer.take() == {}
+
+    def test_ignores_lines_without_data(self):
+        coalescer = EventCoalescer()
+        coalescer.add("a", "event: update")
+        coalescer.add("a", "id: 1")
+        assert coalescer.take() == {}
+
+
+# ---------------------------------------------------------------------------
+# ProgressDashboard
+# ---------------------------------------------------------------------------
+
+
+class TestProgressDashboard:
+    def test_invalid_refresh_rate(self):
+        with pytest.raises(ValueError):
+            ProgressDashboard(refresh_per_second=0)
+
+    def test_work_requirement_row(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WR_ID, YDIDType.WORK_REQUIREMENT)
+        _feed(stream, _wr_event(COMPLETED=6, FAILED=1))
+        list(dashboard.get_renderables())
+        task = _task(dashboard)
+        assert task.total == 15
+        assert task.completed == 6
+        assert task.description == "RUNNING  7/15  6 completed · 1 failed"
+        assert task.fields["name"] == "my-wr"
+
+    def test_work_requirement_row_prepopulated(self):
+        now = datetime.now(timezone.utc)
+        summary = MagicMock(
+            taskCount=4, statusCounts={TaskStatus.COMPLETED: 3, TaskStatus.FAILED: 1}
+        )
+        wr = MagicMock(
+            status=WorkRequirementStatus.COMPLETED,
+            createdTime=now - timedelta(seconds=100),
+            statusChangedTime=now - timedelta(seconds=40),
+            taskGroups=[MagicMock(taskSummary=summary)],
+        )
+        wr.name = "my-wr"
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WR_ID, YDIDType.WORK_REQUIREMENT, wr)
+        task = _task(dashboard)
+        assert task.description == "COMPLETED  4/4  3 completed · 1 failed"
+        assert task.elapsed == pytest.approx(60, abs=1)
+        stop_time = task.stop_time
+        _feed(stream, _wr_event("COMPLETED"))
+        list(dashboard.get_renderables())
+        assert _task(dashboard).stop_time == stop_time
+
+    def test_only_latest_snapshot_is_decoded(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WR_ID, YDIDType.WORK_REQUIREMENT)
+        for completed in range(100):
+            _feed(stream, _wr_event(COMPLETED=completed))
+        with patch.object(
+            dashboard_module, "json_loads", wraps=json.loads
+        ) as mock_loads:
+            list(dashboard.get_renderables())
+            list(dashboard.get_renderables())
+        mock_loads.assert_called_once()
+        assert _task(dashboard).completed == 99
+
+    def test_finished_work_requirement_stops_timer(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WR_ID, YDIDType.WORK_REQUIREMENT)
+        _feed(stream, _wr_event("COMPLETED"))
+        list(dashboard.get_renderables())
+        stop_time = _task(dashboard).stop_time
+        assert stop_time is not None
+        _feed(stream, _wr_event("COMPLETED"))
+        list(dashboard.get_renderables())
+        assert _task(dashboard).stop_time == stop_time
+
+    def test_worker_pool_row(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WP_ID, YDIDType.WORKER_POOL)
+        _feed(
+            stream,
+            _event(
+                {
+                    "name": "my-pool",
+                    "status": "RUNNING",
+                    "nodeSummary": {"statusCounts": {"RUNNING": 3, "STOPPED": 1}},
+                }
+            ),
+        )
+        list(dashboard.get_renderables())
+        task = _task(dashboard)
+        assert (task.completed, task.total) == (3, 4)
+        assert task.description == "RUNNING  3/4 nodes running"
+
+    def test_compute_requirement_row(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(CR_ID, YDIDType.COMPUTE_REQUIREMENT)
+        _feed(
+            stream,
+            _event(
+                {
+                    "name": "my-cr",
+                    "status": "PROVISIONING",
+                    "targetInstanceCount": 10,
+                    "provisionStrategy": {
+                        "sources": [
+                            {"instanceSummary": {"aliveCount": 2}},
+                            {"instanceSummary": {"aliveCount": 3}},
+                        ]
+                    },
+                }
+            ),
+        )
+        list(dashboard.get_renderables())
+        task = _task(dashboard)
+        assert (task.completed, task.total) == (5, 10)
+        assert task.description == "PROVISIONING  5/10 instances alive"
+
+    def test_undecodable_snapshot_is_skipped(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WR_ID, YDIDType.WORK_REQUIREMENT)
+        _feed(stream, "data: {not json")
+        list(dashboard.get_renderables())
+        assert _task(dashboard).total is None
+
+    def test_summary_warns_about_failures(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WR_ID, YDIDType.WORK_REQUIREMENT)
+        _feed(stream, _wr_event("FAILED", FAILED=2, CANCELLED=1))
+        with patch.object(dashboard_module, "print_warning") as mock_warning:
+            dashboard.print_summary()
+        mock_warning.assert_called_once_with(
+            "Work Requirement finished with 2 failed · 1 cancelled task(s)"
+        )
+
+    def test_summary_names_work_requirements_when_several(self):
+        dashboard = ProgressDashboard()
+        stream = dashboard.add_stream(WR_ID, YDIDType.WORK_REQUIREMENT)
+        dashboard.add_stream(WP_ID, YDIDType.WORKER_POOL)
+        _feed(stream, _wr_event("FAILED", FAILED=2))
+        with patch.object(dashboard_module, "print_warning") as mock_warning:
+            dashboard.print_summary()
+        mock_warning.assert_called_once_with(
+            "Work Requirement 'my-wr' finished with 2 failed task(s)"
+        )
@@ -0,0 +1,158 @@
+"""
+Tests for the persistent name -> ID resolution cache in
+yellowdog_cli.utils.resolution_cache.
+"""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import yellowdog_cli.utils.resolution_cache as cache_module
+from yellowdog_cli.utils.entity_utils import (
+    clear_group_caches,
+    get_group_id_by_name,
+)
+from yellowdog_cli.utils.resolution_cache import (
+    cached_resolution,
+    close_resolution_cache,
+    invalidate_resolutions,
+    open_resolution_cache,
+)
+from yellowdog_cli.utils.settings import ET_GROUPS, ET_ROLES
+
+URL = "https://api.example.com"
+GROUP_ID = "ydid:group:000000:11111111-2222-3333-4444-555555555555"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Use a temporary cache directory, and close any open cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    yield tmp_path
+    close_resolution_cache()
+
+
+def _resolver(entity: str = ET_ROLES):
+    """A resolution function that counts its calls."""
+    calls = []
+
+    @cached_resolution(entity)
+    def resolve(client, name: str, namespace: str | None = None) -> str | None:
+        calls.append(name)
+        return None if name == "missing" else f"id-of-{namespace}-{name}"
+
+    return resolve, calls
+
+
+class TestCachedResolution:
+    def test_passthrough_when_not_open(self, cache_dir):
+        resolve, calls = _resolver()
+        assert resolve(None, "a") == "id-of-None-a"
+        assert resolve(None, "a") == "id-of-None-a"
+        assert calls == ["a", "a"]
+        assert not (cache_dir / "yellowdog").exists()
+
+    def test_persists_across_invocations(self, cache_dir):
+        resolve, calls = _resolver()
+        open_resolution_cache(URL, "key", "ns")
+        assert resolve(None, "a", namespace="x") == "id-of-x-a"
+        close_resolution_cache()
+
+        open_resolution_cache(URL, "key", "ns")
+        assert resolve(None, "a", namespace="x") == "id-of-x-a"
+        assert calls == ["a"]
+        assert (cache_dir / "yellowdog" / "resolution-cache.sqlite3").exists()
+
+    def test_scoped_by_url_key_and_namespace(self):
+        resolve, calls = _resolver()
+        for scope in [(URL, "key", "ns"), (URL, "key", "ns2"), (URL, "key2", "ns")]:
+            open_resolution_cache(*scope)
+            resolve(None, "a")
+            close_resolution_cache()
+        assert calls == ["a", "a", "a"]
+
+    def test_none_not_cached(self):
+        resolve, calls = _resolver()
+        open_resolution_cache(URL, "key", "ns")
+        assert resolve(None, "missing") is None
+        assert resolve(None, "missing") is None
+        assert calls == ["missing", "missing"]
+
+    def test_entries_expire(self):
+        resolve, calls = _resolver()
+        open_resolution_cache(URL, "key", "ns")
+        with patch.dict(cache_module.RESOLUTION_CACHE_TTLS, {ET_ROLES: -1}):
+            resolve(None, "a")
+        resolve(None, "a")
+        assert calls == ["a", "a"]
+
+    def test_invalidation(self):
+        roles_resolve, roles_calls = _resolver(ET_ROLES)
+        groups_resolve, groups_calls = _resolver(ET_GROUPS)
+        open_resolution_cache(URL, "key", "ns")
+        roles_resolve(None, "a")
+        groups_resolve(None, "a")
+        invalidate_resolutions(ET_GROUPS)
+        roles_resolve(None, "a")
+        groups_resolve(None, "a")
+        assert roles_calls == ["a"]
+        assert groups_calls == ["a", "a"]
+
+    def test_statistics(self):
+        resolve, _ = _resolver()
+        open_resolution_cache(URL, "key", "ns")
+        resolve(None, "a")
+        resolve(None, "a")
+        resolve(None, "a")
+        with patch.object(cache_module, "print_info") as mock_info:
+            close_resolution_cache()
+        mock_info.assert_called_once_with(
+            "Resolution cache: 2 hit(s), 1 miss(es) "
+            "(all invocations: 2 hit(s), 1 miss(es))"
+        )
+
+        open_resolution_cache(URL, "key", "ns")
+        resolve(None, "a")
+        with patch.object(cache_module, "print_info") as mock_info:
+            close_resolution_cache()
+        mock_info.assert_called_once_with(
+            "Resolution cache: 1 hit(s), 0 miss(es) "
+            "(all invocations: 3 hit(s), 1 miss(es))"
+        )
+
+    def test_database_error_disables_cache(self):
+        resolve, calls = _resolver()
+        open_resolution_cache(URL, "key", "ns")
+        with (
+            patch.object(
+                cache_module.ResolutionCache,
+                "get",
+                side_effect=sqlite3.OperationalError("locked"),
+            ),
+            patch.object(cache_module, "print_warning") as mock_warning,
+        ):
+            assert resolve(None, "a") == "id-of-None-a"
+        mock_warning.assert_called_once()
+        assert cache_module._RESOLUTION_CACHE is None
+        assert calls == ["a"]
+
+
+class TestEntityUtilsResolutions:
+    def test_group_lookup_cached_and_cleared(self):
+        group = MagicMock()
+        group.name, group.id = "my-group", GROUP_ID
+        client = MagicMock()
+        client.account_client.get_groups.return_value.list_all.return_value = [group]
+
+        open_resolution_cache(URL, "key", "ns")
+        clear_group_caches()
+        assert get_group_id_by_name(client, "my-group") == GROUP_ID
+        get_group_id_by_name.cache_clear()  # Simulate a new invocation
+        assert get_group_id_by_name(client, "my-group") == GROUP_ID
+        assert client.account_client.get_groups.call_count == 1
+
+        clear_group_caches()
+        assert get_group_id_by_name(client, "my-group") == GROUP_ID
+        assert client.account_client.get_groups.call_count == 2
+        clear_group_caches()
@@ -0,0 +1,330 @@
+"""
+Tests for the shared REST API session in yellowdog_cli.utils.wrapper, and
+raw JSON Task batch submission using it.
+"""
+
+import gzip
+import json
+from contextlib import ExitStack
+from typing import Any
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError
+
+import yellowdog_cli.submit as submit_module
+import yellowdog_cli.utils.wrapper as wrapper_module
+from yellowdog_cli.utils.args import CLIParser
+from yellowdog_cli.utils.settings import HTTP_MIN_POOL_SIZE, MAX_BATCH_SUBMIT_ATTEMPTS
+from yellowdog_cli.utils.submit_utils import AdaptiveTaskBatching, TaskBatchCheckpoint
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    """Each test starts without a REST session, and closes any it creates."""
+    wrapper_module.close_rest_session()
+    yield
+    wrapper_module.close_rest_session()
+
+
+def _adapter() -> HTTPAdapter:
+    adapter = wrapper_module.get_rest_session().get_adapter("https://api.example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    return adapter
+
+
+# ---------------------------------------------------------------------------
+# get_rest_session
+# ---------------------------------------------------------------------------
+
+
+class TestGetRestSession:
+    def test_session_is_shared(self):
+        assert wrapper_module.get_rest_session() is wrapper_module.get_rest_session()
+
+    def test_authorization_header(self):
+        config = wrapper_module.CONFIG_COMMON
+        session = wrapper_module.get_rest_session()
+        assert (
+            session.headers["Authorization"] == f"yd-key {config.key}:{config.secret}"
+        )
+
+    def test_default_pool_size(self):
+        assert _adapter()._pool_maxsize == HTTP_MIN_POOL_SIZE
+
+    def test_pool_enlarged(self):
+        wrapper_module.get_rest_session(pool_size=HTTP_MIN_POOL_SIZE + 10)
+        assert _adapter()._pool_maxsize == HTTP_MIN_POOL_SIZE + 10
+
+    def test_replaced_adapter_closed(self):
+        adapter = _adapter()
+        with patch.object(adapter, "close") as mock_close:
+            wrapper_module.get_rest_session(pool_size=HTTP_MIN_POOL_SIZE + 10)
+        mock_close.assert_called_once()
+        assert _adapter() is not adapter
+
+    def test_pool_not_reduced(self):
+        wrapper_module.get_rest_session(pool_size=HTTP_MIN_POOL_SIZE + 10)
+        wrapper_module.get_rest_session(pool_size=1)
+        assert _adapter()._pool_maxsize == HTTP_MIN_POOL_SIZE + 10
+
+    def test_posts_not_retried_after_sending(self):
+        # Typed as Any: urllib3 1.x's metaclass hides Retry's attributes
+        retries: Any = _adapter().max_retries
+        assert "GET" in retries.allowed_methods
+        assert "POST" not in retries.allowed_methods
+        assert retries.total > 0
+
+    def test_close_discards_session(self):
+        session = wrapper_module.get_rest_session()
+        wrapper_module.close_rest_session()
+        assert wrapper_module.get_rest_session() is not session
+
+
+# ---------------------------------------------------------------------------
+# submit_json_task_batch
+# ---------------------------------------------------------------------------
+
+
+def _response(status_code: int, text: str = "", headers: dict | None = None):
+    return MagicMock(status_code=status_code, text=text, headers=headers or {})
+
+
+class TestSubmitJsonTaskBatch:
+    def test_batch_posted_using_session(self):
+        session = MagicMock()
+        session.post.return_value = _response(200)
+        tasks = [{"name": "task_1"}, {"name": "task_2"}]
+
+        with patch.object(submit_module, "get_rest_session", return_value=session):
+            num_submitted = submit_module.submit_json_task_batch(
+                tasks, 0, 1, "tg", "wr"
+            )
+
+        assert num_submitted == 2
+        kwargs = session.post.call_args.kwargs
+        assert "Authorization" not in kwargs["headers"]
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["data"])) == tasks
+
+    def test_permanent_failure_not_retried(self):
+        session = MagicMock()
+        session.post.return_value = _response(400, "Bad")
+
+        with (
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(submit_module, "sleep") as mock_sleep,
+            pytest.raises(RuntimeError, match="HTTP 400"),
+        ):
+            submit_module.submit_json_task_batch([{}], 0, 1, "tg", "wr")
+
+        assert session.post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_transient_failures_retried(self):
+        session = MagicMock()
+        session.post.side_effect = [
+            _response(503, "Unavailable"),
+            ConnectionError("Connection reset"),
+            _response(200),
+        ]
+
+        with (
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(submit_module, "sleep") as mock_sleep,
+        ):
+            assert submit_module.submit_json_task_batch([{}], 0, 1, "tg", "wr") == 1
+
+        assert session.post.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_retry_after_respected(self):
+        session = MagicMock()
+        session.post.side_effect = [
+            _response(429, "Slow down", headers={"Retry-After": "45"}),
+            _response(200),
+        ]
+
+        with (
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(submit_module, "sleep") as mock_sleep,
+        ):
+            submit_module.submit_json_task_batch([{}], 0, 1, "tg", "wr")
+
+        assert mock_sleep.call_args.args[0] >= 45
+
+    def test_unique_names_error_is_success(self):
+        session = MagicMock()
+        session.post.side_effect = [
+            _response(500, "Internal error"),
+            _response(400, "Task names must be unique within task group"),
+        ]
+
+        with (
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(submit_module, "sleep"),
+        ):
+            assert submit_module.submit_json_task_batch([{}], 0, 1, "tg", "wr") == 1
+
+    def test_attempts_exhausted_raises(self):
+        session = MagicMock()
+        session.post.return_value = _response(503, "Unavailable")
+
+        with (
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(submit_module, "sleep"),
+            pytest.raises(RuntimeError, match="HTTP 503"),
+        ):
+            submit_module.submit_json_task_batch([{}], 0, 1, "tg", "wr")
+
+        assert session.post.call_count == MAX_BATCH_SUBMIT_ATTEMPTS
+
+    def test_submitted_batch_recorded_in_checkpoint(self, tmp_path):
+        session = MagicMock()
+        session.post.return_value = _response(200)
+        checkpoint = TaskBatchCheckpoint(str(tmp_path / "checkpoint.jsonl"))
+
+        with patch.object(submit_module, "get_rest_session", return_value=session):
+            submit_module.submit_json_task_batch([{}], 0, 5, "tg", "wr", checkpoint)
+
+        assert checkpoint.is_submitted("tg", 0)
+        assert not checkpoint.is_submitted("tg", 1)
+
+    def test_adaptive_batching_posts_sub_batches(self):
+        session = MagicMock()
+        session.post.side_effect = [_response(429, "Slow down"), _response(200)] + [
+            _response(200)
+        ] * 10
+        adaptive_batching = AdaptiveTaskBatching(max_batch_size=10, max_concurrency=1)
+        adaptive_batching.batch_size = 4
+        tasks = [{"name": f"task_{i}"} for i in range(10)]
+
+        with (
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(submit_module, "sleep"),
+        ):
+            assert (
+                submit_module.submit_json_task_batch(
+                    tasks, 0, 1, "tg", "wr", adaptive_batching=adaptive_batching
+                )
+                == 10
+            )
+
+        posted = [
+            json.loads(gzip.decompress(call.kwargs["data"]))
+            for call in session.post.call_args_list
+        ]
+        assert posted[0] == posted[1] == tasks[:4]  # Retried after throttling
+        assert [task for batch in posted[1:] for task in batch] == tasks
+        assert adaptive_batching.num_throttled == 1
+        assert adaptive_batching.num_tasks == 10
+
+    def test_batch_split_by_payload_size(self):
+        session = MagicMock()
+        session.post.return_value = _response(200)
+        tasks = [{"name": f"task_{i}", "taskData": "x" * 50} for i in range(4)]
+
+        with (
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(submit_module, "TASK_BATCH_MAX_BYTES", 150),
+        ):
+            assert submit_module.submit_json_task_batch(tasks, 0, 1, "tg", "wr") == 4
+
+        posted = [
+            json.loads(gzip.decompress(call.kwargs["data"]))
+            for call in session.post.call_args_list
+        ]
+        assert len(posted) == 4
+        assert [task for batch in posted for task in batch] == tasks
+
+
+# ---------------------------------------------------------------------------
+# submit_json_raw
+# ---------------------------------------------------------------------------
+
+
+class TestSubmitJsonRaw:
+    @pytest.fixture
+    def wr_file(self, tmp_path):
+        wr_file = tmp_path / "wr.json"
+        wr_file.write_text(
+            json.dumps(
+                {
+                    "name": "wr",
+                    "namespace": "ns",
+                    "taskGroups": [
+                        {"name": "tg", "tasks": [{"name": f"t{i}"} for i in range(4)]}
+                    ],
+                }
+            )
+        )
+        return str(wr_file)
+
+    @staticmethod
+    def _submit(wr_file: str, checkpoint_file: str, submit_batch) -> MagicMock:
+        session = MagicMock()
+        session.post.return_value = _response(200, '{"id": "ydid:workreq:1"}')
+        properties = {
+            "dry_run": False,
+            "checkpoint_file": checkpoint_file,
+            "quiet": False,
+            "hold": False,
+            "follow": False,
+        }
+        with ExitStack() as stack:
+            for name, value in properties.items():
+                stack.enter_context(
+                    patch.object(
+                        CLIParser, name, new_callable=PropertyMock, return_value=value
+                    )
+                )
+            stack.enter_context(
+                patch.object(submit_module, "get_rest_session", return_value=session)
+            )
+            stack.enter_context(patch.object(submit_module, "TASK_BATCH_SIZE", 1))
+            stack.enter_context(
+                patch.object(submit_module, "get_parallel_batches", return_value=1)
+            )
+            stack.enter_context(
+                patch.object(submit_module, "use_adaptive_batching", return_value=False)
+            )
+            mock_submit = stack.enter_context(
+                patch.object(
+                    submit_module, "submit_json_task_batch", side_effect=submit_batch
+                )
+            )
+            submit_module.submit_json_raw(wr_file)
+        return mock_submit
+
+    def test_stops_at_first_failed_batch(self, wr_file, tmp_path):
+        checkpoint_file = str(tmp_path / "checkpoint.jsonl")
+
+        def submit_batch(task_batch, batch_number, *args):
+            if batch_number == 1:
+                raise RuntimeError("Failed")
+            args[-2].record_batch("tg", batch_number)
+            return len(task_batch)
+
+        with pytest.raises(RuntimeError, match="Failed"):
+            self._submit(wr_file, checkpoint_file, submit_batch)
+
+        checkpoint = TaskBatchCheckpoint(checkpoint_file)
+        assert [checkpoint.is_submitted("tg", batch) for batch in range(4)] == [
+            True,
+            False,
+            False,
+            False,
+        ]
+
+    def test_changed_input_not_resumed(self, wr_file, tmp_path):
+        checkpoint_file = str(tmp_path / "checkpoint.jsonl")
+        self._submit(wr_file, checkpoint_file, lambda task_batch, *args: 1)
+        with open(wr_file, "a") as f:
+            f.write("\n")
+        with pytest.raises(ValueError, match="file has changed"):
+            self._submit(wr_file, checkpoint_file, lambda task_batch, *args: 1)
@@ -0,0 +1,98 @@
+"""
+Tests for the shared rate limiting and backoff in
+yellowdog_cli.utils.retry_utils.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import yellowdog_cli.utils.retry_utils as retry_module
+from yellowdog_cli.utils.retry_utils import (
+    TokenBucket,
+    get_retry_after,
+    get_retry_delay,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def clock():
+    """
+    A fake clock, advanced by the (synchronous and asyncio) sleeps of the
+    token bucket, which are recorded.
+    """
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    async def fake_async_sleep(seconds):
+        fake_sleep(seconds)
+
+    with (
+        patch.object(retry_module, "monotonic", lambda: now[0]),
+        patch.object(retry_module, "sleep", fake_sleep),
+        patch.object(retry_module.asyncio, "sleep", fake_async_sleep),
+    ):
+        yield sleeps
+
+
+class TestTokenBucket:
+    def test_burst_then_rate_limited(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        for _ in range(3):
+            bucket.acquire()
+        assert clock == [0.5]
+
+    def test_async_burst_then_rate_limited(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=2)
+
+        async def acquire_all():
+            for _ in range(3):
+                await bucket.acquire_async()
+
+        asyncio.run(acquire_all())
+        assert clock == [0.5]
+
+    def test_pause(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        bucket.pause(3.0)
+        bucket.pause(1.0)  # Doesn't shorten the pause
+        bucket.acquire()
+        assert clock == [3.0]
+
+
+class TestGetRetryDelay:
+    @pytest.mark.parametrize("attempt", [1, 2, 3, 10])
+    def test_delay_within_backoff_bound(self, attempt):
+        bound = min(30.0, 1.0 * 2 ** (attempt - 1))
+        for _ in range(20):
+            assert 0 <= get_retry_delay(attempt, 1.0, 30.0) <= bound
+
+    def test_retry_after_is_minimum(self):
+        assert get_retry_delay(1, 1.0, 30.0, retry_after=100.0) == 100.0
+
+
+class TestGetRetryAfter:
+    def test_seconds(self):
+        response = MagicMock(headers={"Retry-After": "12"})
+        assert get_retry_after(response) == 12.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=60)
+        response = MagicMock(headers={"Retry-After": format_datetime(when)})
+        retry_after = get_retry_after(response)
+        assert retry_after is not None and 50 < retry_after <= 60
+
+    @pytest.mark.parametrize("headers", [{}, {"Retry-After": "soon"}])
+    def test_absent_or_invalid(self, headers):
+        assert get_retry_after(MagicMock(headers=headers)) is None
+
+    def test_negative_is_zero(self):
+        assert parse_retry_after("-5") == 0.0
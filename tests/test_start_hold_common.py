@@ -229,7 +229,7 @@ class TestTagBasedPath:
             patch.object(shc_module, "confirmed", return_value=confirm_result),
             patch.object(shc_module, "print_error") as mock_error,
             patch.object(shc_module, "print_info"),
-            patch.object(shc_module, "link_entity", return_value="<link>"),
+            patch.object(shc_module, "link_entity_id", return_value="<link>"),
         ):
             result = _start_or_hold_work_requirements(
                 action="Start",
@@ -3,22 +3,40 @@ Tests for the sequential vs parallel batch task submission logic in
 add_tasks_to_task_group (submit.py).
 """
 
+import gzip
+import json
 from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_all_start_methods
+from threading import Event, Lock
+from typing import Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
-from yellowdog_client.model import TaskGroup, WorkRequirement
+import pytest
+from requests.exceptions import HTTPError
+from yellowdog_client.model import Task, TaskGroup, WorkRequirement
 
 import yellowdog_cli.submit as submit_module
+import yellowdog_cli.utils.submit_utils as su
+import yellowdog_cli.utils.variables as var_module
 from yellowdog_cli.utils.args import CLIParser
-from yellowdog_cli.utils.property_names import TASK_GROUPS, TASKS
+from yellowdog_cli.utils.config_types import ConfigWorkRequirement
+from yellowdog_cli.utils.property_names import TASK_COUNT, TASK_GROUPS, TASKS
+from yellowdog_cli.utils.settings import (
+    ADAPTIVE_DEFAULT_PARALLEL_BATCHES,
+    DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS,
+)
+from yellowdog_cli.utils.submit_utils import AdaptiveTaskBatching
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _make_wr_data(num_tasks: int) -> dict:
-    return {TASK_GROUPS: [{TASKS: [{} for _ in range(num_tasks)]}]}
+def _make_wr_data(num_tasks: int, tg_task_count: int | None = None) -> dict:
+    task_group: dict[str, Any] = {TASKS: [{} for _ in range(num_tasks)]}
+    if tg_task_count is not None:
+        task_group[TASK_COUNT] = tg_task_count
+    return {TASK_GROUPS: [task_group]}
 
 
 def _make_tg(name: str = "grp") -> TaskGroup:
@@ -38,18 +56,25 @@ def _run_add_tasks(
     batch_size: int,
     parallel_batches: int,
     pause_flag: int | None = None,
+    submit_side_effect=None,
+    tg_task_count: int | None = None,
 ) -> dict:
     """
     Call add_tasks_to_task_group with generate/submit mocked out.
+    'submit_side_effect' optionally replaces the default fake submission.
 
     Returns:
       generate_calls: list of (start, end) tuples — one per batch, in call order
       submit_calls:   list of task-counts per batch (order may vary in parallel mode)
       pause_mock:     the mock replacing the pause_between_batches function
+      wr_data:        the Work Requirement data after the call
     """
     config_wr_mock = MagicMock()
     config_wr_mock.task_count = None
     config_wr_mock.parallel_batches = None
+    config_wr_mock.generation_processes = None
+    config_wr_mock.adaptive_batching = False
+    config_wr_mock.compress_task_batches = False
     pause_mock = MagicMock()
 
     generate_calls: list[tuple[int, int]] = []
@@ -63,6 +88,8 @@ def _run_add_tasks(
         submit_calls.append(len(tasks_list))
         return len(tasks_list)
 
+    wr_data = _make_wr_data(num_tasks, tg_task_count)
+
     with (
         patch.object(submit_module, "TASK_BATCH_SIZE", batch_size),
         patch.object(submit_module, "CONFIG_WR", config_wr_mock),
@@ -74,7 +101,9 @@ def _run_add_tasks(
         patch.object(
             submit_module,
             "submit_batch_of_tasks_to_task_group",
-            side_effect=fake_submit,
+            side_effect=(
+                fake_submit if submit_side_effect is None else submit_side_effect
+            ),
         ),
         patch.object(submit_module, "pause_between_batches", pause_mock),
         patch.object(
@@ -99,7 +128,7 @@ def _run_add_tasks(
         submit_module.add_tasks_to_task_group(
             tg_number=0,
             task_group=_make_tg(),
-            wr_data=_make_wr_data(num_tasks),
+            wr_data=wr_data,
             task_count=None,
             work_requirement=_make_wr(),
             files_directory=".",
@@ -109,6 +138,7 @@ def _run_add_tasks(
         "generate_calls": generate_calls,
         "submit_calls": submit_calls,
         "pause_mock": pause_mock,
+        "wr_data": wr_data,
     }
 
 
@@ -131,6 +161,9 @@ def _run_add_tasks_tracking_tpe(
     config_wr_mock = MagicMock()
     config_wr_mock.task_count = None
     config_wr_mock.parallel_batches = None
+    config_wr_mock.generation_processes = None
+    config_wr_mock.adaptive_batching = False
+    config_wr_mock.compress_task_batches = False
 
     def fake_generate(start, end, *args, **kwargs):
         return [MagicMock()] * (end - start)
@@ -295,3 +328,478 @@ class TestParallelBatching:
             num_tasks=12, batch_size=3, parallel_batches=4
         )
         assert captured == [4]
+
+
+# ---------------------------------------------------------------------------
+# Task count expansion
+# ---------------------------------------------------------------------------
+
+
+class TestTaskCountExpansion:
+    """
+    A single Task with 'taskCount' set is expanded at generation time,
+    without duplicating the Task specification.
+    """
+
+    def test_expanded_tasks_are_generated_in_batches(self):
+        result = _run_add_tasks(
+            num_tasks=1, batch_size=3, parallel_batches=1, tg_task_count=7
+        )
+        assert result["generate_calls"] == [(0, 3), (3, 6), (6, 7)]
+        assert sum(result["submit_calls"]) == 7
+
+    def test_task_specification_is_not_duplicated(self):
+        result = _run_add_tasks(
+            num_tasks=1, batch_size=3, parallel_batches=2, tg_task_count=7
+        )
+        assert len(result["wr_data"][TASK_GROUPS][0][TASKS]) == 1
+
+    def test_multiple_tasks_are_not_expanded(self):
+        result = _run_add_tasks(
+            num_tasks=2, batch_size=3, parallel_batches=1, tg_task_count=7
+        )
+        assert result["generate_calls"] == [(0, 2)]
+
+
+class TestTaskGroupSubstitutions:
+    """
+    Task Group substitutions are passed to each batch, not set globally.
+    """
+
+    def test_substitutions_scoped_to_batches(self):
+        config_wr_mock = MagicMock()
+        config_wr_mock.task_count = None
+        with (
+            patch.object(submit_module, "CONFIG_WR", config_wr_mock),
+            patch.object(var_module, "VARIABLE_SUBSTITUTIONS", {}) as substitutions,
+            patch.object(
+                CLIParser, "dry_run", new_callable=PropertyMock, return_value=False
+            ),
+        ):
+            batches = submit_module.prepare_task_group_batches(
+                tg_number=0,
+                task_group=_make_tg("grp"),
+                wr_data=_make_wr_data(3),
+                task_count=None,
+            )
+            assert substitutions == {}
+        assert batches.generation_kwargs["task_group_substitutions"] == {
+            su.L_TASK_COUNT: "3",
+            su.L_TASK_GROUP_NAME: "grp",
+            su.L_TASK_GROUP_NUMBER: "1",
+            su.L_TASK_GROUP_COUNT: "1",
+        }
+
+
+# ---------------------------------------------------------------------------
+# Parallel path: backpressure
+# ---------------------------------------------------------------------------
+
+
+class TestParallelBatchingBackpressure:
+    """
+    Generated batches awaiting submission are bounded, and generation stops
+    once a submission has failed.
+    """
+
+    def test_batches_in_flight_are_bounded(self):
+        # 2 workers x 1 batch per thread → at most 2 generated batches pending
+        release = Event()
+        lock = Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def slow_submit(tasks_list, *args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            release.wait(timeout=0.05)
+            with lock:
+                in_flight[0] -= 1
+            return len(tasks_list)
+
+        with patch.object(submit_module, "TASK_BATCHES_IN_FLIGHT_PER_THREAD", 1):
+            result = _run_add_tasks(
+                num_tasks=30,
+                batch_size=3,
+                parallel_batches=2,
+                submit_side_effect=slow_submit,
+            )
+        assert len(result["generate_calls"]) == 10
+        assert max_in_flight[0] <= 2
+
+    def test_generation_stops_after_failed_submission(self):
+        # 100 batches; generation stops soon after the first failure
+        submit_count = [0]
+        lock = Lock()
+
+        def failing_submit(tasks_list, *args, **kwargs):
+            with lock:
+                submit_count[0] += 1
+            raise RuntimeError("Submission failed")
+
+        with (
+            patch.object(submit_module, "TASK_BATCHES_IN_FLIGHT_PER_THREAD", 1),
+            pytest.raises(RuntimeError, match="Submission failed"),
+        ):
+            _run_add_tasks(
+                num_tasks=300,
+                batch_size=3,
+                parallel_batches=2,
+                submit_side_effect=failing_submit,
+            )
+        assert submit_count[0] < 10
+
+
+# ---------------------------------------------------------------------------
+# Task batch generation
+# ---------------------------------------------------------------------------
+
+
+def _generate_batches(
+    num_tasks: int, batch_size: int, generation_processes: int
+) -> list[list]:
+    def fake_generate(start, end, *args, **kwargs):
+        # Must be picklable for return from a generation process
+        return list(range(start, end))
+
+    with (
+        patch.object(submit_module, "TASK_BATCH_SIZE", batch_size),
+        patch.object(
+            submit_module,
+            "generate_batch_of_tasks_for_task_group",
+            side_effect=fake_generate,
+        ),
+    ):
+        return list(
+            submit_module.generate_task_batches(
+                -(-num_tasks // batch_size),
+                num_tasks,
+                generation_processes,
+                (),
+                {},
+            )
+        )
+
+
+class TestGenerateTaskBatches:
+    def test_in_process_batches_are_in_order(self):
+        assert _generate_batches(num_tasks=7, batch_size=3, generation_processes=1) == [
+            [0, 1, 2],
+            [3, 4, 5],
+            [6],
+        ]
+
+    @pytest.mark.skipif(
+        "fork" not in get_all_start_methods(), reason="Requires 'fork' start method"
+    )
+    def test_generation_processes_yield_batches_in_order(self):
+        assert _generate_batches(
+            num_tasks=50, batch_size=3, generation_processes=3
+        ) == [list(range(start, min(start + 3, 50))) for start in range(0, 50, 3)]
+
+    @pytest.mark.skipif(
+        "fork" not in get_all_start_methods(), reason="Requires 'fork' start method"
+    )
+    def test_generation_processes_share_uploads(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        mock_rclone = MagicMock()
+        mock_rclone.list_json.return_value = []
+        mock_rclone.copy_file.return_value = MagicMock(returncode=0, stderr="")
+        rclone_uploaded_files = su.RcloneUploadedFiles(str(tmp_path))
+
+        def fake_generate(start, end, *args, **kwargs):
+            rclone_uploaded_files.upload_dataclient_input_files(
+                [{"localPath": "a.txt", "uploadPath": "r:bucket/a.txt"}]
+            )
+            return list(range(start, end))
+
+        with (
+            patch.object(su, "get_rclone_backend", return_value=mock_rclone),
+            patch.object(su, "print_info"),
+            patch.object(submit_module, "RCLONE_UPLOADED_FILES", rclone_uploaded_files),
+            patch.object(submit_module, "TASK_BATCH_SIZE", 2),
+            patch.object(
+                submit_module,
+                "generate_batch_of_tasks_for_task_group",
+                side_effect=fake_generate,
+            ),
+        ):
+            batches = list(submit_module.generate_task_batches(6, 12, 3, (), {}))
+            uploaded_files = rclone_uploaded_files.uploaded_files
+
+        assert len(batches) == 6
+        # Uploaded once, by this process, rather than by each generation process
+        mock_rclone.copy_file.assert_called_once()
+        assert [uploaded_file.local_file_path for uploaded_file in uploaded_files] == [
+            "a.txt"
+        ]
+
+
+class TestGetTaskGenerationProcesses:
+    @staticmethod
+    def _get(config_value, cli_value, start_methods=("fork", "spawn")):
+        config_wr_mock = MagicMock()
+        config_wr_mock.generation_processes = config_value
+        with (
+            patch.object(submit_module, "CONFIG_WR", config_wr_mock),
+            patch.object(
+                submit_module,
+                "get_all_start_methods",
+                return_value=list(start_methods),
+            ),
+            patch.object(
+                CLIParser,
+                "generation_processes",
+                new_callable=PropertyMock,
+                return_value=cli_value,
+            ),
+        ):
+            return submit_module.get_task_generation_processes()
+
+    def test_default_is_one(self):
+        assert self._get(None, None) == 1
+
+    def test_config_value_used(self):
+        assert self._get(4, None) == 4
+
+    def test_cli_overrides_config(self):
+        assert self._get(4, 2) == 2
+
+    def test_less_than_one_raises(self):
+        with pytest.raises(ValueError):
+            self._get(0, None)
+
+    def test_falls_back_to_one_without_fork(self):
+        assert self._get(4, None, start_methods=("spawn",)) == 1
+
+
+class TestGetParallelBatches:
+    @staticmethod
+    def _get(config_value, cli_value, adaptive=False):
+        config_wr_mock = MagicMock()
+        config_wr_mock.parallel_batches = config_value
+        config_wr_mock.adaptive_batching = adaptive
+        with (
+            patch.object(submit_module, "CONFIG_WR", config_wr_mock),
+            patch.object(
+                CLIParser,
+                "parallel_batches",
+                new_callable=PropertyMock,
+                return_value=cli_value,
+            ),
+            patch.object(
+                CLIParser,
+                "adaptive_batching",
+                new_callable=PropertyMock,
+                return_value=False,
+            ),
+        ):
+            return submit_module.get_parallel_batches()
+
+    def test_default(self):
+        assert self._get(None, None) == DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS
+
+    def test_adaptive_default(self):
+        assert self._get(None, None, adaptive=True) == ADAPTIVE_DEFAULT_PARALLEL_BATCHES
+
+    def test_cli_overrides_config(self):
+        assert self._get(4, 2, adaptive=True) == 2
+        assert self._get(4, None) == 4
+
+
+class TestAdaptiveBatchSubmission:
+    def test_batch_submitted_in_sub_batches(self):
+        adaptive_batching = AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=1)
+        adaptive_batching.batch_size = 4
+        tasks = [Task(name=f"task_{i}", taskType="bash") for i in range(10)]
+        with (
+            patch.object(
+                submit_module,
+                "CONFIG_WR",
+                ConfigWorkRequirement(compress_task_batches=False),
+            ),
+            patch.object(
+                submit_module.CLIENT.work_client, "add_tasks_to_task_group_by_name"
+            ) as mock_add,
+            patch.object(
+                CLIParser, "dry_run", new_callable=PropertyMock, return_value=False
+            ),
+        ):
+            assert (
+                submit_module.submit_batch_of_tasks_to_task_group(
+                    tasks,
+                    _make_wr(),
+                    _make_tg(),
+                    1,
+                    0,
+                    10,
+                    10,
+                    adaptive_batching=adaptive_batching,
+                )
+                == 10
+            )
+
+        submitted = [call.args[3] for call in mock_add.call_args_list]
+        assert [task for batch in submitted for task in batch] == tasks
+        assert len(submitted[0]) == 4
+        assert adaptive_batching.num_tasks == 10
+
+    @pytest.mark.parametrize("status_code, throttled", [(503, 1), (400, 0)])
+    def test_sdk_failure_throttled_by_status(self, status_code, throttled):
+        adaptive_batching = AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=1)
+        tasks = [Task(name=f"task_{i}", taskType="bash") for i in range(3)]
+        error = HTTPError(response=MagicMock(status_code=status_code))
+        with (
+            patch.object(
+                submit_module,
+                "CONFIG_WR",
+                ConfigWorkRequirement(compress_task_batches=False),
+            ),
+            patch.object(
+                submit_module.CLIENT.work_client,
+                "add_tasks_to_task_group_by_name",
+                side_effect=[error, None],
+            ),
+            patch.object(submit_module, "sleep"),
+            patch.object(submit_module, "print_warning"),
+            patch.object(
+                CLIParser, "dry_run", new_callable=PropertyMock, return_value=False
+            ),
+        ):
+            submit_module.submit_batch_of_tasks_to_task_group(
+                tasks,
+                _make_wr(),
+                _make_tg(),
+                1,
+                0,
+                3,
+                3,
+                adaptive_batching=adaptive_batching,
+            )
+
+        assert adaptive_batching.num_failed == 1
+        assert adaptive_batching.num_throttled == throttled
+        assert adaptive_batching.num_tasks == 3
+
+
+class TestCompressedBatchSubmission:
+    @staticmethod
+    def _submit(tasks: list[Task], max_bytes: int) -> MagicMock:
+        session = MagicMock()
+        session.post.return_value = MagicMock(status_code=200, text="")
+        with (
+            patch.object(submit_module, "CONFIG_WR", ConfigWorkRequirement()),
+            patch.object(submit_module, "TASK_BATCH_MAX_BYTES", max_bytes),
+            patch.object(submit_module, "get_rest_session", return_value=session),
+            patch.object(
+                CLIParser, "dry_run", new_callable=PropertyMock, return_value=False
+            ),
+        ):
+            assert submit_module.submit_batch_of_tasks_to_task_group(
+                tasks, _make_wr(), _make_tg(), 1, 0, len(tasks), len(tasks)
+            ) == len(tasks)
+        return session
+
+    @staticmethod
+    def _posted(session: MagicMock) -> list[list[dict]]:
+        return [
+            json.loads(gzip.decompress(call.kwargs["data"]))
+            for call in session.post.call_args_list
+        ]
+
+    def test_batch_posted_gzipped(self):
+        tasks = [Task(name=f"task_{i}", taskType="bash") for i in range(3)]
+        session = self._submit(tasks, max_bytes=1_000_000)
+        assert session.post.call_count == 1
+        assert session.post.call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert [task["name"] for task in self._posted(session)[0]] == [
+            "task_0",
+            "task_1",
+            "task_2",
+        ]
+
+    def test_batch_split_by_payload_size(self):
+        tasks = [
+            Task(name=f"task_{i}", taskType="bash", taskData="x" * 100)
+            for i in range(5)
+        ]
+        session = self._submit(tasks, max_bytes=300)
+        posted = self._posted(session)
+        assert len(posted) > 1
+        assert all(
+            len(gzip.decompress(call.kwargs["data"])) <= 300
+            for call in session.post.call_args_list
+        )
+        assert [task["name"] for batch in posted for task in batch] == [
+            f"task_{i}" for i in range(5)
+        ]
+
+    def test_uncompressed_batch_submitted_whole_without_serializing(self):
+        tasks = [
+            Task(name=f"task_{i}", taskType="bash", taskData="x" * 100)
+            for i in range(5)
+        ]
+        with (
+            patch.object(
+                submit_module,
+                "CONFIG_WR",
+                ConfigWorkRequirement(compress_task_batches=False),
+            ),
+            patch.object(submit_module, "TASK_BATCH_MAX_BYTES", 300),
+            patch.object(submit_module, "json_dumps") as mock_json_dumps,
+            patch.object(
+                submit_module.CLIENT.work_client, "add_tasks_to_task_group_by_name"
+            ) as mock_add,
+            patch.object(
+                CLIParser, "dry_run", new_callable=PropertyMock, return_value=False
+            ),
+        ):
+            assert (
+                submit_module.submit_batch_of_tasks_to_task_group(
+                    tasks, _make_wr(), _make_tg(), 1, 0, 5, 5
+                )
+                == 5
+            )
+        mock_json_dumps.assert_not_called()
+        mock_add.assert_called_once()
+        assert mock_add.call_args.args[3] == tasks
+
+
+class TestSharedTaskDataInputs:
+    """
+    Data Client inputs are shared by the Tasks expanded using 'taskCount',
+    so each Task's upload properties must be removed from a copy.
+    """
+
+    def test_local_path_not_removed_from_shared_inputs(self):
+        task_data_input = {
+            "source": "S3:bucket/input.dat",
+            "destination": "input.dat",
+            "localPath": "input.dat",
+        }
+        tasks = [{"taskType": "bash", "taskDataInputs": [task_data_input]}]
+        wr_data = {TASK_GROUPS: [{TASKS: tasks}]}
+        received = []
+
+        def upload(task_data_inputs):
+            received.append(dict(task_data_inputs[0]))
+            task_data_inputs[0].pop("localPath")
+            return []
+
+        uploaded_files = MagicMock()
+        uploaded_files.upload_dataclient_input_files.side_effect = upload
+        with (
+            patch.object(submit_module, "CONFIG_WR", ConfigWorkRequirement()),
+            patch.object(submit_module, "CONFIG_COMMON", MagicMock()),
+            patch.object(submit_module, "RCLONE_UPLOADED_FILES", uploaded_files),
+        ):
+            tasks_list = submit_module.generate_batch_of_tasks_for_task_group(
+                0, 3, wr_data, "", _make_tg(), 0, tasks, 3, 3, 1
+            )
+
+        assert len(tasks_list) == 3
+        assert [task_input.get("localPath") for task_input in received] == [
+            "input.dat"
+        ] * 3
+        assert task_data_input["localPath"] == "input.dat"
@@ -386,8 +386,9 @@ def _run_submit_wr(
         patch.object(submit_module, "add_substitutions_without_overwriting"),
         patch.object(submit_module, "create_task_group", side_effect=fake_create_tg),
         patch.object(
-            submit_module, "add_tasks_to_task_group", side_effect=fake_add_tasks
+            submit_module, "prepare_task_group_batches", side_effect=fake_add_tasks
         ),
+        patch.object(submit_module, "add_tasks_to_task_groups"),
         patch.object(
             submit_module.CLIENT.work_client,
             "add_work_requirement",
@@ -552,7 +553,7 @@ class TestSubmitWRCleanupOnFailure:
             ),
             patch.object(
                 submit_module,
-                "add_tasks_to_task_group",
+                "add_tasks_to_task_groups",
                 side_effect=RuntimeError("upload failed"),
             ),
             patch.object(
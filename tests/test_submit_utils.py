@@ -4,7 +4,12 @@ Unit tests for the functions moved from submit.py to submit_utils.py:
   get_task_data_property, create_task
 """
 
+import gzip
+import hashlib
+import json
+import os
 from datetime import timedelta
+from threading import Barrier
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -452,19 +457,47 @@ class TestCreateTask:
 
 class TestUploadRcloneFileCore:
     """
-    Tests for the skip-if-exists / overwrite behaviour in _upload_rclone_file_core.
+    Tests for the skip-if-unchanged / overwrite behaviour in
+    _upload_rclone_file_core.
 
     The method is patched at three points:
       - _parse_rclone_connection_string → returns a fixed (remote, None, path) tuple
-      - make_rclone → returns a mock rclone client
+      - get_rclone_backend → returns a mock rclone backend
       - ARGS_PARSER.overwrite → controls whether --overwrite was passed
     """
 
     _CONN_STR = "rclone:myremote:/bucket/file.txt"
     _PARSED = ("myremote", None, "bucket/file.txt")
     _REMOTE_DEST = "myremote:bucket/file.txt"
-
-    def _run(self, *, remote_exists: bool, overwrite: bool) -> MagicMock:
+    _CONTENT = b"file contents"
+    _OTHER_MD5 = "a1d54b6bed6b1e8c5f8c8e6c0b7a5b7e"
+
+    @pytest.fixture(autouse=True)
+    def local_file(self, tmp_path):
+        local_file = tmp_path / "file.txt"
+        local_file.write_bytes(self._CONTENT)
+        self._files_directory = str(tmp_path)
+        return local_file
+
+    def _remote_entry(self, md5: str | None = None) -> dict:
+        return {
+            "Name": "file.txt",
+            "Size": len(self._CONTENT),
+            "ModTime": "2000-01-01T00:00:00Z",
+            "IsDir": False,
+            "Hashes": {"md5": md5 or hashlib.md5(self._CONTENT).hexdigest()},
+        }
+
+    def _run(
+        self,
+        *,
+        remote_exists: bool,
+        overwrite: bool,
+        remote_entry: dict | None = None,
+        returncode: int = 0,
+        manifest_filename: str | None = None,
+        parsed: tuple = _PARSED,
+    ) -> MagicMock:
         """
         Run _upload_rclone_file_core with the given remote-exists / overwrite
         state. Returns the mock rclone instance so callers can inspect calls.
@@ -474,82 +507,500 @@ class TestUploadRcloneFileCore:
             upload_file_path=self._CONN_STR,
         )
         mock_rclone = MagicMock()
-        mock_rclone.exists.return_value = remote_exists
-        mock_rclone.copy_to.return_value = MagicMock(returncode=0, stderr="")
+        mock_rclone.list_json.return_value = (
+            [remote_entry or self._remote_entry()] if remote_exists else []
+        )
+        mock_rclone.copy_file.return_value = MagicMock(
+            returncode=returncode, stderr="connection refused"
+        )
 
-        instance = su.RcloneUploadedFiles()
+        instance = su.RcloneUploadedFiles(
+            self._files_directory, manifest_filename=manifest_filename
+        )
 
         with (
             patch.object(
                 su.RcloneUploadedFiles,
                 "_parse_rclone_connection_string",
-                return_value=self._PARSED,
+                return_value=parsed,
             ),
-            patch.object(su, "make_rclone", return_value=mock_rclone),
+            patch.object(su, "get_rclone_backend", return_value=mock_rclone),
             patch.object(
                 su.ARGS_PARSER.__class__,
                 "overwrite",
                 new_callable=lambda: property(lambda self: overwrite),
             ),
-            patch("yellowdog_cli.utils.submit_utils.Path") as mock_path,
+            patch.object(su, "print_info"),
         ):
-            mock_path.return_value.resolve.return_value = "/resolved/file.txt"
             instance._upload_rclone_file_core(uploaded_file)
 
         return mock_rclone
 
     def test_file_exists_no_overwrite_skips_upload(self):
         mock_rclone = self._run(remote_exists=True, overwrite=False)
-        mock_rclone.copy_to.assert_not_called()
+        mock_rclone.copy_file.assert_not_called()
 
     def test_file_exists_with_overwrite_uploads(self):
         mock_rclone = self._run(remote_exists=True, overwrite=True)
-        mock_rclone.copy_to.assert_called_once()
+        mock_rclone.copy_file.assert_called_once()
 
-    def test_file_absent_no_overwrite_uploads(self):
+    def test_file_absent_no_overwrite_uploads(self, local_file):
         mock_rclone = self._run(remote_exists=False, overwrite=False)
-        mock_rclone.copy_to.assert_called_once()
+        mock_rclone.copy_file.assert_called_once_with(
+            src=str(local_file.resolve()), dst=self._REMOTE_DEST
+        )
 
     def test_file_absent_with_overwrite_uploads(self):
         mock_rclone = self._run(remote_exists=False, overwrite=True)
-        mock_rclone.copy_to.assert_called_once()
+        mock_rclone.copy_file.assert_called_once()
 
     def test_file_exists_no_overwrite_existence_check_uses_correct_dest(self):
         mock_rclone = self._run(remote_exists=True, overwrite=False)
-        mock_rclone.exists.assert_called_once_with(self._REMOTE_DEST)
+        mock_rclone.list_json.assert_called_once_with(
+            "myremote:bucket", files_only=True, hashes=True
+        )
 
     def test_file_exists_with_overwrite_skips_existence_check(self):
         # When --overwrite is set we don't need to check existence at all
         mock_rclone = self._run(remote_exists=True, overwrite=True)
-        mock_rclone.exists.assert_not_called()
+        mock_rclone.list_json.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "remote_path, directory",
+        [("/data/in/file.txt", "myremote:/data/in"), ("/file.txt", "myremote:/")],
+    )
+    def test_absolute_remote_path_lists_absolute_directory(
+        self, remote_path, directory
+    ):
+        mock_rclone = self._run(
+            remote_exists=True,
+            overwrite=False,
+            parsed=("myremote", None, remote_path),
+        )
+        mock_rclone.list_json.assert_called_once_with(
+            directory, files_only=True, hashes=True
+        )
+        mock_rclone.copy_file.assert_not_called()
+
+    def test_overwrite_does_not_hash(self, tmp_path):
+        with patch.object(su, "local_file_entry") as mock_local_file_entry:
+            mock_rclone = self._run(
+                remote_exists=True,
+                overwrite=True,
+                manifest_filename=str(tmp_path / "manifest.sqlite3"),
+            )
+        mock_local_file_entry.assert_not_called()
+        mock_rclone.copy_file.assert_called_once()
+        assert not (tmp_path / "manifest.sqlite3").exists()
+
+    def test_changed_file_uploaded(self):
+        mock_rclone = self._run(
+            remote_exists=True,
+            overwrite=False,
+            remote_entry=self._remote_entry(md5=self._OTHER_MD5),
+        )
+        mock_rclone.copy_file.assert_called_once()
 
-    def test_upload_failure_raises_runtime_error(self):
-        uploaded_file = su.RcloneUploadedFile(
-            local_file_path="file.txt",
-            upload_file_path=self._CONN_STR,
+    def test_changed_size_uploaded(self):
+        remote_entry = self._remote_entry()
+        remote_entry["Size"] += 1
+        mock_rclone = self._run(
+            remote_exists=True, overwrite=False, remote_entry=remote_entry
         )
-        mock_rclone = MagicMock()
-        mock_rclone.exists.return_value = False
-        mock_rclone.copy_to.return_value = MagicMock(
-            returncode=1, stderr="connection refused"
+        mock_rclone.copy_file.assert_called_once()
+
+    def test_hashless_remote_compares_mod_time(self, local_file):
+        remote_entry = self._remote_entry()
+        del remote_entry["Hashes"]
+        mock_rclone = self._run(
+            remote_exists=True, overwrite=False, remote_entry=remote_entry
         )
+        mock_rclone.copy_file.assert_called_once()
 
-        instance = su.RcloneUploadedFiles()
+        os.utime(local_file, (946684800, 946684800))  # 2000-01-01T00:00:00Z
+        mock_rclone = self._run(
+            remote_exists=True, overwrite=False, remote_entry=remote_entry
+        )
+        mock_rclone.copy_file.assert_not_called()
+
+    def test_hashless_remote_uses_manifest(self, tmp_path):
+        remote_entry = self._remote_entry()
+        del remote_entry["Hashes"]
+        manifest_filename = str(tmp_path / "manifest.sqlite3")
+        mock_rclone = self._run(
+            remote_exists=False,
+            overwrite=False,
+            manifest_filename=manifest_filename,
+        )
+        mock_rclone.copy_file.assert_called_once()
+        # The remote copy's modification time differs, but it was uploaded
+        # from the unchanged local file
+        mock_rclone = self._run(
+            remote_exists=True,
+            overwrite=False,
+            remote_entry=remote_entry,
+            manifest_filename=manifest_filename,
+        )
+        mock_rclone.copy_file.assert_not_called()
+
+    def test_upload_failure_raises_runtime_error(self):
+        with pytest.raises(RuntimeError, match="Upload failed"):
+            self._run(remote_exists=False, overwrite=False, returncode=1)
 
+
+# ---------------------------------------------------------------------------
+# RcloneUploadedFiles — concurrent, deduplicated upload stage
+# ---------------------------------------------------------------------------
+
+
+class TestRcloneUploadStage:
+    """
+    Uploads started by upload_dataclient_input_files() run in a thread pool
+    and are awaited with wait_for_uploads().
+    """
+
+    @pytest.fixture
+    def uploads(self, tmp_path):
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_text(name)
+        mock_rclone = MagicMock()
+        # An unchanged copy of 'a.txt'
+        mock_rclone.list_json.return_value = [
+            {
+                "Name": "existing.txt",
+                "Size": 5,
+                "Hashes": {"md5": hashlib.md5(b"a.txt").hexdigest()},
+            }
+        ]
+        mock_rclone.copy_file.return_value = MagicMock(returncode=0, stderr="")
         with (
-            patch.object(
-                su.RcloneUploadedFiles,
-                "_parse_rclone_connection_string",
-                return_value=self._PARSED,
-            ),
-            patch.object(su, "make_rclone", return_value=mock_rclone),
-            patch.object(
-                su.ARGS_PARSER.__class__,
-                "overwrite",
-                new_callable=lambda: property(lambda self: False),
-            ),
-            patch("yellowdog_cli.utils.submit_utils.Path") as mock_path,
-            pytest.raises(RuntimeError, match="Upload failed"),
+            patch.object(su, "get_rclone_backend", return_value=mock_rclone),
+            patch.object(su, "print_info"),
         ):
-            mock_path.return_value.resolve.return_value = "/resolved/file.txt"
-            instance._upload_rclone_file_core(uploaded_file)
+            yield su.RcloneUploadedFiles(str(tmp_path), upload_threads=4), mock_rclone
+
+    @staticmethod
+    def _inputs(*local_and_upload_paths: tuple[str, str]) -> list[dict]:
+        return [
+            {"localPath": local_file, "uploadPath": upload_path, "source": "src"}
+            for local_file, upload_path in local_and_upload_paths
+        ]
+
+    def test_duplicates_uploaded_once(self, uploads):
+        uploaded_files, mock_rclone = uploads
+        required = []
+        for _ in range(3):
+            required += uploaded_files.upload_dataclient_input_files(
+                self._inputs(("a.txt", "r:bucket/a.txt"), ("b.txt", "r:bucket/b.txt"))
+            )
+        uploaded_files.wait_for_uploads(required)
+        assert len(required) == 6
+        assert mock_rclone.copy_file.call_count == 2
+        assert len(uploaded_files.uploaded_files) == 2
+
+    def test_inputs_stripped_of_upload_properties(self, uploads):
+        uploaded_files, _ = uploads
+        inputs = self._inputs(("a.txt", "r:bucket/a.txt"))
+        uploaded_files.wait_for_uploads(
+            uploaded_files.upload_dataclient_input_files(inputs)
+        )
+        assert inputs == [{"source": "src"}]
+
+    def test_destination_directory_listed_once(self, uploads):
+        uploaded_files, mock_rclone = uploads
+        uploaded_files.wait_for_uploads(
+            uploaded_files.upload_dataclient_input_files(
+                self._inputs(
+                    ("a.txt", "r:bucket/dir/a.txt"),
+                    ("b.txt", "r:bucket/dir/b.txt"),
+                    ("a.txt", "r:bucket/dir/existing.txt"),
+                )
+            )
+        )
+        mock_rclone.list_json.assert_called_once_with(
+            "r:bucket/dir", files_only=True, hashes=True
+        )
+        assert sorted(
+            call.kwargs["dst"] for call in mock_rclone.copy_file.call_args_list
+        ) == ["r:bucket/dir/a.txt", "r:bucket/dir/b.txt"]
+
+    def test_uploads_concurrent(self, uploads):
+        uploaded_files, mock_rclone = uploads
+        barrier = Barrier(2, timeout=5)
+
+        def copy_file(src: str, dst: str):
+            # Both uploads must be in progress at once to pass the barrier
+            barrier.wait()
+            return MagicMock(returncode=0, stderr="")
+
+        mock_rclone.copy_file.side_effect = copy_file
+        uploaded_files.wait_for_uploads(
+            uploaded_files.upload_dataclient_input_files(
+                self._inputs(("a.txt", "r:bucket/a.txt"), ("b.txt", "r:bucket/b.txt"))
+            )
+        )
+        assert mock_rclone.copy_file.call_count == 2
+
+    def test_upload_failure_raised_on_wait(self, uploads):
+        uploaded_files, mock_rclone = uploads
+        mock_rclone.copy_file.return_value = MagicMock(returncode=1, stderr="denied")
+        required = uploaded_files.upload_dataclient_input_files(
+            self._inputs(("a.txt", "r:bucket/a.txt"))
+        )
+        with pytest.raises(RuntimeError, match=r"Unable to upload 'a.txt'.*denied"):
+            uploaded_files.wait_for_uploads(required)
+
+    def test_deferred_uploads_started_once(self, uploads, tmp_path):
+        uploaded_files, mock_rclone = uploads
+        generation_process = su.RcloneUploadedFiles(str(tmp_path))
+        generation_process.defer_uploads()
+        required = generation_process.upload_dataclient_input_files(
+            self._inputs(("a.txt", "r:bucket/a.txt"), ("b.txt", "r:bucket/b.txt"))
+        )
+        generation_process.wait_for_uploads(required)
+        assert generation_process.uploaded_files == required
+        for _ in range(2):
+            uploaded_files.start_uploads(generation_process.uploaded_files)
+        uploaded_files.wait_for_uploads(required)
+        assert mock_rclone.copy_file.call_count == 2
+        assert uploaded_files.uploaded_files == required
+
+    def test_missing_local_file_raised_immediately(self, uploads):
+        uploaded_files, mock_rclone = uploads
+        with pytest.raises(FileNotFoundError):
+            uploaded_files.upload_dataclient_input_files(
+                self._inputs(("missing.txt", "r:bucket/missing.txt"))
+            )
+        mock_rclone.copy_file.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# interleave_task_batches
+# ---------------------------------------------------------------------------
+
+
+class TestInterleaveTaskBatches:
+    def test_round_robin(self):
+        result = list(su.interleave_task_batches([[1, 2, 3], [4], [5, 6]], 3))
+        assert result == [1, 4, 5, 2, 6, 3]
+
+    def test_window_limits_rotation(self):
+        result = list(su.interleave_task_batches([[1, 2], [3, 4], [5, 6]], 2))
+        assert result == [1, 3, 2, 4, 5, 6]
+
+    def test_empty_iterables(self):
+        assert list(su.interleave_task_batches([[], [1], []], 1)) == [1]
+        assert list(su.interleave_task_batches([], 4)) == []
+
+
+# ---------------------------------------------------------------------------
+# split_by_payload_size / compress_json_array
+# ---------------------------------------------------------------------------
+
+
+class TestSplitByPayloadSize:
+    def test_all_within_limit(self):
+        assert list(su.split_by_payload_size([10, 10, 10], 100)) == [(0, 3)]
+
+    def test_split_includes_brackets_and_commas(self):
+        # [a,b] = 2 + 10 + 1 + 10 = 23 bytes
+        assert list(su.split_by_payload_size([10, 10, 10], 23)) == [(0, 2), (2, 3)]
+        assert list(su.split_by_payload_size([10, 10, 10], 22)) == [
+            (0, 1),
+            (1, 2),
+            (2, 3),
+        ]
+
+    def test_oversized_item_alone(self):
+        assert list(su.split_by_payload_size([5, 500, 5], 100)) == [
+            (0, 1),
+            (1, 2),
+            (2, 3),
+        ]
+
+    def test_empty(self):
+        assert list(su.split_by_payload_size([], 100)) == []
+
+    def test_compress_json_array(self):
+        compressed = su.compress_json_array([b'{"a": 1}', b'{"b": 2}'])
+        assert json.loads(gzip.decompress(compressed)) == [{"a": 1}, {"b": 2}]
+
+
+# ---------------------------------------------------------------------------
+# AdaptiveTaskBatching
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveTaskBatching:
+    @staticmethod
+    def _submit(
+        batching: su.AdaptiveTaskBatching,
+        latency: float = 1.0,
+        failed: bool = False,
+        throttled: bool = False,
+    ):
+        times = iter([0.0, 0.0, latency])
+        with patch.object(su, "monotonic", side_effect=lambda: next(times)):
+            with batching.submission(100, payload_bytes=1000) as submission:
+                submission.failed = failed
+                submission.throttled = throttled
+
+    def test_initial_state(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=8)
+        assert batching.batch_size == su.ADAPTIVE_TASK_BATCH_SIZE_INITIAL
+        assert batching.concurrency_limit == 1
+        small = su.AdaptiveTaskBatching(max_batch_size=5, max_concurrency=8)
+        assert small.batch_size == 5
+
+    def test_success_increases_additively_to_limits(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=3)
+        self._submit(batching)
+        assert batching.batch_size == (
+            su.ADAPTIVE_TASK_BATCH_SIZE_INITIAL + su.ADAPTIVE_TASK_BATCH_SIZE_INCREMENT
+        )
+        assert batching.concurrency_limit == 2
+        for _ in range(50):
+            self._submit(batching)
+        assert batching.batch_size == 1000
+        assert batching.concurrency_limit == 3
+        assert batching.num_tasks == 5100
+        assert batching.payload_bytes == 51000
+
+    def test_failure_decreases_multiplicatively(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=8)
+        batching.batch_size = 800
+        batching.concurrency = 8.0
+        self._submit(batching, throttled=True)
+        assert batching.batch_size == 400
+        assert batching.concurrency_limit == 4
+        assert (batching.num_failed, batching.num_throttled) == (1, 1)
+        assert batching.num_tasks == 0
+
+    def test_slow_submission_decreases_batch_size_only(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=8)
+        batching.batch_size = 800
+        batching.concurrency = 4.0
+        self._submit(batching, latency=su.ADAPTIVE_TARGET_BATCH_LATENCY + 1)
+        assert batching.batch_size == 400
+        assert batching.concurrency_limit == 4
+
+    def test_decrease_at_most_once_per_round(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=8)
+        batching.batch_size = 800
+        batching.concurrency = 8.0
+        batching._last_decrease = 5.0  # Submissions below started at 0.0
+        self._submit(batching, failed=True)
+        assert batching.batch_size == 800
+        assert batching.concurrency_limit == 8
+
+    def test_batch_size_not_below_minimum(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=1)
+        for _ in range(20):
+            self._submit(batching, failed=True)
+            batching._last_decrease = 0.0
+        assert batching.batch_size == su.ADAPTIVE_TASK_BATCH_SIZE_MIN
+        assert batching.concurrency_limit == 1
+
+    def test_exception_recorded_as_failure(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=1)
+        with pytest.raises(RuntimeError):
+            with batching.submission(10):
+                raise RuntimeError("failed")
+        assert batching.num_failed == 1
+
+    def test_split(self):
+        batching = su.AdaptiveTaskBatching(max_batch_size=1000, max_concurrency=1)
+        batching.batch_size = 3
+        assert list(batching.split(list(range(7)))) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+# ---------------------------------------------------------------------------
+# TaskBatchCheckpoint
+# ---------------------------------------------------------------------------
+
+
+class TestTaskBatchCheckpoint:
+    def test_new_file_is_empty(self, tmp_path):
+        checkpoint = su.TaskBatchCheckpoint(str(tmp_path / "cp.jsonl"))
+        assert checkpoint.work_requirement_id is None
+        assert not checkpoint.is_submitted("tg", 0)
+
+    @staticmethod
+    def _checkpoint(filename: str) -> su.TaskBatchCheckpoint:
+        checkpoint = su.TaskBatchCheckpoint(filename)
+        checkpoint.set_work_requirement(
+            "ydid:workreq:1", "my_wr", 1000, "hash", {"tg_a": 3000, "tg_b": 2000}
+        )
+        return checkpoint
+
+    def test_records_reloaded(self, tmp_path):
+        filename = str(tmp_path / "cp.jsonl")
+        checkpoint = self._checkpoint(filename)
+        checkpoint.record_batch("tg_a", 0)
+        checkpoint.record_batch("tg_a", 1)
+        checkpoint.record_batch("tg_b", 0)
+
+        reloaded = su.TaskBatchCheckpoint(filename)
+        assert reloaded.work_requirement_id == "ydid:workreq:1"
+        assert reloaded.work_requirement_name == "my_wr"
+        assert reloaded.task_batch_size == 1000
+        assert reloaded.input_hash == "hash"
+        assert reloaded.task_counts == {"tg_a": 3000, "tg_b": 2000}
+        assert reloaded.is_submitted("tg_a", 0)
+        assert reloaded.is_submitted("tg_a", 1)
+        assert not reloaded.is_submitted("tg_a", 2)
+        assert reloaded.is_submitted("tg_b", 0)
+
+    def test_batches_after_gap_not_recorded(self, tmp_path):
+        filename = str(tmp_path / "cp.jsonl")
+        checkpoint = self._checkpoint(filename)
+        checkpoint.record_batch("tg_a", 0)
+        checkpoint.record_batch("tg_a", 2)
+        assert not su.TaskBatchCheckpoint(filename).is_submitted("tg_a", 2)
+
+        checkpoint.record_batch("tg_a", 1)
+        reloaded = su.TaskBatchCheckpoint(filename)
+        assert [reloaded.is_submitted("tg_a", batch) for batch in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+
+    def test_recording_continues_after_resume(self, tmp_path):
+        filename = str(tmp_path / "cp.jsonl")
+        self._checkpoint(filename).record_batch("tg_a", 0)
+        resumed = su.TaskBatchCheckpoint(filename)
+        resumed.record_batch("tg_a", 1)
+        assert su.TaskBatchCheckpoint(filename).is_submitted("tg_a", 1)
+
+    def test_check_resume(self, tmp_path):
+        checkpoint = self._checkpoint(str(tmp_path / "cp.jsonl"))
+        checkpoint.check_resume(1000, "hash", {"tg_a": 3000, "tg_b": 2000})
+
+    @pytest.mark.parametrize(
+        "task_batch_size, input_hash, task_counts, message",
+        [
+            (500, "hash", {"tg_a": 3000, "tg_b": 2000}, "batch size"),
+            (1000, "other", {"tg_a": 3000, "tg_b": 2000}, "file has changed"),
+            (1000, "hash", {"tg_a": 3001, "tg_b": 2000}, "numbers of Tasks"),
+            (1000, "hash", {"tg_a": 3000}, "numbers of Tasks"),
+        ],
+    )
+    def test_check_resume_mismatch(
+        self, tmp_path, task_batch_size, input_hash, task_counts, message
+    ):
+        checkpoint = self._checkpoint(str(tmp_path / "cp.jsonl"))
+        with pytest.raises(ValueError, match=message):
+            checkpoint.check_resume(task_batch_size, input_hash, task_counts)
+
+    def test_incomplete_record_ignored(self, tmp_path):
+        filename = tmp_path / "cp.jsonl"
+        checkpoint = self._checkpoint(str(filename))
+        checkpoint.record_batch("tg", 0)
+        with open(filename, "a") as f:
+            f.write('{"taskGroup": "tg", "ba')  # Interrupted write
+
+        reloaded = su.TaskBatchCheckpoint(str(filename))
+        assert reloaded.is_submitted("tg", 0)
+        assert not reloaded.is_submitted("tg", 1)
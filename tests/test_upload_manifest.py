@@ -0,0 +1,147 @@
+"""
+Tests for the manifest of uploaded Data Client input files in
+yellowdog_cli.utils.upload_manifest.
+"""
+
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+
+import yellowdog_cli.utils.upload_manifest as manifest_module
+from yellowdog_cli.utils.upload_manifest import (
+    UploadManifest,
+    UploadManifestEntry,
+    file_md5,
+    get_upload_manifest_filename,
+    local_file_entry,
+    manifest_destination,
+    parse_mod_time,
+    remote_copy_is_unchanged,
+)
+
+CONTENT = b"input data"
+MD5 = hashlib.md5(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def local_file(tmp_path):
+    local_file = tmp_path / "input.dat"
+    local_file.write_bytes(CONTENT)
+    os.utime(local_file, ns=(1_700_000_000_500_000_000, 1_700_000_000_500_000_000))
+    return str(local_file)
+
+
+def _entry(**kwargs) -> UploadManifestEntry:
+    values = {
+        "local_path": "/data/input.dat",
+        "destination": "S3:bucket/input.dat",
+        "size": len(CONTENT),
+        "mtime_ns": 1_700_000_000_500_000_000,
+        "content_hash": MD5,
+        "remote_size": len(CONTENT),
+    }
+    return UploadManifestEntry(**{**values, **kwargs})
+
+
+class TestUploadManifest:
+    def test_round_trip(self, tmp_path):
+        filename = str(tmp_path / "yellowdog" / "upload-manifest.sqlite3")
+        entry = _entry(remote_hash=MD5)
+        UploadManifest(filename).put(entry)
+        manifest = UploadManifest(filename)
+        assert manifest.get(entry.local_path, entry.destination) == entry
+        assert manifest.get(entry.local_path, "S3:bucket/other.dat") is None
+
+    def test_replace(self, tmp_path):
+        manifest = UploadManifest(str(tmp_path / "manifest.sqlite3"))
+        manifest.put(_entry())
+        manifest.put(_entry(size=1, content_hash="0" * 32))
+        entry = manifest.get("/data/input.dat", "S3:bucket/input.dat")
+        assert entry is not None
+        assert (entry.size, entry.content_hash) == (1, "0" * 32)
+
+    def test_filename(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_upload_manifest_filename() == str(
+            tmp_path / "yellowdog" / "upload-manifest.sqlite3"
+        )
+
+
+class TestLocalFileEntry:
+    def test_hashed(self, local_file):
+        entry = local_file_entry(local_file, "S3:bucket/input.dat", None)
+        assert (entry.size, entry.content_hash) == (len(CONTENT), MD5)
+        assert entry.mtime_ns == 1_700_000_000_500_000_000
+        assert file_md5(local_file) == MD5
+
+    def test_unchanged_file_not_rehashed(self, local_file):
+        previous = _entry(local_path=local_file, content_hash="recorded")
+        with patch.object(manifest_module, "file_md5") as mock_md5:
+            entry = local_file_entry(local_file, previous.destination, previous)
+        mock_md5.assert_not_called()
+        assert entry.content_hash == "recorded"
+
+    def test_modified_file_rehashed(self, local_file):
+        previous = _entry(local_path=local_file, content_hash="recorded")
+        os.utime(local_file)
+        entry = local_file_entry(local_file, previous.destination, previous)
+        assert entry.content_hash == MD5
+
+
+class TestManifestDestination:
+    def test_configured_remote(self):
+        assert manifest_destination("S3", None, "bucket/a") == "S3:bucket/a"
+
+    def test_inline_config_hashed(self):
+        config = "[S3]\ntype = s3\nsecret_access_key = secret"
+        destination = manifest_destination("S3", config, "bucket/a")
+        assert destination.startswith("S3:bucket/a#")
+        assert "secret" not in destination
+        assert destination != manifest_destination("S3", config + "x", "bucket/a")
+
+
+class TestParseModTime:
+    @pytest.mark.parametrize(
+        "mod_time, expected",
+        [
+            ("2023-11-14T22:13:20Z", 1_700_000_000.0),
+            ("2023-11-14T22:13:20.5Z", 1_700_000_000.5),
+            ("2023-11-14T22:13:20.500000001Z", 1_700_000_000.500000001),
+            ("2023-11-15T00:13:20.25+02:00", 1_700_000_000.25),
+        ],
+    )
+    def test_valid(self, mod_time, expected):
+        assert parse_mod_time(mod_time) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("mod_time", ["", "yesterday", "2023-11-14"])
+    def test_invalid(self, mod_time):
+        assert parse_mod_time(mod_time) is None
+
+
+class TestRemoteCopyIsUnchanged:
+    def test_matching_hash(self):
+        remote_entry = {"Size": len(CONTENT), "Hashes": {"md5": MD5.upper()}}
+        assert remote_copy_is_unchanged(_entry(), remote_entry, None)
+
+    def test_different_hash(self):
+        remote_entry = {"Size": len(CONTENT), "Hashes": {"md5": "0" * 32}}
+        assert not remote_copy_is_unchanged(_entry(), remote_entry, _entry())
+
+    def test_different_size(self):
+        remote_entry = {"Size": 1, "Hashes": {"md5": MD5}}
+        assert not remote_copy_is_unchanged(_entry(), remote_entry, None)
+
+    def test_no_hash_previously_uploaded(self):
+        remote_entry = {"Size": len(CONTENT), "ModTime": "2026-01-01T00:00:00Z"}
+        assert remote_copy_is_unchanged(_entry(), remote_entry, _entry())
+        assert not remote_copy_is_unchanged(
+            _entry(), remote_entry, _entry(content_hash="0" * 32)
+        )
+
+    def test_no_hash_compares_mod_time(self):
+        remote_entry = {"Size": len(CONTENT), "ModTime": "2023-11-14T22:13:20.9Z"}
+        assert remote_copy_is_unchanged(_entry(), remote_entry, None)
+        remote_entry["ModTime"] = "2023-11-14T22:13:22Z"
+        assert not remote_copy_is_unchanged(_entry(), remote_entry, None)
@@ -4,9 +4,17 @@ Unit tests for yellowdog_cli.utils.validate_properties
 
 import pytest
 
+from yellowdog_cli.utils.csv_data import CSVTaskData, CSVTaskList
 from yellowdog_cli.utils.validate_properties import validate_properties
 
 
+@pytest.fixture()
+def csv_data(tmp_path):
+    csv_file = tmp_path / "tasks.csv"
+    csv_file.write_text("arg\na\nb\n")
+    return CSVTaskData(str(csv_file))
+
+
 class TestValidProperties:
     """
     Valid property dicts should pass without raising.
@@ -33,6 +41,10 @@ class TestValidProperties:
             {"tasks": [{"taskType": "bash", "arguments": ["--flag"]}]}, "ctx"
         )
 
+    def test_valid_csv_task_list(self, csv_data):
+        tasks = CSVTaskList(csv_data, {"arguments": ["<<arg>>"]})
+        validate_properties({"taskGroups": [{"tasks": tasks}]}, "ctx")
+
     def test_list_of_dicts_with_valid_keys(self):
         validate_properties(
             {"taskGroups": [{"name": "a"}, {"name": "b", "namespace": "ns"}]}, "ctx"
@@ -69,6 +81,11 @@ class TestInvalidProperties:
         with pytest.raises(Exception, match="Invalid properties"):
             validate_properties({"tasks": [{"reallyBadKey": "value"}]}, "ctx")
 
+    def test_invalid_key_in_csv_task_prototype_raises(self, csv_data):
+        tasks = CSVTaskList(csv_data, {"arguments": ["<<arg>>"], "badKey": 1})
+        with pytest.raises(Exception, match="badKey"):
+            validate_properties({"taskGroups": [{"tasks": tasks}]}, "ctx")
+
 
 class TestExcludedKeys:
     """
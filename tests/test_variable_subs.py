@@ -6,6 +6,9 @@ and process_variable_substitutions / process_variable_substitutions_in_file_cont
 (require patching the VARIABLE_SUBSTITUTIONS global).
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
 import pytest
 
 import yellowdog_cli.utils.variables as var_module
@@ -532,3 +535,203 @@ class TestProcessVariableSubstitutionsInFileContents:
         content = "{{myvar}} has {{num_var}} items"
         result = var_module.process_variable_substitutions_in_file_contents(content)
         assert result == "hello has 42 items"
+
+
+# ---------------------------------------------------------------------------
+# Compiled templates
+# ---------------------------------------------------------------------------
+
+# Element contents covering each kind of compiled element, plus cases that
+# must defer to process_untyped_variable_substitutions()
+ELEMENT_CONTENTS = [
+    "myvar",
+    "unknown",
+    "myvar::",
+    "unknown::",
+    "myvar:=fallback",
+    "unknown:=fallback",
+    "unknown:=",
+    ":=fallback",
+    "a:=b:=c",
+    "env:YD_TEST_ENV",
+    "env:YD_TEST_MISSING",
+    "env:YD_TEST_ENV:=fallback",
+    "env:YD_TEST_MISSING:=fallback",
+    "env:YD_TEST_ENV::",
+    "env:YD_TEST_MISSING::",
+    "env::=fallback",
+    "indirect",
+    "indirect:=fallback",
+    "{{dyn_key}}",
+    "{{dyn_key}}_suffix:=fallback",
+    "multi\nline",
+]
+
+
+class TestCompiledTemplates:
+    """
+    Compiled rendering must match the general (uncompiled) algorithm.
+    """
+
+    @pytest.fixture(autouse=True)
+    def use_known_subs(self, patched_subs, monkeypatch):
+        var_module.VARIABLE_SUBSTITUTIONS["dyn_key"] = "myvar"
+        var_module.VARIABLE_SUBSTITUTIONS["indirect"] = "{{myvar}}"
+        monkeypatch.setenv("YD_TEST_ENV", "from_env")
+        monkeypatch.delenv("YD_TEST_MISSING", raising=False)
+
+    @staticmethod
+    def _outcome(function, *args):
+        try:
+            return function(*args)
+        except ValueError as e:
+            return str(e)
+
+    @pytest.mark.parametrize("contents", ELEMENT_CONTENTS)
+    def test_matches_uncompiled_algorithm(self, contents):
+        element = "{{" + contents + "}}"
+        assert self._outcome(
+            var_module.process_variable_substitutions, element
+        ) == self._outcome(
+            var_module.process_untyped_variable_substitutions, element, "{{", "}}"
+        )
+
+    @pytest.mark.parametrize("contents", ELEMENT_CONTENTS)
+    def test_matches_uncompiled_algorithm_with_prefix_and_postfix(self, contents):
+        element = "__{{" + contents + "}}__"
+        assert self._outcome(
+            var_module.process_variable_substitutions, element, "__", "__"
+        ) == self._outcome(
+            var_module.process_untyped_variable_substitutions, element, "__{{", "}}__"
+        )
+
+    def test_template_reflects_updated_substitutions(self):
+        template = "task_{{task_number}}_{{myvar}}"
+        for task_number in range(3):
+            var_module.add_or_update_substitution("task_number", str(task_number))
+            assert (
+                var_module.process_variable_substitutions(template)
+                == f"task_{task_number}_hello"
+            )
+
+    def test_template_is_compiled_once(self):
+        var_module._compile_template.cache_clear()
+        for _ in range(5):
+            var_module.process_variable_substitutions("{{myvar}}-{{num:num_var}}")
+        cache_info = var_module._compile_template.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 4
+
+
+# ---------------------------------------------------------------------------
+# Substitution scopes
+# ---------------------------------------------------------------------------
+
+
+class TestSubstitutionScope:
+    @pytest.fixture(autouse=True)
+    def use_known_subs(self, patched_subs):
+        pass
+
+    def test_scoped_substitution_used_within_scope(self):
+        with var_module.substitution_scope():
+            var_module.add_or_update_substitution("task_name", "task_1")
+            assert (
+                var_module.process_variable_substitutions("{{task_name}}-{{myvar}}")
+                == "task_1-hello"
+            )
+            assert var_module.get_user_variable("task_name") == "task_1"
+
+    def test_scoped_substitution_discarded_on_exit(self):
+        with var_module.substitution_scope():
+            var_module.add_or_update_substitution("task_name", "task_1")
+        assert "task_name" not in var_module.VARIABLE_SUBSTITUTIONS
+        assert var_module.process_variable_substitutions("{{task_name}}") == (
+            "{{task_name}}"
+        )
+
+    def test_scoped_substitution_overrides_global(self):
+        with var_module.substitution_scope():
+            var_module.add_or_update_substitution("myvar", "scoped")
+            assert var_module.process_variable_substitutions("{{myvar}}") == "scoped"
+        assert var_module.process_variable_substitutions("{{myvar}}") == "hello"
+
+    def test_nested_scope_inherits_outer_scope(self):
+        with var_module.substitution_scope():
+            var_module.add_or_update_substitution("outer", "1")
+            with var_module.substitution_scope():
+                var_module.add_or_update_substitution("inner", "2")
+                assert (
+                    var_module.process_variable_substitutions("{{outer}}{{inner}}")
+                    == "12"
+                )
+            assert var_module.get_user_variable("inner") is None
+
+    def test_scopes_are_isolated_between_threads(self):
+        def render(task_number: int) -> list[str]:
+            results = []
+            with var_module.substitution_scope():
+                for _ in range(100):
+                    var_module.add_or_update_substitution(
+                        "task_number", str(task_number)
+                    )
+                    results.append(
+                        var_module.process_variable_substitutions("{{task_number}}")
+                    )
+            return results
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(render, range(8)))
+        for task_number, rendered in enumerate(results):
+            assert rendered == [str(task_number)] * 100
+
+
+# ---------------------------------------------------------------------------
+# Substitution prototypes
+# ---------------------------------------------------------------------------
+
+PROTOTYPE_DATA = {
+    "name": "task_{{task_number}}",
+    "constant": {"a": [1, "two", {"three": 3}]},
+    "arguments": ["{{myvar}}", "fixed", ["{{task_number}}", "x"], "{{missing::}}"],
+    "environment": {"A": "{{unknown:=fallback}}", "B": "{{num:num_var}}"},
+    "optional": "{{missing::}}",
+    "userData": "__{{myvar}}__ {{myvar}}",
+}
+
+
+class TestSubstitutionPrototype:
+    @pytest.fixture(autouse=True)
+    def use_known_subs(self, patched_subs):
+        pass
+
+    def test_render_matches_insitu_processing(self):
+        prototype = var_module.SubstitutionPrototype(deepcopy(PROTOTYPE_DATA))
+        for task_number in range(3):
+            var_module.add_or_update_substitution("task_number", str(task_number))
+            expected = var_module.process_variable_substitutions_insitu(
+                deepcopy(PROTOTYPE_DATA)
+            )
+            assert prototype.render() == expected
+
+    def test_original_data_is_not_modified(self):
+        data = deepcopy(PROTOTYPE_DATA)
+        var_module.SubstitutionPrototype(data).render()
+        assert data == PROTOTYPE_DATA
+
+    def test_constant_subtrees_are_shared(self):
+        data = deepcopy(PROTOTYPE_DATA)
+        rendered = var_module.SubstitutionPrototype(data).render()
+        assert isinstance(rendered, dict)
+        assert rendered["constant"] is data["constant"]
+        assert rendered["arguments"] is not data["arguments"]
+
+    def test_data_without_variables_is_returned_unchanged(self):
+        data = {"a": ["b", {"c": "d"}]}
+        assert var_module.SubstitutionPrototype(data).render() is data
+
+    def test_render_with_prefix_and_postfix(self):
+        prototype = var_module.SubstitutionPrototype(
+            ["__{{myvar}}__", "{{myvar}}"], prefix="__", postfix="__"
+        )
+        assert prototype.render() == ["hello", "{{myvar}}"]
@@ -12,6 +12,7 @@ from yellowdog_client.model import (
     WorkRequirementSummary,
 )
 
+from yellowdog_cli.utils.bulk_operations import run_bulk_operation
 from yellowdog_cli.utils.entity_utils import (
     get_filtered_work_requirement_summaries,
     get_task_group_name,
@@ -91,50 +92,57 @@ def abort_tasks_selectively(
             override_quiet=True,
         )
 
-    aborted_tasks = 0
-    if tasks and confirmed(f"Abort {len(tasks)} Task(s)?"):
-        for task in tasks:
-            try:
-                CLIENT.work_client.cancel_task(task, abort=True)
-                print_info(
-                    f"Aborted Task '{task.name}' in Task Group"
-                    f" '{get_task_group_name(CLIENT, wr_summary, task)}' in Work"
-                    f" Requirement '{wr_summary.name}'"
-                )
-                aborted_tasks += 1
-            except Exception as e:
-                print_error(f"Unable to abort Task '{task.name}': {e}")
-
-    if aborted_tasks == 0:
+    if not tasks or not confirmed(f"Abort {len(tasks)} Task(s)?"):
         print_info("No Tasks Aborted")
-    elif aborted_tasks > 1:
-        print_info(f"Aborted {aborted_tasks} Tasks")
+        return
+
+    result = run_bulk_operation(
+        tasks,
+        lambda task: CLIENT.work_client.cancel_task(task, abort=True),
+        on_success=lambda task, _: print_info(
+            f"Aborted Task '{task.name}' in Task Group"
+            f" '{get_task_group_name(CLIENT, wr_summary, task)}' in Work"
+            f" Requirement '{wr_summary.name}'"
+        ),
+        on_failure=lambda task, e: print_error(
+            f"Unable to abort Task '{task.name}': {e}"
+        ),
+    )
+
+    if not result.succeeded:
+        print_info("No Tasks Aborted")
+    elif len(tasks) > 1:
+        result.report("Aborted Tasks")
 
 
 def _abort_tasks_by_name_or_id(task_id_list: list[str]):
     """
     Abort Tasks by their YDIDs.
     """
-    aborted_count = 0
+    task_ids: list[str] = []
     for task_id in task_id_list:
         if get_ydid_type(task_id) != YDIDType.TASK:
             print_error(f"ID '{task_id}' is not a valid Task YDID")
             continue
 
-        if not confirmed(f"Cancel and abort Task '{task_id}'?"):
-            continue
-
-        try:
-            CLIENT.work_client.cancel_task_by_id(task_id, abort=True)
-            print_info(f"Cancelled and aborted Task '{task_id}'")
-            aborted_count += 1
-        except Exception as e:
-            print_error(f"Unable to cancel and abort Task '{task_id}': {e}")
+        if confirmed(f"Cancel and abort Task '{task_id}'?"):
+            task_ids.append(task_id)
+
+    result = run_bulk_operation(
+        task_ids,
+        lambda task_id: CLIENT.work_client.cancel_task_by_id(task_id, abort=True),
+        on_success=lambda task_id, _: print_info(
+            f"Cancelled and aborted Task '{task_id}'"
+        ),
+        on_failure=lambda task_id, e: print_error(
+            f"Unable to cancel and abort Task '{task_id}': {e}"
+        ),
+    )
 
-    if aborted_count > 1:
-        print_info(f"Cancelled and aborted {aborted_count} Tasks")
-    elif aborted_count == 0:
+    if not result.succeeded:
         print_info("No Tasks cancelled and aborted")
+    elif len(task_ids) > 1:
+        result.report("Cancelled and aborted Tasks")
 
 
 # Entry point
@@ -7,18 +7,18 @@ A script to cancel Work Requirements and optionally abort Tasks.
 from typing import cast
 
 from yellowdog_client.model import (
-    WorkRequirement,
     WorkRequirementStatus,
     WorkRequirementSummary,
 )
 
+from yellowdog_cli.utils.bulk_operations import run_bulk_operation
 from yellowdog_cli.utils.entity_utils import (
     get_filtered_work_requirement_summaries,
     get_work_requirement_summary_by_name_or_id,
 )
 from yellowdog_cli.utils.follow_utils import follow_ids
 from yellowdog_cli.utils.interactive import confirmed, select
-from yellowdog_cli.utils.misc_utils import link_entity
+from yellowdog_cli.utils.misc_utils import fq_name, link_entity_id
 from yellowdog_cli.utils.printing import print_error, print_info, print_warning
 from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
 from yellowdog_cli.utils.ydid_utils import YDIDType, get_ydid_type
@@ -49,10 +49,6 @@ def main():
         )
     )
 
-    cancelled_count = 0
-    cancelling_count = 0
-    work_requirement_ids: list[str] = []
-
     if selected_work_requirement_summaries:
         selected_work_requirement_summaries = select(
             CLIENT, selected_work_requirement_summaries
@@ -63,42 +59,35 @@ def main():
         f"Work Requirement(s)"
         f"{'' if not ARGS_PARSER.abort else ' and abort all allocated tasks'}?"
     ):
+        to_cancel: list[WorkRequirementSummary] = []
         for work_summary in selected_work_requirement_summaries:
-            if work_summary.status != WorkRequirementStatus.CANCELLING:
-                try:
-                    CLIENT.work_client.cancel_work_requirement_by_id(
-                        work_summary.id,  # type: ignore[arg-type]
-                        ARGS_PARSER.abort,
-                    )
-                    work_requirement: WorkRequirement = (
-                        CLIENT.work_client.get_work_requirement_by_id(work_summary.id)  # type: ignore[arg-type]
-                    )
-                    cancelled_count += 1
-                    print_info(
-                        f"Cancelled {link_entity(CONFIG_COMMON.url, work_requirement)} "
-                        f"('{work_summary.name}')"
-                        f"{'' if not ARGS_PARSER.abort else ' and aborted all allocated tasks'}"
-                    )
-
-                except Exception as e:
-                    print_error(
-                        f"Failed to cancel Work Requirement '{work_summary.name}': {e}"
-                    )
-
-            elif work_summary.status == WorkRequirementStatus.CANCELLING:
+            if work_summary.status == WorkRequirementStatus.CANCELLING:
                 print_info(
                     f"Work Requirement '{work_summary.name}' is already cancelling"
                 )
-                cancelling_count += 1
-            work_requirement_ids.append(work_summary.id)  # type: ignore[arg-type]
+            else:
+                to_cancel.append(work_summary)
+
+        result = run_bulk_operation(
+            to_cancel,
+            _cancel_work_requirement,
+            on_success=lambda work_summary, _: print_info(
+                f"Cancelled {link_entity_id(CONFIG_COMMON.url, 'WorkRequirement', work_summary.id)} "  # type: ignore[arg-type]
+                f"('{work_summary.name}')"
+                f"{'' if not ARGS_PARSER.abort else ' and aborted all allocated tasks'}"
+            ),
+            on_failure=lambda work_summary, e: print_error(
+                f"Failed to cancel Work Requirement '{work_summary.name}': {e}"
+            ),
+        )
 
-        if cancelled_count > 1:
-            print_info(f"Cancelled {cancelled_count} Work Requirement(s)")
-        elif cancelled_count == 0 and cancelling_count == 0:
-            print_info("No Work Requirements to cancel")
+        if len(to_cancel) > 1:
+            result.report("Cancelled Work Requirements")
 
         if ARGS_PARSER.follow:
-            follow_ids(work_requirement_ids)
+            follow_ids(
+                [cast(str, wrs.id) for wrs in selected_work_requirement_summaries]
+            )
 
     else:
         print_info("No Work Requirements to cancel")
@@ -109,19 +98,17 @@ def _cancel_work_requirements_by_name_or_id(names_or_ids: list[str]):
     Cancel Work Requirements by their names or IDs.
     """
     work_requirement_summaries: list[WorkRequirementSummary] = []
+    to_cancel: list[WorkRequirementSummary] = []
+    task_ids: list[str] = []
 
     for name_or_id in names_or_ids:
         # Handle a task ID
         if get_ydid_type(name_or_id) == YDIDType.TASK:
-            if not confirmed(
+            if confirmed(
                 f"Cancel {'' if not ARGS_PARSER.abort else 'and abort '}"
                 f"Task '{name_or_id}'?"
             ):
-                continue
-            try:
-                CLIENT.work_client.cancel_task_by_id(name_or_id, ARGS_PARSER.abort)
-            except Exception as e:
-                print_error(f"Failed to cancel Task '{name_or_id}': {e}")
+                task_ids.append(name_or_id)
             continue
 
         work_requirement_summary = get_work_requirement_summary_by_name_or_id(
@@ -145,39 +132,59 @@ def _cancel_work_requirements_by_name_or_id(names_or_ids: list[str]):
             continue
 
         work_requirement_summaries.append(work_requirement_summary)
-        fq_name = (
-            f"{work_requirement_summary.namespace}/{work_requirement_summary.name}"
-        )
         if work_requirement_summary.status == WorkRequirementStatus.CANCELLING:
             print_info(
-                f"Work Requirement '{fq_name}' ({work_requirement_summary.id}) "
-                "is already cancelling"
+                f"Work Requirement '{fq_name(work_requirement_summary)}' "
+                f"({work_requirement_summary.id}) is already cancelling"
             )
-        else:
-            if not confirmed(
-                f"Cancel Work Requirement '{fq_name}' ({work_requirement_summary.id})"
-                f"{'' if not ARGS_PARSER.abort else ' and abort all allocated tasks'}?"
-            ):
-                continue
-            try:
-                CLIENT.work_client.cancel_work_requirement_by_id(
-                    work_requirement_summary.id,  # type: ignore[arg-type]
-                    ARGS_PARSER.abort,
-                )
-                print_info(
-                    f"Cancelled Work Requirement '{fq_name}' ({work_requirement_summary.id})"
-                    f"{'' if not ARGS_PARSER.abort else ' and aborted all allocated tasks'}"
-                )
-            except Exception as e:
-                print_error(
-                    f"Failed to cancel Work Requirement '{fq_name}' "
-                    f"({work_requirement_summary.id}): {e}"
-                )
+        elif confirmed(
+            f"Cancel Work Requirement '{fq_name(work_requirement_summary)}' "
+            f"({work_requirement_summary.id})"
+            f"{'' if not ARGS_PARSER.abort else ' and abort all allocated tasks'}?"
+        ):
+            to_cancel.append(work_requirement_summary)
+
+    task_result = run_bulk_operation(
+        task_ids,
+        lambda task_id: CLIENT.work_client.cancel_task_by_id(
+            task_id, ARGS_PARSER.abort
+        ),
+        on_failure=lambda task_id, e: print_error(
+            f"Failed to cancel Task '{task_id}': {e}"
+        ),
+    )
+    if len(task_ids) > 1:
+        task_result.report("Cancelled Tasks")
+
+    result = run_bulk_operation(
+        to_cancel,
+        _cancel_work_requirement,
+        on_success=lambda wr_summary, _: print_info(
+            f"Cancelled Work Requirement '{fq_name(wr_summary)}' ({wr_summary.id})"
+            f"{'' if not ARGS_PARSER.abort else ' and aborted all allocated tasks'}"
+        ),
+        on_failure=lambda wr_summary, e: print_error(
+            f"Failed to cancel Work Requirement '{fq_name(wr_summary)}' "
+            f"({wr_summary.id}): {e}"
+        ),
+    )
+    if len(to_cancel) > 1:
+        result.report("Cancelled Work Requirements")
 
     if ARGS_PARSER.follow:
         follow_ids([cast(str, wrs.id) for wrs in work_requirement_summaries])
 
 
+def _cancel_work_requirement(work_requirement_summary: WorkRequirementSummary):
+    """
+    Cancel a Work Requirement, optionally aborting its allocated tasks.
+    """
+    CLIENT.work_client.cancel_work_requirement_by_id(
+        work_requirement_summary.id,  # type: ignore[arg-type]
+        ARGS_PARSER.abort,
+    )
+
+
 # Entry point
 if __name__ == "__main__":
     main()
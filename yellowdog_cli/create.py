@@ -12,7 +12,6 @@ from typing import cast
 
 import yellowdog_client.model as model
 from dateparser import parse as date_parse
-from requests import post, put
 from requests.exceptions import HTTPError
 from yellowdog_client.common.json import Json
 from yellowdog_client.model import (
@@ -116,7 +115,13 @@ from yellowdog_cli.utils.settings import (
     RN_STRING_ATTRIBUTE_DEFINITION,
     RN_UPDATE_APPLICATION_REQUEST,
 )
-from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
+from yellowdog_cli.utils.wrapper import (
+    ARGS_PARSER,
+    CLIENT,
+    CONFIG_COMMON,
+    get_rest_session,
+    main_wrapper,
+)
 from yellowdog_cli.utils.ydid_utils import YDIDType, get_ydid_type
 
 CLEAR_CST_CACHE: bool = False  # Track whether the CST cache needs to be cleared
@@ -809,7 +814,6 @@ def create_attribute_definition(resource: dict, resource_type: str):
         raise KeyError(f"Expected property to be defined ({e})")
 
     url = f"{CONFIG_COMMON.url}/compute/attributes/user"
-    headers = {"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"}
     if resource_type == RN_STRING_ATTRIBUTE_DEFINITION:
         payload = {
             # Required
@@ -838,7 +842,7 @@ def create_attribute_definition(resource: dict, resource_type: str):
 
     # Attempt attribute creation
     print_info(f"Attempting to create or update Attribute Definition '{name}'")
-    response = post(url=url, headers=headers, json=payload)
+    response = get_rest_session().post(url=url, json=payload)
 
     if response.status_code == 200:
         print_info(f"Created new Attribute Definition '{name}'")
@@ -848,7 +852,7 @@ def create_attribute_definition(resource: dict, resource_type: str):
         if not confirmed(f"Update existing Attribute Definition '{name}'?"):
             return
 
-        response = put(url=url, headers=headers, json=payload)
+        response = get_rest_session().put(url=url, json=payload)
         if response.status_code == 200:
             print_info(f"Updated existing Attribute Definition '{name}'")
             return
@@ -13,6 +13,7 @@ from yellowdog_cli.utils.dataclient_wrapper import dataclient_wrapper
 from yellowdog_cli.utils.load_config import load_config_data_client
 from yellowdog_cli.utils.printing import print_info
 from yellowdog_cli.utils.rclone_utils import upgrade_rclone, which_rclone
+from yellowdog_cli.utils.settings import FLATTEN_COLLISION_POLICY_DEFAULT
 
 CONFIG_DATA_CLIENT: ConfigDataClient = load_config_data_client()
 
@@ -30,6 +31,7 @@ def main():
     sync = ARGS_PARSER.sync or False
     flatten = ARGS_PARSER.flatten or False
     dry_run = ARGS_PARSER.dry_run or False
+    on_collision = ARGS_PARSER.on_collision or FLATTEN_COLLISION_POLICY_DEFAULT
     explicit_destination = ARGS_PARSER.destination
 
     for remote_path_str in ARGS_PARSER.remote_paths:
@@ -54,6 +56,7 @@ def main():
             flatten=flatten,
             sync=sync,
             dry_run=dry_run,
+            on_collision=on_collision,
         )
 
     print_info("Download complete")
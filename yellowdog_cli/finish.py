@@ -7,18 +7,18 @@ A script to finish Work Requirements.
 from typing import cast
 
 from yellowdog_client.model import (
-    WorkRequirement,
     WorkRequirementStatus,
     WorkRequirementSummary,
 )
 
+from yellowdog_cli.utils.bulk_operations import run_bulk_operation
 from yellowdog_cli.utils.entity_utils import (
     get_filtered_work_requirement_summaries,
     get_work_requirement_summary_by_name_or_id,
 )
 from yellowdog_cli.utils.follow_utils import follow_ids
 from yellowdog_cli.utils.interactive import confirmed, select
-from yellowdog_cli.utils.misc_utils import link_entity
+from yellowdog_cli.utils.misc_utils import fq_name, link_entity_id
 from yellowdog_cli.utils.printing import print_error, print_info, print_warning
 from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
 
@@ -49,10 +49,6 @@ def main():
         )
     )
 
-    finished_count = 0
-    finishing_count = 0
-    work_requirement_ids: list[str] = []
-
     if selected_work_requirement_summaries:
         selected_work_requirement_summaries = select(
             CLIENT, selected_work_requirement_summaries
@@ -61,38 +57,34 @@ def main():
     if selected_work_requirement_summaries and confirmed(
         f"Finish {len(selected_work_requirement_summaries)} Work Requirement(s)?"
     ):
+        to_finish: list[WorkRequirementSummary] = []
         for work_summary in selected_work_requirement_summaries:
-            if work_summary.status != WorkRequirementStatus.FINISHING:
-                try:
-                    CLIENT.work_client.finish_work_requirement_by_id(work_summary.id)  # type: ignore[arg-type]
-                    work_requirement: WorkRequirement = (
-                        CLIENT.work_client.get_work_requirement_by_id(work_summary.id)  # type: ignore[arg-type]
-                    )
-                    finished_count += 1
-                    print_info(
-                        f"Finished {link_entity(CONFIG_COMMON.url, work_requirement)} "
-                        f"('{work_summary.name}')"
-                    )
-
-                except Exception as e:
-                    print_error(
-                        f"Failed to finish Work Requirement '{work_summary.name}': {e}"
-                    )
-
-            elif work_summary.status == WorkRequirementStatus.FINISHING:
+            if work_summary.status == WorkRequirementStatus.FINISHING:
                 print_info(
                     f"Work Requirement '{work_summary.name}' is already finishing"
                 )
-                finishing_count += 1
-            work_requirement_ids.append(work_summary.id)  # type: ignore[arg-type]
+            else:
+                to_finish.append(work_summary)
+
+        result = run_bulk_operation(
+            to_finish,
+            _finish_work_requirement,
+            on_success=lambda work_summary, _: print_info(
+                f"Finished {link_entity_id(CONFIG_COMMON.url, 'WorkRequirement', work_summary.id)} "  # type: ignore[arg-type]
+                f"('{work_summary.name}')"
+            ),
+            on_failure=lambda work_summary, e: print_error(
+                f"Failed to finish Work Requirement '{work_summary.name}': {e}"
+            ),
+        )
 
-        if finished_count > 1:
-            print_info(f"Finished {finished_count} Work Requirement(s)")
-        elif finished_count == 0 and finishing_count == 0:
-            print_info("No Work Requirements to finish")
+        if len(to_finish) > 1:
+            result.report("Finished Work Requirements")
 
         if ARGS_PARSER.follow:
-            follow_ids(work_requirement_ids)
+            follow_ids(
+                [cast(str, wrs.id) for wrs in selected_work_requirement_summaries]
+            )
 
     else:
         print_info("No Work Requirements to finish")
@@ -103,6 +95,7 @@ def _finish_work_requirements_by_name_or_id(names_or_ids: list[str]):
     Finish Work Requirements by their names or IDs.
     """
     work_requirement_summaries: list[WorkRequirementSummary] = []
+    to_finish: list[WorkRequirementSummary] = []
 
     for name_or_id in names_or_ids:
         work_requirement_summary = get_work_requirement_summary_by_name_or_id(
@@ -125,36 +118,44 @@ def _finish_work_requirements_by_name_or_id(names_or_ids: list[str]):
             continue
 
         work_requirement_summaries.append(work_requirement_summary)
-        fq_name = (
-            f"{work_requirement_summary.namespace}/{work_requirement_summary.name}"
-        )
         if work_requirement_summary.status == WorkRequirementStatus.FINISHING:
             print_info(
-                f"Work Requirement '{fq_name}' ({work_requirement_summary.id}) "
-                "is already finishing"
+                f"Work Requirement '{fq_name(work_requirement_summary)}' "
+                f"({work_requirement_summary.id}) is already finishing"
             )
-        else:
-            if not confirmed(
-                f"Finish Work Requirement '{fq_name}' ({work_requirement_summary.id})"
-            ):
-                continue
-            try:
-                CLIENT.work_client.finish_work_requirement_by_id(
-                    work_requirement_summary.id  # type: ignore[arg-type]
-                )
-                print_info(
-                    f"Finished Work Requirement '{fq_name}' ({work_requirement_summary.id})"
-                )
-            except Exception as e:
-                print_error(
-                    f"Failed to finish Work Requirement '{fq_name}' "
-                    f"({work_requirement_summary.id}): {e}"
-                )
+        elif confirmed(
+            f"Finish Work Requirement '{fq_name(work_requirement_summary)}' "
+            f"({work_requirement_summary.id})"
+        ):
+            to_finish.append(work_requirement_summary)
+
+    result = run_bulk_operation(
+        to_finish,
+        _finish_work_requirement,
+        on_success=lambda wr_summary, _: print_info(
+            f"Finished Work Requirement '{fq_name(wr_summary)}' ({wr_summary.id})"
+        ),
+        on_failure=lambda wr_summary, e: print_error(
+            f"Failed to finish Work Requirement '{fq_name(wr_summary)}' "
+            f"({wr_summary.id}): {e}"
+        ),
+    )
+    if len(to_finish) > 1:
+        result.report("Finished Work Requirements")
 
     if ARGS_PARSER.follow:
         follow_ids([cast(str, wrs.id) for wrs in work_requirement_summaries])
 
 
+def _finish_work_requirement(work_requirement_summary: WorkRequirementSummary):
+    """
+    Finish a Work Requirement.
+    """
+    CLIENT.work_client.finish_work_requirement_by_id(
+        work_requirement_summary.id  # type: ignore[arg-type]
+    )
+
+
 # Entry point
 if __name__ == "__main__":
     main()
@@ -4,13 +4,22 @@
 A script to follow event streams.
 """
 
-from yellowdog_cli.utils.follow_utils import follow_ids
+from yellowdog_cli.utils.follow_utils import follow_ids, replay_events
 from yellowdog_cli.utils.printing import print_info
+from yellowdog_cli.utils.settings import EVENT_REPLAY_SPEED_DEFAULT
 from yellowdog_cli.utils.wrapper import ARGS_PARSER, main_wrapper
 
 
 @main_wrapper
 def main():
+    if ARGS_PARSER.replay is not None:
+        replay_speed = ARGS_PARSER.replay_speed
+        replay_events(
+            ARGS_PARSER.replay,
+            EVENT_REPLAY_SPEED_DEFAULT if replay_speed is None else replay_speed,
+        )
+        return
+
     if not ARGS_PARSER.yellowdog_ids:
         print_info("No YellowDog IDs to follow")
         return
@@ -39,7 +39,13 @@ from yellowdog_cli.utils.variables import (
     load_json_file_with_variable_substitutions,
     load_jsonnet_file_with_variable_substitutions,
 )
-from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
+from yellowdog_cli.utils.wrapper import (
+    ARGS_PARSER,
+    CLIENT,
+    CONFIG_COMMON,
+    get_rest_session,
+    main_wrapper,
+)
 from yellowdog_cli.utils.ydid_utils import YDIDType
 
 
@@ -313,9 +319,8 @@ def _create_compute_requirement_from_json(
         print_info("Dry-run: Complete")
         return
 
-    response = requests.post(
+    response = get_rest_session().post(
         url=f"{CONFIG_COMMON.url}/compute/templates/provision",
-        headers={"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"},
         json=cr_data,
     )
     name = cr_data["requirementName"]
@@ -4,11 +4,12 @@
 Command to list YellowDog entities.
 """
 
+from collections.abc import Callable, Iterator
+from itertools import chain, islice
 from json import loads as json_loads
 from os.path import exists
-from typing import cast
+from typing import Any, TypeVar, cast
 
-from requests import get
 from yellowdog_client.common import SearchClient
 from yellowdog_client.common.json import Json
 from yellowdog_client.model import (
@@ -58,15 +59,19 @@ from yellowdog_cli.utils.entity_utils import (
     get_task_groups_from_wr_by_id,
     get_user_groups,
     get_worker_pool_summaries,
+    iterate_filtered_work_requirement_summaries,
+    iterate_tasks_in_task_group,
     substitute_id_for_name_in_allowance,
     substitute_ids_for_names_in_crt,
     substitute_image_family_id_for_name_in_cst,
 )
+from yellowdog_cli.utils.fetch_utils import check_fetch_failures, fetch_concurrently
 from yellowdog_cli.utils.interactive import confirmed, select
 from yellowdog_cli.utils.printing import (
     print_info,
     print_json,
     print_numbered_object_list,
+    print_numbered_object_stream,
     print_warning,
     print_yd_object,
     print_yd_object_list,
@@ -94,6 +99,7 @@ from yellowdog_cli.utils.settings import (
     ET_WORK_REQUIREMENTS,
     ET_WORKER_POOLS,
     ET_WORKERS,
+    FETCH_THREADS,
     PROP_GROUPS,
     PROP_RESOURCE,
     RN_ALLOWANCE,
@@ -108,7 +114,13 @@ from yellowdog_cli.utils.settings import (
     RN_SOURCE_TEMPLATE,
     RN_STRING_ATTRIBUTE_DEFINITION,
 )
-from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
+from yellowdog_cli.utils.wrapper import (
+    ARGS_PARSER,
+    CLIENT,
+    CONFIG_COMMON,
+    get_rest_session,
+    main_wrapper,
+)
 
 
 @main_wrapper
@@ -121,10 +133,30 @@ def main():
         or ARGS_PARSER.strip_ids
         or ARGS_PARSER.substitute_ids
         or ARGS_PARSER.output_file
+        or ARGS_PARSER.json_lines
     ) and not ARGS_PARSER.details:
         print_info("Automatically setting the '--details' option")
         ARGS_PARSER.details = True
 
+    if (
+        ARGS_PARSER.limit is not None or ARGS_PARSER.offset is not None
+    ) and not ARGS_PARSER.stream:
+        print_info("Automatically setting the '--stream' option")
+        ARGS_PARSER.stream = True
+
+    if ARGS_PARSER.stream:
+        if ARGS_PARSER.entity_type not in (ET_WORK_REQUIREMENTS, ET_TASKS):
+            raise ValueError(
+                "The '--stream' option can only be used when listing "
+                "work requirements or tasks"
+            )
+        if ARGS_PARSER.limit is not None and ARGS_PARSER.limit < 1:
+            raise ValueError("The '--limit' option must be at least 1")
+        if ARGS_PARSER.offset is not None and ARGS_PARSER.offset < 0:
+            raise ValueError("The '--offset' option must not be negative")
+        if ARGS_PARSER.reverse:
+            print_warning("Ignoring '--reverse': streamed items are not sorted")
+
     if ARGS_PARSER.details and ARGS_PARSER.strip_ids:
         print_info("Stripping YellowDog IDs (etc.) from detailed JSON objects")
 
@@ -170,6 +202,9 @@ def main():
     elif entity_type == ET_PERMISSIONS:
         list_permissions()
 
+    # Exit with an error if the details of any items couldn't be fetched
+    check_fetch_failures()
+
 
 def list_work_requirements():
     """
@@ -195,6 +230,24 @@ def list_work_requirements():
         if ARGS_PARSER.active_only
         else []
     )
+    if ARGS_PARSER.stream and ARGS_PARSER.entity_type == ET_WORK_REQUIREMENTS:
+        list_streamed_objects(
+            iterate_filtered_work_requirement_summaries(
+                CLIENT,
+                namespace=CONFIG_COMMON.namespace,
+                tag=CONFIG_COMMON.name_tag,
+                exclude_filter=exclude_filter,
+                max_items=_stream_max_items(),
+            ),
+            "Work Requirements",
+            lambda wr_summary: (
+                CLIENT.work_client.get_work_requirement_by_id(wr_summary.id),  # type: ignore[arg-type]
+                None,
+            ),
+            lambda wr_summary: f"Work Requirement '{wr_summary.name}'",
+        )
+        return
+
     work_requirement_summaries: list[WorkRequirementSummary] = (
         get_filtered_work_requirement_summaries(
             CLIENT,
@@ -211,10 +264,14 @@ def list_work_requirements():
     if ARGS_PARSER.entity_type == ET_WORK_REQUIREMENTS:
         if ARGS_PARSER.details:
             print_yd_object_list(
-                [
-                    (CLIENT.work_client.get_work_requirement_by_id(wr_summary.id), None)  # type: ignore[arg-type]
-                    for wr_summary in select(CLIENT, work_requirement_summaries)
-                ]
+                fetch_concurrently(
+                    select(CLIENT, work_requirement_summaries),
+                    lambda wr_summary: (
+                        CLIENT.work_client.get_work_requirement_by_id(wr_summary.id),  # type: ignore[arg-type]
+                        None,
+                    ),
+                    lambda wr_summary: f"Work Requirement '{wr_summary.name}'",
+                )
             )
         elif ARGS_PARSER.ids_only:
             for wr_summary in work_requirement_summaries:
@@ -252,7 +309,24 @@ def list_task_groups(work_summary: WorkRequirementSummary):
 
 
 def list_tasks(task_group: TaskGroup, work_summary: WorkRequirementSummary):
-    tasks: list[Task] = get_all_tasks_in_task_group(CLIENT, cast(str, task_group.id))
+    if ARGS_PARSER.active_only:
+        print_info("Listing active Tasks only")
+
+    if ARGS_PARSER.stream:
+        list_streamed_objects(
+            iterate_tasks_in_task_group(
+                CLIENT,
+                cast(str, task_group.id),
+                active_only=bool(ARGS_PARSER.active_only),
+                max_items=_stream_max_items(),
+            ),
+            "Tasks",
+        )
+        return
+
+    tasks: list[Task] = get_all_tasks_in_task_group(
+        CLIENT, cast(str, task_group.id), active_only=bool(ARGS_PARSER.active_only)
+    )
     tasks = sorted_objects(tasks)
     if ARGS_PARSER.details:
         print_yd_object_list([(task, None) for task in select(CLIENT, tasks)])
@@ -263,6 +337,58 @@ def list_tasks(task_group: TaskGroup, work_summary: WorkRequirementSummary):
         print_numbered_object_list(CLIENT, tasks)
 
 
+StreamedItem = TypeVar("StreamedItem", WorkRequirementSummary, Task)
+
+
+def list_streamed_objects(
+    objects: Iterator[StreamedItem],
+    type_name: str,
+    fetch_details: Callable[[StreamedItem], tuple[Any, dict | None]] | None = None,
+    description: Callable[[StreamedItem], str] = str,
+):
+    """
+    List objects as they're received, applying '--offset' and '--limit'.
+    Stopping early means no further pages of results are requested.
+    If 'fetch_details' is supplied, it's used to fetch the details of each
+    object when '--details' is specified.
+    """
+    offset = ARGS_PARSER.offset or 0
+    objects = islice(
+        objects,
+        offset,
+        None if ARGS_PARSER.limit is None else offset + ARGS_PARSER.limit,
+    )
+    first = next(objects, None)
+    if first is None:
+        print_info(f"No matching {type_name}")
+        return
+    objects = chain([first], objects)
+
+    if ARGS_PARSER.details:
+        if fetch_details is None:
+            print_yd_object_list((object_, None) for object_ in objects)
+        else:
+            print_yd_object_list(
+                details
+                for batch in iter(lambda: list(islice(objects, FETCH_THREADS)), [])
+                for details in fetch_concurrently(batch, fetch_details, description)
+            )
+    elif ARGS_PARSER.ids_only:
+        for object_ in objects:
+            print(object_.id)
+    else:
+        print_numbered_object_stream(CLIENT, objects)
+
+
+def _stream_max_items() -> int | None:
+    """
+    The maximum number of items needed to satisfy '--offset' and '--limit'.
+    """
+    if ARGS_PARSER.limit is None:
+        return None
+    return (ARGS_PARSER.offset or 0) + ARGS_PARSER.limit
+
+
 def list_worker_pools():
     print_info(
         f"Displaying Worker Pools in namespace '{CONFIG_COMMON.namespace}' "
@@ -418,8 +544,8 @@ def list_nodes(worker_pool_summaries: list[WorkerPoolSummary]):
     """
     List the Nodes in a list of Worker Pools.
     """
-    nodes_all: list[Node] = []
-    for worker_pool_summary in worker_pool_summaries:
+
+    def get_nodes(worker_pool_summary: WorkerPoolSummary) -> list[Node]:
         nodes_search = NodeSearch(
             worker_pool_summary.id,
             statuses=[NodeStatus.RUNNING] if ARGS_PARSER.active_only else None,
@@ -428,6 +554,14 @@ def list_nodes(worker_pool_summaries: list[WorkerPoolSummary]):
         nodes: list[Node] = search_client.list_all()
         for node in nodes:
             node.workerPoolName = worker_pool_summary.name  # type: ignore[attr-defined]
+        return nodes
+
+    nodes_all: list[Node] = []
+    for nodes in fetch_concurrently(
+        worker_pool_summaries,
+        get_nodes,
+        lambda wp_summary: f"Nodes for Worker Pool '{wp_summary.name}'",
+    ):
         nodes_all += nodes
 
     if not nodes_all:
@@ -616,9 +750,8 @@ def get_keyring(name: str) -> Keyring:
     """
     Temporary function in place of a missing KeyringClient SDK call.
     """
-    response = get(
+    response = get_rest_session().get(
         url=f"{CONFIG_COMMON.url}/keyrings/{name}",
-        headers={"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"},
     )
     if response.status_code == 200:
         return Json.load(response.json(), Keyring)
@@ -711,9 +844,8 @@ def list_attribute_definitions():
     """
     List user compute attribute definitions using the API.
     """
-    response = get(
+    response = get_rest_session().get(
         url=f"{CONFIG_COMMON.url}/compute/attributes/user",
-        headers={"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"},
     )
 
     if response.status_code != 200:
@@ -827,8 +959,9 @@ def list_users():
 
     # Add the list of groups to the user details
     print_yd_object_list(
-        [
-            (
+        fetch_concurrently(
+            select(CLIENT, users),
+            lambda user: (
                 user,
                 {
                     PROP_GROUPS: [
@@ -837,9 +970,9 @@ def list_users():
                     ],
                     PROP_RESOURCE: user.__class__.__name__,
                 },
-            )
-            for user in select(CLIENT, users)
-        ]
+            ),
+            lambda user: f"Groups for User '{user.name}'",
+        )
     )
 
 
@@ -861,8 +994,9 @@ def list_applications():
 
     # Add the list of group names for each application
     print_yd_object_list(
-        [
-            (
+        fetch_concurrently(
+            select(CLIENT, applications),
+            lambda application: (
                 application,
                 {
                     PROP_GROUPS: [
@@ -873,9 +1007,9 @@ def list_applications():
                     ],
                     PROP_RESOURCE: RN_APPLICATION,
                 },
-            )
-            for application in select(CLIENT, applications)
-        ]
+            ),
+            lambda application: f"Groups for Application '{application.name}'",
+        )
     )
 
 
@@ -891,10 +1025,11 @@ def list_groups():
 
     group_summaries.sort(key=lambda group: group.name if group.name is not None else "")  # type: ignore[arg-type]
 
-    groups: list[Group] = [
-        CLIENT.account_client.get_group(group.id)  # type: ignore[arg-type]
-        for group in group_summaries
-    ]
+    groups: list[Group] = fetch_concurrently(
+        group_summaries,
+        lambda group: CLIENT.account_client.get_group(group.id),  # type: ignore[arg-type]
+        lambda group: f"Group '{group.name}'",
+    )
 
     if ARGS_PARSER.ids_only:
         for group in groups:
@@ -925,7 +1060,11 @@ def list_roles():
     role_summaries.sort(key=lambda role_: role_.name if role_.name is not None else "")
 
     print_info("Obtaining permissions for each role ...")
-    roles: list[Role] = [CLIENT.account_client.get_role(x.id) for x in role_summaries]  # type: ignore[arg-type]
+    roles: list[Role] = fetch_concurrently(
+        role_summaries,
+        lambda role_: CLIENT.account_client.get_role(role_.id),  # type: ignore[arg-type]
+        lambda role_: f"Role '{role_.name}'",
+    )
 
     # Sort permissions alphabetically (contorting the type)
     for role in roles:
@@ -960,9 +1099,8 @@ def get_autoscaling_capacity(namespace: str) -> dict:
     """
     Get the current autoscaling values for a namespace.
     """
-    response = get(
+    response = get_rest_session().get(
         url=f"{CONFIG_COMMON.url}/workerPools/namespaces/{namespace}/autoscalingCapacity",
-        headers={"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"},
     )
     if response.status_code == 200:
         return response.json()
@@ -10,7 +10,6 @@ from math import ceil, floor
 from os.path import dirname
 from typing import cast
 
-import requests
 from yellowdog_client.common.iso_datetime import iso_timedelta_format
 from yellowdog_client.model import (
     AutoShutdown,
@@ -57,7 +56,13 @@ from yellowdog_cli.utils.variables import (
     load_jsonnet_file_with_variable_substitutions,
     resolve_filename,
 )
-from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
+from yellowdog_cli.utils.wrapper import (
+    ARGS_PARSER,
+    CLIENT,
+    CONFIG_COMMON,
+    get_rest_session,
+    main_wrapper,
+)
 
 
 # Specifies the cardinality for a Worker Pool batch
@@ -254,9 +259,8 @@ def create_worker_pool_from_json(wp_json_file: str) -> None:
         print_info("Dry-run: Complete")
         return
 
-    response = requests.post(
+    response = get_rest_session().post(
         url=f"{CONFIG_COMMON.url}/workerPools/provisioned/template",
-        headers={"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"},
         json=wp_data,
     )
     name = wp_data["requirementTemplateUsage"]["requirementName"]
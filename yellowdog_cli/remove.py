@@ -7,7 +7,6 @@ A script to remove YellowDog resources.
 from copy import deepcopy
 from typing import cast
 
-from requests import delete
 from requests.exceptions import HTTPError
 from yellowdog_client.model import (
     MachineImage,
@@ -17,7 +16,10 @@ from yellowdog_client.model import (
 
 from yellowdog_cli.utils.entity_utils import (
     clear_application_caches,
+    clear_compute_requirement_template_cache,
+    clear_compute_source_template_cache,
     clear_group_caches,
+    clear_image_caches,
     get_application_id_by_name,
     get_compute_requirement_template_id_by_name,
     get_compute_source_template_id_by_name,
@@ -54,7 +56,13 @@ from yellowdog_cli.utils.settings import (
     RN_SOURCE_TEMPLATE,
     RN_STRING_ATTRIBUTE_DEFINITION,
 )
-from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
+from yellowdog_cli.utils.wrapper import (
+    ARGS_PARSER,
+    CLIENT,
+    CONFIG_COMMON,
+    get_rest_session,
+    main_wrapper,
+)
 from yellowdog_cli.utils.ydid_utils import YDIDType, get_ydid_type
 
 
@@ -167,6 +175,7 @@ def remove_compute_source_template(resource: dict):
     try:
         CLIENT.compute_client.delete_compute_source_template_by_id(source_id)
         print_info(f"Removed Compute Source Template '{name}' ({source_id})")
+        clear_compute_source_template_cache()
     except Exception as e:
         print_error(
             f"Unable to remove Compute Source Template '{name}' ({source_id}): {e}"
@@ -197,6 +206,7 @@ def remove_compute_requirement_template(resource: dict):
     try:
         CLIENT.compute_client.delete_compute_requirement_template_by_id(template_id)
         print_info(f"Removed Compute Requirement Template '{name}' ({template_id})")
+        clear_compute_requirement_template_cache()
     except Exception as e:
         print_error(
             f"Unable to remove Compute Requirement Template '{name}'"
@@ -295,6 +305,7 @@ def remove_image_family(resource: dict):
     try:
         CLIENT.images_client.delete_image_family(image_family)
         print_info(f"Removed Image Family '{fq_name}' ({image_family.id})")
+        clear_image_caches()
     except Exception as e:
         print_error(f"Unable to remove Image Family '{fq_name}': {e}")
         raise
@@ -380,6 +391,7 @@ def remove_resource_by_id(resource_id: str):
                 print_info(
                     f"Removed Compute Source Template {resource_id} (if present)"
                 )
+                clear_compute_source_template_cache()
 
         elif ydid_type == YDIDType.COMPUTE_REQUIREMENT_TEMPLATE:
             if confirmed(f"Remove Compute Requirement Template {resource_id}?"):
@@ -389,6 +401,7 @@ def remove_resource_by_id(resource_id: str):
                 print_info(
                     f"Removed Compute Requirement Template {resource_id} (if present)"
                 )
+                clear_compute_requirement_template_cache()
 
         elif ydid_type == YDIDType.IMAGE_FAMILY:
             if confirmed(f"Remove Image Family '{resource_id}'?"):
@@ -397,6 +410,7 @@ def remove_resource_by_id(resource_id: str):
                 )
                 CLIENT.images_client.delete_image_family(family)
                 print_info(f"Removed Image Family {resource_id} (if present)")
+                clear_image_caches()
 
         elif ydid_type == YDIDType.IMAGE_GROUP:
             if confirmed(f"Remove Image Group '{resource_id}'?"):
@@ -405,6 +419,7 @@ def remove_resource_by_id(resource_id: str):
                 )
                 CLIENT.images_client.delete_image_group(group)
                 print_info(f"Removed Image Family {resource_id} (if present)")
+                clear_image_caches()
 
         elif ydid_type == YDIDType.IMAGE:
             if confirmed(f"Remove Image '{resource_id}'?"):
@@ -436,11 +451,13 @@ def remove_resource_by_id(resource_id: str):
             if confirmed(f"Remove Group {resource_id}?"):
                 CLIENT.account_client.delete_group(resource_id)
                 print_info(f"Removed Group {resource_id} (if present)")
+                clear_group_caches()
 
         elif ydid_type == YDIDType.APPLICATION:
             if confirmed(f"Remove Application {resource_id}?"):
                 CLIENT.account_client.delete_application(resource_id)
                 print_info(f"Removed Application {resource_id} (if present)")
+                clear_application_caches()
 
         else:
             print_error(f"Resource ID type is unknown/unsupported: {resource_id}")
@@ -462,8 +479,7 @@ def remove_attribute_definition(resource: dict):
         return
 
     url = f"{CONFIG_COMMON.url}/compute/attributes/user/{name}"
-    headers = {"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"}
-    response = delete(url=url, headers=headers)
+    response = get_rest_session().delete(url=url)
 
     if response.status_code == 200:
         print_info(f"Removed Attribute Definition '{name}' (if present)")
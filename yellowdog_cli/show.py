@@ -55,8 +55,12 @@ def main():
         return
 
     # Generate a JSON list of resources if there are multiple YDIDs
-    # and the 'quiet' option is enabled
-    generate_json_list = len(ARGS_PARSER.yellowdog_ids) > 1 and ARGS_PARSER.quiet
+    # and the 'quiet' option is enabled, unless using JSON Lines
+    generate_json_list = (
+        len(ARGS_PARSER.yellowdog_ids) > 1
+        and ARGS_PARSER.quiet
+        and not ARGS_PARSER.json_lines
+    )
 
     if ARGS_PARSER.strip_ids:
         print_info("Stripping YellowDog IDs (etc.) from detailed JSON objects")
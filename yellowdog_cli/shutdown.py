@@ -7,20 +7,18 @@ A script to shut down Worker Pools and/or Nodes.
 from typing import cast
 
 from yellowdog_client.model import (
-    ConfiguredWorkerPool,
     ProvisionedWorkerPool,
-    WorkerPool,
     WorkerPoolSummary,
 )
 
+from yellowdog_cli.utils.bulk_operations import run_bulk_operation
 from yellowdog_cli.utils.entity_utils import (
-    get_worker_pool_by_id,
     get_worker_pool_id_by_name,
     get_worker_pool_summaries,
 )
 from yellowdog_cli.utils.follow_utils import follow_ids
 from yellowdog_cli.utils.interactive import confirmed, select
-from yellowdog_cli.utils.misc_utils import link_entity
+from yellowdog_cli.utils.misc_utils import link_entity_id
 from yellowdog_cli.utils.printing import print_error, print_info, print_warning
 from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
 from yellowdog_cli.utils.ydid_utils import YDIDType, get_ydid_type
@@ -45,8 +43,6 @@ def main():
         partial_name_matches=True,
     )
 
-    shutdown_count = 0
-
     selected_worker_pool_summaries: list[WorkerPoolSummary] = []
     for worker_pool_summary in worker_pool_summaries:
         if not worker_pool_summary.status.finished:  # type: ignore[union-attr]
@@ -60,36 +56,40 @@ def main():
     if selected_worker_pool_summaries:
         selected_worker_pool_summaries = select(CLIENT, selected_worker_pool_summaries)
 
-    if selected_worker_pool_summaries and confirmed(
+    if not selected_worker_pool_summaries or not confirmed(
         f"Shutdown {len(selected_worker_pool_summaries)} Worker Pool(s)?"
     ):
-        for worker_pool_summary in selected_worker_pool_summaries:
-            try:
-                CLIENT.worker_pool_client.shutdown_worker_pool_by_id(
-                    worker_pool_summary.id  # type: ignore[arg-type]
-                )
-                shutdown_count += 1
-                worker_pool: WorkerPool = get_worker_pool_by_id(
-                    CLIENT, cast(str, worker_pool_summary.id)
-                )
-                print_info(
-                    f"Shut down {link_entity(CONFIG_COMMON.url, cast(ConfiguredWorkerPool, worker_pool))}"
-                )
-                optionally_terminate_compute_requirement(
-                    cast(str, worker_pool_summary.id)
-                )
-            except Exception as e:
-                print_error(f"Failed to shut down '{worker_pool_summary.name}': {e}")
-
-    if shutdown_count > 0:
-        print_info(f"Shut down {shutdown_count} Worker Pool(s)")
-        if ARGS_PARSER.follow:
-            follow_ids(
-                [cast(str, wp.id) for wp in selected_worker_pool_summaries],
-                auto_cr=ARGS_PARSER.auto_cr,
+        print_info("No Worker Pools shut down")
+        return
+
+    result = run_bulk_operation(
+        selected_worker_pool_summaries,
+        lambda worker_pool_summary: (
+            CLIENT.worker_pool_client.shutdown_worker_pool_by_id(
+                worker_pool_summary.id  # type: ignore[arg-type]
             )
-    else:
+        ),
+        on_success=lambda worker_pool_summary, _: print_info(
+            f"Shut down {_link_worker_pool(worker_pool_summary)}"
+        ),
+        on_failure=lambda worker_pool_summary, e: print_error(
+            f"Failed to shut down '{worker_pool_summary.name}': {e}"
+        ),
+    )
+    if len(selected_worker_pool_summaries) > 1:
+        result.report("Shut down Worker Pools")
+    if not result.succeeded:
         print_info("No Worker Pools shut down")
+        return
+
+    optionally_terminate_compute_requirements(
+        [cast(str, wp.id) for wp, _ in result.succeeded]
+    )
+    if ARGS_PARSER.follow:
+        follow_ids(
+            [cast(str, wp.id) for wp in selected_worker_pool_summaries],
+            auto_cr=ARGS_PARSER.auto_cr,
+        )
 
 
 def shutdown_by_names_or_ids(names_or_ids: list[str]):
@@ -125,44 +125,82 @@ def shutdown_by_names_or_ids(names_or_ids: list[str]):
     ):
         return
 
-    for worker_pool_id in worker_pool_ids:
-        try:
-            CLIENT.worker_pool_client.shutdown_worker_pool_by_id(worker_pool_id)
-            print_info(f"Shut down Worker Pool '{worker_pool_id}'")
-            optionally_terminate_compute_requirement(worker_pool_id)
-        except Exception as e:
-            print_error(f"Failed to shut down Worker Pool '{worker_pool_id}': ({e})")
-
-    for node_id in node_ids:
-        try:
-            CLIENT.worker_pool_client.shutdown_node_by_id(node_id)
-            print_info(f"Shut down Node '{node_id}'")
-        except Exception as e:
-            print_error(f"Failed to to shut down Node '{node_id}': ({e})")
+    result = run_bulk_operation(
+        worker_pool_ids,
+        CLIENT.worker_pool_client.shutdown_worker_pool_by_id,
+        on_success=lambda worker_pool_id, _: print_info(
+            f"Shut down Worker Pool '{worker_pool_id}'"
+        ),
+        on_failure=lambda worker_pool_id, e: print_error(
+            f"Failed to shut down Worker Pool '{worker_pool_id}': ({e})"
+        ),
+    )
+    if len(worker_pool_ids) > 1:
+        result.report("Shut down Worker Pools")
+    optionally_terminate_compute_requirements(
+        [worker_pool_id for worker_pool_id, _ in result.succeeded]
+    )
+
+    result = run_bulk_operation(
+        node_ids,
+        CLIENT.worker_pool_client.shutdown_node_by_id,
+        on_success=lambda node_id, _: print_info(f"Shut down Node '{node_id}'"),
+        on_failure=lambda node_id, e: print_error(
+            f"Failed to to shut down Node '{node_id}': ({e})"
+        ),
+    )
+    if len(node_ids) > 1:
+        result.report("Shut down Nodes")
 
     if ARGS_PARSER.follow:
         follow_ids(worker_pool_ids, auto_cr=ARGS_PARSER.auto_cr)
 
 
-def optionally_terminate_compute_requirement(worker_pool_id: str):
+def optionally_terminate_compute_requirements(worker_pool_ids: list[str]):
     """
-    Optionally terminate the associated compute requirement.
+    Optionally terminate the compute requirements associated with
+    provisioned worker pools.
     """
     if not ARGS_PARSER.terminate:
         return
 
-    try:
-        worker_pool: ProvisionedWorkerPool = (
-            CLIENT.worker_pool_client.get_worker_pool_by_id(worker_pool_id)  # type: ignore[assignment]
-        )
-        CLIENT.compute_client.terminate_compute_requirement_by_id(
-            worker_pool.computeRequirementId  # type: ignore[arg-type]
-        )
-        print_info(
-            f"Terminated associated Compute Requirement '{worker_pool.computeRequirementId}'"
-        )
-    except Exception as e:
-        print_error(f"Failed to terminate Compute Requirement: ({e})")
+    result = run_bulk_operation(
+        worker_pool_ids,
+        _terminate_compute_requirement,
+        on_success=lambda _, compute_requirement_id: print_info(
+            f"Terminated associated Compute Requirement '{compute_requirement_id}'"
+        ),
+        on_failure=lambda _, e: print_error(
+            f"Failed to terminate Compute Requirement: ({e})"
+        ),
+    )
+    if len(worker_pool_ids) > 1:
+        result.report("Terminated associated Compute Requirements")
+
+
+def _terminate_compute_requirement(worker_pool_id: str) -> str:
+    """
+    Terminate the compute requirement associated with a provisioned worker
+    pool, and return its ID.
+    """
+    worker_pool: ProvisionedWorkerPool = (
+        CLIENT.worker_pool_client.get_worker_pool_by_id(worker_pool_id)  # type: ignore[assignment]
+    )
+    CLIENT.compute_client.terminate_compute_requirement_by_id(
+        worker_pool.computeRequirementId  # type: ignore[arg-type]
+    )
+    return cast(str, worker_pool.computeRequirementId)
+
+
+def _link_worker_pool(worker_pool_summary: WorkerPoolSummary) -> str:
+    """
+    Link to a worker pool using its summary.
+    """
+    return link_entity_id(
+        CONFIG_COMMON.url,
+        (worker_pool_summary.type or "").split(".")[-1],
+        cast(str, worker_pool_summary.id),
+    )
 
 
 # Entry point
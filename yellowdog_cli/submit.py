@@ -4,17 +4,31 @@
 A script to submit a Work Requirement.
 """
 
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import ExitStack, closing, contextmanager, nullcontext
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import timedelta
-from gzip import compress
+from hashlib import sha256
+from itertools import islice
 from json import dumps as json_dumps
 from math import ceil
+from multiprocessing import get_all_start_methods, get_context
 from os.path import dirname, relpath
+from threading import BoundedSemaphore, Event
+from time import sleep
 from typing import cast
 
 import jsons
-import requests
+from requests.exceptions import HTTPError, RequestException
+from yellowdog_client.common.json import Json
 from yellowdog_client.model import (
     CloudProvider,
     DoubleRange,
@@ -31,6 +45,7 @@ from yellowdog_client.model.instance_pricing_preference import (
 
 from yellowdog_cli.utils.config_types import ConfigWorkRequirement
 from yellowdog_cli.utils.csv_data import (
+    CSVTaskList,
     csv_expand_toml_tasks,
     load_json_file_with_csv_task_expansion,
     load_jsonnet_file_with_csv_task_expansion,
@@ -99,8 +114,14 @@ from yellowdog_cli.utils.property_names import (
     WR_TAG,
 )
 from yellowdog_cli.utils.rclone_utils import upgrade_rclone, which_rclone
+from yellowdog_cli.utils.retry_utils import get_retry_after, get_retry_delay
 from yellowdog_cli.utils.settings import (
+    ADAPTIVE_DEFAULT_PARALLEL_BATCHES,
+    BATCH_SUBMIT_BACKOFF_BASE,
+    BATCH_SUBMIT_BACKOFF_MAX,
+    DEFAULT_DATA_CLIENT_UPLOAD_THREADS,
     DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS,
+    DEFAULT_TASK_GENERATION_PROCESSES,
     L_TASK_COUNT,
     L_TASK_GROUP_COUNT,
     L_TASK_GROUP_NAME,
@@ -109,11 +130,17 @@ from yellowdog_cli.utils.settings import (
     L_TASK_NUMBER,
     L_WR_NAME,
     MAX_BATCH_SUBMIT_ATTEMPTS,
+    TASK_BATCHES_IN_FLIGHT_PER_THREAD,
+    TRANSIENT_ERROR_STATUS_CODES,
     VAR_NAME_OF_UNNAMED_TASK,
 )
 from yellowdog_cli.utils.submit_utils import (
+    AdaptiveTaskBatching,
+    RcloneUploadedFile,
     RcloneUploadedFiles,
+    TaskBatchCheckpoint,
     assemble_arguments,
+    compress_json_array,
     create_task,
     formatted_number_str,
     generate_dependencies,
@@ -122,9 +149,11 @@ from yellowdog_cli.utils.submit_utils import (
     get_task_data_property,
     get_task_group_name,
     get_task_name,
+    interleave_task_batches,
     merge_environment,
     pause_between_batches,
     resolve_task_data,
+    split_by_payload_size,
     update_config_work_requirement_object,
 )
 from yellowdog_cli.utils.type_check import (
@@ -135,16 +164,25 @@ from yellowdog_cli.utils.type_check import (
     check_list,
     check_str,
 )
+from yellowdog_cli.utils.upload_manifest import get_upload_manifest_filename
 from yellowdog_cli.utils.validate_properties import validate_properties
 from yellowdog_cli.utils.variables import (
+    SubstitutionPrototype,
     add_or_update_substitution,
     add_substitutions_without_overwriting,
     load_json_file_with_variable_substitutions,
     load_jsonnet_file_with_variable_substitutions,
     load_toml_file_with_variable_substitutions,
     process_variable_substitutions_insitu,
+    substitution_scope,
+)
+from yellowdog_cli.utils.wrapper import (
+    ARGS_PARSER,
+    CLIENT,
+    CONFIG_COMMON,
+    get_rest_session,
+    main_wrapper,
 )
-from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
 from yellowdog_cli.utils.ydid_utils import YDIDType
 
 # Import the Work Requirement configuration from the TOML file
@@ -153,6 +191,7 @@ CONFIG_WR: ConfigWorkRequirement = load_config_work_requirement()
 
 ID = generate_id(CONFIG_COMMON.name_tag)
 TASK_BATCH_SIZE = CONFIG_WR.task_batch_size
+TASK_BATCH_MAX_BYTES = CONFIG_WR.task_batch_max_bytes
 
 if ARGS_PARSER.dry_run:
     WR_SNAPSHOT = WorkRequirementSnapshot()
@@ -174,6 +213,9 @@ def main():
     if not 1 <= TASK_BATCH_SIZE <= 10000:
         raise ValueError("Task batch size must be between 1 and 10,000")
 
+    if TASK_BATCH_MAX_BYTES < 1:
+        raise ValueError("Task batch maximum bytes must be at least 1")
+
     if ARGS_PARSER.json_raw:
         submit_json_raw(ARGS_PARSER.json_raw)
         return
@@ -350,7 +392,13 @@ def submit_work_requirement(
 
     # Handle any files that need to be uploaded
     global RCLONE_UPLOADED_FILES
-    RCLONE_UPLOADED_FILES = RcloneUploadedFiles(files_directory=files_directory)
+    RCLONE_UPLOADED_FILES = RcloneUploadedFiles(
+        files_directory=files_directory,
+        upload_threads=get_upload_threads(),
+        manifest_filename=(
+            get_upload_manifest_filename() if CONFIG_WR.upload_manifest else None
+        ),
+    )
 
     # Expand number of task groups if there's a single task group
     # and taskGroupCount is set
@@ -420,20 +468,24 @@ def submit_work_requirement(
         WR_SNAPSHOT.set_work_requirement(work_requirement)
 
     # Add Tasks to their Task Groups
-    for tg_number, task_group in enumerate(task_groups):
-        try:
-            add_tasks_to_task_group(
-                tg_number,
-                task_group,
-                cast(dict, wr_data),
-                task_count,
-                work_requirement,
-                files_directory=files_directory,
-            )
+    try:
+        add_tasks_to_task_groups(
+            [
+                prepare_task_group_batches(
+                    tg_number,
+                    task_group,
+                    cast(dict, wr_data),
+                    task_count,
+                    files_directory=files_directory,
+                )
+                for tg_number, task_group in enumerate(task_groups)
+            ],
+            work_requirement,
+        )
 
-        except Exception as e:
-            cleanup_on_failure(work_requirement)
-            raise e
+    except Exception as e:
+        cleanup_on_failure(work_requirement)
+        raise e
 
     if ARGS_PARSER.progress:
         follow_progress_bar(work_requirement)
@@ -464,13 +516,16 @@ def create_task_group(
         if task_group_data.get(TASK_TYPES) is None:
             task_group_data[TASK_TYPES] = [task_group_data[TASK_TYPE]]
 
-    # Gather task types
+    # Gather task types; Tasks from CSV data aren't rendered to do this
     task_types_from_tasks = set()
-    for task in task_group_data[TASKS]:
-        try:
-            task_types_from_tasks.add(task[TASK_TYPE])
-        except KeyError:
-            pass
+    if isinstance(task_group_data[TASKS], CSVTaskList):
+        task_types_from_tasks = task_group_data[TASKS].property_values(TASK_TYPE)
+    else:
+        for task in task_group_data[TASKS]:
+            try:
+                task_types_from_tasks.add(task[TASK_TYPE])
+            except KeyError:
+                pass
 
     # Name the Task Group
     num_task_groups = (
@@ -692,6 +747,21 @@ def create_task_group(
     return task_group
 
 
+@dataclass
+class TaskGroupBatches:
+    """
+    The Task batches to be added to a Task Group, and their submission state.
+    """
+
+    task_group: TaskGroup
+    num_tasks: int
+    num_task_batches: int
+    generation_args: tuple
+    generation_kwargs: dict
+    task_batches: Iterator[list[Task]] | None = None
+    num_submitted_tasks: int = 0
+
+
 def add_tasks_to_task_group(
     tg_number: int,
     task_group: TaskGroup,
@@ -712,11 +782,43 @@ def add_tasks_to_task_group(
     task_number_offset: starting task number within the TG (for adding to an
       existing Task Group that already contains tasks).
     """
+    add_tasks_to_task_groups(
+        [
+            prepare_task_group_batches(
+                tg_number,
+                task_group,
+                wr_data,
+                task_count,
+                files_directory=files_directory,
+                tg_number_offset=tg_number_offset,
+                total_num_task_groups=total_num_task_groups,
+                task_number_offset=task_number_offset,
+            )
+        ],
+        work_requirement,
+    )
+
+
+def prepare_task_group_batches(
+    tg_number: int,
+    task_group: TaskGroup,
+    wr_data: dict,
+    task_count: int | None,
+    files_directory: str = "",
+    tg_number_offset: int = 0,
+    total_num_task_groups: int | None = None,
+    task_number_offset: int = 0,
+) -> TaskGroupBatches:
+    """
+    Determine the Task batches to be added to a Task Group, for submission
+    using add_tasks_to_task_groups(). Arguments are as for
+    add_tasks_to_task_group().
+    """
 
     num_tasks = len(wr_data[TASK_GROUPS][tg_number][TASKS])
 
     # If the 'taskCount' property is set, and there is only one Task
-    # in the Task Group, create 'taskCount' duplicates of the Task.
+    # in the Task Group, generate 'taskCount' Tasks from it.
     task_group_task_count = check_int(
         wr_data[TASK_GROUPS][tg_number].get(
             TASK_COUNT, wr_data.get(TASK_COUNT, CONFIG_WR.task_count)
@@ -729,10 +831,8 @@ def add_tasks_to_task_group(
                 f"Expanding number of Tasks in Task Group '{task_group.name}' to"
                 f" '{TASK_COUNT}={task_group_task_count}' Tasks"
             )
-            for _ in range(1, task_group_task_count):
-                wr_data[TASK_GROUPS][tg_number][TASKS].append(
-                    deepcopy(wr_data[TASK_GROUPS][tg_number][TASKS][0])
-                )
+            if task_count is None:
+                task_count = task_group_task_count
         elif task_group_task_count > 1:
             print_warning(
                 f"Note: Task Group '{task_group.name}' already contains"
@@ -757,112 +857,459 @@ def add_tasks_to_task_group(
             f"{num_task_batches} batches (batch size = {TASK_BATCH_SIZE})"
         )
 
-    # Add lazy substitutions for use in any Task property
-    add_or_update_substitution(L_TASK_COUNT, str(num_tasks))
-    add_or_update_substitution(L_TASK_GROUP_NAME, task_group.name)
-    add_or_update_substitution(
-        L_TASK_GROUP_NUMBER, formatted_number_str(effective_tg_number, num_task_groups)
+    # Lazy substitutions for use in any Task property. These are applied
+    # for each batch, so batches for different Task Groups can be interleaved.
+    task_group_substitutions = {
+        L_TASK_COUNT: str(num_tasks),
+        L_TASK_GROUP_NAME: task_group.name,
+        L_TASK_GROUP_NUMBER: formatted_number_str(effective_tg_number, num_task_groups),
+        L_TASK_GROUP_COUNT: str(num_task_groups),
+    }
+
+    return TaskGroupBatches(
+        task_group=task_group,
+        num_tasks=num_tasks,
+        num_task_batches=num_task_batches,
+        generation_args=(
+            wr_data,
+            files_directory,
+            task_group,
+            effective_tg_number,
+            tasks,
+            task_count,
+            num_tasks,
+            num_task_groups,
+        ),
+        generation_kwargs={
+            "task_number_offset": task_number_offset,
+            "wr_tg_index": tg_number,
+            "task_group_substitutions": task_group_substitutions,
+        },
+    )
+
+
+def add_tasks_to_task_groups(
+    task_group_batches_list: list[TaskGroupBatches],
+    work_requirement: WorkRequirement,
+) -> None:
+    """
+    Generate and submit the Task batches for one or more Task Groups.
+
+    Parallel submission uses a single pool of submission threads for all the
+    Task Groups, so the number of batches in flight isn't limited by the
+    number of batches in each Task Group. Batches are taken from the Task
+    Groups in turn, from a window of (at most) one Task Group per thread.
+    """
+    num_task_batches = sum(x.num_task_batches for x in task_group_batches_list)
+    if num_task_batches == 0:
+        for task_group_batches in task_group_batches_list:
+            report_task_group_submission(task_group_batches)
+        return
+
+    # Dry-run output is printed as the Tasks are added, so the batches
+    # are added in order
+    parallel_upload_threads = 1 if ARGS_PARSER.dry_run else get_parallel_batches()
+    adaptive_batching = (
+        None
+        if ARGS_PARSER.dry_run or not use_adaptive_batching()
+        else AdaptiveTaskBatching(
+            TASK_BATCH_SIZE, min(num_task_batches, parallel_upload_threads)
+        )
     )
-    add_or_update_substitution(L_TASK_GROUP_COUNT, str(num_task_groups))
 
-    num_submitted_tasks = 0
+    with ExitStack() as exit_stack:
+        # Batches are generated lazily, in order for each Task Group, as
+        # they're consumed below. Generation processes are shared by all the
+        # Task Groups.
+        generation_processes = min(get_task_generation_processes(), num_task_batches)
+        generation_executor = None
+        if generation_processes > 1:
+            print_info(
+                f"Generating Task batches using {generation_processes} processes"
+            )
+            generation_executor = exit_stack.enter_context(
+                create_task_generation_executor(
+                    generation_processes,
+                    {
+                        generation_key: (x.generation_args, x.generation_kwargs)
+                        for generation_key, x in enumerate(task_group_batches_list)
+                    },
+                )
+            )
+        for generation_key, task_group_batches in enumerate(task_group_batches_list):
+            task_group_batches.task_batches = exit_stack.enter_context(
+                closing(
+                    generate_task_batches(
+                        task_group_batches.num_task_batches,
+                        task_group_batches.num_tasks,
+                        generation_processes,
+                        task_group_batches.generation_args,
+                        task_group_batches.generation_kwargs,
+                        executor=generation_executor,
+                        generation_key=generation_key,
+                    )
+                )
+            )
 
-    # Determine number of parallel upload threads
-    parallel_upload_threads = (
+        # Single batch or sequential batch submission
+        if parallel_upload_threads == 1 or num_task_batches == 1:
+            for task_group_batches in task_group_batches_list:
+                _submit_task_group_batches_sequentially(
+                    task_group_batches, work_requirement, adaptive_batching
+                )
+
+        # Parallel batches
+        else:
+            _submit_task_batches_in_parallel(
+                task_group_batches_list,
+                work_requirement,
+                min(num_task_batches, parallel_upload_threads),
+                adaptive_batching,
+            )
+
+    for task_group_batches in task_group_batches_list:
+        report_task_group_submission(task_group_batches)
+
+    if adaptive_batching is not None:
+        adaptive_batching.print_report()
+
+
+def get_parallel_batches() -> int:
+    """
+    Determine the maximum number of Task batches to submit in parallel.
+    """
+    parallel_batches = (
         CONFIG_WR.parallel_batches
         if ARGS_PARSER.parallel_batches is None
         else ARGS_PARSER.parallel_batches
     )
-    parallel_upload_threads = (
-        DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS
-        if parallel_upload_threads is None
-        else parallel_upload_threads
+    if parallel_batches is not None:
+        return parallel_batches
+    return (
+        ADAPTIVE_DEFAULT_PARALLEL_BATCHES
+        if use_adaptive_batching()
+        else DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS
     )
 
-    # Single batch or sequential batch submission
-    if parallel_upload_threads == 1 or num_task_batches == 1:
-        if num_task_batches > 1:
-            print_info(f"Uploading {num_task_batches} Task batches sequentially")
-        for batch_number in range(num_task_batches):
-            if ARGS_PARSER.pause_between_batches is not None and num_task_batches > 1:
-                pause_between_batches(
-                    task_batch_size=TASK_BATCH_SIZE,
-                    batch_number=batch_number,
-                    num_tasks=num_tasks,
-                )
-            tasks_list = generate_batch_of_tasks_for_task_group(
-                (TASK_BATCH_SIZE * batch_number),
-                min(TASK_BATCH_SIZE * (batch_number + 1), num_tasks),
-                wr_data,
-                files_directory,
-                task_group,
-                effective_tg_number,
-                tasks,
-                task_count,
-                num_tasks,
-                num_task_groups,
-                task_number_offset=task_number_offset,
-                wr_tg_index=tg_number,
+
+def use_adaptive_batching() -> bool:
+    """
+    Is adaptive Task batch submission selected?
+    """
+    return bool(ARGS_PARSER.adaptive_batching or CONFIG_WR.adaptive_batching)
+
+
+def _submit_task_group_batches_sequentially(
+    task_group_batches: TaskGroupBatches,
+    work_requirement: WorkRequirement,
+    adaptive_batching: AdaptiveTaskBatching | None = None,
+):
+    """
+    Submit the Task batches for a Task Group one at a time.
+    """
+    num_task_batches = task_group_batches.num_task_batches
+    if num_task_batches > 1 and not ARGS_PARSER.dry_run:
+        print_info(f"Uploading {num_task_batches} Task batches sequentially")
+    for batch_number in range(num_task_batches):
+        if (
+            ARGS_PARSER.pause_between_batches is not None
+            and num_task_batches > 1
+            and not ARGS_PARSER.dry_run
+        ):
+            pause_between_batches(
+                task_batch_size=TASK_BATCH_SIZE,
+                batch_number=batch_number,
+                num_tasks=task_group_batches.num_tasks,
             )
-            num_submitted_tasks += submit_batch_of_tasks_to_task_group(
-                tasks_list,
+        task_group_batches.num_submitted_tasks += submit_batch_of_tasks_to_task_group(
+            next(cast(Iterator[list[Task]], task_group_batches.task_batches)),
+            work_requirement,
+            task_group_batches.task_group,
+            num_task_batches,
+            batch_number,
+            TASK_BATCH_SIZE,
+            task_group_batches.num_tasks,
+            adaptive_batching=adaptive_batching,
+        )
+
+
+def _submit_task_batches_in_parallel(
+    task_group_batches_list: list[TaskGroupBatches],
+    work_requirement: WorkRequirement,
+    max_workers: int,
+    adaptive_batching: AdaptiveTaskBatching | None = None,
+):
+    """
+    Submit the Task batches for the Task Groups using a pool of 'max_workers'
+    submission threads. With adaptive batching, the number of submissions
+    in flight is limited by 'adaptive_batching' and can be fewer.
+    """
+    if ARGS_PARSER.pause_between_batches is not None:
+        print_warning(
+            "Option 'pause-between-batches/-P' is ignored for parallel batch uploads"
+        )
+    print_info(
+        f"Submitting Task batches using {max_workers} parallel submission threads"
+        + ("" if adaptive_batching is None else " (adaptive batching)")
+    )
+    if CONFIG_WR.compress_task_batches:
+        get_rest_session(pool_size=max_workers)  # One connection per thread
+    # Batches are generated in this thread (or in generation processes),
+    # overlapping with submission in the pool. The semaphore applies
+    # backpressure, so only a bounded number of generated batches are
+    # held in memory at any time.
+    batches_in_flight = BoundedSemaphore(
+        max_workers * TASK_BATCHES_IN_FLIGHT_PER_THREAD
+    )
+    submission_failed = Event()
+
+    def _on_batch_done(future: Future):
+        if future.cancelled() or future.exception() is not None:
+            submission_failed.set()
+        batches_in_flight.release()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        executors: list[tuple[TaskGroupBatches, Future]] = []
+        for task_group_batches, batch_number in interleave_task_batches(
+            [
+                [(x, batch_number) for batch_number in range(x.num_task_batches)]
+                for x in task_group_batches_list
+            ],
+            max_workers,
+        ):
+            batches_in_flight.acquire()
+            if submission_failed.is_set():
+                # Stop generating; the failure is raised below
+                batches_in_flight.release()
+                break
+            future = executor.submit(
+                submit_batch_of_tasks_to_task_group,
+                next(cast(Iterator[list[Task]], task_group_batches.task_batches)),
                 work_requirement,
-                task_group,
-                num_task_batches,
+                task_group_batches.task_group,
+                task_group_batches.num_task_batches,
                 batch_number,
                 TASK_BATCH_SIZE,
-                num_tasks,
+                task_group_batches.num_tasks,
+                adaptive_batching=adaptive_batching,
             )
+            future.add_done_callback(_on_batch_done)
+            executors.append((task_group_batches, future))
 
-    # Parallel batches
-    else:
-        if ARGS_PARSER.pause_between_batches is not None:
-            print_warning(
-                "Option 'pause-between-batches/-P' is ignored for parallel batch uploads"
-            )
-        max_workers = min(num_task_batches, parallel_upload_threads)
+    for task_group_batches, future in executors:
+        # Raises any submission failure
+        task_group_batches.num_submitted_tasks += future.result()
+
+
+def report_task_group_submission(task_group_batches: TaskGroupBatches):
+    """
+    Report the number of Tasks added to a Task Group.
+    """
+    if ARGS_PARSER.dry_run:
+        return
+    task_group = task_group_batches.task_group
+    num_submitted_tasks = task_group_batches.num_submitted_tasks
+    if num_submitted_tasks > 0:
         print_info(
-            f"Submitting Task batches using {max_workers} parallel submission threads"
+            f"Added a total of {num_submitted_tasks:,d} Task(s) to Task Group"
+            f" '{task_group.name}'"
         )
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            executors: list[Future] = []
-            for batch_number in range(num_task_batches):
-                executors.append(
-                    executor.submit(
-                        submit_batch_of_tasks_to_task_group,
-                        generate_batch_of_tasks_for_task_group(
-                            (TASK_BATCH_SIZE * batch_number),
-                            min(TASK_BATCH_SIZE * (batch_number + 1), num_tasks),
-                            wr_data,
-                            files_directory,
-                            task_group,
-                            effective_tg_number,
-                            tasks,
-                            task_count,
-                            num_tasks,
-                            num_task_groups,
-                            task_number_offset=task_number_offset,
-                            wr_tg_index=tg_number,
-                        ),
-                        work_requirement,
-                        task_group,
-                        num_task_batches,
-                        batch_number,
-                        TASK_BATCH_SIZE,
-                        num_tasks,
-                    )
-                )
+    else:
+        print_info(f"No Tasks added to Task Group '{task_group.name}'")
 
-        num_submitted_tasks = sum(x.result() for x in executors)
 
-    if not ARGS_PARSER.dry_run:
-        if num_submitted_tasks > 0:
+def get_task_generation_processes() -> int:
+    """
+    Determine the number of processes to use for generating Task batches.
+    """
+    generation_processes = (
+        CONFIG_WR.generation_processes
+        if ARGS_PARSER.generation_processes is None
+        else ARGS_PARSER.generation_processes
+    )
+    if generation_processes is None:
+        return DEFAULT_TASK_GENERATION_PROCESSES
+
+    if generation_processes < 1:
+        raise ValueError("The number of Task generation processes must be at least 1")
+
+    if generation_processes > 1 and "fork" not in get_all_start_methods():
+        print_warning(
+            "Option 'generation-processes' requires the 'fork' process start "
+            "method, which is not available on this platform: generating Tasks "
+            "in a single process"
+        )
+        return 1
+
+    return generation_processes
+
+
+def get_upload_threads() -> int:
+    """
+    Determine the number of threads to use for uploading Data Client input
+    files.
+    """
+    upload_threads = (
+        CONFIG_WR.upload_threads
+        if ARGS_PARSER.upload_threads is None
+        else ARGS_PARSER.upload_threads
+    )
+    if upload_threads is None:
+        return DEFAULT_DATA_CLIENT_UPLOAD_THREADS
+
+    if upload_threads < 1:
+        raise ValueError("The number of upload threads must be at least 1")
+
+    return upload_threads
+
+
+def generate_task_batches(
+    num_task_batches: int,
+    num_tasks: int,
+    generation_processes: int,
+    generation_args: tuple,
+    generation_kwargs: dict,
+    executor: ProcessPoolExecutor | None = None,
+    generation_key: int = 0,
+) -> Generator[list[Task], None, None]:
+    """
+    Yield the batches of Tasks for a Task Group, in order, using
+    generate_batch_of_tasks_for_task_group(). With more than one generation
+    process, a bounded number of batches are generated ahead in a pool of
+    forked processes. A pool shared by several Task Groups can be supplied
+    as 'executor', with the Task Group's arguments registered under
+    'generation_key'.
+    """
+    batch_ranges = (
+        (
+            TASK_BATCH_SIZE * batch_number,
+            min(TASK_BATCH_SIZE * (batch_number + 1), num_tasks),
+        )
+        for batch_number in range(num_task_batches)
+    )
+
+    if generation_processes <= 1:
+        for start_task_number, end_task_number in batch_ranges:
+            yield generate_batch_of_tasks_for_task_group(
+                start_task_number,
+                end_task_number,
+                *generation_args,
+                **generation_kwargs,
+            )
+        return
+
+    with ExitStack() as exit_stack:
+        if executor is None:
             print_info(
-                f"Added a total of {num_submitted_tasks:,d} Task(s) to Task Group"
-                f" '{task_group.name}'"
+                f"Generating Task batches using {generation_processes} processes"
             )
-        else:
-            print_info(f"No Tasks added to Task Group '{task_group.name}'")
+            executor = exit_stack.enter_context(
+                create_task_generation_executor(
+                    generation_processes,
+                    {generation_key: (generation_args, generation_kwargs)},
+                )
+            )
+
+        def _start_uploads(future: Future):
+            if not future.cancelled() and future.exception() is None:
+                RCLONE_UPLOADED_FILES.start_uploads(future.result()[1])  # type: ignore[union-attr]
+
+        def _submit(start: int, end: int) -> Future:
+            future = cast(ProcessPoolExecutor, executor).submit(
+                _generate_batch_of_tasks_in_process, generation_key, start, end
+            )
+            # The files used by the batch are uploaded by this process as
+            # soon as it's generated
+            if RCLONE_UPLOADED_FILES is not None:
+                future.add_done_callback(_start_uploads)
+            return future
+
+        pending_batches: deque[Future] = deque(
+            _submit(start, end)
+            for start, end in islice(
+                batch_ranges,
+                generation_processes * TASK_BATCHES_IN_FLIGHT_PER_THREAD,
+            )
+        )
+        try:
+            while pending_batches:
+                tasks_list, uploaded_files = pending_batches.popleft().result()
+                if RCLONE_UPLOADED_FILES is not None:
+                    # The batch can only be submitted once its files are
+                    # uploaded; earlier batches have waited for any files
+                    # the generation process recorded before this batch
+                    RCLONE_UPLOADED_FILES.start_uploads(uploaded_files)
+                    RCLONE_UPLOADED_FILES.wait_for_uploads(uploaded_files)
+                for start, end in islice(batch_ranges, 1):
+                    pending_batches.append(_submit(start, end))
+                yield tasks_list
+        finally:
+            for future in pending_batches:
+                future.cancel()
+
+
+@contextmanager
+def create_task_generation_executor(
+    generation_processes: int, generation_args: dict[int, tuple[tuple, dict]]
+) -> Iterator[ProcessPoolExecutor]:
+    """
+    Create a pool of forked Task generation processes. 'generation_args' maps
+    generation keys to the (args, kwargs) for
+    generate_batch_of_tasks_for_task_group().
+    """
+    # Forked processes inherit the generation arguments and the current
+    # variable substitutions without pickling
+    executor = ProcessPoolExecutor(
+        max_workers=generation_processes,
+        mp_context=get_context("fork"),
+        initializer=_init_task_generation_process,
+        initargs=(generation_args,),
+    )
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Arguments for generate_batch_of_tasks_for_task_group() in a Task
+# generation process, by generation key
+_GENERATION_ARGS: dict[int, tuple[tuple, dict]] = {}
+
+
+def _init_task_generation_process(generation_args: dict[int, tuple[tuple, dict]]):
+    """
+    Initialise a Task generation process.
+    """
+    global _GENERATION_ARGS
+    _GENERATION_ARGS = generation_args
+    # Files are uploaded by the parent process, which deduplicates them
+    # across all the generation processes
+    if RCLONE_UPLOADED_FILES is not None:
+        RCLONE_UPLOADED_FILES.defer_uploads()
+
+
+def _generate_batch_of_tasks_in_process(
+    generation_key: int, start_task_number: int, end_task_number: int
+) -> tuple[list[Task], list[RcloneUploadedFile]]:
+    """
+    Generate a batch of Tasks in a Task generation process. Also returns the
+    files first used by this process while generating the batch, to be
+    uploaded by the parent process.
+    """
+    num_uploaded_files = (
+        0
+        if RCLONE_UPLOADED_FILES is None
+        else len(RCLONE_UPLOADED_FILES.uploaded_files)
+    )
+    generation_args, generation_kwargs = _GENERATION_ARGS[generation_key]
+    tasks_list = generate_batch_of_tasks_for_task_group(
+        start_task_number, end_task_number, *generation_args, **generation_kwargs
+    )
+    return tasks_list, (
+        []
+        if RCLONE_UPLOADED_FILES is None
+        else RCLONE_UPLOADED_FILES.uploaded_files[num_uploaded_files:]
+    )
 
 
 def generate_batch_of_tasks_for_task_group(
@@ -878,6 +1325,7 @@ def generate_batch_of_tasks_for_task_group(
     num_task_groups: int,
     task_number_offset: int = 0,
     wr_tg_index: int | None = None,
+    task_group_substitutions: dict | None = None,
 ) -> list[Task]:
     """
     Generate a batch of tasks for subsequent addition to a task group.
@@ -887,164 +1335,202 @@ def generate_batch_of_tasks_for_task_group(
       existing Task Group that already contains tasks.
     wr_tg_index: spec-relative index for accessing wr_data[TASK_GROUPS];
       defaults to tg_number when not provided.
+    task_group_substitutions: lazy substitutions for the Task Group, applied
+      for this batch only.
     """
     spec_tg_index = wr_tg_index if wr_tg_index is not None else tg_number
     tasks_list: list[Task] = []
-    for task_number in range(start_task_number, end_task_number):
-        task_group_data = wr_data[TASK_GROUPS][spec_tg_index]
-        task = tasks[task_number] if task_count is None else tasks[0]
-
-        set_task_names = check_bool(
-            task.get(
-                SET_TASK_NAMES,
-                task_group_data.get(
+    required_uploads: list[RcloneUploadedFile] = []
+
+    # Lazy substitutions are re-rendered for each Task only where they're
+    # used: a Task expanded using 'task_count', and the config, are analysed
+    # once per batch and their variable-free content is shared
+    task_prototype = None if task_count is None else SubstitutionPrototype(tasks[0])
+    config_wr_prototype = SubstitutionPrototype(deepcopy(CONFIG_WR.__dict__))
+
+    # Per-Task lazy substitutions are scoped to this batch, so batches can
+    # be generated concurrently
+    with substitution_scope():
+        for name, value in (task_group_substitutions or {}).items():
+            add_or_update_substitution(name, value)
+        for task_number in range(start_task_number, end_task_number):
+            task_group_data = wr_data[TASK_GROUPS][spec_tg_index]
+            task = tasks[task_number] if task_count is None else tasks[0]
+
+            set_task_names = check_bool(
+                task.get(
                     SET_TASK_NAMES,
-                    wr_data.get(SET_TASK_NAMES, CONFIG_WR.set_task_names),
-                ),
+                    task_group_data.get(
+                        SET_TASK_NAMES,
+                        wr_data.get(SET_TASK_NAMES, CONFIG_WR.set_task_names),
+                    ),
+                )
             )
-        )
 
-        display_task_number = task_number + task_number_offset
-        display_num_tasks = task_number_offset + num_tasks
+            display_task_number = task_number + task_number_offset
+            display_num_tasks = task_number_offset + num_tasks
 
-        task_name = get_task_name(
-            task.get(NAME, task.get(TASK_NAME, CONFIG_WR.task_name)),
-            set_task_names,
-            display_task_number,
-            display_num_tasks,
-            tg_number,
-            num_task_groups,
-            task_group.name,
-        )
+            task_name = get_task_name(
+                task.get(NAME, task.get(TASK_NAME, CONFIG_WR.task_name)),
+                set_task_names,
+                display_task_number,
+                display_num_tasks,
+                tg_number,
+                num_task_groups,
+                task_group.name,
+            )
 
-        task_name = None if task_name is None else format_yd_name(task_name)
+            task_name = None if task_name is None else format_yd_name(task_name)
 
-        add_or_update_substitution(
-            L_TASK_NAME,
-            VAR_NAME_OF_UNNAMED_TASK if task_name is None else task_name,
-        )
-        add_or_update_substitution(
-            L_TASK_NUMBER,
-            formatted_number_str(display_task_number, display_num_tasks),
-        )
-        process_variable_substitutions_insitu(task)
-        config_wr = update_config_work_requirement_object(deepcopy(CONFIG_WR))
+            add_or_update_substitution(
+                L_TASK_NAME,
+                VAR_NAME_OF_UNNAMED_TASK if task_name is None else task_name,
+            )
+            add_or_update_substitution(
+                L_TASK_NUMBER,
+                formatted_number_str(display_task_number, display_num_tasks),
+            )
+            if task_prototype is None:
+                process_variable_substitutions_insitu(task)
+            else:
+                task = cast(dict, task_prototype.render())
+            config_wr = ConfigWorkRequirement(
+                **cast(dict, config_wr_prototype.render())
+            )
 
-        arguments_list = check_list(
-            task.get(
-                ARGS,
-                wr_data.get(ARGS, task_group_data.get(ARGS, config_wr.args)),
+            arguments_list = check_list(
+                task.get(
+                    ARGS,
+                    wr_data.get(ARGS, task_group_data.get(ARGS, config_wr.args)),
+                )
             )
-        )
-        args_prefix = check_list(
-            wr_data.get(
-                ARGS_PREFIX, task_group_data.get(ARGS_PREFIX, config_wr.args_prefix)
+            args_prefix = check_list(
+                wr_data.get(
+                    ARGS_PREFIX, task_group_data.get(ARGS_PREFIX, config_wr.args_prefix)
+                )
             )
-        )
-        args_postfix = check_list(
-            wr_data.get(
-                ARGS_POSTFIX, task_group_data.get(ARGS_POSTFIX, config_wr.args_postfix)
+            args_postfix = check_list(
+                wr_data.get(
+                    ARGS_POSTFIX,
+                    task_group_data.get(ARGS_POSTFIX, config_wr.args_postfix),
+                )
             )
-        )
-        arguments_list = assemble_arguments(args_prefix, arguments_list, args_postfix)
-        env = check_dict(
-            task.get(ENV, task_group_data.get(ENV, wr_data.get(ENV, config_wr.env)))
-        )
-        add_env = check_dict(
-            wr_data.get(
-                ADD_ENVIRONMENT,
-                task_group_data.get(ADD_ENVIRONMENT, config_wr.add_environment),
+            arguments_list = assemble_arguments(
+                args_prefix, arguments_list, args_postfix
             )
-        )
-        env = merge_environment(env, add_env)
+            env = check_dict(
+                task.get(ENV, task_group_data.get(ENV, wr_data.get(ENV, config_wr.env)))
+            )
+            add_env = check_dict(
+                wr_data.get(
+                    ADD_ENVIRONMENT,
+                    task_group_data.get(ADD_ENVIRONMENT, config_wr.add_environment),
+                )
+            )
+            env = merge_environment(env, add_env)
 
-        add_yd_env_vars = check_bool(
-            task.get(
-                ADD_YD_ENV_VARS,
-                task_group_data.get(
+            add_yd_env_vars = check_bool(
+                task.get(
                     ADD_YD_ENV_VARS,
-                    wr_data.get(ADD_YD_ENV_VARS, config_wr.add_yd_env_vars),
-                ),
+                    task_group_data.get(
+                        ADD_YD_ENV_VARS,
+                        wr_data.get(ADD_YD_ENV_VARS, config_wr.add_yd_env_vars),
+                    ),
+                )
             )
-        )
 
-        # Task timeout is automatically inherited from the Task Group level
-        # unless overridden by the Task
-        task_timeout_minutes = check_float_or_int(
-            task.get(TASK_LEVEL_TIMEOUT, CONFIG_WR.task_level_timeout)
-        )
-        task_timeout = (
-            None
-            if task_timeout_minutes is None
-            else timedelta(minutes=task_timeout_minutes)
-        )
+            # Task timeout is automatically inherited from the Task Group level
+            # unless overridden by the Task
+            task_timeout_minutes = check_float_or_int(
+                task.get(TASK_LEVEL_TIMEOUT, CONFIG_WR.task_level_timeout)
+            )
+            task_timeout = (
+                None
+                if task_timeout_minutes is None
+                else timedelta(minutes=task_timeout_minutes)
+            )
 
-        # Data client inputs and outputs
-        task_data_inputs = check_list(
-            task.get(
-                TASK_DATA_INPUTS,
-                task_group_data.get(
+            # Data client inputs and outputs
+            task_data_inputs = check_list(
+                task.get(
                     TASK_DATA_INPUTS,
-                    wr_data.get(TASK_DATA_INPUTS, config_wr.task_data_inputs),
-                ),
+                    task_group_data.get(
+                        TASK_DATA_INPUTS,
+                        wr_data.get(TASK_DATA_INPUTS, config_wr.task_data_inputs),
+                    ),
+                )
             )
-        )
-        task_data_outputs = check_list(
-            task.get(
-                TASK_DATA_OUTPUTS,
-                task_group_data.get(
+            task_data_outputs = check_list(
+                task.get(
                     TASK_DATA_OUTPUTS,
-                    wr_data.get(TASK_DATA_OUTPUTS, config_wr.task_data_outputs),
-                ),
+                    task_group_data.get(
+                        TASK_DATA_OUTPUTS,
+                        wr_data.get(TASK_DATA_OUTPUTS, config_wr.task_data_outputs),
+                    ),
+                )
+            )
+            # This will 'pop' any 'localFile' properties, required for the
+            # following 'generate' call; the uploads proceed in the background.
+            # The inputs are copied first, because they may be shared with
+            # other Tasks (e.g., by the Task prototype, or from the Task Group)
+            if task_data_inputs is not None:
+                task_data_inputs = [
+                    dict(task_data_input)
+                    if isinstance(task_data_input, dict)
+                    else task_data_input
+                    for task_data_input in task_data_inputs
+                ]
+            required_uploads += RCLONE_UPLOADED_FILES.upload_dataclient_input_files(  # type: ignore[union-attr]
+                task_data_inputs
+            )
+            task_data_inputs_and_outputs = generate_taskdata_object(
+                task_data_inputs, task_data_outputs
             )
-        )
-        # This will 'pop' any 'localFile' properties, required for the
-        # following 'generate' call
-        RCLONE_UPLOADED_FILES.upload_dataclient_input_files(task_data_inputs)  # type: ignore[union-attr]
-        task_data_inputs_and_outputs = generate_taskdata_object(
-            task_data_inputs, task_data_outputs
-        )
-
-        # If there's no task type in the task definition, AND
-        # there's only one task type at the task group level,
-        # use that task type
-        try:
-            task_type = task[TASK_TYPE]
-        except KeyError:
-            if len(task_group.runSpecification.taskTypes) == 1:
-                task_type = task_group.runSpecification.taskTypes[0]
-            else:
-                task_type = config_wr.task_type
 
-        tasks_list.append(
-            create_task(
-                wr_data=wr_data,
-                task_group_data=task_group_data,
-                task_data=task,
-                task_name=task_name,
-                task_number=display_task_number + 1,
-                tg_name=task_group.name,
-                tg_number=tg_number + 1,
-                task_type=cast(str, task_type),
-                args=cast(list, arguments_list),
-                task_data_property=get_task_data_property(
-                    config_wr,
-                    wr_data,
-                    task_group_data,
-                    task,
-                    task_name,
-                    files_directory,
-                ),
-                env=env,
-                task_timeout=task_timeout,
-                add_yd_env_vars=add_yd_env_vars,
-                task_data_inputs_and_outputs=task_data_inputs_and_outputs,
-                wr_name=ID,
-                namespace=CONFIG_COMMON.namespace,
-                total_num_task_groups=num_task_groups,
-                total_num_tasks=display_num_tasks,
+            # If there's no task type in the task definition, AND
+            # there's only one task type at the task group level,
+            # use that task type
+            try:
+                task_type = task[TASK_TYPE]
+            except KeyError:
+                if len(task_group.runSpecification.taskTypes) == 1:
+                    task_type = task_group.runSpecification.taskTypes[0]
+                else:
+                    task_type = config_wr.task_type
+
+            tasks_list.append(
+                create_task(
+                    wr_data=wr_data,
+                    task_group_data=task_group_data,
+                    task_data=task,
+                    task_name=task_name,
+                    task_number=display_task_number + 1,
+                    tg_name=task_group.name,
+                    tg_number=tg_number + 1,
+                    task_type=cast(str, task_type),
+                    args=cast(list, arguments_list),
+                    task_data_property=get_task_data_property(
+                        config_wr,
+                        wr_data,
+                        task_group_data,
+                        task,
+                        task_name,
+                        files_directory,
+                    ),
+                    env=env,
+                    task_timeout=task_timeout,
+                    add_yd_env_vars=add_yd_env_vars,
+                    task_data_inputs_and_outputs=task_data_inputs_and_outputs,
+                    wr_name=ID,
+                    namespace=CONFIG_COMMON.namespace,
+                    total_num_task_groups=num_task_groups,
+                    total_num_tasks=display_num_tasks,
+                )
             )
-        )
+
+    # The batch can only be submitted once the files it uses are uploaded
+    if required_uploads:
+        RCLONE_UPLOADED_FILES.wait_for_uploads(required_uploads)  # type: ignore[union-attr]
 
     return tasks_list
 
@@ -1057,10 +1543,15 @@ def submit_batch_of_tasks_to_task_group(
     batch_number: int,
     task_batch_size: int,
     total_num_tasks: int,
+    adaptive_batching: AdaptiveTaskBatching | None = None,
 ) -> int:
     """
     Submit a batch of tasks to a task group. Return the number of tasks
-    submitted.
+    submitted. Unless Task batch compression is disabled, the Tasks are
+    serialized and posted as gzipped JSON, in submissions of no more than
+    TASK_BATCH_MAX_BYTES of JSON; otherwise the batch is submitted using the
+    SDK, which serializes it. With adaptive batching, the batch is also split
+    into sub-batches sized by 'adaptive_batching'.
     """
     if ARGS_PARSER.dry_run:
         global WR_SNAPSHOT
@@ -1086,49 +1577,95 @@ def submit_batch_of_tasks_to_task_group(
                 f" Group '{task_group.name}'"
             )
 
-    warning_already_displayed = False
-    last_exception = None
-
-    for attempts in range(MAX_BATCH_SUBMIT_ATTEMPTS):
-        try:
-            CLIENT.work_client.add_tasks_to_task_group_by_name(
-                CONFIG_COMMON.namespace,
-                work_requirement.name,
-                task_group.name,
-                tasks_list,
-            )
-            report_success()
-            return len(tasks_list)
+    def add_tasks(tasks: list[Task]):
+        warning_already_displayed = False
+        last_exception = None
+
+        for attempts in range(MAX_BATCH_SUBMIT_ATTEMPTS):
+            try:
+                with (
+                    nullcontext()
+                    if adaptive_batching is None
+                    else adaptive_batching.submission(len(tasks))
+                ) as submission:
+                    try:
+                        CLIENT.work_client.add_tasks_to_task_group_by_name(
+                            CONFIG_COMMON.namespace,
+                            work_requirement.name,
+                            task_group.name,
+                            tasks,
+                        )
+                    except HTTPError as e:
+                        if submission is not None:
+                            submission.throttled = (
+                                e.response is not None
+                                and e.response.status_code
+                                in TRANSIENT_ERROR_STATUS_CODES
+                            )
+                        raise
+                return
+
+            except Exception as e:
+                if "InvalidRequestException" in str(e):
+                    # Permanent failure; don't retry
+                    last_exception = e
+                    break
+
+                if "Task names must be unique within task group" in str(e):
+                    # Interpret this as success ... it implies that a previous
+                    # errored (500?) submission of these tasks must have
+                    # succeeded
+                    return
+
+                if not warning_already_displayed:
+                    print_warning(
+                        f"Failed to submit batch {batch_number_str} of {num_task_batches}: {e}"
+                    )
+                    warning_already_displayed = True
 
-        except Exception as e:
-            if "InvalidRequestException" in str(e):
-                # Permanent failure; don't retry
                 last_exception = e
-                break
-
-            if "Task names must be unique within task group" in str(e):
-                # Interpret this as success ... it implies that a previous
-                # errored (500?) submission of this batch must have succeeded
-                report_success()
-                return len(tasks_list)
-
-            if not warning_already_displayed:
-                print_warning(
-                    f"Failed to submit batch {batch_number_str} of {num_task_batches}: {e}"
-                )
-                warning_already_displayed = True
+                if attempts < MAX_BATCH_SUBMIT_ATTEMPTS - 1:
+                    retry_delay = get_retry_delay(
+                        attempts + 1,
+                        BATCH_SUBMIT_BACKOFF_BASE,
+                        BATCH_SUBMIT_BACKOFF_MAX,
+                    )
+                    print_info(
+                        f"Retrying submission of batch {batch_number_str} in "
+                        f"{retry_delay:.1f}s (retry attempt {attempts + 1} of "
+                        f"{MAX_BATCH_SUBMIT_ATTEMPTS - 1})"
+                    )
+                    sleep(retry_delay)
 
-            if attempts < MAX_BATCH_SUBMIT_ATTEMPTS - 1:
-                print_info(
-                    f"Retrying submission of batch {batch_number_str} "
-                    f"(retry attempt {attempts + 1} of {MAX_BATCH_SUBMIT_ATTEMPTS - 1})"
-                )
-            last_exception = e
+        raise RuntimeError(
+            f"Failed to submit batch {batch_number_str} {task_range_str}of {num_task_batches}: "
+            f"{last_exception}"
+        )
 
-    raise RuntimeError(
-        f"Failed to submit batch {batch_number_str} {task_range_str}of {num_task_batches}: "
-        f"{last_exception}"
-    )
+    for tasks in (
+        [tasks_list]
+        if adaptive_batching is None
+        else adaptive_batching.split(tasks_list)
+    ):
+        if not CONFIG_WR.compress_task_batches:
+            add_tasks(tasks)
+            continue
+        serialized_tasks = [
+            json_dumps(Json.dump(task)).encode("utf-8") for task in tasks
+        ]
+        for start, end in split_by_payload_size(
+            [len(x) for x in serialized_tasks], TASK_BATCH_MAX_BYTES
+        ):
+            post_json_tasks(
+                serialized_tasks[start:end],
+                batch_number_str,
+                num_task_batches,
+                task_group.name,
+                work_requirement.name,
+                adaptive_batching,
+            )
+    report_success()
+    return len(tasks_list)
 
 
 def follow_progress(work_requirement: WorkRequirement) -> None:
@@ -1204,7 +1741,13 @@ def add_to_existing_work_requirement(
 
     # Initialise rclone file uploads
     global RCLONE_UPLOADED_FILES
-    RCLONE_UPLOADED_FILES = RcloneUploadedFiles(files_directory=files_directory)
+    RCLONE_UPLOADED_FILES = RcloneUploadedFiles(
+        files_directory=files_directory,
+        upload_threads=get_upload_threads(),
+        manifest_filename=(
+            get_upload_manifest_filename() if CONFIG_WR.upload_manifest else None
+        ),
+    )
 
     # Build spec data
     wr_data = {TASK_GROUPS: [{TASKS: [{}]}]} if wr_data is None else wr_data
@@ -1277,37 +1820,39 @@ def add_to_existing_work_requirement(
             f"Added {len(new_tgs)} new Task Group(s) to existing Work Requirement '{ID}'"
         )
 
-    # Add tasks to new TGs (no task offset)
-    for spec_idx, spec_tg in new_tgs:
-        add_tasks_to_task_group(
+    # Add tasks to new TGs (no task offset), and to matched (existing) TGs,
+    # offsetting task numbers
+    task_group_batches_list = [
+        prepare_task_group_batches(
             tg_number=spec_idx,
             task_group=spec_tg,
             wr_data=cast(dict, wr_data),
             task_count=task_count,
-            work_requirement=work_requirement,
             files_directory=files_directory,
             tg_number_offset=n_existing,
             total_num_task_groups=total_tgs,
             task_number_offset=0,
         )
-
-    # Add tasks to matched (existing) TGs, offsetting task numbers
+        for spec_idx, spec_tg in new_tgs
+    ]
     for spec_idx, spec_tg, existing_tg in matched:
         task_summary = existing_tg.taskSummary
         existing_task_count: int = (
             task_summary.taskCount if task_summary is not None else 0
         )
-        add_tasks_to_task_group(
-            tg_number=spec_idx,
-            task_group=existing_tg,
-            wr_data=cast(dict, wr_data),
-            task_count=task_count,
-            work_requirement=work_requirement,
-            files_directory=files_directory,
-            tg_number_offset=n_existing,
-            total_num_task_groups=total_tgs,
-            task_number_offset=existing_task_count,
+        task_group_batches_list.append(
+            prepare_task_group_batches(
+                tg_number=spec_idx,
+                task_group=existing_tg,
+                wr_data=cast(dict, wr_data),
+                task_count=task_count,
+                files_directory=files_directory,
+                tg_number_offset=n_existing,
+                total_num_task_groups=total_tgs,
+                task_number_offset=existing_task_count,
+            )
         )
+    add_tasks_to_task_groups(task_group_batches_list, work_requirement)
 
     if ARGS_PARSER.progress:
         follow_progress_bar(work_requirement)
@@ -1356,109 +1901,273 @@ def submit_json_raw(wr_file: str):
         task_lists[task_group["name"]] = task_group.get("tasks", [])
         task_group.pop("tasks", None)
 
-    # Submit the Work Requirement and its Task Groups
-    response = requests.post(
-        url=f"{CONFIG_COMMON.url}/work/requirements",
-        headers={"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"},
-        json=wr_data,
+    checkpoint = (
+        None
+        if ARGS_PARSER.checkpoint_file is None
+        else TaskBatchCheckpoint(ARGS_PARSER.checkpoint_file)
     )
-
-    if response.status_code == 200:
-        wr_id = jsons.loads(response.text)["id"]
+    # Used to check that a resumed submission has the same Task batches
+    input_hash = ""
+    if checkpoint is not None:
+        with open(wr_file, "rb") as f:
+            input_hash = sha256(f.read()).hexdigest()
+    task_counts = {name: len(task_list) for name, task_list in task_lists.items()}
+
+    if checkpoint is not None and checkpoint.work_requirement_id is not None:
+        # Resume the submission recorded in the checkpoint file
+        checkpoint.check_resume(TASK_BATCH_SIZE, input_hash, task_counts)
+        wr_id = checkpoint.work_requirement_id
+        wr_name = cast(str, checkpoint.work_requirement_name)
         print_info(
-            f"Created Work Requirement '{wr_data['namespace']}/{wr_name}' ({wr_id})"
+            f"Resuming submission to Work Requirement '{wr_data['namespace']}/"
+            f"{wr_name}' ({wr_id}) using checkpoint file '{checkpoint.filename}'"
         )
-        if ARGS_PARSER.quiet:
-            print(wr_id)
+
     else:
-        print_error(f"Failed to create Work Requirement '{wr_name}'")
-        raise RuntimeError(f"{response.text}")
+        # Submit the Work Requirement and its Task Groups
+        response = get_rest_session().post(
+            url=f"{CONFIG_COMMON.url}/work/requirements",
+            json=wr_data,
+        )
 
-    if ARGS_PARSER.hold:
-        CLIENT.work_client.hold_work_requirement_by_id(wr_id)
-        print_info("Work Requirement status set to 'HELD'")
+        if response.status_code == 200:
+            wr_id = jsons.loads(response.text)["id"]
+            print_info(
+                f"Created Work Requirement '{wr_data['namespace']}/{wr_name}' ({wr_id})"
+            )
+            if ARGS_PARSER.quiet:
+                print(wr_id)
+        else:
+            print_error(f"Failed to create Work Requirement '{wr_name}'")
+            raise RuntimeError(f"{response.text}")
+
+        if ARGS_PARSER.hold:
+            CLIENT.work_client.hold_work_requirement_by_id(wr_id)
+            print_info("Work Requirement status set to 'HELD'")
 
-    # Submit Tasks in batches
+        if checkpoint is not None:
+            checkpoint.set_work_requirement(
+                wr_id, wr_name, TASK_BATCH_SIZE, input_hash, task_counts
+            )
+            print_info(
+                f"Recording submitted Task batches in checkpoint file "
+                f"'{checkpoint.filename}'"
+            )
+
+    # Submit Tasks in batches, using a single pool of submission threads for
+    # all the Task Groups; batches are taken from the Task Groups in turn
+    task_batch_numbers: dict[str, list[int]] = {}
     for task_group_name, task_list in task_lists.items():
         num_batches = ceil(len(task_list) / TASK_BATCH_SIZE)
-        max_workers = min(
-            num_batches,
-            (
-                DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS
-                if ARGS_PARSER.parallel_batches is None
-                else ARGS_PARSER.parallel_batches
-            ),
-        )
+        task_batch_numbers[task_group_name] = [
+            batch_number
+            for batch_number in range(num_batches)
+            if checkpoint is None
+            or not checkpoint.is_submitted(task_group_name, batch_number)
+        ]
+        num_skipped_batches = num_batches - len(task_batch_numbers[task_group_name])
+        if num_skipped_batches > 0:
+            print_info(
+                f"Skipped {num_skipped_batches} Task batch(es) already submitted "
+                f"to Task Group '{task_group_name}'"
+            )
+
+    max_workers = max(
+        1,
+        min(
+            sum(len(x) for x in task_batch_numbers.values()),
+            get_parallel_batches(),
+        ),
+    )
+    adaptive_batching = (
+        AdaptiveTaskBatching(TASK_BATCH_SIZE, max_workers)
+        if use_adaptive_batching()
+        else None
+    )
+    print_info(
+        f"Submitting task batches using {max_workers} parallel submission thread(s)"
+        + ("" if adaptive_batching is None else " (adaptive batching)")
+    )
+    get_rest_session(pool_size=max_workers)  # One connection per thread
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        executors: dict[str, list[Future]] = {name: [] for name in task_lists}
+        for task_group_name, batch_number in interleave_task_batches(
+            [
+                [(task_group_name, batch_number) for batch_number in batch_numbers]
+                for task_group_name, batch_numbers in task_batch_numbers.items()
+            ],
+            max_workers,
+        ):
+            task_list = task_lists[task_group_name]
+            executors[task_group_name].append(
+                executor.submit(
+                    submit_json_task_batch,
+                    task_list[
+                        batch_number * TASK_BATCH_SIZE : min(
+                            len(task_list), (batch_number + 1) * TASK_BATCH_SIZE
+                        )
+                    ],
+                    batch_number,
+                    ceil(len(task_list) / TASK_BATCH_SIZE),
+                    task_group_name,
+                    wr_name,
+                    checkpoint,
+                    adaptive_batching,
+                )
+            )
+
+        # Stop at the first failed batch: batches not yet started are
+        # cancelled, so the submission can be resumed from the failed batch
+        try:
+            for future in as_completed(
+                [future for futures in executors.values() for future in futures]
+            ):
+                future.result()
+        except Exception:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    for task_group_name, task_group_executors in executors.items():
+        num_submitted_tasks = sum([x.result() for x in task_group_executors])
         print_info(
-            f"Submitting task batches using {max_workers} parallel submission thread(s)"
+            f"Added a total of {num_submitted_tasks} Task(s) to Task Group '{task_group_name}'"
         )
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            executors: list[Future] = []
-            for batch_number in range(num_batches):
-                task_batch = task_list[
-                    batch_number * TASK_BATCH_SIZE : min(
-                        len(task_list), (batch_number + 1) * TASK_BATCH_SIZE
-                    )
-                ]
-                executors.append(
-                    executor.submit(
-                        submit_json_task_batch,
-                        task_batch,
-                        batch_number,
-                        num_batches,
-                        task_group_name,
-                        wr_name,
-                    )
-                )
 
-            executor.shutdown()
-            num_submitted_tasks = sum([x.result() for x in executors])
-            print_info(
-                f"Added a total of {num_submitted_tasks} Task(s) to Task Group '{task_group_name}'"
-            )
+    if adaptive_batching is not None:
+        adaptive_batching.print_report()
 
     if ARGS_PARSER.follow:
         follow_progress(CLIENT.work_client.get_work_requirement_by_id(wr_id))
 
 
 def submit_json_task_batch(
-    task_batch: dict,
+    task_batch: list[dict],
     batch_number: int,
     num_batches: int,
     task_group_name: str,
     wr_name: str,
+    checkpoint: TaskBatchCheckpoint | None = None,
+    adaptive_batching: AdaptiveTaskBatching | None = None,
 ) -> int:
     """
-    Submit a batch of tasks using the REST API. Return the number of tasks submitted.
+    Submit a batch of tasks using the REST API. Return the number of tasks
+    submitted. Transient failures are retried with backoff; raise an exception
+    if the batch can't be submitted. The batch is split into submissions of
+    no more than TASK_BATCH_MAX_BYTES of JSON. With adaptive batching, the
+    batch is also split into sub-batches sized by 'adaptive_batching'.
     """
-    task_batch_compressed = compress(json_dumps(task_batch).encode("utf-8"))
+    batch_number_str = formatted_number_str(batch_number, num_batches)
 
-    response = requests.post(
-        url=(
-            f"{CONFIG_COMMON.url}/work/namespaces/{CONFIG_COMMON.namespace}"
-            f"/requirements/{wr_name}/taskGroups/{task_group_name}/tasks"
-        ),
-        headers={
-            "Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}",
-            "Content-Encoding": "gzip",
-            "Content-Type": "application/json",
-        },
-        data=task_batch_compressed,
+    for tasks in (
+        [task_batch]
+        if adaptive_batching is None
+        else adaptive_batching.split(task_batch)
+    ):
+        serialized_tasks = [json_dumps(task).encode("utf-8") for task in tasks]
+        for start, end in split_by_payload_size(
+            [len(x) for x in serialized_tasks], TASK_BATCH_MAX_BYTES
+        ):
+            post_json_tasks(
+                serialized_tasks[start:end],
+                batch_number_str,
+                num_batches,
+                task_group_name,
+                wr_name,
+                adaptive_batching,
+            )
+
+    print_info(
+        f"Added {len(task_batch)} Task(s) to Task Group "
+        f"'{task_group_name}' (Batch {batch_number_str} "
+        f"of {num_batches})"
     )
+    if checkpoint is not None:
+        checkpoint.record_batch(task_group_name, batch_number)
+    return len(task_batch)
 
-    if response.status_code == 200:
-        print_info(
-            f"Added {len(task_batch)} Task(s) to Task Group "
-            f"'{task_group_name}' (Batch {formatted_number_str(batch_number, num_batches)} "
-            f"of {num_batches})"
-        )
-        return len(task_batch)
 
-    print_error(
-        f"Failed to submit batch {batch_number + 1} of {num_batches}: {response.text}"
-    )
+def post_json_tasks(
+    serialized_tasks: list[bytes],
+    batch_number_str: str,
+    num_batches: int,
+    task_group_name: str,
+    wr_name: str,
+    adaptive_batching: AdaptiveTaskBatching | None = None,
+):
+    """
+    Post a list of serialized tasks to a Task Group as gzipped JSON using the
+    REST API, retrying transient failures with backoff. Raise an exception if
+    the tasks can't be submitted.
+    """
+    tasks_compressed = compress_json_array(serialized_tasks)
+    last_error = None
+    retry_after = None
+
+    for attempts in range(MAX_BATCH_SUBMIT_ATTEMPTS):
+        if attempts > 0:
+            retry_delay = get_retry_delay(
+                attempts,
+                BATCH_SUBMIT_BACKOFF_BASE,
+                BATCH_SUBMIT_BACKOFF_MAX,
+                retry_after,
+            )
+            print_info(
+                f"Retrying submission of batch {batch_number_str} in "
+                f"{retry_delay:.1f}s (retry attempt {attempts} of "
+                f"{MAX_BATCH_SUBMIT_ATTEMPTS - 1})"
+            )
+            sleep(retry_delay)
+            retry_after = None
 
-    return 0
+        try:
+            with (
+                nullcontext()
+                if adaptive_batching is None
+                else adaptive_batching.submission(
+                    len(serialized_tasks), len(tasks_compressed)
+                )
+            ) as submission:
+                response = get_rest_session().post(
+                    url=(
+                        f"{CONFIG_COMMON.url}/work/namespaces/{CONFIG_COMMON.namespace}"
+                        f"/requirements/{wr_name}/taskGroups/{task_group_name}/tasks"
+                    ),
+                    headers={
+                        "Content-Encoding": "gzip",
+                        "Content-Type": "application/json",
+                    },
+                    data=tasks_compressed,
+                )
+                if submission is not None and response.status_code != 200:
+                    submission.failed = True
+                    submission.throttled = (
+                        response.status_code in TRANSIENT_ERROR_STATUS_CODES
+                    )
+        except RequestException as e:
+            last_error = str(e)
+        else:
+            # A 'unique names' error implies that a previous errored submission
+            # of these tasks must have succeeded
+            if (
+                response.status_code == 200
+                or "Task names must be unique within task group" in response.text
+            ):
+                return
+
+            last_error = f"HTTP {response.status_code} ({response.text})"
+            if response.status_code not in TRANSIENT_ERROR_STATUS_CODES:
+                break  # Permanent failure; don't retry
+            retry_after = get_retry_after(response)
+
+        if attempts == 0:
+            print_warning(
+                f"Failed to submit batch {batch_number_str} of {num_batches}: "
+                f"{last_error}"
+            )
+
+    raise RuntimeError(
+        f"Failed to submit batch {batch_number_str} of {num_batches}: {last_error}"
+    )
 
 
 # Standalone entry point
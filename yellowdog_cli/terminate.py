@@ -7,7 +7,6 @@ A script to terminate Compute Requirements and Nodes.
 from typing import cast
 
 from yellowdog_client.model import (
-    ComputeRequirement,
     ComputeRequirementStatus,
     ComputeRequirementSummary,
     Instance,
@@ -16,6 +15,7 @@ from yellowdog_client.model import (
     NodeStatus,
 )
 
+from yellowdog_cli.utils.bulk_operations import run_bulk_operation
 from yellowdog_cli.utils.entity_utils import (
     get_compute_requirement_id_by_name,
     get_compute_requirement_id_by_worker_pool_id,
@@ -24,7 +24,7 @@ from yellowdog_cli.utils.entity_utils import (
 )
 from yellowdog_cli.utils.follow_utils import follow_ids
 from yellowdog_cli.utils.interactive import confirmed, select
-from yellowdog_cli.utils.misc_utils import link_entity
+from yellowdog_cli.utils.misc_utils import link_entity_id
 from yellowdog_cli.utils.printing import print_error, print_info, print_warning
 from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON, main_wrapper
 from yellowdog_cli.utils.ydid_utils import YDIDType, get_ydid_type
@@ -59,41 +59,42 @@ def main():
         )
     )
 
-    terminated_count = 0
     selected_compute_requirement_summaries: list[ComputeRequirementSummary] = select(
         CLIENT, compute_requirement_summaries
     )
 
-    if selected_compute_requirement_summaries and confirmed(
+    if not selected_compute_requirement_summaries or not confirmed(
         f"Terminate {len(selected_compute_requirement_summaries)} Compute Requirement(s)?"
     ):
-        for compute_requirement_summary in selected_compute_requirement_summaries:  # type: ignore[assignment]
-            try:
-                CLIENT.compute_client.terminate_compute_requirement_by_id(
-                    compute_requirement_summary.id  # type: ignore[arg-type]
-                )
-                compute_requirement_summary: ComputeRequirement = (  # type: ignore[assignment]
-                    CLIENT.compute_client.get_compute_requirement_by_id(
-                        compute_requirement_summary.id  # type: ignore[arg-type]
-                    )
-                )
-                terminated_count += 1
-                print_info(
-                    f"Terminated {link_entity(CONFIG_COMMON.url, compute_requirement_summary)}"
-                )
-            except Exception as e:
-                print_error(
-                    f"Failed to terminate '{compute_requirement_summary.name}': {e}"
-                )
+        print_info("No Compute Requirements terminated")
+        return
 
-    if terminated_count > 0:
-        print_info(f"Terminated {terminated_count} Compute Requirement(s)")
-        if ARGS_PARSER.follow:
-            follow_ids(
-                [cast(str, cr.id) for cr in selected_compute_requirement_summaries]
+    result = run_bulk_operation(
+        selected_compute_requirement_summaries,
+        lambda compute_requirement_summary: (
+            CLIENT.compute_client.terminate_compute_requirement_by_id(
+                compute_requirement_summary.id  # type: ignore[arg-type]
+            )
+        ),
+        on_success=lambda compute_requirement_summary, _: print_info(
+            "Terminated "
+            + link_entity_id(
+                CONFIG_COMMON.url,
+                "ComputeRequirement",
+                cast(str, compute_requirement_summary.id),
             )
-    else:
+        ),
+        on_failure=lambda compute_requirement_summary, e: print_error(
+            f"Failed to terminate '{compute_requirement_summary.name}': {e}"
+        ),
+    )
+
+    if len(selected_compute_requirement_summaries) > 1:
+        result.report("Terminated Compute Requirements")
+    if not result.succeeded:
         print_info("No Compute Requirements terminated")
+    elif ARGS_PARSER.follow:
+        follow_ids([cast(str, cr.id) for cr in selected_compute_requirement_summaries])
 
 
 def terminate_by_name_or_id(names_or_ids: list[str]):
@@ -158,14 +159,18 @@ def terminate_by_name_or_id(names_or_ids: list[str]):
             f": ({', '.join(compute_requirement_ids)})"
         ):
             return
-        for compute_requirement_id in compute_requirement_ids:
-            try:
-                CLIENT.compute_client.terminate_compute_requirement_by_id(
-                    compute_requirement_id
-                )
-                print_info(f"Terminated '{compute_requirement_id}'")
-            except Exception as e:
-                print_error(f"Failed to terminate '{compute_requirement_id}': ({e})")
+        result = run_bulk_operation(
+            compute_requirement_ids,
+            CLIENT.compute_client.terminate_compute_requirement_by_id,
+            on_success=lambda compute_requirement_id, _: print_info(
+                f"Terminated '{compute_requirement_id}'"
+            ),
+            on_failure=lambda compute_requirement_id, e: print_error(
+                f"Failed to terminate '{compute_requirement_id}': ({e})"
+            ),
+        )
+        if len(compute_requirement_ids) > 1:
+            result.report("Terminated Compute Requirements")
 
     # Follow all the CR IDs from CR terminations and node, instance terminations
     if ARGS_PARSER.follow:
@@ -17,6 +17,7 @@ from yellowdog_cli.utils.dataclient_wrapper import dataclient_wrapper
 from yellowdog_cli.utils.load_config import load_config_data_client
 from yellowdog_cli.utils.printing import print_error, print_info, print_warning
 from yellowdog_cli.utils.rclone_utils import upgrade_rclone, which_rclone
+from yellowdog_cli.utils.settings import FLATTEN_COLLISION_POLICY_DEFAULT
 
 CONFIG_DATA_CLIENT: ConfigDataClient = load_config_data_client()
 
@@ -35,6 +36,7 @@ def main():
     recursive = (ARGS_PARSER.recursive or False) or sync  # --sync implies --recursive
     flatten = ARGS_PARSER.flatten or False
     dry_run = ARGS_PARSER.dry_run or False
+    on_collision = ARGS_PARSER.on_collision or FLATTEN_COLLISION_POLICY_DEFAULT
     destination = ARGS_PARSER.destination
 
     for local_path_str in ARGS_PARSER.local_paths:
@@ -61,6 +63,7 @@ def main():
                 flatten=flatten,
                 sync=sync,
                 dry_run=dry_run,
+                on_collision=on_collision,
             )
         else:
             remote_path = (
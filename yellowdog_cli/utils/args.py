@@ -7,7 +7,9 @@ import sys
 
 from yellowdog_cli.__init__ import __version__
 from yellowdog_cli.utils.settings import (
+    DEFAULT_DATA_CLIENT_UPLOAD_THREADS,
     DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS,
+    DEFAULT_TASK_GENERATION_PROCESSES,
     DEFAULT_URL,
     ET_ALLOWANCES,
     ET_APPLICATIONS,
@@ -30,6 +32,11 @@ from yellowdog_cli.utils.settings import (
     ET_WORK_REQUIREMENTS,
     ET_WORKER_POOLS,
     ET_WORKERS,
+    EVENT_REPLAY_SPEED_DEFAULT,
+    FLATTEN_COLLISION_POLICIES,
+    FLATTEN_COLLISION_POLICY_DEFAULT,
+    PROGRESS_REFRESH_PER_SECOND,
+    TASK_BATCH_MAX_BYTES_DEFAULT,
 )
 from yellowdog_cli.version import DOCS_URL
 
@@ -196,6 +203,14 @@ class CLIParser:
             required=False,
             help="enable PAC (proxy auto-configuration) support",
         )
+        parser.add_argument(
+            "--resolution-cache",
+            action="store_true",
+            required=False,
+            help=(
+                "cache name to ID resolutions on disk, for use by subsequent commands"
+            ),
+        )
         parser.add_argument(
             "--no-format",
             "--nf",
@@ -355,6 +370,17 @@ class CLIParser:
                 help="submit a 'raw' JSON work requirement file",
                 metavar="<raw_work_requirement.json>",
             )
+            parser.add_argument(
+                "--checkpoint-file",
+                type=str,
+                required=False,
+                help=(
+                    "record the task batches submitted using 'json-raw' in this"
+                    " file; if the file exists, resume the recorded submission,"
+                    " skipping batches already submitted"
+                ),
+                metavar="<checkpoint_file>",
+            )
             parser.add_argument(
                 "--follow",
                 "-f",
@@ -394,6 +420,17 @@ class CLIParser:
                 help="the batch size for task submission; must be between 1 and 10,000",
                 metavar="<batch_size>",
             )
+            parser.add_argument(
+                "--task-batch-max-bytes",
+                type=int,
+                required=False,
+                help=(
+                    "the maximum serialized size of a compressed task batch "
+                    "submission in bytes; larger batches are split "
+                    f"(default={TASK_BATCH_MAX_BYTES_DEFAULT:,d})"
+                ),
+                metavar="<max_bytes>",
+            )
             parser.add_argument(
                 "--pause-between-batches",
                 "-P",
@@ -440,12 +477,35 @@ class CLIParser:
                 type=int,
                 required=False,
                 help=(
-                    "the maximum number of parallel task batch "
-                    f"uploads (default={DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS})"
+                    "the maximum number of parallel task batch uploads, "
+                    "across all task groups "
+                    f"(default={DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS})"
                     "; set this to '1' for sequential batch upload"
                 ),
                 metavar="<max_number_of_parallel_batches>",
             )
+            parser.add_argument(
+                "--generation-processes",
+                type=int,
+                required=False,
+                help=(
+                    "the number of processes used to generate task batches "
+                    f"(default={DEFAULT_TASK_GENERATION_PROCESSES}); requires "
+                    "the 'fork' process start method"
+                ),
+                metavar="<number_of_generation_processes>",
+            )
+            parser.add_argument(
+                "--adaptive-batching",
+                action="store_true",
+                required=False,
+                help=(
+                    "adapt the task batch size and the number of parallel batch "
+                    "uploads to the observed API latency and errors, up to the "
+                    "task batch size and parallel batch limits, and report the "
+                    "submission throughput"
+                ),
+            )
             parser.add_argument(
                 "--empty",
                 "-e",
@@ -466,6 +526,16 @@ class CLIParser:
                     " remote destination; by default existing files are skipped"
                 ),
             )
+            parser.add_argument(
+                "--upload-threads",
+                type=int,
+                required=False,
+                help=(
+                    "the number of threads used to upload Data Client input files"
+                    f" (default={DEFAULT_DATA_CLIENT_UPLOAD_THREADS})"
+                ),
+                metavar="<number_of_upload_threads>",
+            )
             parser.add_argument(
                 "--add-to",
                 "-A",
@@ -603,7 +673,7 @@ class CLIParser:
                 required=False,
                 help=(
                     "list only active compute requirements / worker pools / work"
-                    " requirements"
+                    " requirements / tasks"
                 ),
             )
             parser.add_argument(
@@ -625,6 +695,36 @@ class CLIParser:
                 required=False,
                 help="automatically select all listed objects (implies '--details')",
             )
+            parser.add_argument(
+                "--stream",
+                action="store_true",
+                required=False,
+                help=(
+                    "list work requirements or tasks as each page of results "
+                    "arrives, in the order received, without sorting or selecting "
+                    "the listed items"
+                ),
+            )
+            parser.add_argument(
+                "--limit",
+                type=int,
+                required=False,
+                help=(
+                    "stop after listing this number of work requirements or tasks "
+                    "(implies '--stream')"
+                ),
+                metavar="<count>",
+            )
+            parser.add_argument(
+                "--offset",
+                type=int,
+                required=False,
+                help=(
+                    "skip this number of work requirements or tasks before "
+                    "listing (implies '--stream')"
+                ),
+                metavar="<count>",
+            )
 
         # yd-submit / yd-provision / yd-instantiate / yd-create
         if any(
@@ -900,8 +1000,46 @@ class CLIParser:
                 action="store_true",
                 required=False,
                 help=(
-                    "display a live progress bar for Work Requirement IDs; "
-                    "ignored for Worker Pool and Compute Requirement IDs"
+                    "display a live progress dashboard with a row for each "
+                    "Work Requirement, Worker Pool and Compute Requirement"
+                ),
+            )
+            parser.add_argument(
+                "--record",
+                type=str,
+                required=False,
+                metavar="<event-log-file>",
+                help="append the raw events received to a gzipped event log file",
+            )
+            parser.add_argument(
+                "--replay",
+                type=str,
+                required=False,
+                metavar="<event-log-file>",
+                help=(
+                    "replay the events recorded in an event log file, instead "
+                    "of following live event streams"
+                ),
+            )
+            parser.add_argument(
+                "--replay-speed",
+                type=float,
+                required=False,
+                metavar="<speed-multiplier>",
+                help=(
+                    "the speed at which to replay recorded events, relative to "
+                    "the speed at which they were received; use 0 to replay as "
+                    f"fast as possible (default: {EVENT_REPLAY_SPEED_DEFAULT})"
+                ),
+            )
+            parser.add_argument(
+                "--progress-rate",
+                type=float,
+                required=False,
+                metavar="<frames-per-second>",
+                help=(
+                    "the frame rate of the '--progress' display "
+                    f"(default: {PROGRESS_REFRESH_PER_SECOND})"
                 ),
             )
 
@@ -1230,6 +1368,18 @@ class CLIParser:
                 ),
                 metavar="<output-file>",
             )
+            parser.add_argument(
+                "--json-lines",
+                "--jsonl",
+                action="store_true",
+                required=False,
+                help=(
+                    "output detailed JSON resources as JSON Lines, one compact "
+                    "JSON object per line, instead of as a JSON list "
+                    "(implies '--details'); use with '--quiet' for output "
+                    "containing only JSON"
+                ),
+            )
 
         # yd-compare
         if "compare" in sys.argv[0]:
@@ -1251,6 +1401,16 @@ class CLIParser:
 
         # yd-submit
         if any(module in sys.argv[0] for module in ["submit"]):
+            parser.add_argument(
+                "--output-file",
+                type=str,
+                required=False,
+                help=(
+                    "if specified with '--dry-run', the JSON Work Requirement "
+                    "specification will also be written to the nominated output file"
+                ),
+                metavar="<output-file>",
+            )
             parser.add_argument(
                 "--upgrade-rclone",
                 action="store_true",
@@ -1263,6 +1423,20 @@ class CLIParser:
                 required=False,
                 help="report the path and version of the rclone binary in use, then exit",
             )
+            parser.add_argument(
+                "--rclone-daemon",
+                type=str,
+                nargs="?",
+                const="start",
+                required=False,
+                help=(
+                    "perform rclone operations through one long-lived 'rclone rcd'"
+                    " process, started for this command or, if a 'unix://' or"
+                    " 'http://' URL is supplied, already running; overrides"
+                    " YD_RCLONE_DAEMON"
+                ),
+                metavar="<rc-url>",
+            )
             parser.add_argument(
                 "--progress",
                 action="store_true",
@@ -1272,6 +1446,16 @@ class CLIParser:
                     "implies following the Work Requirement to completion"
                 ),
             )
+            parser.add_argument(
+                "--progress-rate",
+                type=float,
+                required=False,
+                metavar="<frames-per-second>",
+                help=(
+                    "the frame rate of the '--progress' display "
+                    f"(default: {PROGRESS_REFRESH_PER_SECOND})"
+                ),
+            )
 
         # yd-upload / yd-download / yd-delete / yd-ls (data client commands)
         if any(
@@ -1322,6 +1506,20 @@ class CLIParser:
                 required=False,
                 help="report the path and version of the rclone binary in use, then exit",
             )
+            parser.add_argument(
+                "--rclone-daemon",
+                type=str,
+                nargs="?",
+                const="start",
+                required=False,
+                help=(
+                    "perform rclone operations through one long-lived 'rclone rcd'"
+                    " process, started for this command or, if a 'unix://' or"
+                    " 'http://' URL is supplied, already running; overrides"
+                    " YD_RCLONE_DAEMON"
+                ),
+                metavar="<rc-url>",
+            )
             parser.add_argument(
                 "--data-client-profile",
                 "--profile",
@@ -1371,6 +1569,19 @@ class CLIParser:
                 required=False,
                 help="strip directory structure; upload all files flat under the destination",
             )
+            parser.add_argument(
+                "--on-collision",
+                type=str,
+                required=False,
+                choices=FLATTEN_COLLISION_POLICIES,
+                default=FLATTEN_COLLISION_POLICY_DEFAULT,
+                help=(
+                    "with --flatten, how to handle files with the same name:"
+                    " 'overwrite' (the default) keeps only the last file, 'error'"
+                    " fails before transferring anything, 'rename' adds a numeric"
+                    " suffix"
+                ),
+            )
             parser.add_argument(
                 "--sync",
                 action="store_true",
@@ -1414,6 +1625,19 @@ class CLIParser:
                 required=False,
                 help="strip remote directory structure; download all files flat",
             )
+            parser.add_argument(
+                "--on-collision",
+                type=str,
+                required=False,
+                choices=FLATTEN_COLLISION_POLICIES,
+                default=FLATTEN_COLLISION_POLICY_DEFAULT,
+                help=(
+                    "with --flatten, how to handle files with the same name:"
+                    " 'overwrite' (the default) keeps only the last file, 'error'"
+                    " fails before transferring anything, 'rename' adds a numeric"
+                    " suffix"
+                ),
+            )
 
         # yd-delete (data client)
         if "delete" in sys.argv[0]:
@@ -1492,6 +1716,11 @@ class CLIParser:
     def use_pac(self) -> bool | None:
         return self.args.pac
 
+    @property
+    @allow_missing_attribute
+    def resolution_cache(self) -> bool | None:
+        return self.args.resolution_cache
+
     @property
     @allow_missing_attribute
     def no_format(self) -> bool | None:
@@ -1568,6 +1797,11 @@ class CLIParser:
     def json_raw(self) -> str | None:
         return self.args.json_raw
 
+    @property
+    @allow_missing_attribute
+    def checkpoint_file(self) -> str | None:
+        return self.args.checkpoint_file
+
     # Also used by yd-cancel, yd-provision, yd-instantiate, yd-start, yd-hold,
     # yd-finish, yd-shutdown, yd-terminate, yd-resize
     @property
@@ -1595,6 +1829,11 @@ class CLIParser:
     def task_batch_size(self) -> int | None:
         return self.args.task_batch_size
 
+    @property
+    @allow_missing_attribute
+    def task_batch_max_bytes(self) -> int | None:
+        return self.args.task_batch_max_bytes
+
     @property
     @allow_missing_attribute
     def pause_between_batches(self) -> int | None:
@@ -1620,6 +1859,16 @@ class CLIParser:
     def parallel_batches(self) -> int | None:
         return self.args.parallel_batches
 
+    @property
+    @allow_missing_attribute
+    def generation_processes(self) -> int | None:
+        return self.args.generation_processes
+
+    @property
+    @allow_missing_attribute
+    def adaptive_batching(self) -> bool | None:
+        return self.args.adaptive_batching
+
     @property
     @allow_missing_attribute
     def empty(self) -> bool | None:
@@ -1630,6 +1879,11 @@ class CLIParser:
     def overwrite(self) -> bool | None:
         return self.args.overwrite
 
+    @property
+    @allow_missing_attribute
+    def upload_threads(self) -> int | None:
+        return self.args.upload_threads
+
     @property
     @allow_missing_attribute
     def add_to(self) -> str | None:
@@ -1715,6 +1969,25 @@ class CLIParser:
     def auto_select_all(self) -> bool | None:
         return self.args.auto_select_all
 
+    @property
+    @allow_missing_attribute
+    def stream(self) -> bool | None:
+        return self.args.stream
+
+    @stream.setter
+    def stream(self, stream: bool):
+        self.args.stream = stream
+
+    @property
+    @allow_missing_attribute
+    def limit(self) -> int | None:
+        return self.args.limit
+
+    @property
+    @allow_missing_attribute
+    def offset(self) -> int | None:
+        return self.args.offset
+
     # -----------------------------------------------------------------------
     # yd-submit / yd-provision / yd-instantiate / yd-create
     # -----------------------------------------------------------------------
@@ -2023,6 +2296,11 @@ class CLIParser:
     def output_file(self) -> str | None:
         return self.args.output_file
 
+    @property
+    @allow_missing_attribute
+    def json_lines(self) -> bool | None:
+        return self.args.json_lines
+
     # -----------------------------------------------------------------------
     # yd-compare
     # -----------------------------------------------------------------------
@@ -2056,11 +2334,36 @@ class CLIParser:
     def which_rclone(self) -> bool | None:
         return self.args.which_rclone
 
+    @property
+    @allow_missing_attribute
+    def rclone_daemon(self) -> str | None:
+        return self.args.rclone_daemon
+
     @property
     @allow_missing_attribute
     def progress(self) -> bool | None:
         return self.args.progress
 
+    @property
+    @allow_missing_attribute
+    def progress_rate(self) -> float | None:
+        return self.args.progress_rate
+
+    @property
+    @allow_missing_attribute
+    def record(self) -> str | None:
+        return self.args.record
+
+    @property
+    @allow_missing_attribute
+    def replay(self) -> str | None:
+        return self.args.replay
+
+    @property
+    @allow_missing_attribute
+    def replay_speed(self) -> float | None:
+        return self.args.replay_speed
+
     # -----------------------------------------------------------------------
     # yd-upload / yd-download / yd-delete / yd-ls (data client commands)
     # -----------------------------------------------------------------------
@@ -2119,6 +2422,11 @@ class CLIParser:
     def sync(self) -> bool | None:
         return self.args.sync
 
+    @property
+    @allow_missing_attribute
+    def on_collision(self) -> str | None:
+        return self.args.on_collision
+
     # -----------------------------------------------------------------------
     # yd-download / yd-delete / yd-ls
     # -----------------------------------------------------------------------
@@ -0,0 +1,146 @@
+"""
+Apply a lifecycle operation (cancel, abort, terminate, etc.) to many items
+concurrently, using a bounded pool of threads, a client-side limit on the
+rate of API calls, and retries of transient failures.
+"""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic, sleep
+from typing import Generic, TypeVar
+
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+from yellowdog_client.model.exceptions import InternalServerException
+
+from yellowdog_cli.utils.printing import print_info
+from yellowdog_cli.utils.retry_utils import (
+    TokenBucket,
+    get_retry_after,
+    get_retry_delay,
+)
+from yellowdog_cli.utils.settings import (
+    BULK_OPERATION_BACKOFF_BASE,
+    BULK_OPERATION_BACKOFF_MAX,
+    BULK_OPERATION_BURST,
+    BULK_OPERATION_MAX_ATTEMPTS,
+    BULK_OPERATION_THREADS,
+    BULK_OPERATIONS_PER_SECOND,
+    TRANSIENT_ERROR_STATUS_CODES,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class BulkOperationResult(Generic[T, R]):
+    """
+    The outcome of applying an operation to a list of items.
+    """
+
+    succeeded: list[tuple[T, R]] = field(default_factory=list)
+    failed: list[tuple[T, Exception]] = field(default_factory=list)
+    retries: int = 0
+    elapsed: float = 0.0
+
+    def report(self, description: str):
+        """
+        Print a summary of the outcome, e.g., 'Cancelled Work Requirements:
+        10 succeeded, 1 failed (2 retries) in 1.2s'.
+        """
+        retries = f" ({self.retries:,d} retries)" if self.retries > 0 else ""
+        print_info(
+            f"{description}: {len(self.succeeded):,d} succeeded, "
+            f"{len(self.failed):,d} failed{retries} in {self.elapsed:.1f}s"
+        )
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Whether an operation that failed with 'error' is worth retrying.
+    """
+    if isinstance(error, HTTPError):
+        return (
+            error.response is not None
+            and error.response.status_code in TRANSIENT_ERROR_STATUS_CODES
+        )
+    return isinstance(error, (ConnectionError, Timeout, InternalServerException))
+
+
+def _get_retry_after(error: Exception) -> float | None:
+    """
+    The 'Retry-After' interval of the HTTP response of a failed operation,
+    if any.
+    """
+    response = getattr(error, "response", None)
+    return None if response is None else get_retry_after(response)
+
+
+def run_bulk_operation(
+    items: Sequence[T],
+    operation: Callable[[T], R],
+    on_success: Callable[[T, R], None] | None = None,
+    on_failure: Callable[[T, Exception], None] | None = None,
+    max_workers: int = BULK_OPERATION_THREADS,
+    max_attempts: int = BULK_OPERATION_MAX_ATTEMPTS,
+    rate_limiter: TokenBucket | None = None,
+) -> BulkOperationResult[T, R]:
+    """
+    Call 'operation' for each item using a bounded pool of threads, retrying
+    transient failures. 'on_success' and 'on_failure' are called in the
+    calling thread as each item's operation concludes, in order of
+    completion, so they can report progress.
+    """
+    result: BulkOperationResult[T, R] = BulkOperationResult()
+    if not items:
+        return result
+
+    if rate_limiter is None:
+        rate_limiter = TokenBucket(BULK_OPERATIONS_PER_SECOND, BULK_OPERATION_BURST)
+    lock = Lock()
+    start_time = monotonic()
+
+    def apply(item: T) -> R:
+        attempt = 1
+        while True:
+            rate_limiter.acquire()
+            try:
+                return operation(item)
+            except Exception as e:
+                if attempt >= max_attempts or not is_transient_error(e):
+                    raise
+                with lock:
+                    result.retries += 1
+                sleep(
+                    get_retry_delay(
+                        attempt,
+                        BULK_OPERATION_BACKOFF_BASE,
+                        BULK_OPERATION_BACKOFF_MAX,
+                        _get_retry_after(e),
+                    )
+                )
+            attempt += 1
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    try:
+        futures = {executor.submit(apply, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                value = future.result()
+            except Exception as e:
+                result.failed.append((item, e))
+                if on_failure is not None:
+                    on_failure(item, e)
+                continue
+            result.succeeded.append((item, value))
+            if on_success is not None:
+                on_success(item, value)
+    finally:
+        # Don't wait for outstanding operations if interrupted
+        executor.shutdown(cancel_futures=True)
+
+    result.elapsed = monotonic() - start_time
+    return result
@@ -1,9 +1,26 @@
 """
-Copied from:
+Adapted from:
   https://gist.github.com/jannismain/e96666ca4f059c3e5bc28abb711b5c92
+
+The encoder makes a single pass over the object, appending its output to one
+list of chunks, so the cost is linear in the size of the output.
 """
 
 import json
+from json.encoder import encode_basestring_ascii
+
+try:
+    import orjson
+except ImportError:  # Optional, for faster JSON Lines output
+    orjson = None  # type: ignore[assignment]
+
+_PRIMITIVE_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: lambda o: format(o, "g"),
+    bool: lambda o: "true" if o else "false",
+    type(None): lambda o: "null",
+}
 
 
 class CompactJSONEncoder(json.JSONEncoder):
@@ -23,78 +40,128 @@ class CompactJSONEncoder(json.JSONEncoder):
         if kwargs.get("indent") is None:
             kwargs.update({"indent": 4})
         super().__init__(*args, **kwargs)
-        self.indentation_level = 0
+        if isinstance(self.indent, int):
+            self._indent_unit = " " * self.indent
+        elif isinstance(self.indent, str):
+            self._indent_unit = self.indent
+        else:
+            raise ValueError(
+                f"indent must either be of type int or str (is: {type(self.indent)})"
+            )
+        self._indents = [""]
 
     def encode(self, o):
         """Encode JSON object *o* with respect to single line lists."""
-        if isinstance(o, (list, tuple)):
-            if self._put_on_single_line(o):
-                return "[" + ", ".join(self.encode(el) for el in o) + "]"
-            else:
-                self.indentation_level += 1
-                output = [self.indent_str + self.encode(el) for el in o]
-                self.indentation_level -= 1
-                return "[\n" + ",\n".join(output) + "\n" + self.indent_str + "]"
-        elif isinstance(o, dict):
-            if o:
-                if self._put_on_single_line(o):
-                    return (
-                        "{"
-                        + ", ".join(
-                            f"{self.encode(k)}: {self.encode(el)}"
-                            for k, el in o.items()
-                        )
-                        + "}"
-                    )
-                else:
-                    self.indentation_level += 1
-                    output = [
-                        self.indent_str + f"{json.dumps(k)}: {self.encode(v)}"
-                        for k, v in o.items()
-                    ]
-                    self.indentation_level -= 1
-                    return "{\n" + ",\n".join(output) + "\n" + self.indent_str + "}"
-            else:
-                return "{}"
-        elif isinstance(
-            o, float
-        ):  # Use scientific notation for floats, where appropriate
-            return format(o, "g")
-        # elif isinstance(o, str):  # escape newlines
-        #     o = o.replace("\n", "\\n")
-        #     return f'"{o}"'
-        else:
-            return json.dumps(o)
+        chunks: list[str] = []
+        self._encode(o, chunks, 0)
+        return "".join(chunks)
 
     def iterencode(self, o, **kwargs):
         """Required to also work with `json.dump`."""
         return self.encode(o)
 
-    def _put_on_single_line(self, o):
-        return (
-            self._primitives_only(o)
-            and len(o) <= self.MAX_ITEMS
-            and len(str(o)) - 2 <= self.MAX_WIDTH
-        )
+    def _encode(self, o, chunks: list[str], level: int):
+        """
+        Append the encoding of *o* at indentation *level* to *chunks*.
 
-    def _primitives_only(self, o: list | tuple | dict) -> bool:
-        if isinstance(o, (list, tuple)):
-            return not any(isinstance(el, self.CONTAINER_TYPES) for el in o)
-        elif isinstance(o, dict):
-            return not any(isinstance(el, self.CONTAINER_TYPES) for el in o.values())
+        The items of a container are encoded as they're checked for nested
+        containers, so a container of primitives is only visited once
+        whether or not it ends up on a single line.
+        """
+        if isinstance(o, dict):
+            if not o:
+                chunks.append("{}")
+                return
+            keys = [
+                encode_basestring_ascii(k) if type(k) is str else json.dumps(k)
+                for k in o
+            ]
+            values = list(o.values())
+            opening, closing = "{", "}"
+        elif isinstance(o, (list, tuple)):
+            keys = None
+            values = o
+            opening, closing = "[", "]"
         else:
-            return False
+            chunks.append(self._encode_primitive(o))
+            return
 
-    @property
-    def indent_str(self) -> str:
-        if isinstance(self.indent, int):
-            return " " * (self.indentation_level * self.indent)
-        elif isinstance(self.indent, str):
-            return self.indentation_level * self.indent
+        encoded = self._encode_primitives(values)
+        if (
+            encoded is not None
+            and len(encoded) <= self.MAX_ITEMS
+            and len(str(o)) - 2 <= self.MAX_WIDTH
+        ):
+            if keys is not None:
+                encoded = [f"{k}: {v}" for k, v in zip(keys, encoded)]
+            chunks.append(opening + ", ".join(encoded) + closing)
+            return
+
+        item_indent = self._indent(level + 1)
+        separator = f"{opening}\n{item_indent}"
+        next_separator = f",\n{item_indent}"
+        for index, value in enumerate(values):
+            chunks.append(separator if keys is None else f"{separator}{keys[index]}: ")
+            if encoded is not None:
+                chunks.append(encoded[index])
+            elif (encoder := _PRIMITIVE_ENCODERS.get(type(value))) is not None:
+                chunks.append(encoder(value))
+            else:
+                self._encode(value, chunks, level + 1)
+            separator = next_separator
+        chunks.append(f"\n{self._indent(level)}{closing}")
+
+    def _encode_primitives(self, values) -> list[str] | None:
+        """
+        Encode a sequence of primitives, or return None if the sequence
+        includes a container.
+        """
+        encoded = []
+        for value in values:
+            # Look up the encoder for the commonest types directly
+            encoder = _PRIMITIVE_ENCODERS.get(type(value))
+            if encoder is not None:
+                encoded.append(encoder(value))
+            elif isinstance(value, self.CONTAINER_TYPES):
+                return None
+            else:
+                encoded.append(self._encode_primitive(value))
+        return encoded
+
+    @staticmethod
+    def _encode_primitive(o) -> str:
+        if isinstance(o, str):
+            return encode_basestring_ascii(o)
+        elif o is None:
+            return "null"
+        elif o is True:
+            return "true"
+        elif o is False:
+            return "false"
+        elif isinstance(o, int):
+            return int.__repr__(o)
+        elif isinstance(o, float):  # Use scientific notation, where appropriate
+            return format(o, "g")
         else:
-            raise ValueError(
-                f"indent must either be of type int or str (is: {type(self.indent)})"
-            )
+            return json.dumps(o)
+
+    def _indent(self, level: int) -> str:
+        while len(self._indents) <= level:
+            self._indents.append(self._indents[-1] + self._indent_unit)
+        return self._indents[level]
+
+
+def to_json_line(o) -> str:
+    """
+    Encode *o* as a single line of compact JSON, using orjson if it's
+    installed and can encode the object.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(o).decode()
+        except TypeError:  # Includes orjson.JSONEncodeError
+            pass
+    return json.dumps(o, separators=(",", ":"))
 
 
 if __name__ == "__main__":
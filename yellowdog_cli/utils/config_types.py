@@ -4,7 +4,11 @@ Configuration classes.
 
 from dataclasses import dataclass, field
 
-from yellowdog_cli.utils.settings import CR_MAX_INSTANCES, TASK_BATCH_SIZE_DEFAULT
+from yellowdog_cli.utils.settings import (
+    CR_MAX_INSTANCES,
+    TASK_BATCH_MAX_BYTES_DEFAULT,
+    TASK_BATCH_SIZE_DEFAULT,
+)
 
 
 @dataclass
@@ -22,21 +26,25 @@ class ConfigCommon:
     namespace: str
     name_tag: str
     use_pac: bool
+    resolution_cache: bool = False
 
 
 @dataclass
 class ConfigWorkRequirement:
+    adaptive_batching: bool = False
     add_environment: dict | None = None
     add_yd_env_vars: bool = False
     args: list[str] = field(default_factory=list)
     args_postfix: list[str] | None = None
     args_prefix: list[str] | None = None
     completed_task_ttl: float | None = None  # In minutes
+    compress_task_batches: bool = True
     csv_files: list[str] | None = None
     disable_preallocation: bool | None = None
     env: dict = field(default_factory=dict)
     finish_if_all_tasks_finished: bool = True
     finish_if_any_task_failed: bool = False
+    generation_processes: int | None = None
     instance_pricing_preference: str | None = None
     instance_types: list[str] | None = None
     max_retries: int | None = None
@@ -50,6 +58,7 @@ class ConfigWorkRequirement:
     regions: list[str] | None = None
     retryable_errors: list[dict] | None = None
     set_task_names: bool = True
+    task_batch_max_bytes: int = TASK_BATCH_MAX_BYTES_DEFAULT
     task_batch_size: int = TASK_BATCH_SIZE_DEFAULT
     task_count: int = 1
     task_data: str | None = None
@@ -65,6 +74,8 @@ class ConfigWorkRequirement:
     task_timeout: float | None = None
     task_type: str | None = None
     tasks_per_worker: int | None = None
+    upload_manifest: bool = True
+    upload_threads: int | None = None
     vcpus: list[float] | None = None
     worker_tags: list[str] | None = None
     wr_data_file: str | None = None
@@ -3,11 +3,17 @@ Module for handling Task data supplied in CSV files.
 """
 
 import csv
+import os
 import re
 from ast import literal_eval
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from copy import copy
+from dataclasses import dataclass
 from json import load as json_load
+from math import inf, isfinite
 from os.path import relpath
+from typing import TextIO, cast, overload
 
 from tomli import load as toml_load
 
@@ -18,10 +24,12 @@ from yellowdog_cli.utils.printing import print_info, print_json
 from yellowdog_cli.utils.property_names import *
 from yellowdog_cli.utils.settings import (
     BOOL_TYPE_TAG,
+    CSV_ROW_INDEX_INTERVAL,
     CSV_VAR_CLOSING_DELIMITER,
     CSV_VAR_OPENING_DELIMITER,
     FORMAT_NAME_TYPE_TAG,
     NUMBER_TYPE_TAG,
+    VAR_OPENING_DELIMITER,
 )
 from yellowdog_cli.utils.variables import (
     load_jsonnet_file_with_variable_substitutions,
@@ -30,43 +38,72 @@ from yellowdog_cli.utils.variables import (
 )
 
 
+def _csv_reader(csv_file: TextIO) -> Iterator[list[str]]:
+    """
+    Return a CSV reader for a file. The file is read by line, so its
+    position can be recorded between rows.
+    """
+    return csv.reader(iter(csv_file.readline, ""), delimiter=",", skipinitialspace=True)
+
+
 class CSVTaskData:
     """
-    A class for reading and storing CSV data
+    A class for reading CSV data. Rows are read from the file as they're
+    used, so memory use doesn't depend on the size of the file.
     """
 
     def __init__(self, csv_filename: str):
         """
-        Load the data from the CSV file; validate row lengths
+        Scan the CSV file: validate row lengths, count the rows and record
+        the file position of every CSV_ROW_INDEX_INTERVAL'th data row
         """
-        self._csv_data = []
-        row_length = None
+        self._csv_filename = csv_filename
+        self._var_names: list[str] = []
+        self._row_positions: list[int] = []
+        num_rows = 0
 
         with open(csv_filename) as csv_file:
-            csv_reader = csv.reader(csv_file, delimiter=",", skipinitialspace=True)
-            for row_number, row in enumerate(csv_reader):
-                if row_length is None:
-                    row_length = len(row)
-                else:
-                    if len(row) != row_length:
-                        raise ValueError(
-                            f"Malformed CSV file (row {row_number + 1}): "
-                            "all rows must have the same number of items"
-                        )
-                self._csv_data.append(row)
-
+            csv_reader = _csv_reader(csv_file)
+            while True:
+                if num_rows > 0 and (num_rows - 1) % CSV_ROW_INDEX_INTERVAL == 0:
+                    self._row_positions.append(csv_file.tell())
+                row = next(csv_reader, None)
+                if row is None:
+                    break
+                if num_rows == 0:
+                    self._var_names = row
+                elif len(row) != len(self._var_names):
+                    raise ValueError(
+                        f"Malformed CSV file (row {num_rows + 1}): "
+                        "all rows must have the same number of items"
+                    )
+                num_rows += 1
+
+        self._total_tasks = max(num_rows - 1, 0)
         self._index = 0
-        self._total_tasks = len(self._csv_data) - 1
+        self._csv_file: TextIO | None = None
+        self._csv_reader: Iterator[list[str]] | None = None
+        self._pid: int | None = None
 
     def __iter__(self):
         return self
 
+    def __copy__(self):
+        """
+        Share the scanned data, but read the rows independently
+        """
+        csv_task_data = CSVTaskData.__new__(CSVTaskData)
+        csv_task_data.__dict__.update(self.__dict__)
+        csv_task_data.reset()
+        csv_task_data._csv_file = None
+        return csv_task_data
+
     @property
     def var_names(self) -> list[str]:
         """
         Return the list of headings (variable names)
         """
-        return self._csv_data[0]
+        return self._var_names
 
     def __next__(self):
         """
@@ -74,14 +111,54 @@ class CSVTaskData:
         """
         if self.remaining_tasks == 0:
             raise StopIteration
+        return self.get_row(self._index)
+
+    def get_row(self, index: int) -> list[str]:
+        """
+        Return the task data row at 'index'. Reading is fastest when rows
+        are requested in order.
+        """
+        if not 0 <= index < self._total_tasks:
+            raise IndexError(f"CSV data row index '{index}' out of range")
+        if index != self._index or self._csv_reader is None or self._pid != os.getpid():
+            self._seek(index)
+        row = next(cast(Iterator[list[str]], self._csv_reader))
         self._index += 1
-        return self._csv_data[self._index]
+        if self._index == self._total_tasks:
+            self.close()
+        return row
+
+    def _seek(self, index: int):
+        """
+        Position the reader at the task data row at 'index'
+        """
+        if self._csv_file is None or self._pid != os.getpid():
+            # A file object inherited from a parent process shares its
+            # file position with the parent, so always use a new one
+            self._csv_file = open(self._csv_filename)
+            self._pid = os.getpid()
+        indexed_row, offset = divmod(index, CSV_ROW_INDEX_INTERVAL)
+        self._csv_file.seek(self._row_positions[indexed_row])
+        self._csv_reader = _csv_reader(self._csv_file)
+        for _ in range(offset):
+            next(self._csv_reader)
+        self._index = index
 
     def reset(self):
         """
         Rewind the list of Tasks to the beginning
         """
         self._index = 0
+        self._csv_reader = None
+
+    def close(self):
+        """
+        Close the CSV file, if open; it's reopened if required
+        """
+        if self._csv_file is not None and self._pid == os.getpid():
+            self._csv_file.close()
+        self._csv_file = None
+        self._csv_reader = None
 
     @property
     def total_tasks(self):
@@ -108,7 +185,7 @@ class CSVDataCache:
 
     def get_csv_task_data(self, csv_filename: str) -> CSVTaskData:
         csv_task_data = self._csv_task_data_objects.get(csv_filename)
-        if csv_task_data:  # Cache hit
+        if csv_task_data is not None:  # Cache hit
             csv_task_data.reset()
         else:  # Cache miss
             if self._max_entries is not None:
@@ -127,6 +204,276 @@ class CSVDataCache:
 CSV_DATA_CACHE = CSVDataCache(max_entries=2)
 
 
+@dataclass(frozen=True)
+class _CSVVariable:
+    """
+    A CSV variable in a string: the CSV column supplying its value, its
+    type tag and its text.
+    """
+
+    column: int
+    type_tag: str
+    text: str
+
+
+@dataclass(frozen=True)
+class _CSVPrototypeNode:
+    """
+    The entries of a dict or list that contain CSV variables, or that
+    must be copied for each Task. 'values' holds (key, string_template,
+    child_node) for each such entry. 'keys' maps dict keys containing CSV
+    variables to their string templates.
+    """
+
+    values: tuple[tuple, ...]
+    keys: dict
+
+
+class CSVTaskPrototype:
+    """
+    A Task prototype analysed once for CSV variable substitutions. Each
+    render() substitutes a row of CSV data into the prototype. Strings
+    containing variables are rendered from their parsed templates, and
+    subtrees without variables are shared between Tasks.
+
+    Subtrees containing non-CSV variables are copied for each Task, so
+    they can be processed in-situ later.
+    """
+
+    def __init__(self, task_prototype: dict, var_names: list[str]):
+        self._task_prototype = task_prototype
+        # Where variable names are repeated, the last column is used
+        columns = {var_name: column for column, var_name in enumerate(var_names)}
+        self._columns = columns
+        self._variable_re = re.compile(
+            re.escape(CSV_VAR_OPENING_DELIMITER)
+            + "("
+            + "|".join(
+                re.escape(type_tag)
+                for type_tag in [NUMBER_TYPE_TAG, BOOL_TYPE_TAG, FORMAT_NAME_TYPE_TAG]
+            )
+            + ")?("
+            + "|".join(
+                re.escape(var_name)
+                for var_name in sorted(columns, key=len, reverse=True)
+            )
+            + ")"
+            + re.escape(CSV_VAR_CLOSING_DELIMITER)
+        )
+        self._node = self._compile(task_prototype)
+
+    @property
+    def task_prototype(self) -> dict:
+        return self._task_prototype
+
+    def render(self, task_data: list[str]) -> dict:
+        """
+        Return the Task for a row of CSV data.
+        """
+        if self._node is None:
+            return self._task_prototype
+        return cast(dict, self._render(self._task_prototype, self._node, task_data))
+
+    def property_values(self, key: str, task_data_rows: Iterable[list[str]]) -> set:
+        """
+        Return the distinct values of a top-level Task property for rows of
+        CSV data. Only the property is rendered, and the rows are only read
+        if it contains CSV variables.
+        """
+        if key not in self._task_prototype:
+            return set()
+        value = self._task_prototype[key]
+        template = self._compile_string(value) if isinstance(value, str) else None
+        if template is None:
+            return {value}
+        return {
+            _render_csv_template(template, task_data) for task_data in task_data_rows
+        }
+
+    def _compile_string(self, input: str) -> tuple | _CSVVariable | None:
+        """
+        Parse a string into a tuple of strings and CSV variables, or return
+        the variable alone if it's a number or Boolean variable that's the
+        whole string. Returns None if there are no CSV variables.
+        """
+        if CSV_VAR_OPENING_DELIMITER not in input or not self._columns:
+            return None
+        template: list[str | _CSVVariable] = []
+        position = 0
+        for match in self._variable_re.finditer(input):
+            if match.start() > position:
+                template.append(input[position : match.start()])
+            template.append(
+                _CSVVariable(
+                    column=self._columns[match.group(2)],
+                    type_tag=match.group(1) or "",
+                    text=match.group(0),
+                )
+            )
+            position = match.end()
+        if not template:
+            return None
+        if position < len(input):
+            template.append(input[position:])
+        if len(template) == 1 and isinstance(template[0], _CSVVariable):
+            if template[0].type_tag in [NUMBER_TYPE_TAG, BOOL_TYPE_TAG]:
+                return template[0]
+        return tuple(template)
+
+    def _compile(self, data: dict | list) -> _CSVPrototypeNode | None:
+        """
+        Return the node describing the entries of 'data' to be rendered for
+        each Task, or None if 'data' can be shared between Tasks.
+        """
+        values = []
+        keys = {}
+        copy_required = False
+        items = data.items() if isinstance(data, dict) else enumerate(data)
+        for key_, value_ in items:
+            if isinstance(data, dict) and isinstance(key_, str):
+                key_template = self._compile_string(key_)
+                if key_template is not None:
+                    keys[key_] = key_template
+            if isinstance(value_, str):
+                copy_required = copy_required or VAR_OPENING_DELIMITER in value_
+                template = self._compile_string(value_)
+                if template is not None:
+                    values.append((key_, template, None))
+            elif isinstance(value_, dict) or isinstance(value_, list):
+                child_node = self._compile(value_)
+                if child_node is not None:
+                    values.append((key_, None, child_node))
+        if values or keys or copy_required:
+            return _CSVPrototypeNode(values=tuple(values), keys=keys)
+        return None
+
+    def _render(
+        self, data: dict | list, node: _CSVPrototypeNode, task_data: list[str]
+    ) -> dict | list:
+        rendered: dict | list = dict(data) if isinstance(data, dict) else list(data)
+        for key_, template, child_node in node.values:
+            if child_node is not None:
+                rendered[key_] = self._render(data[key_], child_node, task_data)
+            else:
+                rendered[key_] = _render_csv_template(template, task_data)
+        if node.keys:
+            rendered = {
+                (
+                    _render_csv_template(node.keys[key_], task_data)
+                    if key_ in node.keys
+                    else key_
+                ): value_
+                for key_, value_ in cast(dict, rendered).items()
+            }
+        return rendered
+
+
+def _render_csv_template(
+    template: tuple | _CSVVariable, task_data: list[str]
+) -> str | int | float | bool:
+    """
+    Render a string template from CSV data. Number and Boolean variables
+    return their typed value if they're the whole string; otherwise they're
+    checked, but left in place.
+    """
+    if isinstance(template, _CSVVariable):
+        return _typed_csv_value(template.type_tag, task_data[template.column])
+
+    rendered_segments = []
+    for segment in template:
+        if isinstance(segment, str):
+            rendered_segments.append(segment)
+            continue
+        value = task_data[segment.column]
+        if segment.type_tag == "":
+            rendered_segments.append(value)
+        elif segment.type_tag == FORMAT_NAME_TYPE_TAG:
+            rendered_segments.append(format_yd_name(value, add_prefix=False))
+        else:
+            _typed_csv_value(segment.type_tag, value)
+            rendered_segments.append(segment.text)
+    return "".join(rendered_segments)
+
+
+def _typed_csv_value(type_tag: str, value: str) -> int | float | bool:
+    """
+    Convert a CSV value for a number or Boolean variable.
+    """
+    if type_tag == NUMBER_TYPE_TAG:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            number = float(value)
+        except ValueError:
+            number = inf
+        if not isfinite(number):
+            raise ValueError(f"Invalid number substitution in CSV: '{value}'")
+        return number
+
+    if value.lower() == "true":
+        return True
+    if value.lower() == "false":
+        return False
+    raise ValueError(f"Invalid Boolean substitution in CSV: '{value}'")
+
+
+class CSVTaskList(Sequence[dict]):
+    """
+    The list of Tasks generated from a Task prototype and CSV data. Tasks
+    are rendered from the CSV rows as they're accessed, so the Task list
+    doesn't need to be held in memory.
+    """
+
+    def __init__(self, csv_data: CSVTaskData, task_prototype: dict):
+        self._csv_data = copy(csv_data)
+        self._prototype = CSVTaskPrototype(task_prototype, csv_data.var_names)
+
+    @property
+    def task_prototype(self) -> dict:
+        return self._prototype.task_prototype
+
+    def __len__(self) -> int:
+        return self._csv_data.total_tasks
+
+    def property_values(self, key: str) -> set:
+        """
+        Return the distinct values of a top-level property across the Tasks,
+        without rendering the Tasks.
+        """
+        if len(self) == 0:
+            return set()
+        return self._prototype.property_values(key, copy(self._csv_data))
+
+    @overload
+    def __getitem__(self, index: int) -> dict: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[dict]: ...
+
+    def __getitem__(self, index: int | slice) -> dict | Sequence[dict]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Task index out of range")
+        return self._prototype.render(self._csv_data.get_row(index))
+
+    def __iter__(self) -> Iterator[dict]:
+        for task_data in copy(self._csv_data):
+            yield self._prototype.render(task_data)
+
+    def __deepcopy__(self, memo: dict):
+        """
+        Copies share the compiled prototype and the scanned CSV data
+        """
+        task_list = copy(self)
+        task_list._csv_data = copy(self._csv_data)
+        return task_list
+
+
 def load_json_file_with_csv_task_expansion(
     json_file: str, csv_files: list[str], files_directory: str = ""
 ) -> dict:
@@ -186,6 +533,7 @@ def perform_csv_task_expansion(
     if len(csv_files) > len(wr_data[TASK_GROUPS]):
         raise ValueError("Number of CSV files exceeds number of Task Groups")
 
+    csv_expansions: list[tuple[dict, CSVTaskData]] = []
     for counter, csv_file in enumerate(csv_files):
         csv_file, index = get_csv_file_index(csv_file, wr_data[TASK_GROUPS])
         if index is None:
@@ -214,23 +562,21 @@ def perform_csv_task_expansion(
             )
             continue
 
-        generated_task_list = []
-        for task_data in csv_data:
-            generated_task_list.append(
-                csv_variables_substitution(
-                    task_prototype, csv_data.var_names, task_data
-                )
-            )
-        task_group[TASKS] = generated_task_list
-        print_info(f"Generated {len(generated_task_list)} Task(s) from CSV data")
+        csv_expansions.append((task_group, csv_data))
+        print_info(f"Generated {csv_data.total_tasks} Task(s) from CSV data")
 
     if ARGS_PARSER.process_csv_only:
+        for task_group, csv_data in csv_expansions:
+            task_group[TASKS] = list(CSVTaskList(csv_data, task_group[TASKS][0]))
         print_info("Displaying CSV substitutions only:")
         print_json(wr_data)
         exit(0)
 
-    # Process remaining substitutions
+    # Process remaining substitutions. The Task prototypes are processed
+    # before their CSV substitutions, which are applied as the Tasks are used.
     process_variable_substitutions_insitu(wr_data)
+    for task_group, csv_data in csv_expansions:
+        task_group[TASKS] = CSVTaskList(csv_data, task_group[TASKS][0])
     return wr_data
 
 
@@ -4,16 +4,19 @@ yd-upload, yd-download, yd-delete, yd-ls.
 """
 
 import fnmatch
-import json
-from pathlib import Path
+import os
+import shutil
+import tempfile
+from pathlib import Path, PurePosixPath
 from typing import cast
 
-from rclone_api import Config, Rclone
 from rclone_api.dir_listing import DirListing
 
 from yellowdog_cli.utils.config_types import ConfigDataClient
 from yellowdog_cli.utils.printing import print_info, print_warning
-from yellowdog_cli.utils.rclone_utils import make_rclone, parse_rclone_config
+from yellowdog_cli.utils.rclone_backend import RcloneBackend, get_rclone_backend
+from yellowdog_cli.utils.rclone_utils import parse_rclone_config
+from yellowdog_cli.utils.settings import FLATTEN_COLLISION_POLICY_DEFAULT
 from yellowdog_cli.utils.variables import process_variable_substitutions
 
 _GLOB_CHARS = frozenset("*?[")
@@ -33,14 +36,13 @@ def _require_remote(config: ConfigDataClient) -> str:
     return config.remote
 
 
-def _rclone_for_config(config: ConfigDataClient):
+def _rclone_for_config(config: ConfigDataClient) -> tuple[str, RcloneBackend]:
     """
-    Return (remote_name, Rclone) for the given data client config.
+    Return (remote_name, RcloneBackend) for the given data client config.
     """
     remote_str = _require_remote(config)
     remote_name, config_section = parse_rclone_config(remote_str)
-    rclone = make_rclone(Config(config_section) if config_section is not None else None)
-    return remote_name, rclone
+    return remote_name, get_rclone_backend(remote_name, config_section)
 
 
 def resolve_remote_path(
@@ -96,31 +98,81 @@ def upload_file(
 
     _, rclone = _rclone_for_config(config)
     print_info(f"Uploading '{local_path}' → '{remote_path}'")
-    result = rclone.copy_to(src=str(local_path.resolve()), dst=remote_path)
+    result = rclone.copy_file(src=str(local_path.resolve()), dst=remote_path)
     if result.returncode != 0:
         raise RuntimeError(f"Upload failed: {result.stderr}")
 
 
-def _rclone_sync(rclone: Rclone, src: str, dst: str):
-    """
-    Run 'rclone sync src dst', making dst an exact mirror of src.
-    rclone_api has no sync wrapper, so we call the underlying _run directly.
-    Performance flags match those hardcoded in rclone_api's copy().
-    """
-    return rclone.impl._run(
-        [
-            "sync",
-            src,
-            dst,
-            "--checkers",
-            "1000",
-            "--transfers",
-            "32",
-            "--low-level-retries",
-            "10",
-        ],
-        capture=False,
-    )
+def flatten_names(
+    relative_paths: list[str], on_collision: str = FLATTEN_COLLISION_POLICY_DEFAULT
+) -> dict[str, str]:
+    """
+    Map each '/'-separated relative path to the file name it takes in a
+    flattened destination.
+
+    Files with the same name are handled according to on_collision:
+      'error'     — raise a ValueError naming the colliding paths
+      'rename'    — the first path (in sorted order) keeps its name; the
+                    others become '<stem>_<n><suffix>', avoiding taken names
+      'overwrite' — only the last path (in sorted order) is included
+    """
+    by_name: dict[str, list[str]] = {}
+    for path in sorted(relative_paths):
+        by_name.setdefault(PurePosixPath(path).name, []).append(path)
+    collisions = {name: paths for name, paths in by_name.items() if len(paths) > 1}
+
+    if collisions and on_collision == "error":
+        examples = "; ".join(
+            f"'{name}' ({', '.join(paths)})"
+            for name, paths in list(collisions.items())[:5]
+        )
+        more = f" and {len(collisions) - 5} more" if len(collisions) > 5 else ""
+        raise ValueError(
+            f"{len(collisions)} file name(s) would collide when flattened: "
+            f"{examples}{more}; use '--on-collision rename' or "
+            "'--on-collision overwrite'"
+        )
+
+    if on_collision == "overwrite":
+        return {paths[-1]: name for name, paths in by_name.items()}
+
+    flat_names = {paths[0]: name for name, paths in by_name.items()}
+    taken = set(by_name)
+    for name, paths in collisions.items():
+        stem, suffix = PurePosixPath(name).stem, PurePosixPath(name).suffix
+        index = 1
+        for path in paths[1:]:
+            while f"{stem}_{index}{suffix}" in taken:
+                index += 1
+            flat_names[path] = f"{stem}_{index}{suffix}"
+            taken.add(flat_names[path])
+    return flat_names
+
+
+def _report_flatten_overwrites(n_files: int, flat_names: dict[str, str]):
+    """
+    Warn about files omitted from a flattened transfer because a later file
+    has the same name.
+    """
+    n_omitted = n_files - len(flat_names)
+    if n_omitted > 0:
+        print_warning(
+            f"{n_omitted} file(s) omitted because a later file has the same name"
+        )
+
+
+def _stage_file(src: Path, dst: Path):
+    """
+    Make src available as dst for an upload, preferring a symbolic link,
+    then a hard link, then a copy.
+    """
+    try:
+        dst.symlink_to(src)
+    except OSError:
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
 
 
 def upload_directory(
@@ -130,17 +182,19 @@ def upload_directory(
     flatten: bool = False,
     sync: bool = False,
     dry_run: bool = False,
+    on_collision: str = FLATTEN_COLLISION_POLICY_DEFAULT,
 ) -> None:
     """
     Upload a local directory to the given remote path.
 
     With flatten=True, all files are uploaded flat to the remote destination
-    (no subdirectory structure preserved).
+    (no subdirectory structure preserved), with files of the same name
+    handled according to on_collision (see flatten_names()).
     With sync=True, the remote destination is made to mirror the local source
     (remote files not present locally are deleted).
     """
     if flatten:
-        _upload_directory_flat(config, local_path, remote_path, dry_run)
+        _upload_directory_flat(config, local_path, remote_path, dry_run, on_collision)
         return
 
     action = "sync" if sync else "copy"
@@ -152,10 +206,7 @@ def upload_directory(
 
     _, rclone = _rclone_for_config(config)
     print_info(f"{'Syncing' if sync else 'Uploading'} '{local_path}' → '{remote_path}'")
-    if sync:
-        result = _rclone_sync(rclone, src=str(local_path.resolve()), dst=remote_path)
-    else:
-        result = rclone.copy(src=str(local_path.resolve()), dst=remote_path)
+    result = rclone.copy(src=str(local_path.resolve()), dst=remote_path, sync=sync)
     if result.returncode != 0:
         raise RuntimeError(f"Directory upload failed: {result.stderr}")
 
@@ -165,19 +216,52 @@ def _upload_directory_flat(
     local_path: Path,
     remote_path: str,
     dry_run: bool,
+    on_collision: str = FLATTEN_COLLISION_POLICY_DEFAULT,
 ) -> None:
     """
     Upload all files under local_path to remote_path without preserving
     directory structure (all files land directly under remote_path).
+
+    The files are linked under their flattened names in a temporary staging
+    directory, which is uploaded by a single rclone invocation.
     """
-    files = [f for f in local_path.rglob("*") if f.is_file()]
+    files = {
+        f.relative_to(local_path).as_posix(): f
+        for f in local_path.rglob("*")
+        if f.is_file()
+    }
     if not files:
         print_info(f"No files found under '{local_path}'")
         return
 
-    for local_file in files:
-        dest = f"{remote_path.rstrip('/')}/{local_file.name}"
-        upload_file(config, local_file, dest, dry_run=dry_run)
+    flat_names = flatten_names(list(files), on_collision)
+    _report_flatten_overwrites(len(files), flat_names)
+    remote_dir = remote_path.rstrip("/")
+
+    if dry_run:
+        for relative_path, flat_name in flat_names.items():
+            print_info(
+                f"Dry-run: Would upload '{files[relative_path]}' → "
+                f"'{remote_dir}/{flat_name}'"
+            )
+        return
+
+    _, rclone = _rclone_for_config(config)
+    print_info(
+        f"Uploading (flat) {len(flat_names):,d} file(s) '{local_path}' → "
+        f"'{remote_path}'"
+    )
+    with tempfile.TemporaryDirectory(prefix="yd-flatten-") as staging_dir:
+        for relative_path, flat_name in flat_names.items():
+            _stage_file(files[relative_path].resolve(), Path(staging_dir) / flat_name)
+        result = rclone.copy(
+            src=staging_dir,
+            dst=remote_dir,
+            files_from=list(flat_names.values()),
+            copy_links=True,
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"Directory upload failed: {result.stderr}")
 
 
 def is_glob(path: str) -> bool:
@@ -234,11 +318,10 @@ def _download_with_glob(
 
     # Preflight: list the parent directory and check whether any entry
     # (file or directory) matches the glob pattern.
-    check = rclone.impl._run(["lsjson", remote_dir], capture=True)
-    if check.returncode != 0:
+    entries = rclone.list_json(remote_dir)
+    if entries is None:
         print_warning(f"Cannot access '{remote_dir}'")
         return
-    entries = json.loads(check.stdout or "[]")
     matches = [e for e in entries if fnmatch.fnmatch(e["Name"], pattern)]
     if not matches:
         print_info(f"No matches for wildcard '{remote_path}'")
@@ -248,24 +331,11 @@ def _download_with_glob(
     action = "Syncing" if sync else "Downloading"
     print_info(f"{action} '{remote_path}' → '{local_destination}'")
     local_destination.mkdir(parents=True, exist_ok=True)
-    cmd = "sync" if sync else "copy"
-    result = rclone.impl._run(
-        [
-            cmd,
-            remote_dir,
-            str(local_destination),
-            "--include",
-            pattern,
-            "--include",
-            f"{pattern}/**",
-            "--checkers",
-            "1000",
-            "--transfers",
-            "32",
-            "--low-level-retries",
-            "10",
-        ],
-        capture=False,
+    result = rclone.copy(
+        src=remote_dir,
+        dst=str(local_destination),
+        sync=sync,
+        include=[pattern, f"{pattern}/**"],
     )
     if result.returncode != 0:
         raise RuntimeError(f"Download failed: {result.stderr}")
@@ -278,13 +348,16 @@ def download_files(
     flatten: bool = False,
     sync: bool = False,
     dry_run: bool = False,
+    on_collision: str = FLATTEN_COLLISION_POLICY_DEFAULT,
 ) -> None:
     """
     Download from remote_path to local_destination.
 
     remote_path may be a single file, a directory, or include glob patterns
     (delegated to rclone).  With flatten=True, all remote files are placed
-    directly in local_destination without preserving directory structure.
+    directly in local_destination without preserving directory structure,
+    with files of the same name handled according to on_collision (see
+    flatten_names()).
     With sync=True, local files not present in the remote are deleted.
     """
     if flatten and sync:
@@ -330,28 +403,63 @@ def download_files(
     dst = str(local_destination)
 
     if flatten:
-        # Walk the remote path and download each file flat to the destination
-        print_info(f"Downloading (flat) '{remote_path}' → '{local_destination}'")
-        local_destination.mkdir(parents=True, exist_ok=True)
-        for dir_listing in rclone.walk(remote_path):
-            for f in dir_listing.files:
-                file_dst = str(local_destination / f.name)
-                result = rclone.copy_to(
-                    src=f"{remote_path.rstrip('/')}/{f.path.path}", dst=file_dst
-                )
-                if result.returncode != 0:
-                    raise RuntimeError(
-                        f"Download failed for '{f.path.path}': {result.stderr}"
-                    )
+        _download_flat(rclone, remote_path, local_destination, on_collision)
     else:
         action = "Syncing" if sync else "Downloading"
         print_info(f"{action} '{remote_path}' → '{local_destination}'")
-        if sync:
-            result = _rclone_sync(rclone, src=remote_path, dst=dst)
-        else:
-            result = rclone.copy(src=remote_path, dst=dst)
+        result = rclone.copy(src=remote_path, dst=dst, sync=sync)
+        if result.returncode != 0:
+            raise RuntimeError(f"Download failed: {result.stderr}")
+
+
+def _download_flat(
+    rclone: RcloneBackend,
+    remote_path: str,
+    local_destination: Path,
+    on_collision: str = FLATTEN_COLLISION_POLICY_DEFAULT,
+) -> None:
+    """
+    Download all files under remote_path directly into local_destination.
+
+    The files are listed with one recursive listing and downloaded, with
+    their directory structure, by a single rclone invocation into a staging
+    directory inside local_destination; each file is then moved to its
+    flattened name.
+    """
+    local_destination.mkdir(parents=True, exist_ok=True)
+
+    # Download a single file directly
+    entry = rclone.stat(remote_path)
+    if entry is not None and not entry["IsDir"]:
+        print_info(f"Downloading (flat) '{remote_path}' → '{local_destination}'")
+        result = rclone.copy_file(
+            src=remote_path, dst=str(local_destination / entry["Name"])
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Download failed: {result.stderr}")
+        return
+
+    entries = rclone.list_json(remote_path, recursive=True, files_only=True)
+    if entries is None:
+        raise RuntimeError(f"Download failed: cannot list '{remote_path}'")
+    relative_paths = [e["Path"] for e in entries]
+    flat_names = flatten_names(relative_paths, on_collision)
+    _report_flatten_overwrites(len(relative_paths), flat_names)
+    print_info(
+        f"Downloading (flat) {len(flat_names):,d} file(s) '{remote_path}' → "
+        f"'{local_destination}'"
+    )
+    staging_dir = Path(tempfile.mkdtemp(prefix=".yd-flatten-", dir=local_destination))
+    try:
+        result = rclone.copy(
+            src=remote_path, dst=str(staging_dir), files_from=list(flat_names)
+        )
         if result.returncode != 0:
             raise RuntimeError(f"Download failed: {result.stderr}")
+        for relative_path, flat_name in flat_names.items():
+            os.replace(staging_dir / relative_path, local_destination / flat_name)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
 
 def _delete_with_glob(
@@ -368,11 +476,10 @@ def _delete_with_glob(
     remote_dir, pattern = _split_glob_remote_path(remote_path)
     _, rclone = _rclone_for_config(config)
 
-    check = rclone.impl._run(["lsjson", remote_dir], capture=True)
-    if check.returncode != 0:
+    entries = rclone.list_json(remote_dir)
+    if entries is None:
         print_warning(f"Cannot access '{remote_dir}'")
         return
-    entries = json.loads(check.stdout or "[]")
     matches = [e for e in entries if fnmatch.fnmatch(e["Name"], pattern)]
     if not matches:
         print_info(f"No matches for wildcard '{remote_path}'")
@@ -392,7 +499,7 @@ def _delete_with_glob(
                 continue
         else:
             print_info(f"Deleting '{entry_path}'")
-            result = rclone.delete_files(entry_path)
+            result = rclone.delete_file(entry_path)
         if result.returncode != 0:
             raise RuntimeError(f"Delete failed: {result.stderr}")
 
@@ -470,7 +577,7 @@ def delete_remote(
 
     if is_file:
         print_info(f"Deleting '{remote_path}'")
-        result = rclone.delete_files(remote_path)
+        result = rclone.delete_file(remote_path)
     elif recursive:
         print_info(f"Deleting directory '{remote_path}'")
         result = rclone.purge(remote_path)
@@ -494,10 +601,9 @@ def list_remote_glob(
     """
     remote_dir, pattern = _split_glob_remote_path(remote_path)
     _, rclone = _rclone_for_config(config)
-    check = rclone.impl._run(["lsjson", remote_dir], capture=True)
-    if check.returncode != 0:
+    entries = rclone.list_json(remote_dir)
+    if entries is None:
         return remote_dir, []
-    entries = json.loads(check.stdout or "[]")
     return remote_dir, [e for e in entries if fnmatch.fnmatch(e["Name"], pattern)]
 
 
@@ -514,4 +620,4 @@ def list_remote(
     """
     _, rclone = _rclone_for_config(config)
     max_depth = -1 if recursive else 1
-    return rclone.ls(src=remote_path, max_depth=max_depth)
+    return rclone.ls(remote_path, max_depth=max_depth)
@@ -8,6 +8,7 @@ from sys import exit
 
 from yellowdog_cli.utils.args import ARGS_PARSER
 from yellowdog_cli.utils.printing import print_error, print_info
+from yellowdog_cli.utils.rclone_daemon import close_rclone_daemon
 
 
 def dataclient_wrapper(func):
@@ -25,11 +26,15 @@ def dataclient_wrapper(func):
                 print_info("Keyboard interruption ... exiting")
                 exit_code = 1
             finally:
+                close_rclone_daemon()
                 if exit_code == 0 and not ARGS_PARSER.print_pid:
                     print_info("Done")
                 exit(exit_code)
         else:
-            func()
+            try:
+                func()
+            finally:
+                close_rclone_daemon()
             if not ARGS_PARSER.print_pid:
                 print_info("Done")
             exit(0)
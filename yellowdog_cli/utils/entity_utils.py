@@ -2,7 +2,9 @@
 Various utility functions for finding objects, etc.
 """
 
+from collections.abc import Iterator
 from functools import lru_cache
+from typing import TypeVar
 
 from yellowdog_client import PlatformClient
 from yellowdog_client.common import SearchClient
@@ -38,11 +40,13 @@ from yellowdog_client.model import (
     RequirementsAllowance,
     RoleSearch,
     RoleSummary,
+    SliceReference,
     SourceAllowance,
     SourcesAllowance,
     Task,
     TaskGroup,
     TaskSearch,
+    TaskStatus,
     User,
     UserSearch,
     WorkerPool,
@@ -56,7 +60,20 @@ from yellowdog_client.model import (
 from yellowdog_cli.utils.args import ARGS_PARSER
 from yellowdog_cli.utils.interactive import confirmed, select
 from yellowdog_cli.utils.printing import print_info
-from yellowdog_cli.utils.settings import NAMESPACE_PREFIX_SEPARATOR
+from yellowdog_cli.utils.resolution_cache import (
+    cached_resolution,
+    invalidate_resolutions,
+)
+from yellowdog_cli.utils.settings import (
+    ET_APPLICATIONS,
+    ET_COMPUTE_REQUIREMENT_TEMPLATES,
+    ET_COMPUTE_SOURCE_TEMPLATES,
+    ET_GROUPS,
+    ET_IMAGE_FAMILIES,
+    ET_ROLES,
+    NAMESPACE_PREFIX_SEPARATOR,
+    SEARCH_PAGE_SIZE,
+)
 from yellowdog_cli.utils.ydid_utils import (
     TYPE_IMGFAM,
     TYPE_IMGGRP,
@@ -66,6 +83,8 @@ from yellowdog_cli.utils.ydid_utils import (
     get_ydid_type,
 )
 
+T = TypeVar("T")
+
 
 @lru_cache
 def get_task_groups_from_wr_by_id(
@@ -106,6 +125,36 @@ def get_filtered_work_requirement_summaries(
     namespace, tag and statuses. Also support an exclusion
     filter.
     """
+    return list(
+        iterate_filtered_work_requirement_summaries(
+            client, name, namespace, tag, include_filter, exclude_filter
+        )
+    )
+
+
+def iterate_filtered_work_requirement_summaries(
+    client: PlatformClient,
+    name: str | None = None,
+    namespace: str | None = None,
+    tag: str | None = None,
+    include_filter: list[WorkRequirementStatus] | None = None,
+    exclude_filter: list[WorkRequirementStatus] | None = None,
+    max_items: int | None = None,
+) -> Iterator[WorkRequirementSummary]:
+    """
+    Iterate lazily over Work Requirements optionally filtered by name,
+    namespace, tag and statuses. The exclusion filter is applied by the
+    platform, by searching for the statuses that aren't excluded.
+    """
+    if exclude_filter:
+        include_filter = [
+            status
+            for status in include_filter or WorkRequirementStatus
+            if status not in exclude_filter
+        ]
+        if not include_filter:
+            return iter([])
+
     wr_search = WorkRequirementSearch(
         name=name,
         namespaces=None if namespace is None else [namespace],
@@ -114,19 +163,33 @@ def get_filtered_work_requirement_summaries(
     )
 
     # Note: partial matches on 'name'
-    wr_search_client = client.work_client.get_work_requirements(wr_search)
-    work_requirement_summaries: list[WorkRequirementSummary] = (
-        wr_search_client.list_all()
+    return iterate_search(
+        client.work_client.get_work_requirements(wr_search), max_items
     )
 
-    if exclude_filter is None:
-        return work_requirement_summaries
 
-    return [
-        work_requirement_summary
-        for work_requirement_summary in work_requirement_summaries
-        if work_requirement_summary.status not in exclude_filter
-    ]
+def iterate_search(
+    search_client: SearchClient[T], max_items: int | None = None
+) -> Iterator[T]:
+    """
+    Iterate lazily over the results of a search, fetching each page of
+    results only when it's needed. If 'max_items' is set, pages are no
+    larger than required to supply that many items.
+    """
+    page_size = SEARCH_PAGE_SIZE if max_items is None else max_items
+    slice_reference = SliceReference(
+        size=max(SliceReference.MIN_SIZE, min(page_size, SliceReference.MAX_SIZE))
+    )
+    while True:
+        search_slice = search_client.slice(slice_reference)
+        if not search_slice.items:
+            return
+        yield from search_slice.items
+        if search_slice.nextSliceId is None:
+            return
+        slice_reference = SliceReference(
+            sliceId=search_slice.nextSliceId, size=slice_reference.size
+        )
 
 
 @lru_cache
@@ -224,6 +287,7 @@ def get_work_requirement_summary_by_name_or_id(
 
 
 @lru_cache
+@cached_resolution(ET_COMPUTE_SOURCE_TEMPLATES)
 def get_compute_source_template_id_by_name(
     client: PlatformClient, name: str, namespace: str | None = None
 ) -> str | None:
@@ -306,8 +370,10 @@ def clear_compute_source_template_cache():
     """
     get_compute_source_templates.cache_clear()
     get_compute_source_template_id_by_name.cache_clear()
+    invalidate_resolutions(ET_COMPUTE_SOURCE_TEMPLATES)
 
 
+@cached_resolution(ET_COMPUTE_REQUIREMENT_TEMPLATES)
 def get_compute_requirement_template_id_by_name(
     client: PlatformClient, name: str, namespace: str | None = None
 ) -> str | None:
@@ -358,6 +424,7 @@ def clear_compute_requirement_template_cache():
     Clear the cache of Compute Requirement Templates.
     """
     get_compute_requirement_templates.cache_clear()
+    invalidate_resolutions(ET_COMPUTE_REQUIREMENT_TEMPLATES)
 
 
 def get_compute_requirement_id_by_worker_pool_id(
@@ -403,6 +470,7 @@ def get_worker_pool_summaries(
 
 
 @lru_cache
+@cached_resolution(ET_IMAGE_FAMILIES)
 def get_image_name_or_id(
     client: PlatformClient,
     image_name_or_id: str | None,
@@ -615,15 +683,36 @@ def remove_allowances_matching_description(
 
 @lru_cache
 def get_all_tasks_in_task_group(
-    client: PlatformClient, task_group_id: str
+    client: PlatformClient, task_group_id: str, active_only: bool = False
 ) -> list[Task]:
     """
     Return all the tasks in a task group, with caching.
     """
-    return client.work_client.find_tasks(
-        TaskSearch(
-            taskGroupId=task_group_id,
-        )
+    return list(iterate_tasks_in_task_group(client, task_group_id, active_only))
+
+
+def iterate_tasks_in_task_group(
+    client: PlatformClient,
+    task_group_id: str,
+    active_only: bool = False,
+    max_items: int | None = None,
+) -> Iterator[Task]:
+    """
+    Iterate lazily over the tasks in a task group, optionally only those
+    that haven't finished.
+    """
+    return iterate_search(
+        client.work_client.get_tasks(
+            TaskSearch(
+                taskGroupId=task_group_id,
+                statuses=(
+                    [status for status in TaskStatus if not status.finished]
+                    if active_only
+                    else None
+                ),
+            )
+        ),
+        max_items,
     )
 
 
@@ -811,6 +900,7 @@ def _get_image_family_or_group_name_from_id(
 
 
 @lru_cache
+@cached_resolution(ET_ROLES)
 def get_role_id_by_name(client: PlatformClient, role_name: str) -> str | None:
     """
     Find the ID of a role by its name. Accept IDs and return unchanged.
@@ -850,6 +940,7 @@ def get_all_roles(client: PlatformClient) -> list[RoleSummary]:
 
 
 @lru_cache
+@cached_resolution(ET_GROUPS)
 def get_group_id_by_name(client: PlatformClient, group_name: str) -> str | None:
     """
     Get a group's ID by its name. Accept IDs and return unchanged.
@@ -897,6 +988,7 @@ def clear_group_caches():
     get_all_groups.cache_clear()
     get_group_name_by_id.cache_clear()
     get_group_id_by_name.cache_clear()
+    invalidate_resolutions(ET_GROUPS)
 
 
 @lru_cache
@@ -912,6 +1004,7 @@ def get_all_applications(client: PlatformClient) -> list[Application]:
 
 
 @lru_cache
+@cached_resolution(ET_APPLICATIONS)
 def get_application_id_by_name(client: PlatformClient, app_name: str) -> str | None:
     """
     Get an application ID by its name. Accept IDs and return unchanged.
@@ -994,6 +1087,7 @@ def clear_application_caches():
     get_application_group_summaries.cache_clear()
     get_application_groups.cache_clear()
     get_all_roles_and_namespaces_for_application.cache_clear()
+    invalidate_resolutions(ET_APPLICATIONS)
 
 
 def get_user_groups(client: PlatformClient, user_id: str) -> list[GroupSummary]:
@@ -1128,6 +1222,7 @@ def clear_image_caches():
     get_image_name_or_id.cache_clear()
     get_image_family_summaries.cache_clear()
     get_image_family_groups.cache_clear()
+    invalidate_resolutions(ET_IMAGE_FAMILIES)
 
 
 @lru_cache
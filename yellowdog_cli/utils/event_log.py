@@ -0,0 +1,117 @@
+"""
+Record event stream lines to a compressed, append-only log, and replay them.
+
+Each log entry is a JSON line holding the time the event line was received,
+the YDID of its stream, and the raw line.
+"""
+
+import gzip
+import zlib
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from json import dumps as json_dumps
+from json import loads as json_loads
+from time import monotonic, sleep, time
+
+from yellowdog_cli.utils.event_streams import EventStream
+from yellowdog_cli.utils.printing import print_event, print_warning
+from yellowdog_cli.utils.settings import EVENT_LOG_FLUSH_INTERVAL
+from yellowdog_cli.utils.ydid_utils import YDIDType
+
+
+@dataclass
+class EventRecord:
+    """
+    An event stream line, as recorded.
+    """
+
+    time: float
+    ydid: str
+    line: str
+
+
+class EventRecorder:
+    """
+    Append the lines received on event streams to a gzipped log file. The
+    compressed stream is flushed periodically, so that if the recorder is
+    killed, the log can be replayed up to the last flush.
+    """
+
+    def __init__(self, filename: str):
+        self._file = gzip.open(filename, "at", encoding="utf-8")
+        self._flushed = monotonic()
+
+    def record(self, ydid: str, line: str):
+        self._file.write(
+            json_dumps({"time": time(), "ydid": ydid, "line": line}) + "\n"
+        )
+        if monotonic() - self._flushed >= EVENT_LOG_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """
+        Write out the records so far as a complete block of compressed data
+        (a zlib Z_SYNC_FLUSH).
+        """
+        self._file.flush()
+        self._flushed = monotonic()
+
+    def wrap(self, event_stream: EventStream) -> EventStream:
+        """
+        Return an EventStream that records each line before handling it as
+        'event_stream' would.
+        """
+        on_event = (
+            print_event if event_stream.on_event is None else event_stream.on_event
+        )
+
+        def record_and_handle(event: str, ydid_type: YDIDType):
+            self.record(event_stream.ydid, event)
+            on_event(event, ydid_type)
+
+        return EventStream(event_stream.ydid, event_stream.ydid_type, record_and_handle)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_event_log(filename: str) -> Iterator[EventRecord]:
+    """
+    Read the records from an event log, in the order they were received.
+    A log that ends unexpectedly, e.g. because its recorder was killed, is
+    read up to the last complete record.
+    """
+    with gzip.open(filename, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                if line.strip():
+                    yield EventRecord(**json_loads(line))
+        except (EOFError, gzip.BadGzipFile, zlib.error) as e:
+            print_warning(f"Event log '{filename}' ends unexpectedly ({e})")
+
+
+def replay_event_log(
+    filename: str,
+    speed: float,
+    on_record: Callable[[EventRecord], None],
+):
+    """
+    Replay the records from an event log, preserving the intervals between
+    them scaled by 'speed' (e.g. 2.0 is twice as fast). A speed of zero
+    replays the records as fast as possible.
+    """
+    if speed < 0:
+        raise ValueError("Replay speed must not be negative")
+
+    previous_time: float | None = None
+    for record in read_event_log(filename):
+        if speed > 0 and previous_time is not None:
+            sleep(max(0.0, record.time - previous_time) / speed)
+        previous_time = record.time
+        on_record(record)
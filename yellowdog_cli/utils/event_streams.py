@@ -0,0 +1,232 @@
+"""
+An asyncio engine for following many event streams concurrently, using a
+single event loop and a shared HTTP client session.
+"""
+
+import asyncio
+import os
+import random
+import ssl
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
+
+from yellowdog_cli.utils.printing import (
+    print_error,
+    print_event,
+    print_info,
+    print_warning,
+)
+from yellowdog_cli.utils.retry_utils import TokenBucket, parse_retry_after
+from yellowdog_cli.utils.settings import (
+    EVENT_STREAM_CONNECT_TIMEOUT,
+    EVENT_STREAM_MAX_LINE_BYTES,
+    EVENT_STREAM_MAX_RETRY_INTERVAL,
+    EVENT_STREAM_RECONNECT_BURST,
+    EVENT_STREAM_RECONNECTS_PER_SECOND,
+    EVENT_STREAM_RETRY_INTERVAL,
+    HTTP_RETRY_STATUS_CODES,
+)
+from yellowdog_cli.utils.wrapper import CONFIG_COMMON
+from yellowdog_cli.utils.ydid_utils import YDIDType
+
+
+@dataclass
+class EventStream:
+    """
+    An event stream to follow. If 'on_event' is set, it's called for each
+    event line instead of print_event().
+    """
+
+    ydid: str
+    ydid_type: YDIDType
+    on_event: Callable[[str, YDIDType], None] | None = None
+
+
+class EventLineParser:
+    """
+    Split the bytes received on an event stream into lines, incrementally.
+    Only the current incomplete line is buffered.
+    """
+
+    def __init__(self, max_line_bytes: int = EVENT_STREAM_MAX_LINE_BYTES):
+        self._max_line_bytes = max_line_bytes
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> list[str]:
+        """
+        Add received data, and return any lines it completes.
+        """
+        lines = []
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            self._buffer += data[start:end]
+            lines.append(self._buffer.rstrip(b"\r").decode("utf-8", errors="replace"))
+            self._buffer.clear()
+            start = end + 1
+        self._buffer += data[start:]
+        if len(self._buffer) > self._max_line_bytes:
+            raise ValueError(
+                f"Event stream line exceeds {self._max_line_bytes:,d} bytes"
+            )
+        return lines
+
+
+@dataclass
+class StreamPosition:
+    """
+    The SSE 'id:' and 'retry:' fields last received on an event stream, used
+    to resume the stream and to pace reconnection.
+    """
+
+    last_event_id: str | None = None
+    retry_interval: float | None = None  # Seconds
+
+    def observe(self, line: str):
+        """
+        Record the value of an 'id:' or 'retry:' field line.
+        """
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "id" and "\0" not in value:
+            self.last_event_id = value
+        elif field == "retry" and value.isdigit():
+            self.retry_interval = int(value) / 1000
+
+    def get_headers(self) -> dict[str, str] | None:
+        """
+        The headers to resume the stream from the last event received.
+        """
+        return {"Last-Event-ID": self.last_event_id} if self.last_event_id else None
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter, starting from the interval requested
+        by the server if there is one.
+        """
+        base = (
+            EVENT_STREAM_RETRY_INTERVAL
+            if self.retry_interval is None
+            else self.retry_interval
+        )
+        delay = min(EVENT_STREAM_MAX_RETRY_INTERVAL, base * 2**attempt)
+        return random.uniform(delay / 2, delay)
+
+
+def follow_event_streams(event_streams: list[EventStream]):
+    """
+    Follow event streams concurrently until they have all concluded.
+    """
+    if event_streams:
+        asyncio.run(_follow_event_streams(event_streams))
+
+
+async def _follow_event_streams(event_streams: list[EventStream]):
+    # One connection per stream; proxy settings are taken from the
+    # environment, as for 'requests'
+    async with ClientSession(
+        connector=TCPConnector(limit=0, ssl=_get_ssl_context()),
+        headers={"Authorization": f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"},
+        timeout=ClientTimeout(total=None, sock_connect=EVENT_STREAM_CONNECT_TIMEOUT),
+        trust_env=True,
+    ) as session:
+        # Limits the overall reconnection rate so that an interruption
+        # affecting many streams doesn't cause a reconnection storm
+        reconnect_budget = TokenBucket(
+            EVENT_STREAM_RECONNECTS_PER_SECOND, EVENT_STREAM_RECONNECT_BURST
+        )
+        await asyncio.gather(
+            *(_follow_event_stream(session, x, reconnect_budget) for x in event_streams)
+        )
+
+
+def _get_ssl_context() -> ssl.SSLContext | bool:
+    """
+    Use any CA bundle set for 'requests' by the 'certificates' property.
+    """
+    ca_bundle = os.getenv("REQUESTS_CA_BUNDLE")
+    return True if ca_bundle is None else ssl.create_default_context(cafile=ca_bundle)
+
+
+async def _follow_event_stream(
+    session: ClientSession,
+    event_stream: EventStream,
+    reconnect_budget: TokenBucket,
+):
+    """
+    Follow a single event stream. If it's interrupted, or the server
+    responds with a transient error status, reconnect with backoff, resuming
+    from the last event ID received.
+    """
+    ydid = event_stream.ydid
+    on_event = print_event if event_stream.on_event is None else event_stream.on_event
+    position = StreamPosition()
+    attempt = 0
+
+    while True:
+        retry_after = None
+        try:
+            async with session.get(
+                get_event_url(ydid, event_stream.ydid_type),
+                headers=position.get_headers(),
+            ) as response:
+                if response.status in HTTP_RETRY_STATUS_CODES:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                elif response.status != 200:
+                    try:
+                        error_text = (await response.json(content_type=None))["message"]
+                    except Exception:
+                        error_text = "(JSON error cannot be decoded)"
+                    print_error(f"'{ydid}': {error_text}")
+                    break
+                else:
+                    parser = EventLineParser()
+                    async for data in response.content.iter_any():
+                        for event in parser.feed(data):
+                            if event:
+                                attempt = 0  # The connection was productive
+                                position.observe(event)
+                                on_event(event, event_stream.ydid_type)
+                    break
+
+        # Includes failures to connect (ClientConnectorError) and
+        # disconnections by the server
+        except (ClientPayloadError, ClientConnectionError):
+            pass
+
+        except Exception as e:
+            print_error(f"Event stream error: {e}")
+            break
+
+        delay = position.get_retry_delay(attempt)
+        attempt += 1
+        if retry_after is not None:
+            # Hold back the reconnection of every stream, not just this one
+            reconnect_budget.pause(retry_after)
+            delay = max(delay, retry_after)
+        print_warning(
+            f"Event stream interruption for '{ydid}' (retrying in {delay:.1f}s)"
+        )
+        await asyncio.sleep(delay)
+        await reconnect_budget.acquire_async()
+
+    print_info(f"Event stream concluded for '{ydid}'")
+
+
+def get_event_url(ydid: str, ydid_type: YDIDType) -> str:
+    """
+    Get the event stream URL. Assumes we've already checked that the
+    YDID is one of these types.
+    """
+    if ydid_type is YDIDType.WORK_REQUIREMENT:
+        return f"{CONFIG_COMMON.url}/work/requirements/{ydid}/updates"
+    if ydid_type == YDIDType.WORKER_POOL:
+        return f"{CONFIG_COMMON.url}/workerPools/{ydid}/updates"
+    return f"{CONFIG_COMMON.url}/compute/requirements/{ydid}/updates"
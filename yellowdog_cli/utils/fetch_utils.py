@@ -0,0 +1,62 @@
+"""
+Fetch the details of many items concurrently, for listings that need an API
+call per item.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from yellowdog_cli.utils.printing import print_error
+from yellowdog_cli.utils.settings import FETCH_THREADS
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# The number of items that couldn't be fetched, since the last call to
+# check_fetch_failures()
+_NUM_FETCH_FAILURES = 0
+
+
+def fetch_concurrently(
+    items: list[T],
+    fetch: Callable[[T], R],
+    description: Callable[[T], str] = str,
+    max_workers: int = FETCH_THREADS,
+) -> list[R]:
+    """
+    Call 'fetch' for each item using a bounded pool of threads, and return
+    the results in the same order as 'items'. Items for which 'fetch' fails
+    are reported (using 'description' to identify them) and omitted from the
+    results; the command should call check_fetch_failures() once it has
+    used the results.
+    """
+    global _NUM_FETCH_FAILURES
+    if not items:
+        return []
+
+    results: list[R] = []
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    try:
+        futures = [executor.submit(fetch, item) for item in items]
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print_error(f"Unable to fetch {description(item)}: {e}")
+                _NUM_FETCH_FAILURES += 1
+    finally:
+        # Don't wait for outstanding fetches if interrupted
+        executor.shutdown(cancel_futures=True)
+    return results
+
+
+def check_fetch_failures():
+    """
+    Raise an exception if any items couldn't be fetched, so that a command
+    exits with an error after listing the items that were fetched.
+    """
+    global _NUM_FETCH_FAILURES
+    num_fetch_failures, _NUM_FETCH_FAILURES = _NUM_FETCH_FAILURES, 0
+    if num_fetch_failures > 0:
+        raise RuntimeError(f"Unable to fetch {num_fetch_failures:,d} item(s)")
@@ -36,6 +36,7 @@ from yellowdog_cli.utils.property_names import *  # noqa: E402
 from yellowdog_cli.utils.settings import (  # noqa: E402
     CR_MAX_INSTANCES,
     DEFAULT_URL,
+    TASK_BATCH_MAX_BYTES_DEFAULT,
     TASK_BATCH_SIZE_DEFAULT,
     TOML_VAR_NESTED_DEPTH,
     YD_DATA_CLIENT,
@@ -299,6 +300,11 @@ def load_config_common() -> ConfigCommon:
             use_pac=(
                 True if ARGS_PARSER.use_pac else common_section.get(USE_PAC, False)
             ),
+            resolution_cache=(
+                True
+                if ARGS_PARSER.resolution_cache
+                else common_section.get(RESOLUTION_CACHE, False)
+            ),
         )
 
     except KeyError as e:
@@ -580,6 +586,12 @@ def load_config_work_requirement() -> ConfigWorkRequirement:
             else ARGS_PARSER.task_batch_size
         )
 
+        task_batch_max_bytes = (
+            wr_section.get(TASK_BATCH_MAX_BYTES, TASK_BATCH_MAX_BYTES_DEFAULT)
+            if ARGS_PARSER.task_batch_max_bytes is None
+            else ARGS_PARSER.task_batch_max_bytes
+        )
+
         task_count = (
             ARGS_PARSER.task_count
             if ARGS_PARSER.task_count is not None
@@ -593,12 +605,14 @@ def load_config_work_requirement() -> ConfigWorkRequirement:
         )
 
         return ConfigWorkRequirement(
+            adaptive_batching=wr_section.get(ADAPTIVE_BATCHING, False),
             add_environment=wr_section.get(ADD_ENVIRONMENT),
             add_yd_env_vars=wr_section.get(ADD_YD_ENV_VARS, False),
             args=wr_section.get(ARGS, []),
             args_postfix=wr_section.get(ARGS_POSTFIX),
             args_prefix=wr_section.get(ARGS_PREFIX),
             completed_task_ttl=wr_section.get(COMPLETED_TASK_TTL),
+            compress_task_batches=wr_section.get(COMPRESS_TASK_BATCHES, True),
             csv_files=cast(list[str] | None, csv_files),
             disable_preallocation=wr_section.get(DISABLE_PREALLOCATION),
             env=wr_section.get(ENV, {}),
@@ -606,6 +620,7 @@ def load_config_work_requirement() -> ConfigWorkRequirement:
                 FINISH_IF_ALL_TASKS_FINISHED, True
             ),
             finish_if_any_task_failed=wr_section.get(FINISH_IF_ANY_TASK_FAILED, False),
+            generation_processes=wr_section.get(GENERATION_PROCESSES),
             instance_pricing_preference=wr_section.get(INSTANCE_PRICING_PREFERENCE),
             instance_types=wr_section.get(INSTANCE_TYPES),
             max_retries=wr_section.get(MAX_RETRIES),
@@ -619,6 +634,7 @@ def load_config_work_requirement() -> ConfigWorkRequirement:
             regions=wr_section.get(REGIONS),
             retryable_errors=wr_section.get(RETRYABLE_ERRORS),
             set_task_names=wr_section.get(SET_TASK_NAMES, True),
+            task_batch_max_bytes=task_batch_max_bytes,
             task_batch_size=task_batch_size,
             task_count=task_count,
             task_data=wr_section.get(TASK_DATA),
@@ -634,6 +650,8 @@ def load_config_work_requirement() -> ConfigWorkRequirement:
             task_type=task_type,
             tasks_per_worker=wr_section.get(TASKS_PER_WORKER),
             task_level_timeout=wr_section.get(TASK_LEVEL_TIMEOUT),
+            upload_manifest=wr_section.get(UPLOAD_MANIFEST, True),
+            upload_threads=wr_section.get(UPLOAD_THREADS),
             vcpus=wr_section.get(VCPUS),
             worker_tags=worker_tags,
             wr_data_file=wr_data_file,
@@ -16,6 +16,7 @@ from yellowdog_client.model import (
     ConfiguredWorkerPool,
     ProvisionedWorkerPool,
     WorkRequirement,
+    WorkRequirementSummary,
 )
 
 from yellowdog_cli.utils.args import ARGS_PARSER
@@ -24,6 +25,17 @@ from yellowdog_cli.utils.printing import print_info
 UTCNOW = datetime.now(timezone.utc)
 
 
+def get_cache_dir() -> str:
+    """
+    The CLI's directory in the user's cache directory ('$XDG_CACHE_HOME',
+    or '~/.cache'), for caches shared by successive commands.
+    """
+    cache_dir = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_dir, "yellowdog")
+
+
 def pathname_relative_to_config_file(config_file_dir: str, file: str) -> str:
     """
     Find the pathname of a file relative to the location
@@ -60,14 +72,28 @@ entities: dict[str, str] = {
 
 
 def link_entity(base_url: str, entity: _EntityType) -> str:
-    entity_type_name = type(entity).__name__
+    return link_entity_id(base_url, type(entity).__name__, entity.id)  # type: ignore[arg-type]
+
+
+def link_entity_id(base_url: str, entity_type_name: str, entity_id: str) -> str:
+    """
+    Link to an entity using its type name and ID, without needing to fetch
+    the entity itself.
+    """
     return link(
         base_url,
-        f"#/{entities.get(entity_type_name)}/{entity.id}",  # type: ignore[union-attr]
+        f"#/{entities.get(entity_type_name)}/{entity_id}",
         camel_case_split(entity_type_name).upper(),
     )
 
 
+def fq_name(work_requirement_summary: WorkRequirementSummary) -> str:
+    """
+    The namespace-qualified name of a Work Requirement.
+    """
+    return f"{work_requirement_summary.namespace}/{work_requirement_summary.name}"
+
+
 def link(base_url: str, url_suffix: str = "", text: str | None = None) -> str:
     url_parts = urlparse(base_url)
     base_url = url_parts.scheme + "://" + url_parts.netloc
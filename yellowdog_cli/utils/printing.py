@@ -3,17 +3,17 @@ Functions focused on print outputs.
 """
 
 import re
-from collections.abc import Sequence
-from contextlib import redirect_stdout
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from json import dumps as json_dumps
 from json import loads as json_loads
 from os import get_terminal_size, getpid
 from sys import stderr
 from textwrap import fill
 from textwrap import indent as text_indent
-from typing import Any, TypeVar
+from typing import Any, TextIO, TypeVar
 
 from rich.console import Console
 from rich.highlighter import JSONHighlighter, RegexHighlighter
@@ -62,7 +62,7 @@ from yellowdog_client.model import (
 
 from yellowdog_cli.utils.args import ARGS_PARSER
 from yellowdog_cli.utils.cloudwizard_aws_types import AWSAvailabilityZone
-from yellowdog_cli.utils.compact_json import CompactJSONEncoder
+from yellowdog_cli.utils.compact_json import CompactJSONEncoder, to_json_line
 from yellowdog_cli.utils.items import Item
 from yellowdog_cli.utils.property_names import NAME, TASK_GROUPS, TASKS
 from yellowdog_cli.utils.rich_console_input_fixed import ConsoleWithInputBackspaceFixed
@@ -75,6 +75,7 @@ from yellowdog_cli.utils.settings import (
     JSON_INDENT,
     MAX_LINES_COLOURED_FORMATTING,
     MAX_TABLE_DESCRIPTION,
+    OUTPUT_FILE_BUFFER_SIZE,
     PROP_ACCESS_DELEGATES,
     PROP_ADMIN_GROUP,
     PROP_CREATED_BY_ID,
@@ -88,6 +89,7 @@ from yellowdog_cli.utils.settings import (
     PROP_SOURCE,
     PROP_SUPPORTING_RESOURCE_CREATED,
     PROP_TRAITS,
+    SEARCH_PAGE_SIZE,
     WARNING_STYLE,
 )
 from yellowdog_cli.utils.ydid_utils import YDID_HIGHLIGHT_RE, YDIDType
@@ -960,7 +962,47 @@ def print_numbered_object_list(
     )
     print()
 
+    headers, table = _object_table(client, objects, object_type_name)
+    _print_object_table(headers, table)
+    print(flush=True)
+
+
+def print_numbered_object_stream(
+    client: PlatformClient,
+    objects: Iterable[Item],
+    batch_size: int = SEARCH_PAGE_SIZE,
+) -> int:
+    """
+    Print a numbered list of objects in order of receipt, as a table for
+    each batch of objects, without waiting for the remaining objects.
+    Return the number of objects printed.
+    """
+    iterator = iter(objects)
+    count = 0
+    while batch := list(islice(iterator, batch_size)):
+        if count == 0:
+            print_info(f"Displaying matching {get_type_name(batch[0])}(s):")
+            print()
+        headers, table = _object_table(client, batch)
+        for row in table:
+            row[0] += count
+        _print_object_table(headers, table)
+        print(flush=True)
+        count += len(batch)
+    return count
+
+
+def _object_table(
+    client: PlatformClient,
+    objects: Sequence[Item | str | dict],
+    object_type_name: str | None = None,
+) -> tuple[list[str] | None, list[list]]:
+    """
+    Generate the numbered table for a list of objects, and its headers, if
+    any.
+    """
     headers = None
+    table: list[list]
     if isinstance(objects[0], str):
         headers = ["#", "Name"]
         table = [[index + 1, name] for index, name in enumerate(objects)]
@@ -1012,6 +1054,13 @@ def print_numbered_object_list(
         table = []
         for index, obj in enumerate(objects):
             table.append([index + 1, ":", obj.name])  # type: ignore[union-attr]
+    return headers, table
+
+
+def _print_object_table(headers: list[str] | None, table: list[list]):
+    """
+    Print a numbered table of objects.
+    """
     if headers is None:
         print_table_core(indent(tabulate(table, tablefmt="plain"), indent_width=4))
     else:
@@ -1021,7 +1070,6 @@ def print_numbered_object_list(
                 indent_width=4,
             )
         )
-    print(flush=True)
 
 
 def print_numbered_strings(objects: list[str], override_quiet: bool = False):
@@ -1097,11 +1145,18 @@ def print_json(
 ):
     """
     Print a dictionary as a JSON data structure, using the compact JSON
-    encoder.
+    encoder, or as a single line of JSON if '--json-lines' is specified.
     """
-    json_string = indent(
-        json_dumps(data, indent=JSON_INDENT, cls=CompactJSONEncoder), initial_indent
-    )
+    if ARGS_PARSER.json_lines:
+        json_string = to_json_line(data)
+        print(json_string)
+        if ARGS_PARSER.output_file is not None:
+            print_to_file(json_string, ARGS_PARSER.output_file)
+        return
+
+    json_string = json_dumps(data, indent=JSON_INDENT, cls=CompactJSONEncoder)
+    if initial_indent > 0:
+        json_string = indent(json_string, initial_indent)
     if drop_first_line:
         json_string = "\n".join(json_string.splitlines()[1:])
 
@@ -1194,29 +1249,41 @@ def print_yd_object(
 
 
 def print_yd_object_list(
-    objects: list[tuple[Any, dict | None]],
+    objects: Iterable[tuple[Any, dict | None]],
 ):
     """
-    Print a JSON list of objects.
+    Print a JSON list of objects, or one JSON object per line if
+    '--json-lines' is specified. Objects are printed as they're supplied,
+    so 'objects' can be a lazily evaluated iterable.
     """
 
     if ARGS_PARSER.output_file is not None:
         print_info(f"Copying detailed resource list to '{ARGS_PARSER.output_file}'")
 
-    if len(objects) > 1:
+    iterator = iter(objects)
+    current = next(iterator, None)
+    if current is None:
+        return
+    following = next(iterator, None)
+
+    json_list = following is not None and not ARGS_PARSER.json_lines
+
+    if json_list:
         print("[")
         if ARGS_PARSER.output_file is not None:
             print_to_file("[", ARGS_PARSER.output_file)
 
-    for index, (object_, add_fields) in enumerate(objects):
+    while current is not None:
+        object_, add_fields = current
         print_yd_object(
             object_,
-            initial_indent=2 if len(objects) > 1 else 0,
-            with_final_comma=(True if index < len(objects) - 1 else False),
+            initial_indent=2 if json_list else 0,
+            with_final_comma=json_list and following is not None,
             add_fields=add_fields,
         )
+        current, following = following, next(iterator, None)
 
-    if len(objects) > 1:
+    if json_list:
         print("]")
         if ARGS_PARSER.output_file is not None:
             print_to_file("]", ARGS_PARSER.output_file)
@@ -1241,37 +1308,193 @@ class WorkRequirementSnapshot:
     Represent a complete Work Requirement, with Tasks included within
     Task Group definitions. Note, this is not an 'official' representation
     of a Work Requirement.
+
+    The JSON representation is printed as it's built, so the Tasks aren't
+    held in memory: the Work Requirement and Task Group properties are
+    printed up to each Task Group's Task list, then the Tasks as they're
+    added. Tasks must therefore be added in Task Group order. The output is
+    the same as formatting the complete Work Requirement in one go.
     """
 
+    # Stands in for a list while the surrounding JSON is formatted
+    _MARKER = "\0"
+    _ENCODED_MARKER = json_dumps([_MARKER])
+
     def __init__(self):
         self.wr_data: dict = {}
+        self._task_groups: list[dict] = []
+        self._next_task_group = 0  # The next Task Group to be printed
+        self._open_task_group: int | None = None  # Task Group with Tasks pending
+        self._num_tasks_printed = 0  # Tasks printed for the open Task Group
+        self._task_group_suffix = ""
+        self._wr_suffix = ""
+        self._started = False
+        # Output is held until it's known whether it's short enough for
+        # coloured formatting
+        self._pending: list[str] | None = []
+        self._pending_lines = 0
 
     def set_work_requirement(self, wr: WorkRequirement):
         """
         Set the Work Requirement to be represented, processed to
         comply with the API.
         """
-        self.wr_data = Json.dump(wr)  # type: ignore[assignment]  # Dictionary holding the complete WR
+        self.wr_data = Json.dump(wr)  # type: ignore[assignment]
+        self._task_groups = self.wr_data.get(TASK_GROUPS) or []
 
     def add_tasks(self, task_group_name: str, tasks: list[Task]):
         """
         Add the list of Tasks to a named Task Group within the
         Work Requirement. Cumulative.
         """
-        for task_group in self.wr_data[TASK_GROUPS]:
+        for index, task_group in enumerate(self._task_groups):
             if task_group[NAME] == task_group_name:
-                task_group[TASKS] = task_group.get(TASKS, [])
-                task_group[TASKS] += [Json.dump(task) for task in tasks]
-                return
+                break
+        else:
+            return
+
+        self._start()
+        if index != self._open_task_group:
+            if index < self._next_task_group:
+                raise ValueError(
+                    f"Tasks for Task Group '{task_group_name}' must be added"
+                    " before those of later Task Groups"
+                )
+            self._close_task_group()
+            self._print_task_groups(until=index)
+            self._open_task_group_tasks(index)
+
+        task_indent = 4 * JSON_INDENT
+        for task in tasks:
+            self._write(
+                ("\n" if self._num_tasks_printed == 0 else ",\n")
+                + indent(
+                    json_dumps(
+                        Json.dump(task), indent=JSON_INDENT, cls=CompactJSONEncoder
+                    ),
+                    task_indent,
+                )
+            )
+            self._num_tasks_printed += 1
 
     def print(self):
         """
-        Print the JSON representation.
+        Print the remainder of the JSON representation.
         """
-        print_info("Dry-run: Printing JSON Work Requirement specification:")
-        print_json(self.wr_data)
+        if not self._task_groups:
+            print_info("Dry-run: Printing JSON Work Requirement specification:")
+            print_json(self.wr_data)
+        else:
+            self._start()
+            self._close_task_group()
+            self._print_task_groups(until=len(self._task_groups))
+            self._write(f"\n{' ' * JSON_INDENT}]{self._wr_suffix}\n")
+            self._flush()
         print_info("Dry-run: Complete")
 
+    def _start(self):
+        """
+        Print the Work Requirement properties preceding its Task Groups.
+        """
+        if self._started:
+            return
+        self._started = True
+        print_info("Dry-run: Printing JSON Work Requirement specification:")
+        wr_prefix, self._wr_suffix = self._split_on_marker(
+            {**self.wr_data, TASK_GROUPS: [self._MARKER]}
+        )
+        self._write(f"{wr_prefix}[")
+
+    def _print_task_groups(self, until: int):
+        """
+        Print the Task Groups that have no Tasks, up to Task Group 'until'.
+        """
+        for index in range(self._next_task_group, until):
+            self._write(
+                self._task_group_separator(index)
+                + indent(
+                    json_dumps(
+                        self._task_groups[index],
+                        indent=JSON_INDENT,
+                        cls=CompactJSONEncoder,
+                    ),
+                    2 * JSON_INDENT,
+                )
+            )
+        self._next_task_group = max(self._next_task_group, until)
+
+    def _open_task_group_tasks(self, index: int):
+        """
+        Print a Task Group's properties preceding its Tasks.
+        """
+        task_group_prefix, self._task_group_suffix = self._split_on_marker(
+            {**self._task_groups[index], TASKS: [self._MARKER]},
+            2 * JSON_INDENT,
+        )
+        self._write(f"{self._task_group_separator(index)}{task_group_prefix}[")
+        self._open_task_group = index
+        self._next_task_group = index + 1
+        self._num_tasks_printed = 0
+
+    def _close_task_group(self):
+        """
+        Print the remainder of the Task Group with Tasks pending, if any.
+        """
+        if self._open_task_group is None:
+            return
+        if self._num_tasks_printed > 0:
+            self._write(f"\n{' ' * 3 * JSON_INDENT}")
+        self._write(f"]{self._task_group_suffix}")
+        self._open_task_group = None
+
+    @staticmethod
+    def _task_group_separator(index: int) -> str:
+        return "\n" if index == 0 else ",\n"
+
+    @classmethod
+    def _split_on_marker(cls, data: dict, initial_indent: int = 0) -> tuple[str, str]:
+        """
+        Format 'data' and split it where the marker appears.
+        """
+        json_string = json_dumps(data, indent=JSON_INDENT, cls=CompactJSONEncoder)
+        if initial_indent > 0:
+            json_string = indent(json_string, initial_indent)
+        prefix, _, suffix = json_string.partition(cls._ENCODED_MARKER)
+        return prefix, suffix
+
+    def _write(self, text: str):
+        """
+        Write part of the JSON representation to the console, and to the
+        output file if one is specified.
+        """
+        if self._pending is not None:
+            self._pending.append(text)
+            self._pending_lines += text.count("\n")
+            if self._pending_lines <= MAX_LINES_COLOURED_FORMATTING + 1:
+                return
+            # Too long for coloured formatting: print as plain text from now on
+            text = "".join(self._pending)
+            self._pending = None
+        print(text, end="")
+        if ARGS_PARSER.output_file is not None:
+            print_to_file(text, ARGS_PARSER.output_file, end="")
+
+    def _flush(self):
+        """
+        Print any output held for coloured formatting.
+        """
+        if self._pending is None:
+            print(end="", flush=True)
+            return
+        json_string = "".join(self._pending).removesuffix("\n")
+        self._pending = None
+        if ARGS_PARSER.no_format:
+            print(json_string, flush=True)
+        else:
+            CONSOLE_JSON.print(escape(json_string), soft_wrap=True)
+        if ARGS_PARSER.output_file is not None:
+            print_to_file(json_string, ARGS_PARSER.output_file)
+
 
 def print_compute_template_test_result(result: ComputeRequirementTemplateTestResult):
     """
@@ -1492,26 +1715,45 @@ def print_event(event: str, id_type: YDIDType):
     print_info(msg, no_fill=True)
 
 
-FIRST_OUTPUT_TO_FILE = True  # Determine whether to 'write' or 'append'
+_OUTPUT_FILE: TextIO | None = None  # Opened on first use, then kept open
 
 
-def print_to_file(json_string: str, output_file: str, with_final_comma: bool = False):
+def print_to_file(
+    json_string: str,
+    output_file: str,
+    with_final_comma: bool = False,
+    end: str = "\n",
+):
     """
-    Dump details output to a file.
+    Dump details output to a file. The file is truncated and opened on
+    first use, and the same buffered file handle is used for all subsequent
+    output until close_output_file() is called.
     """
-    global FIRST_OUTPUT_TO_FILE
+    global _OUTPUT_FILE
 
     try:
-        with open(output_file, "w" if FIRST_OUTPUT_TO_FILE else "a") as f:
-            with redirect_stdout(f):
-                if with_final_comma:
-                    print(json_string, end=",\n", flush=True)
-                else:
-                    print(json_string, flush=True)
+        if _OUTPUT_FILE is None:
+            _OUTPUT_FILE = open(output_file, "w", buffering=OUTPUT_FILE_BUFFER_SIZE)
+        _OUTPUT_FILE.write(
+            f"{json_string},{end}" if with_final_comma else f"{json_string}{end}"
+        )
     except Exception as e:
         raise RuntimeError(f"Cannot open output file for writing: {e}")
 
-    FIRST_OUTPUT_TO_FILE = False
+
+def close_output_file():
+    """
+    Flush and close the details output file, if it's open.
+    """
+    global _OUTPUT_FILE
+
+    if _OUTPUT_FILE is None:
+        return
+    output_file, _OUTPUT_FILE = _OUTPUT_FILE, None
+    try:
+        output_file.close()
+    except Exception as e:
+        raise RuntimeError(f"Cannot write to output file: {e}")
 
 
 def _truncate_text(description: str | None):
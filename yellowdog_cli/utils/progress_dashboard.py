@@ -0,0 +1,318 @@
+"""
+A live progress dashboard for Work Requirement, Worker Pool and Compute
+Requirement event streams.
+
+Events are coalesced: only the latest snapshot received for each stream is
+kept, and it's decoded and rendered at most once per frame.
+"""
+
+from collections.abc import Hashable
+from dataclasses import dataclass
+from json import loads as json_loads
+from threading import Lock
+from time import monotonic, time
+from typing import Generic, TypeVar
+
+from rich.progress import (
+    BarColumn,
+    Progress,
+    ProgressColumn,
+    TaskID,
+    TaskProgressColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
+from rich.text import Text
+from yellowdog_client.model import (
+    TaskStatus,
+    WorkRequirement,
+    WorkRequirementStatus,
+)
+
+from yellowdog_cli.utils.event_streams import EventStream
+from yellowdog_cli.utils.printing import CONSOLE, print_warning
+from yellowdog_cli.utils.settings import PROGRESS_REFRESH_PER_SECOND
+from yellowdog_cli.utils.ydid_utils import YDIDType
+
+DATA_PREFIX = "data:"
+
+K = TypeVar("K", bound=Hashable)
+
+
+class EventCoalescer(Generic[K]):
+    """
+    Keep the latest undecoded 'data:' payload received for each stream.
+    Safe to use from multiple threads.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._latest: dict[K, str] = {}
+
+    def add(self, key: K, event: str):
+        """
+        Record an event line, replacing any pending payload for 'key'.
+        Lines without a 'data:' payload are ignored.
+        """
+        if event.startswith(DATA_PREFIX):
+            with self._lock:
+                self._latest[key] = event[len(DATA_PREFIX) :]
+
+    def take(self) -> dict[K, str]:
+        """
+        Return and clear the pending payloads.
+        """
+        with self._lock:
+            latest, self._latest = self._latest, {}
+        return latest
+
+
+@dataclass
+class _Row:
+    """
+    The state displayed for one stream. For Work Requirements, 'total' and
+    'completed' count Tasks; for Worker Pools, all and RUNNING Nodes; for
+    Compute Requirements, target and alive instances.
+    """
+
+    ydid: str
+    ydid_type: YDIDType
+    name: str = ""
+    status: str = ""
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    aborted: int = 0
+    cancelled: int = 0
+
+
+class _NameColumn(ProgressColumn):
+    """
+    Renders the name of the followed item (stored in task.fields["name"]) in
+    brackets with dim styling, for display after the progress bar.
+    """
+
+    def render(self, task) -> Text:
+        name = task.fields.get("name", "")
+        return Text(f"[{name}]" if name else "", style="dim")
+
+
+class ProgressDashboard(Progress):
+    """
+    A single live display with a progress row for each followed stream.
+    """
+
+    def __init__(self, refresh_per_second: float = PROGRESS_REFRESH_PER_SECOND):
+        if refresh_per_second <= 0:
+            raise ValueError("Progress refresh rate must be greater than zero")
+        # Set before initialising Progress, which may render
+        self._coalescer: EventCoalescer[TaskID] = EventCoalescer()
+        self._rows: dict[TaskID, _Row] = {}
+        self._stopped: set[TaskID] = set()
+        super().__init__(
+            TextColumn("{task.description}"),
+            BarColumn(
+                complete_style="green4",
+                finished_style="green4",
+                pulse_style="deep_sky_blue4",
+            ),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            _NameColumn(),
+            console=CONSOLE,
+            transient=False,
+            refresh_per_second=refresh_per_second,
+        )
+
+    def add_stream(
+        self,
+        ydid: str,
+        ydid_type: YDIDType,
+        work_requirement: WorkRequirement | None = None,
+    ) -> EventStream:
+        """
+        Add a row for a stream, and return the EventStream that feeds it.
+        A Work Requirement row is populated from 'work_requirement', if
+        supplied.
+        """
+        row = _Row(ydid, ydid_type)
+        task_id = self.add_task("Starting…", total=None, name="")
+        self._rows[task_id] = row
+        if work_requirement is not None:
+            self._prepopulate_work_requirement(task_id, row, work_requirement)
+
+        def on_event(event: str, _: YDIDType):
+            self._coalescer.add(task_id, event)
+
+        return EventStream(ydid, ydid_type, on_event)
+
+    def get_renderables(self):
+        """
+        Apply the latest snapshots before each frame is rendered.
+        """
+        self._apply_snapshots()
+        yield from super().get_renderables()
+
+    def print_summary(self):
+        """
+        Warn about any Work Requirements with failed, aborted or cancelled
+        Tasks.
+        """
+        self._apply_snapshots()
+        for row in self._rows.values():
+            if row.ydid_type is not YDIDType.WORK_REQUIREMENT:
+                continue
+            parts = []
+            if row.failed:
+                parts.append(f"{row.failed:,} failed")
+            if row.aborted:
+                parts.append(f"{row.aborted:,} aborted")
+            if row.cancelled:
+                parts.append(f"{row.cancelled:,} cancelled")
+            if parts:
+                name = f" '{row.name}'" if len(self._rows) > 1 else ""
+                print_warning(
+                    f"Work Requirement{name} finished with {' · '.join(parts)} task(s)"
+                )
+
+    def _apply_snapshots(self):
+        for task_id, payload in self._coalescer.take().items():
+            row = self._rows[task_id]
+            try:
+                _update_row(row, json_loads(payload))
+            except Exception:
+                continue
+            self._update_task(task_id, row)
+            if row.ydid_type is YDIDType.WORK_REQUIREMENT and _is_finished(row.status):
+                self._stop_timer(task_id)
+
+    def _update_task(self, task_id: TaskID, row: _Row):
+        self.update(
+            task_id,
+            total=row.total if row.total > 0 else None,
+            completed=row.completed,
+            description=_row_desc(row),
+            name=row.name,
+        )
+
+    def _stop_timer(self, task_id: TaskID):
+        """
+        Freeze a row's elapsed time, if not already frozen.
+        """
+        if task_id not in self._stopped:
+            self._stopped.add(task_id)
+            self.stop_task(task_id)
+
+    def _prepopulate_work_requirement(
+        self, task_id: TaskID, row: _Row, wr: WorkRequirement
+    ):
+        """
+        Populate the row from the current Work Requirement so it shows a
+        meaningful state and elapsed time even if no events arrive (e.g. the
+        Work Requirement is already in a terminal state).
+        """
+        wr_is_terminal = wr.status is not None and wr.status.finished
+        wr_age_seconds = 0.0
+        if (
+            wr_is_terminal
+            and wr.createdTime is not None
+            and wr.statusChangedTime is not None
+        ):
+            # Show how long the WR actually ran, not how long ago we fetched it
+            wr_age_seconds = max(
+                0.0, (wr.statusChangedTime - wr.createdTime).total_seconds()
+            )
+        elif wr.createdTime is not None:
+            wr_age_seconds = max(0.0, time() - wr.createdTime.timestamp())
+        if wr_age_seconds > 0:
+            # Rich can't start a task in the past, so backdate the start time
+            # of the (public) Task object; the new task is the last one
+            task = next(x for x in reversed(self.tasks) if x.id == task_id)
+            task.start_time = monotonic() - wr_age_seconds
+        if wr_is_terminal:
+            self._stop_timer(task_id)
+
+        try:
+            row.name = wr.name or ""
+            row.status = wr.status.value if wr.status else ""
+            for tg in wr.taskGroups or []:
+                summary = tg.taskSummary
+                if summary:
+                    row.total += summary.taskCount or 0
+                    counts = summary.statusCounts or {}
+                    row.completed += counts.get(TaskStatus.COMPLETED, 0)
+                    row.failed += counts.get(TaskStatus.FAILED, 0)
+                    row.aborted += counts.get(TaskStatus.ABORTED, 0)
+                    row.cancelled += counts.get(TaskStatus.CANCELLED, 0)
+        except Exception:
+            pass
+        self._update_task(task_id, row)
+
+
+def _update_row(row: _Row, snapshot: dict):
+    """
+    Update a row from a decoded event snapshot.
+    """
+    row.name = snapshot.get("name", row.name)
+    row.status = snapshot.get("status", "")
+
+    if row.ydid_type is YDIDType.WORK_REQUIREMENT:
+        row.total = row.completed = row.failed = row.aborted = row.cancelled = 0
+        for tg in snapshot.get("taskGroups", []):
+            summary = tg.get("taskSummary", {})
+            row.total += summary.get("taskCount", 0)
+            counts = summary.get("statusCounts", {})
+            row.completed += counts.get("COMPLETED", 0)
+            row.failed += counts.get("FAILED", 0)
+            row.aborted += counts.get("ABORTED", 0)
+            row.cancelled += counts.get("CANCELLED", 0)
+
+    elif row.ydid_type is YDIDType.WORKER_POOL:
+        counts = snapshot.get("nodeSummary", {}).get("statusCounts", {})
+        row.total = sum(counts.values())
+        row.completed = counts.get("RUNNING", 0)
+
+    elif row.ydid_type is YDIDType.COMPUTE_REQUIREMENT:
+        row.total = snapshot.get("targetInstanceCount", 0)
+        row.completed = sum(
+            int(source["instanceSummary"]["aliveCount"])
+            for source in snapshot.get("provisionStrategy", {}).get("sources", [])
+        )
+
+
+def _row_desc(row: _Row) -> str:
+    """
+    Build the progress-bar description string.
+
+    For Work Requirements, shows the status and done/total Task counts, then
+    a breakdown of each terminal state (omitting any that are zero).
+    """
+    if row.ydid_type is YDIDType.WORKER_POOL:
+        return f"{row.status}  {row.completed:,}/{row.total:,} nodes running"
+    if row.ydid_type is YDIDType.COMPUTE_REQUIREMENT:
+        return f"{row.status}  {row.completed:,}/{row.total:,} instances alive"
+
+    done = row.completed + row.failed + row.aborted + row.cancelled
+    desc = f"{row.status}  {done:,}/{row.total:,}"
+    parts = []
+    if row.completed:
+        parts.append(f"{row.completed:,} completed")
+    if row.failed:
+        parts.append(f"{row.failed:,} failed")
+    if row.aborted:
+        parts.append(f"{row.aborted:,} aborted")
+    if row.cancelled:
+        parts.append(f"{row.cancelled:,} cancelled")
+    if parts:
+        desc += "  " + " · ".join(parts)
+    return desc
+
+
+def _is_finished(status: str) -> bool:
+    """
+    Whether a Work Requirement status is terminal.
+    """
+    try:
+        return WorkRequirementStatus(status).finished
+    except ValueError:
+        return False
@@ -9,6 +9,7 @@ ACTION_GROUPS = "actionGroups"  # List - grouped node actions
 ACTION_PATH = "path"  # String - command/file path
 ACTION_TYPE = "type"  # String - "runCommand", "writeFile", "createWorkers"
 ACTIONS = "actions"  # List - flat node actions
+ADAPTIVE_BATCHING = "adaptiveBatching"  # Boolean
 ADD_ENVIRONMENT = "addEnvironment"  # Dict
 ADD_YD_ENV_VARS = "addYDEnvironment"
 ARGS = "arguments"  # List
@@ -17,6 +18,7 @@ ARGS_POSTFIX = "argumentsPostfix"  # List
 CERTIFICATES = "certificates"
 COMMON_SECTION = "common"  # No value
 COMPLETED_TASK_TTL = "completedTaskTtl"  # Float
+COMPRESS_TASK_BATCHES = "compressTaskBatches"  # Boolean
 COMPUTE_REQUIREMENT_BATCH_SIZE = "computeRequirementBatchSize"  # Integer
 COMPUTE_REQUIREMENT_DATA_FILE = "computeRequirementData"  # String
 COMPUTE_REQUIREMENT_SECTION = "computeRequirement"  # No value
@@ -37,6 +39,7 @@ ENV = "environment"  # Dictionary
 ERROR_TYPES = "errorTypes"  # List of Strings
 FINISH_IF_ALL_TASKS_FINISHED = "finishIfAllTasksFinished"  # Boolean
 FINISH_IF_ANY_TASK_FAILED = "finishIfAnyTaskFailed"  # Boolean
+GENERATION_PROCESSES = "generationProcesses"  # Integer
 IDLE_NODE_TIMEOUT = "idleNodeTimeout"  # Float
 IDLE_POOL_TIMEOUT = "idlePoolTimeout"  # Float
 IMAGES_ID = "imagesId"  # String
@@ -72,6 +75,7 @@ PROVIDERS = "providers"  # List of Strings
 RAM = "ram"  # List of two Floats
 REGIONS = "regions"  # List of Strings
 REQUIRED = "required"  # Boolean
+RESOLUTION_CACHE = "resolutionCache"  # Boolean
 RETRYABLE_ERRORS = "retryableErrors"  # List of Dicts
 SECRET = "secret"  # String
 SET_TASK_NAMES = "setTaskNames"  # Set to False to suppress task naming
@@ -79,6 +83,7 @@ STATUSES_AT_FAILURE = "statusesAtFailure"  # List of Strings
 TARGET_INSTANCE_COUNT = "targetInstanceCount"  # Integer
 TASKS = "tasks"  # List of Tasks
 TASKS_PER_WORKER = "tasksPerWorker"  # Integer
+TASK_BATCH_MAX_BYTES = "taskBatchMaxBytes"  # Integer
 TASK_BATCH_SIZE = "taskBatchSize"  # Integer
 TASK_COUNT = "taskCount"  # Integer
 TASK_DATA = "taskData"  # String
@@ -100,6 +105,8 @@ TASK_TIMEOUT = "taskTimeout"  # Float
 TASK_TYPE = "taskType"  # String
 TASK_TYPES = "taskTypes"  # List of Strings
 TEMPLATE_ID = "templateId"  # String
+UPLOAD_MANIFEST = "uploadManifest"  # Boolean
+UPLOAD_THREADS = "uploadThreads"  # Integer
 URL = "url"  # String
 USERDATA = "userData"  # String
 USERDATAFILE = "userDataFile"  # String
@@ -129,6 +136,7 @@ ALL_KEYS = [
     ACTION_PATH,
     ACTION_TYPE,
     ACTIONS,
+    ADAPTIVE_BATCHING,
     ADD_ENVIRONMENT,
     ADD_YD_ENV_VARS,
     ARGS,
@@ -137,6 +145,7 @@ ALL_KEYS = [
     CERTIFICATES,
     COMMON_SECTION,
     COMPLETED_TASK_TTL,
+    COMPRESS_TASK_BATCHES,
     COMPUTE_REQUIREMENT_BATCH_SIZE,
     COMPUTE_REQUIREMENT_DATA_FILE,
     COMPUTE_REQUIREMENT_SECTION,
@@ -157,6 +166,7 @@ ALL_KEYS = [
     ERROR_TYPES,
     FINISH_IF_ALL_TASKS_FINISHED,
     FINISH_IF_ANY_TASK_FAILED,
+    GENERATION_PROCESSES,
     IDLE_NODE_TIMEOUT,
     IDLE_POOL_TIMEOUT,
     IMAGES_ID,
@@ -189,6 +199,7 @@ ALL_KEYS = [
     RAM,
     REGIONS,
     REQUIRED,
+    RESOLUTION_CACHE,
     RETRYABLE_ERRORS,
     SECRET,
     SET_TASK_NAMES,
@@ -196,6 +207,7 @@ ALL_KEYS = [
     TARGET_INSTANCE_COUNT,
     TASKS,
     TASKS_PER_WORKER,
+    TASK_BATCH_MAX_BYTES,
     TASK_BATCH_SIZE,
     TASK_COUNT,
     TASK_DATA,
@@ -217,6 +229,8 @@ ALL_KEYS = [
     TASK_TYPE,
     TASK_TYPES,
     TEMPLATE_ID,
+    UPLOAD_MANIFEST,
+    UPLOAD_THREADS,
     URL,
     USERDATA,
     USERDATAFILE,
@@ -0,0 +1,461 @@
+"""
+Backends through which the data client commands and yd-submit perform rclone
+operations: either a new rclone subprocess per operation (via rclone_api),
+or calls to one long-lived rclone daemon shared by all operations.
+"""
+
+import configparser
+import json
+import os
+import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import cache, cached_property
+
+from rclone_api import Config
+from rclone_api.completed_process import CompletedProcess
+from rclone_api.dir_listing import DirListing
+from rclone_api.rclone_impl import RcloneImpl
+from rclone_api.remote import Remote
+from rclone_api.rpath import RPath
+
+from yellowdog_cli.utils.rclone_daemon import (
+    RcloneDaemon,
+    RcloneDaemonError,
+    get_rclone_daemon,
+    rclone_daemon_setting,
+)
+from yellowdog_cli.utils.rclone_utils import make_rclone
+
+# Performance settings matching those hardcoded in rclone_api's copy()
+_CHECKERS = 1000
+_TRANSFERS = 32
+_LOW_LEVEL_RETRIES = 10
+_TRANSFER_FLAGS = [
+    "--checkers",
+    str(_CHECKERS),
+    "--transfers",
+    str(_TRANSFERS),
+    "--low-level-retries",
+    str(_LOW_LEVEL_RETRIES),
+]
+
+
+class RcloneBackend(ABC):
+    """
+    The rclone operations used by the CLI. Paths are rclone paths, using
+    the remote name for remote paths (e.g., 'S3:bucket/file.txt'), or local
+    paths. Operations that can fail return a subprocess.CompletedProcess,
+    with the 'returncode' and 'stderr' of the operation.
+    """
+
+    def __init__(self, remote_name: str, config_section: str | None):
+        self.remote_name = remote_name
+        self.config_section = config_section
+
+    @abstractmethod
+    def copy_file(self, src: str, dst: str) -> subprocess.CompletedProcess[str]:
+        """
+        Copy a single file to the destination file path.
+        """
+
+    @abstractmethod
+    def copy(
+        self,
+        src: str,
+        dst: str,
+        sync: bool = False,
+        files_from: list[str] | None = None,
+        include: list[str] | None = None,
+        copy_links: bool = False,
+    ) -> subprocess.CompletedProcess[str]:
+        """
+        Copy (or, with sync=True, mirror) a directory, optionally restricted
+        to a list of paths relative to src or to files matching 'include'
+        rules. With copy_links=True, local symbolic links are followed.
+        """
+
+    @abstractmethod
+    def list_json(
+        self,
+        path: str,
+        recursive: bool = False,
+        files_only: bool = False,
+        hashes: bool = False,
+    ) -> list[dict] | None:
+        """
+        Return the 'rclone lsjson' entries for a path, or None if the path
+        can't be listed. With hashes=True, entries include the MD5 hashes of
+        files where the remote supports them, as 'Hashes': {'md5': ...}.
+        """
+
+    @abstractmethod
+    def stat(self, path: str) -> dict | None:
+        """
+        Return the 'rclone lsjson --stat' entry for a path, or None if the
+        path doesn't exist or can't be read.
+        """
+
+    @abstractmethod
+    def ls(self, path: str, max_depth: int) -> DirListing:
+        """
+        List the files and directories at a path, recursively if max_depth
+        is negative.
+        """
+
+    @abstractmethod
+    def delete_file(self, path: str) -> subprocess.CompletedProcess[str]:
+        """
+        Delete a single file.
+        """
+
+    @abstractmethod
+    def purge(self, path: str) -> subprocess.CompletedProcess[str]:
+        """
+        Delete a directory and all its contents.
+        """
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        """
+        Whether a file or directory exists.
+        """
+
+
+@contextmanager
+def _files_from(relative_paths: list[str]):
+    """
+    Write a list of relative paths to a temporary file for rclone's
+    '--files-from-raw' filter, yielding the file's name.
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", prefix="yd-files-from-", suffix=".txt", delete=False
+    ) as files_from:
+        files_from.write("".join(f"{path}\n" for path in relative_paths))
+    try:
+        yield files_from.name
+    finally:
+        os.unlink(files_from.name)
+
+
+def _completed_process(result: CompletedProcess) -> subprocess.CompletedProcess[str]:
+    """
+    Combine the results of the rclone invocations made by an rclone_api
+    operation.
+    """
+    return subprocess.CompletedProcess(
+        args=[subprocess.list2cmdline(process.args) for process in result.completed],
+        returncode=0 if result.ok else (result.returncode or 1),
+        stdout=result.stdout,
+        stderr=result.stderr,
+    )
+
+
+class SubprocessRcloneBackend(RcloneBackend):
+    """
+    Runs each operation as a separate rclone subprocess.
+    """
+
+    def __init__(self, remote_name: str, config_section: str | None):
+        super().__init__(remote_name, config_section)
+        # Auto-downloads rclone binary if missing (~20-40 MB, only once)
+        self.rclone = make_rclone(
+            Config(config_section) if config_section is not None else None
+        )
+
+    def copy_file(self, src: str, dst: str) -> subprocess.CompletedProcess[str]:
+        return _completed_process(self.rclone.copy_to(src=src, dst=dst))
+
+    def copy(
+        self,
+        src: str,
+        dst: str,
+        sync: bool = False,
+        files_from: list[str] | None = None,
+        include: list[str] | None = None,
+        copy_links: bool = False,
+    ) -> subprocess.CompletedProcess[str]:
+        if not sync and files_from is None and include is None and not copy_links:
+            return _completed_process(self.rclone.copy(src=src, dst=dst))
+
+        # rclone_api has no sync or filtered copy wrappers, so we call the
+        # underlying _run directly
+        args = ["sync" if sync else "copy", src, dst]
+        for rule in include or []:
+            args += ["--include", rule]
+        if copy_links:
+            args.append("--copy-links")
+        if files_from is None:
+            return self.rclone.impl._run([*args, *_TRANSFER_FLAGS], capture=False)
+        with _files_from(files_from) as files_from_file:
+            return self.rclone.impl._run(
+                [*args, "--files-from-raw", files_from_file, *_TRANSFER_FLAGS],
+                capture=False,
+            )
+
+    def list_json(
+        self,
+        path: str,
+        recursive: bool = False,
+        files_only: bool = False,
+        hashes: bool = False,
+    ) -> list[dict] | None:
+        args = ["lsjson", path]
+        if recursive:
+            args.append("--recursive")
+        if files_only:
+            args.append("--files-only")
+        if hashes:
+            args += ["--hash", "--hash-type", "MD5"]
+        result = self.rclone.impl._run(args, capture=True)
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout or "[]")
+
+    def stat(self, path: str) -> dict | None:
+        result = self.rclone.impl._run(["lsjson", "--stat", path], capture=True)
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout or "null")
+
+    def ls(self, path: str, max_depth: int) -> DirListing:
+        return self.rclone.ls(src=path, max_depth=max_depth)
+
+    def delete_file(self, path: str) -> subprocess.CompletedProcess[str]:
+        return _completed_process(self.rclone.delete_files(path))
+
+    def purge(self, path: str) -> subprocess.CompletedProcess[str]:
+        return _completed_process(self.rclone.purge(path))
+
+    def exists(self, path: str) -> bool:
+        return self.rclone.exists(path)
+
+
+def _quote_connection_value(value: str) -> str:
+    """
+    Quote a parameter value for an rclone connection string, if required.
+    """
+    if any(c in value for c in ",:'\""):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def connection_string_prefix(remote_name: str, config_section: str | None) -> str:
+    """
+    The prefix of the rclone paths for a remote that the daemon can use: the
+    remote name for a remote defined in rclone.conf, or an on-the-fly
+    connection string (':<type>,<key>=<value>,...:') for an inline remote
+    configuration, so that no configuration needs to be written to the
+    daemon.
+    """
+    if config_section is None:
+        return f"{remote_name}:"
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = str  # type: ignore[assignment,method-assign]
+    parser.read_string(config_section)
+    params = dict(parser[remote_name])
+    backend_type = params.pop("type", None)
+    if backend_type is None:
+        raise ValueError(f"No 'type' specified for rclone remote '{remote_name}'")
+    return (
+        ":"
+        + ",".join(
+            [backend_type]
+            + [
+                f"{key}={_quote_connection_value(value)}"
+                for key, value in params.items()
+            ]
+        )
+        + ":"
+    )
+
+
+class DaemonRcloneBackend(RcloneBackend):
+    """
+    Performs operations through the rclone daemon's remote control API, so
+    they share one process, its remote connections and its directory cache.
+    """
+
+    def __init__(self, remote_name: str, config_section: str | None):
+        super().__init__(remote_name, config_section)
+        self._prefix = connection_string_prefix(remote_name, config_section)
+
+    @property
+    def _daemon(self) -> RcloneDaemon:
+        """
+        The daemon for this invocation, started on first use.
+        """
+        return get_rclone_daemon()
+
+    def _remote_path(self, path: str) -> str | None:
+        """
+        The part of a remote path after 'remote_name:', or None for a local
+        path.
+        """
+        remote = f"{self.remote_name}:"
+        return path[len(remote) :] if path.startswith(remote) else None
+
+    def _fs(self, path: str, copy_links: bool = False) -> str:
+        """
+        The daemon's form of a path.
+        """
+        remote_path = self._remote_path(path)
+        if remote_path is not None:
+            return f"{self._prefix}{remote_path}"
+        return f":local,copy_links:{path}" if copy_links else path
+
+    def _fs_and_remote(self, path: str) -> tuple[str, str]:
+        """
+        Split a file path into the daemon's form of its directory, and its
+        name.
+        """
+        remote_path = self._remote_path(path)
+        if remote_path is not None:
+            directory, _, name = remote_path.rstrip("/").rpartition("/")
+            return f"{self._prefix}{directory}", name
+        directory, name = os.path.split(path.rstrip("/\\"))
+        return directory or ".", name
+
+    @staticmethod
+    def _result(
+        method: str, error: Exception | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(
+            args=[method],
+            returncode=0 if error is None else 1,
+            stdout="",
+            stderr="" if error is None else str(error),
+        )
+
+    def _call(self, method: str, **params) -> subprocess.CompletedProcess[str]:
+        try:
+            self._daemon.call(method, **params)
+        except RcloneDaemonError as e:
+            return self._result(method, e)
+        return self._result(method)
+
+    def copy_file(self, src: str, dst: str) -> subprocess.CompletedProcess[str]:
+        src_fs, src_remote = self._fs_and_remote(src)
+        dst_fs, dst_remote = self._fs_and_remote(dst)
+        return self._call(
+            "operations/copyfile",
+            srcFs=src_fs,
+            srcRemote=src_remote,
+            dstFs=dst_fs,
+            dstRemote=dst_remote,
+        )
+
+    def copy(
+        self,
+        src: str,
+        dst: str,
+        sync: bool = False,
+        files_from: list[str] | None = None,
+        include: list[str] | None = None,
+        copy_links: bool = False,
+    ) -> subprocess.CompletedProcess[str]:
+        method = "sync/sync" if sync else "sync/copy"
+        params = {
+            "srcFs": self._fs(src, copy_links),
+            "dstFs": self._fs(dst),
+            "_config": {
+                "Checkers": _CHECKERS,
+                "Transfers": _TRANSFERS,
+                "LowLevelRetries": _LOW_LEVEL_RETRIES,
+            },
+        }
+        if include is not None:
+            params["_filter"] = {"IncludeRule": include}
+        if files_from is None:
+            return self._call(method, **params)
+        with _files_from(files_from) as files_from_file:
+            params["_filter"] = {"FilesFromRaw": [files_from_file]}
+            return self._call(method, **params)
+
+    def _list(
+        self, path: str, recursive: bool, files_only: bool, hashes: bool = False
+    ) -> list[dict]:
+        """
+        List a path like 'rclone lsjson', which lists a file as itself.
+        """
+        hash_opt = {"showHash": True, "hashTypes": ["md5"]} if hashes else {}
+        remote_path = self._remote_path(path)
+        if remote_path is None or remote_path.strip("/"):
+            fs, remote = self._fs_and_remote(path)
+            item = self._daemon.call(
+                "operations/stat", fs=fs, remote=remote, opt=hash_opt
+            ).get("item")
+            if item is not None and not item["IsDir"]:
+                return [item]
+        return self._daemon.call(
+            "operations/list",
+            fs=self._fs(path),
+            remote="",
+            opt={"recurse": recursive, "filesOnly": files_only, **hash_opt},
+        )["list"]
+
+    def list_json(
+        self,
+        path: str,
+        recursive: bool = False,
+        files_only: bool = False,
+        hashes: bool = False,
+    ) -> list[dict] | None:
+        try:
+            return self._list(path, recursive, files_only, hashes)
+        except RcloneDaemonError:
+            return None
+
+    def stat(self, path: str) -> dict | None:
+        fs, remote = self._fs_and_remote(path)
+        try:
+            return self._daemon.call("operations/stat", fs=fs, remote=remote).get(
+                "item"
+            )
+        except RcloneDaemonError:
+            return None
+
+    def ls(self, path: str, max_depth: int) -> DirListing:
+        entries = self._list(path, recursive=max_depth < 0, files_only=False)
+        # Build the listing as rclone_api's ls() does; its objects require
+        # an rclone_api implementation, although it isn't used to list
+        rclone_impl = self._rclone_impl
+        paths = RPath.from_array(
+            entries,
+            Remote(self.remote_name, rclone_impl),
+            parent_path=(self._remote_path(path) or path).rstrip("/"),
+        )
+        for rpath in paths:
+            rpath.set_rclone(rclone_impl)
+        return DirListing(paths)
+
+    @cached_property
+    def _rclone_impl(self) -> RcloneImpl:
+        return make_rclone(
+            Config(self.config_section) if self.config_section is not None else None
+        ).impl
+
+    def delete_file(self, path: str) -> subprocess.CompletedProcess[str]:
+        fs, remote = self._fs_and_remote(path)
+        return self._call("operations/deletefile", fs=fs, remote=remote)
+
+    def purge(self, path: str) -> subprocess.CompletedProcess[str]:
+        return self._call("operations/purge", fs=self._fs(path), remote="")
+
+    def exists(self, path: str) -> bool:
+        try:
+            return len(self._list(path, recursive=False, files_only=False)) > 0
+        except RcloneDaemonError:
+            return False
+
+
+@cache
+def get_rclone_backend(remote_name: str, config_section: str | None) -> RcloneBackend:
+    """
+    Return the backend for a remote, using the rclone daemon if it's enabled
+    by '--rclone-daemon' or YD_RCLONE_DAEMON.
+    """
+    if rclone_daemon_setting() is not None:
+        return DaemonRcloneBackend(remote_name, config_section)
+    return SubprocessRcloneBackend(remote_name, config_section)
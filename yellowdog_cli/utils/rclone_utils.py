@@ -14,6 +14,7 @@ from functools import cache
 from pathlib import Path
 
 from rclone_api import Config, Rclone
+from rclone_api.util import get_rclone_exe
 
 from yellowdog_cli.utils.args import ARGS_PARSER
 from yellowdog_cli.utils.printing import print_info, print_simple
@@ -84,6 +85,20 @@ def make_rclone(config: Config | None) -> Rclone:
         return Rclone(rclone_conf)
 
 
+def locate_rclone() -> tuple[Path, Path | None]:
+    """
+    Return the rclone binary used by rclone_api (downloading it if it's
+    missing) and the system rclone.conf, if there is one.
+    """
+    ctx = _suppress_rclone_download_output() if ARGS_PARSER.quiet else nullcontext()
+    with ctx:
+        rclone_exe = get_rclone_exe(None)
+    try:
+        return rclone_exe, _find_rclone_conf()
+    except FileNotFoundError:
+        return rclone_exe, None
+
+
 @cache
 def parse_rclone_config(config_str: str) -> tuple[str, str | None]:
     """
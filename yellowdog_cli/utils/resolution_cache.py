@@ -0,0 +1,210 @@
+"""
+An optional on-disk cache of name -> ID resolutions, shared by successive
+command invocations.
+
+Entries are scoped by API URL, Application key ID and namespace, and expire
+after a per-entity-type TTL. The cache is a SQLite database, so it can be
+used by concurrent commands.
+"""
+
+import os
+import sqlite3
+from collections.abc import Callable
+from functools import wraps
+from json import dumps as json_dumps
+from json import loads as json_loads
+from pathlib import Path
+from threading import Lock
+from time import time
+
+from yellowdog_cli.utils.misc_utils import get_cache_dir
+from yellowdog_cli.utils.printing import print_info, print_warning
+from yellowdog_cli.utils.settings import (
+    RESOLUTION_CACHE_DB_TIMEOUT,
+    RESOLUTION_CACHE_TTLS,
+)
+
+
+class ResolutionCache:
+    """
+    A persistent cache of resolved values, keyed by entity type and lookup.
+    """
+
+    def __init__(self, filename: str, scope: str):
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        self._scope = scope
+        self._lock = Lock()
+        self._connection = sqlite3.connect(
+            filename, timeout=RESOLUTION_CACHE_DB_TIMEOUT, check_same_thread=False
+        )
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS resolutions (scope TEXT, entity TEXT, "
+                "key TEXT, value TEXT, expires REAL, PRIMARY KEY (scope, entity, key))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS statistics "
+                "(entity TEXT PRIMARY KEY, hits INTEGER, misses INTEGER)"
+            )
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    def get(self, entity: str, key: str) -> tuple[bool, object]:
+        """
+        Return (True, value) for an unexpired entry, or (False, None).
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM resolutions WHERE scope = ? AND entity = ? "
+                "AND key = ? AND expires > ?",
+                (self._scope, entity, key, time()),
+            ).fetchone()
+            counts = self.misses if row is None else self.hits
+            counts[entity] = counts.get(entity, 0) + 1
+        return (False, None) if row is None else (True, json_loads(row[0]))
+
+    def put(self, entity: str, key: str, value: object):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?, ?)",
+                (
+                    self._scope,
+                    entity,
+                    key,
+                    json_dumps(value),
+                    time() + RESOLUTION_CACHE_TTLS[entity],
+                ),
+            )
+
+    def invalidate(self, entity: str):
+        """
+        Remove all entries for an entity type, in all scopes.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM resolutions WHERE entity = ?", (entity,)
+            )
+
+    def close(self) -> tuple[int, int]:
+        """
+        Add this invocation's statistics to the running totals, remove
+        expired entries, and close the cache. Return the total hits and
+        misses for all invocations.
+        """
+        with self._lock, self._connection:
+            for entity in set(self.hits) | set(self.misses):
+                self._connection.execute(
+                    "INSERT INTO statistics VALUES (?, ?, ?) ON CONFLICT (entity) "
+                    "DO UPDATE SET hits = hits + excluded.hits, "
+                    "misses = misses + excluded.misses",
+                    (entity, self.hits.get(entity, 0), self.misses.get(entity, 0)),
+                )
+            self._connection.execute(
+                "DELETE FROM resolutions WHERE expires <= ?", (time(),)
+            )
+            total_hits, total_misses = self._connection.execute(
+                "SELECT COALESCE(SUM(hits), 0), COALESCE(SUM(misses), 0) "
+                "FROM statistics"
+            ).fetchone()
+        self._connection.close()
+        return total_hits, total_misses
+
+
+_RESOLUTION_CACHE: ResolutionCache | None = None
+
+
+def get_resolution_cache_filename() -> str:
+    """
+    The location of the cache, in the user's cache directory.
+    """
+    return os.path.join(get_cache_dir(), "resolution-cache.sqlite3")
+
+
+def open_resolution_cache(url: str, key: str, namespace: str):
+    """
+    Start using the resolution cache for this invocation.
+    """
+    global _RESOLUTION_CACHE
+    filename = get_resolution_cache_filename()
+    try:
+        _RESOLUTION_CACHE = ResolutionCache(filename, f"{url}|{key}|{namespace}")
+    except sqlite3.Error as e:
+        print_warning(f"Unable to use resolution cache '{filename}': {e}")
+
+
+def close_resolution_cache():
+    """
+    Stop using the resolution cache, and report its statistics.
+    """
+    global _RESOLUTION_CACHE
+    if _RESOLUTION_CACHE is None:
+        return
+    cache, _RESOLUTION_CACHE = _RESOLUTION_CACHE, None
+    hits, misses = sum(cache.hits.values()), sum(cache.misses.values())
+    try:
+        total_hits, total_misses = cache.close()
+    except sqlite3.Error as e:
+        print_warning(f"Unable to update resolution cache: {e}")
+        return
+    if hits + misses > 0:
+        print_info(
+            f"Resolution cache: {hits:,d} hit(s), {misses:,d} miss(es) "
+            f"(all invocations: {total_hits:,d} hit(s), {total_misses:,d} miss(es))"
+        )
+
+
+def invalidate_resolutions(entity: str):
+    """
+    Remove the cached resolutions for an entity type.
+    """
+    if _RESOLUTION_CACHE is None:
+        return
+    try:
+        _RESOLUTION_CACHE.invalidate(entity)
+    except sqlite3.Error as e:
+        _disable_resolution_cache(e)
+
+
+def _disable_resolution_cache(error: sqlite3.Error):
+    """
+    Stop using the resolution cache for the rest of this invocation.
+    """
+    global _RESOLUTION_CACHE
+    print_warning(f"Unable to use resolution cache (disabling): {error}")
+    _RESOLUTION_CACHE = None
+
+
+def cached_resolution(entity: str) -> Callable:
+    """
+    Decorator to cache the results of a resolution function, whose first
+    argument is the PlatformClient, in the resolution cache (when it's in
+    use). Results of None are not cached.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(client, *args, **kwargs):
+            cache = _RESOLUTION_CACHE
+            if cache is None:
+                return func(client, *args, **kwargs)
+
+            key = f"{func.__name__}:{json_dumps([args, kwargs], sort_keys=True)}"
+            try:
+                found, value = cache.get(entity, key)
+                if found:
+                    return value
+            except sqlite3.Error as e:
+                _disable_resolution_cache(e)
+
+            value = func(client, *args, **kwargs)
+            if value is not None and _RESOLUTION_CACHE is not None:
+                try:
+                    cache.put(entity, key, value)
+                except sqlite3.Error as e:
+                    _disable_resolution_cache(e)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,109 @@
+"""
+Rate limiting and backoff shared by the commands that retry API calls.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+
+from requests import Response
+
+
+class TokenBucket:
+    """
+    A token bucket limiting the overall rate of an action across threads or
+    asyncio tasks. The bucket can also be paused, e.g., for a 'Retry-After'
+    interval requested by a server.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._paused_until = self._updated
+        self._lock = Lock()
+
+    def pause(self, seconds: float):
+        """
+        Allow no actions for the given interval.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    def _take(self) -> float:
+        """
+        Take a token if one is available and return zero, or return the
+        time to wait before trying again.
+        """
+        with self._lock:
+            now = monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    def acquire(self):
+        """
+        Wait until an action is allowed.
+        """
+        while (wait := self._take()) > 0:
+            sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Wait until an action is allowed, without blocking the event loop.
+        """
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
+
+
+def get_retry_delay(
+    attempt: int, base: float, maximum: float, retry_after: float | None = None
+) -> float:
+    """
+    Return the delay in seconds before retry 'attempt' (starting at 1):
+    exponential backoff from 'base' with full jitter, capped at 'maximum',
+    but no less than any 'Retry-After' interval requested by the server.
+    """
+    delay = uniform(0, min(maximum, base * 2 ** (attempt - 1)))
+    return delay if retry_after is None else max(delay, retry_after)
+
+
+def get_retry_after(response: Response) -> float | None:
+    """
+    Return the 'Retry-After' interval of an HTTP response in seconds, if
+    present.
+    """
+    return parse_retry_after(response.headers.get("Retry-After"))
+
+
+def parse_retry_after(retry_after: str | None) -> float | None:
+    """
+    Parse the value of a 'Retry-After' header as an interval in seconds. The
+    header may contain seconds or an HTTP date.
+    """
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(
+            0.0,
+            (
+                parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)
+            ).total_seconds(),
+        )
+    except (TypeError, ValueError):
+        return None
@@ -15,6 +15,7 @@ YD_DATA_CLIENT = "YD_DATA_CLIENT"
 YD_DATA_CLIENT_BUCKET = "YD_DATA_CLIENT_BUCKET"
 YD_DATA_CLIENT_PREFIX = "YD_DATA_CLIENT_PREFIX"
 YD_DATA_CLIENT_REMOTE = "YD_DATA_CLIENT_REMOTE"
+YD_RCLONE_DAEMON = "YD_RCLONE_DAEMON"
 YD_ENV_VAR_PREFIX = "YD_VAR_"
 ENV_VAR_SUB_PREFIX = "env:"
 RAND_VAR_SIZE = 0xFFF
@@ -25,14 +26,79 @@ YD_SECRET_ALT = "YD_API_KEY_SECRET"
 YD_URL_ALT = "YD_API_URL"
 
 TASK_BATCH_SIZE_DEFAULT = 1_000
+# Maximum serialized (uncompressed) JSON size of a Task batch submission;
+# larger batches are split
+TASK_BATCH_MAX_BYTES_DEFAULT = 5_000_000
 DEFAULT_PARALLEL_TASK_BATCH_UPLOAD_THREADS = 1
+DEFAULT_TASK_GENERATION_PROCESSES = 1
+# Threads uploading Data Client input files ('localFile') for yd-submit
+DEFAULT_DATA_CLIENT_UPLOAD_THREADS = 8
+# HTTP status codes of transient errors, for which Task batch submissions and
+# bulk operations are retried
+TRANSIENT_ERROR_STATUS_CODES = [408, 429, 500, 502, 503, 504]
 MAX_BATCH_SUBMIT_ATTEMPTS = 4  # Initial attempt plus retries
+# Jittered exponential backoff between Task batch submission attempts
+BATCH_SUBMIT_BACKOFF_BASE = 1.0  # Seconds
+BATCH_SUBMIT_BACKOFF_MAX = 30.0  # Seconds
+# Generated Task batches allowed to wait for upload, per submission thread;
+# bounds memory use when generation outpaces parallel batch submission
+TASK_BATCHES_IN_FLIGHT_PER_THREAD = 2
+# Adaptive Task batch submission: the batch size grows additively from the
+# initial size (up to the configured Task batch size) and the number of
+# submissions in flight grows by one per round (up to the parallel batch
+# limit), while submissions succeed within the target latency; both are
+# halved on failures or throttling, and the batch size on slow submissions
+ADAPTIVE_TASK_BATCH_SIZE_INITIAL = 100
+ADAPTIVE_TASK_BATCH_SIZE_MIN = 10
+ADAPTIVE_TASK_BATCH_SIZE_INCREMENT = 100
+ADAPTIVE_DEFAULT_PARALLEL_BATCHES = 8
+ADAPTIVE_TARGET_BATCH_LATENCY = 10.0  # Seconds
+ADAPTIVE_DECREASE_FACTOR = 0.5
 
 CR_MAX_INSTANCES = (
     10_000  # This is enforced by the platform (MAX_WORKER_POOL_NODE_COUNT)
 )
 
+# Event stream reconnection: backoff starts at the interval requested by the
+# server (if any) or EVENT_STREAM_RETRY_INTERVAL; responses with
+# HTTP_RETRY_STATUS_CODES are also retried. The overall reconnection rate
+# across all followed streams is limited by a token bucket, which is paused
+# for any 'Retry-After' interval sent by the server
 EVENT_STREAM_RETRY_INTERVAL = 5.0  # Seconds
+EVENT_STREAM_MAX_RETRY_INTERVAL = 60.0  # Seconds
+EVENT_STREAM_RECONNECTS_PER_SECOND = 10.0
+EVENT_STREAM_RECONNECT_BURST = 20
+EVENT_STREAM_CONNECT_TIMEOUT = 30.0  # Seconds
+# Bounds the memory used to buffer an incomplete event stream line
+EVENT_STREAM_MAX_LINE_BYTES = 64 * 1024 * 1024
+PROGRESS_REFRESH_PER_SECOND = 4.0  # Progress display frame rate
+EVENT_REPLAY_SPEED_DEFAULT = 1.0  # Relative to the recorded speed
+EVENT_LOG_FLUSH_INTERVAL = 1.0  # Seconds; bounds the events lost if killed
+
+# Concurrent API calls when fetching details for listings; matches the size
+# of the SDK client's connection pool
+FETCH_THREADS = 10
+
+# Page size used when iterating over search results (the platform maximum)
+SEARCH_PAGE_SIZE = 1000
+
+# Bulk lifecycle operations (cancel, abort, finish, start, hold, shutdown,
+# terminate): concurrent API calls, an overall rate limit enforced by a token
+# bucket, and jittered exponential backoff between attempts for transient
+# failures
+BULK_OPERATION_THREADS = 10
+BULK_OPERATIONS_PER_SECOND = 100.0
+BULK_OPERATION_BURST = 20
+BULK_OPERATION_MAX_ATTEMPTS = 4  # Initial attempt plus retries
+BULK_OPERATION_BACKOFF_BASE = 0.5  # Seconds
+BULK_OPERATION_BACKOFF_MAX = 10.0  # Seconds
+
+# Direct REST API calls: minimum connection pool size, and retries of
+# failed connections and transient HTTP errors
+HTTP_MIN_POOL_SIZE = 4
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF_FACTOR = 0.5  # Seconds; doubles on each retry
+HTTP_RETRY_STATUS_CODES = [429, 502, 503, 504]
 NODE_ACTION_QUEUE_POLL_INTERVAL = 5.0  # Seconds
 
 NAMESPACE_PREFIX_SEPARATOR = "/"
@@ -40,10 +106,14 @@ WP_VARIABLES_PREFIX = "__"
 WP_VARIABLES_POSTFIX = "__"
 CSV_VAR_OPENING_DELIMITER = "<<"
 CSV_VAR_CLOSING_DELIMITER = ">>"
+# CSV data rows between recorded file positions, for seeking to a row
+CSV_ROW_INDEX_INTERVAL = 1000
 VAR_OPENING_DELIMITER = "{{"
 VAR_CLOSING_DELIMITER = "}}"
 VAR_DEFAULT_SEPARATOR = ":="
 VAR_UNSET_SUFFIX = "::"
+# Number of parsed variable substitution templates to cache
+VAR_TEMPLATE_CACHE_SIZE = 8192
 
 # Lazy variable substitution names (used in submit/task naming)
 L_WR_NAME = "wr_name"
@@ -66,6 +136,11 @@ TABLE_TYPE_TAG = "table" + TYPE_TAG_TERMINATOR
 FORMAT_NAME_TYPE_TAG = "format_name" + TYPE_TAG_TERMINATOR
 TOML_VAR_NESTED_DEPTH = 3
 RCLONE_PREFIX = "rclone:"
+# How a flattened upload or download handles files with the same name
+FLATTEN_COLLISION_POLICIES = ["error", "rename", "overwrite"]
+FLATTEN_COLLISION_POLICY_DEFAULT = "overwrite"
+# Seconds to wait for an rclone daemon (rclone rcd) to start responding
+RCLONE_DAEMON_START_TIMEOUT = 10.0
 
 VAR_NAME_OF_UNNAMED_TASK = "none"
 
@@ -76,6 +151,7 @@ ERROR_STYLE = "bold red3"
 WARNING_STYLE = "red3"
 DEBUG_STYLE = "dark_orange"
 JSON_INDENT = 2
+OUTPUT_FILE_BUFFER_SIZE = 1024 * 1024
 HIGHLIGHTED_STATES = [
     re.compile(r"(?P<active>ALLOCATED)"),
     re.compile(r"(?P<active>DOING_TASK)"),
@@ -187,6 +263,23 @@ ET_WORK_REQUIREMENTS = "work-requirements"
 ET_WORKER_POOLS = "worker-pools"
 ET_WORKERS = "workers"
 
+# Persistent name -> ID resolution cache: entry lifetimes by entity type
+RESOLUTION_CACHE_TTLS = {  # Seconds
+    ET_APPLICATIONS: 3600,
+    ET_COMPUTE_REQUIREMENT_TEMPLATES: 3600,
+    ET_COMPUTE_SOURCE_TEMPLATES: 3600,
+    ET_GROUPS: 3600,
+    ET_IMAGE_FAMILIES: 3600,
+    ET_ROLES: 86400,
+}
+RESOLUTION_CACHE_DB_TIMEOUT = 10.0  # Seconds to wait for a locked database
+
+# Manifest of Data Client input files uploaded by yd-submit
+UPLOAD_MANIFEST_DB_TIMEOUT = 10.0  # Seconds to wait for a locked database
+UPLOAD_MANIFEST_HASH_CHUNK_SIZE = 1_048_576  # Bytes read at a time when hashing
+# Modification times within this interval are equal, as for 'rclone --modify-window'
+UPLOAD_MANIFEST_MOD_TIME_TOLERANCE = 1.0  # Seconds
+
 # Property Names
 PROP_ACCESS_DELEGATES = "accessDelegates"
 PROP_ADMIN_GROUP = "adminGroup"
@@ -8,18 +8,18 @@ from collections.abc import Callable
 from typing import cast
 
 from yellowdog_client.model import (
-    WorkRequirement,
     WorkRequirementStatus,
     WorkRequirementSummary,
 )
 
+from yellowdog_cli.utils.bulk_operations import run_bulk_operation
 from yellowdog_cli.utils.entity_utils import (
     get_filtered_work_requirement_summaries,
     get_work_requirement_summary_by_name_or_id,
 )
 from yellowdog_cli.utils.follow_utils import follow_ids
 from yellowdog_cli.utils.interactive import confirmed, select
-from yellowdog_cli.utils.misc_utils import link_entity
+from yellowdog_cli.utils.misc_utils import fq_name, link_entity_id
 from yellowdog_cli.utils.printing import print_error, print_info, print_warning
 from yellowdog_cli.utils.wrapper import ARGS_PARSER, CLIENT, CONFIG_COMMON
 
@@ -67,7 +67,6 @@ def _start_or_hold_work_requirements(
         )
     )
 
-    count = 0
     work_requirement_ids: list[str] = []
 
     if selected_work_requirement_summaries:
@@ -78,28 +77,33 @@ def _start_or_hold_work_requirements(
     if selected_work_requirement_summaries and confirmed(
         f"{action} {len(selected_work_requirement_summaries)} Work Requirement(s)?"
     ):
-        for work_summary in selected_work_requirement_summaries:
-            if work_summary.status == required_state:
-                try:
-                    action_function(work_summary.id)  # type: ignore[arg-type]
-                    work_requirement: WorkRequirement = (
-                        CLIENT.work_client.get_work_requirement_by_id(work_summary.id)  # type: ignore[arg-type]
-                    )
-                    count += 1
-                    print_info(
-                        f"Applied {action} to "
-                        f"{link_entity(CONFIG_COMMON.url, work_requirement)} "
-                        f"('{work_summary.name}')"
-                    )
-                except Exception as e:
-                    print_error(
-                        f"Failed to {action} Work Requirement '{work_summary.name}': {e}"
-                    )
-            work_requirement_ids.append(cast(str, work_summary.id))
-
-        if count > 0:
-            print_info(f"{action} applied to {count} Work Requirement(s)")
-        else:
+        to_action = [
+            work_summary
+            for work_summary in selected_work_requirement_summaries
+            if work_summary.status == required_state and work_summary.id is not None
+        ]
+        result = run_bulk_operation(
+            to_action,
+            lambda work_summary: action_function(work_summary.id),
+            on_success=lambda work_summary, _: print_info(
+                f"Applied {action} to "
+                + link_entity_id(
+                    CONFIG_COMMON.url, "WorkRequirement", cast(str, work_summary.id)
+                )
+                + f" ('{work_summary.name}')"
+            ),
+            on_failure=lambda work_summary, e: print_error(
+                f"Failed to {action} Work Requirement '{work_summary.name}': {e}"
+            ),
+        )
+        work_requirement_ids = [
+            cast(str, work_summary.id)
+            for work_summary in selected_work_requirement_summaries
+        ]
+
+        if len(to_action) > 1:
+            result.report(f"{action} applied to Work Requirements")
+        elif not result.succeeded:
             print_info(f"No Work Requirements to {action}")
 
     else:
@@ -129,10 +133,7 @@ def _start_or_hold_work_requirements_by_name_or_id(
             print_error(f"Work Requirement '{name_or_id}' not found")
             continue
 
-        fq_name_and_id = (
-            f"'{work_requirement_summary.namespace}/{work_requirement_summary.name}' "
-            f"({work_requirement_summary.id})"
-        )
+        fq_name_and_id = _fq_name_and_id(work_requirement_summary)
 
         if work_requirement_summary.status != required_state:
             print_warning(
@@ -141,18 +142,34 @@ def _start_or_hold_work_requirements_by_name_or_id(
             )
             continue
 
-        if not confirmed(f"{action} Work Requirement {fq_name_and_id}?"):
-            continue
-
-        try:
-            action_function(work_requirement_summary.id)
-            print_info(
-                f"Applied action '{action}' to Work Requirement {fq_name_and_id}"
-            )
+        if confirmed(f"{action} Work Requirement {fq_name_and_id}?"):
             work_requirement_summaries.append(work_requirement_summary)
-        except Exception as e:
-            print_error(
-                f"Failed to apply action '{action}' to Work Requirement {fq_name_and_id}: {e}"
-            )
 
-    return [cast(str, wr.id) for wr in work_requirement_summaries]
+    result = run_bulk_operation(
+        work_requirement_summaries,
+        lambda wr_summary: action_function(wr_summary.id),
+        on_success=lambda wr_summary, _: print_info(
+            f"Applied action '{action}' to Work Requirement {_fq_name_and_id(wr_summary)}"
+        ),
+        on_failure=lambda wr_summary, e: print_error(
+            f"Failed to apply action '{action}' to Work Requirement "
+            f"{_fq_name_and_id(wr_summary)}: {e}"
+        ),
+    )
+    if len(work_requirement_summaries) > 1:
+        result.report(f"{action} applied to Work Requirements")
+
+    # Return the IDs in the order supplied, not the order of completion
+    succeeded = {wr_summary.id for wr_summary, _ in result.succeeded}
+    return [
+        cast(str, wr_summary.id)
+        for wr_summary in work_requirement_summaries
+        if wr_summary.id in succeeded
+    ]
+
+
+def _fq_name_and_id(work_requirement_summary: WorkRequirementSummary) -> str:
+    """
+    The namespace-qualified name and ID of a Work Requirement.
+    """
+    return f"'{fq_name(work_requirement_summary)}' ({work_requirement_summary.id})"
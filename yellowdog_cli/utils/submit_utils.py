@@ -2,16 +2,27 @@
 Utility functions for use with the submit command.
 """
 
+import sqlite3
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import timedelta
-from os import chdir, getcwd
+from gzip import compress
+from itertools import islice
+from json import JSONDecodeError
+from json import dumps as json_dumps
+from json import loads as json_loads
+from math import ceil
+from os import getpid
 from os.path import abspath, exists
 from pathlib import Path
-from time import sleep
-from typing import cast
+from threading import Condition, Lock
+from time import monotonic, sleep
+from typing import TypeVar, cast
 
-from rclone_api import Config
 from yellowdog_client.model import (
     Task,
     TaskData,
@@ -40,8 +51,15 @@ from yellowdog_cli.utils.property_names import (
     TASK_TAG,
     TASKS,
 )
-from yellowdog_cli.utils.rclone_utils import make_rclone, parse_rclone_config
+from yellowdog_cli.utils.rclone_backend import RcloneBackend, get_rclone_backend
+from yellowdog_cli.utils.rclone_utils import parse_rclone_config
 from yellowdog_cli.utils.settings import (
+    ADAPTIVE_DECREASE_FACTOR,
+    ADAPTIVE_TARGET_BATCH_LATENCY,
+    ADAPTIVE_TASK_BATCH_SIZE_INCREMENT,
+    ADAPTIVE_TASK_BATCH_SIZE_INITIAL,
+    ADAPTIVE_TASK_BATCH_SIZE_MIN,
+    DEFAULT_DATA_CLIENT_UPLOAD_THREADS,
     L_TASK_COUNT,
     L_TASK_GROUP_COUNT,
     L_TASK_GROUP_NAME,
@@ -52,6 +70,13 @@ from yellowdog_cli.utils.settings import (
     VAR_OPENING_DELIMITER,
 )
 from yellowdog_cli.utils.type_check import check_list, check_str
+from yellowdog_cli.utils.upload_manifest import (
+    UploadManifest,
+    UploadManifestEntry,
+    local_file_entry,
+    manifest_destination,
+    remote_copy_is_unchanged,
+)
 from yellowdog_cli.utils.variables import (
     process_variable_substitutions_in_file_contents,
     process_variable_substitutions_insitu,
@@ -70,6 +95,8 @@ YD_TASK_NAME = "YD_TASK_NAME"
 YD_TASK_NUMBER = "YD_TASK_NUMBER"
 YD_WORK_REQUIREMENT_NAME = "YD_WORK_REQUIREMENT_NAME"
 
+_T = TypeVar("_T")
+
 
 def assemble_arguments(
     prefix: list | None,
@@ -156,6 +183,355 @@ def pause_between_batches(task_batch_size: int, batch_number: int, num_tasks: in
             sleep(ARGS_PARSER.pause_between_batches)
 
 
+def interleave_task_batches(
+    task_batches: list[Iterable[_T]], window_size: int
+) -> Iterator[_T]:
+    """
+    Yield the items from each of the Task batch iterables in turn, so that
+    batches for different Task Groups are submitted fairly. At most
+    'window_size' iterables are in the rotation at any time; each iterable's
+    items are yielded in order.
+    """
+    waiting = deque(iter(x) for x in task_batches)
+    active: deque[Iterator[_T]] = deque()
+    while waiting or active:
+        while waiting and len(active) < window_size:
+            active.append(waiting.popleft())
+        batches = active.popleft()
+        for item in islice(batches, 1):
+            yield item
+            active.append(batches)
+
+
+def split_by_payload_size(
+    payload_sizes: list[int], max_bytes: int
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield the (start, end) ranges into a list of serialized Tasks of sizes
+    'payload_sizes', such that the JSON array of each range of Tasks is no
+    larger than 'max_bytes'. A Task that's larger than 'max_bytes' is
+    yielded on its own.
+    """
+    start = 0
+    array_bytes = 2  # The enclosing brackets
+    for index, payload_size in enumerate(payload_sizes):
+        if index > start and array_bytes + payload_size + 1 > max_bytes:
+            yield start, index
+            start = index
+            array_bytes = 2
+        array_bytes += payload_size + (1 if index > start else 0)  # Plus comma
+    if start < len(payload_sizes):
+        yield start, len(payload_sizes)
+
+
+def compress_json_array(serialized_items: list[bytes]) -> bytes:
+    """
+    Gzip the JSON array of a list of serialized JSON items.
+    """
+    return compress(b"[" + b",".join(serialized_items) + b"]")
+
+
+class TaskBatchCheckpoint:
+    """
+    A file recording the progress of a 'raw' JSON Work Requirement
+    submission, so an interrupted submission can be resumed without
+    resubmitting Task batches. Records are appended as lines of JSON: the
+    Work Requirement, with a hash of the input file and the number of Tasks
+    in each Task Group, then each Task batch once it and all the earlier
+    batches in its Task Group have been submitted.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Load any existing records from the file
+        """
+        self._filename = filename
+        self._lock = Lock()
+        self.work_requirement_id: str | None = None
+        self.work_requirement_name: str | None = None
+        self.task_batch_size: int | None = None
+        self.input_hash: str | None = None
+        self.task_counts: dict[str, int] | None = None
+        self._submitted_batches: dict[str, set[int]] = {}
+        # Batches submitted out of order, awaiting the earlier batches
+        self._pending_batches: dict[str, set[int]] = {}
+        self._next_batches: dict[str, int] = {}
+
+        if not exists(filename):
+            return
+        with open(filename) as f:
+            for line in f:
+                try:
+                    record = json_loads(line)
+                except JSONDecodeError:
+                    continue  # A record interrupted while being written
+                if "workRequirementId" in record:
+                    self.work_requirement_id = record["workRequirementId"]
+                    self.work_requirement_name = record["workRequirementName"]
+                    self.task_batch_size = record["taskBatchSize"]
+                    self.input_hash = record.get("inputHash")
+                    self.task_counts = record.get("taskCounts")
+                else:
+                    self._submitted_batches.setdefault(record["taskGroup"], set()).add(
+                        record["batch"]
+                    )
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    def set_work_requirement(
+        self,
+        wr_id: str,
+        wr_name: str,
+        task_batch_size: int,
+        input_hash: str,
+        task_counts: dict[str, int],
+    ):
+        """
+        Record the submitted Work Requirement, the Task batch size, and the
+        input file hash and Task counts used to check a resumed submission.
+        """
+        self.work_requirement_id = wr_id
+        self.work_requirement_name = wr_name
+        self.task_batch_size = task_batch_size
+        self.input_hash = input_hash
+        self.task_counts = task_counts
+        with self._lock:
+            self._append(
+                {
+                    "workRequirementId": wr_id,
+                    "workRequirementName": wr_name,
+                    "taskBatchSize": task_batch_size,
+                    "inputHash": input_hash,
+                    "taskCounts": task_counts,
+                }
+            )
+
+    def check_resume(
+        self, task_batch_size: int, input_hash: str, task_counts: dict[str, int]
+    ):
+        """
+        Raise an exception if a resumed submission doesn't match the one
+        recorded, because its Task batches would be different.
+        """
+        if self.task_batch_size != task_batch_size:
+            raise ValueError(
+                f"Task batch size ({task_batch_size}) must match the batch size "
+                f"recorded in checkpoint file '{self._filename}' "
+                f"({self.task_batch_size})"
+            )
+        if self.input_hash is not None and self.input_hash != input_hash:
+            raise ValueError(
+                "The Work Requirement file has changed since checkpoint file "
+                f"'{self._filename}' was recorded"
+            )
+        if self.task_counts is not None and self.task_counts != task_counts:
+            raise ValueError(
+                f"The Task Groups or their numbers of Tasks ({task_counts}) must "
+                f"match those recorded in checkpoint file '{self._filename}' "
+                f"({self.task_counts})"
+            )
+
+    def is_submitted(self, task_group_name: str, batch_number: int) -> bool:
+        """
+        Has the Task batch already been submitted?
+        """
+        return batch_number in self._submitted_batches.get(task_group_name, set())
+
+    def record_batch(self, task_group_name: str, batch_number: int):
+        """
+        Record a submitted Task batch. A batch is only written to the file
+        once all the earlier batches in its Task Group have been submitted,
+        so the file never records batches beyond a batch that failed.
+        """
+        with self._lock:
+            submitted = self._submitted_batches.setdefault(task_group_name, set())
+            pending = self._pending_batches.setdefault(task_group_name, set())
+            next_batch = self._next_batches.get(task_group_name, 0)
+            while next_batch in submitted:
+                next_batch += 1
+            pending.add(batch_number)
+            while next_batch in pending:
+                pending.remove(next_batch)
+                submitted.add(next_batch)
+                self._append({"taskGroup": task_group_name, "batch": next_batch})
+                next_batch += 1
+            self._next_batches[task_group_name] = next_batch
+
+    def _append(self, record: dict):
+        """
+        Append a record to the file; the lock must be held.
+        """
+        with open(self._filename, "a") as f:
+            f.write(json_dumps(record) + "\n")
+            f.flush()
+
+
+@dataclass
+class TaskBatchSubmission:
+    """
+    A single Task batch submission API call, for adaptive batching. The
+    caller sets 'failed' or 'throttled' for an unsuccessful response; an
+    exception also marks the submission as failed.
+    """
+
+    num_tasks: int
+    payload_bytes: int | None = None
+    failed: bool = False
+    throttled: bool = False
+
+
+class AdaptiveTaskBatching:
+    """
+    Adapt the size of Task batch submissions and the number of submissions
+    in flight, AIMD-style, from the observed submission latency, failures
+    and throttling. Also accumulates the statistics for a throughput report.
+    """
+
+    def __init__(self, max_batch_size: int, max_concurrency: int):
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_batch_size = min(ADAPTIVE_TASK_BATCH_SIZE_MIN, max_batch_size)
+        self.batch_size = min(ADAPTIVE_TASK_BATCH_SIZE_INITIAL, max_batch_size)
+        self.concurrency = 1.0
+        self._condition = Condition()
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._start_time: float | None = None
+        self._end_time: float | None = None
+        self.num_submissions = 0
+        self.num_failed = 0
+        self.num_throttled = 0
+        self.num_tasks = 0
+        self.payload_bytes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return int(self.concurrency)
+
+    def split(self, task_batch: list) -> Iterator[list]:
+        """
+        Yield a generated Task batch as sub-batches, each sized using the
+        batch size at the time it's taken.
+        """
+        position = 0
+        while position < len(task_batch):
+            batch_size = self.batch_size
+            yield task_batch[position : position + batch_size]
+            position += batch_size
+
+    @contextmanager
+    def submission(
+        self, num_tasks: int, payload_bytes: int | None = None
+    ) -> Iterator[TaskBatchSubmission]:
+        """
+        Wait until the number of submissions in flight is below the current
+        limit, then time the submission made in the 'with' block.
+        """
+        with self._condition:
+            while self._in_flight >= self.concurrency_limit:
+                self._condition.wait()
+            self._in_flight += 1
+            if self._start_time is None:
+                self._start_time = monotonic()
+
+        submission = TaskBatchSubmission(num_tasks, payload_bytes)
+        started = monotonic()
+        try:
+            yield submission
+        except BaseException:
+            submission.failed = True
+            raise
+        finally:
+            self._record(submission, started, monotonic())
+
+    def _record(self, submission: TaskBatchSubmission, started: float, ended: float):
+        """
+        Record a submission, and adjust the batch size and concurrency.
+        Decreases are applied at most once for the submissions that were in
+        flight at the time of the previous decrease.
+        """
+        latency = ended - started
+        with self._condition:
+            self._in_flight -= 1
+            self._end_time = ended
+            self.num_submissions += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            can_decrease = started >= self._last_decrease
+
+            if submission.failed or submission.throttled:
+                self.num_failed += 1
+                self.num_throttled += 1 if submission.throttled else 0
+                if can_decrease:
+                    self._decrease_batch_size()
+                    self.concurrency = max(
+                        1.0, self.concurrency * ADAPTIVE_DECREASE_FACTOR
+                    )
+                    self._last_decrease = ended
+
+            else:
+                self.num_tasks += submission.num_tasks
+                self.payload_bytes += submission.payload_bytes or 0
+                if latency > ADAPTIVE_TARGET_BATCH_LATENCY:
+                    if can_decrease:
+                        self._decrease_batch_size()
+                        self._last_decrease = ended
+                else:
+                    # Additive increase, by one step per round of submissions
+                    self.batch_size = min(
+                        self.max_batch_size,
+                        self.batch_size
+                        + ceil(
+                            ADAPTIVE_TASK_BATCH_SIZE_INCREMENT / self.concurrency_limit
+                        ),
+                    )
+                    self.concurrency = min(
+                        float(self.max_concurrency),
+                        self.concurrency + 1 / self.concurrency_limit,
+                    )
+
+            self._condition.notify_all()
+
+    def _decrease_batch_size(self):
+        self.batch_size = max(
+            self.min_batch_size, int(self.batch_size * ADAPTIVE_DECREASE_FACTOR)
+        )
+
+    def print_report(self):
+        """
+        Print a summary of submission throughput.
+        """
+        if self.num_submissions == 0:
+            return
+        elapsed = cast(float, self._end_time) - cast(float, self._start_time)
+        tasks_per_second = self.num_tasks / elapsed if elapsed > 0 else 0.0
+        print_info(
+            f"Adaptive batching: submitted {self.num_tasks:,d} Task(s) in "
+            f"{self.num_submissions:,d} submission(s) over {elapsed:.1f}s "
+            f"({tasks_per_second:,.1f} Tasks/s)"
+        )
+        print_info(
+            f"Adaptive batching: mean submission latency "
+            f"{self.total_latency / self.num_submissions:.2f}s (maximum "
+            f"{self.max_latency:.2f}s); {self.num_failed:,d} failed submission(s)"
+            f" ({self.num_throttled:,d} throttled)"
+            + (
+                f"; {self.payload_bytes:,d} bytes sent"
+                if self.payload_bytes > 0
+                else ""
+            )
+        )
+        print_info(
+            f"Adaptive batching: final batch size {self.batch_size:,d} (maximum "
+            f"{self.max_batch_size:,d}); final submissions in flight "
+            f"{self.concurrency_limit} (maximum {self.max_concurrency})"
+        )
+
+
 def generate_taskdata_object(
     task_data_inputs: list[dict] | None, task_data_outputs: list[dict] | None
 ) -> TaskData | None:
@@ -282,7 +658,7 @@ def _generate_task_error_matcher(task_error_matcher_data: dict) -> TaskErrorMatc
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class RcloneUploadedFile:
     """
     Capture the local and destination state of an rcloned file.
@@ -295,25 +671,52 @@ class RcloneUploadedFile:
 class RcloneUploadedFiles:
     """
     Upload and manage uploaded files from taskData.inputs.
+
+    Uploads run concurrently in a pool of threads while Tasks are generated;
+    each file/destination pair is uploaded once, and callers wait for the
+    uploads they need using wait_for_uploads(). In Task generation processes,
+    uploads are deferred to the parent process (see defer_uploads()), so that
+    each file is only uploaded once.
     """
 
     def __init__(
         self,
         files_directory: str = ".",
+        upload_threads: int = DEFAULT_DATA_CLIENT_UPLOAD_THREADS,
+        manifest_filename: str | None = None,
     ):
+        """
+        If 'manifest_filename' is supplied, an upload manifest is used to
+        record uploaded files, to skip unchanged files in later submissions.
+        """
         self._rcloned_files: list[RcloneUploadedFile] = []
+        self._rcloned_file_set: set[RcloneUploadedFile] = set()
         self._files_directory = abspath(files_directory)
-        self._working_directory = getcwd()
-
-    def upload_dataclient_input_files(self, task_data_inputs: list[dict] | None):
+        self._upload_threads = upload_threads
+        self._uploads: dict[RcloneUploadedFile, Future] = {}
+        # The 'lsjson' entries of the files in each remote directory, by
+        # name, listed once per (remote name, config section, directory)
+        self._remote_listings: dict[tuple[str, str | None, str], Future] = {}
+        self._manifest_filename = manifest_filename
+        self._manifest: UploadManifest | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._defer_uploads = False
+        self._pid = getpid()
+        self._lock = Lock()
+
+    def upload_dataclient_input_files(
+        self, task_data_inputs: list[dict] | None
+    ) -> list[RcloneUploadedFile]:
         """
         Extract files to be uploaded from a task_data_inputs objects, and
-        upload them. Important: removes any 'localFile' and 'uploadPath'
-        properties.
+        start uploading them. Important: removes any 'localFile' and
+        'uploadPath' properties. Returns the files required, to be supplied
+        to wait_for_uploads() before the Task is submitted.
         """
         if task_data_inputs is None:
-            return
+            return []
 
+        required_files: list[RcloneUploadedFile] = []
         for task_data_input in task_data_inputs:
             local_file = task_data_input.pop(DATA_CLIENT_LOCAL_PATH, None)
             if local_file is None:
@@ -323,95 +726,291 @@ class RcloneUploadedFiles:
                 upload_path = task_data_input.get(TASK_DATA_SOURCE)
             if upload_path is None:
                 continue
-            self._upload_rclone_file(
-                # Ugly cast to keep PyCharm type system happy
-                cast(str, cast(object, local_file)),
-                cast(str, upload_path),
+            required_files.append(
+                self._upload_rclone_file(
+                    # Ugly cast to keep PyCharm type system happy
+                    cast(str, cast(object, local_file)),
+                    cast(str, upload_path),
+                )
             )
+        return required_files
 
-    def _upload_rclone_file(self, local_file: str, rclone_upload_path: str):
+    def wait_for_uploads(self, rclone_uploaded_files: Iterable[RcloneUploadedFile]):
         """
-        Rclone a DataClient inputs file if it hasn't already been uploaded to
-        the same location.
+        Wait for the uploads of the specified files to complete, raising
+        an exception if any upload failed.
         """
-        chdir(self._files_directory)
+        for rclone_uploaded_file in rclone_uploaded_files:
+            upload = self._uploads.get(rclone_uploaded_file)
+            if upload is None:
+                continue
+            try:
+                upload.result()
+            except Exception as e:
+                raise RuntimeError(
+                    f"Unable to upload '{rclone_uploaded_file.local_file_path}' -> "
+                    f"'{rclone_uploaded_file.upload_file_path}': {e}"
+                )
 
-        if not exists(local_file):
+    @property
+    def uploaded_files(self) -> list[RcloneUploadedFile]:
+        """
+        The files uploaded (or being uploaded) so far.
+        """
+        self._check_process()
+        return list(self._rcloned_files)
+
+    def defer_uploads(self):
+        """
+        Record the files to be uploaded without uploading them. Used in Task
+        generation processes: the files are returned to the parent process,
+        which uploads them using start_uploads(). Otherwise, each process
+        would upload the files it uses, and files shared by Tasks in
+        different processes would be uploaded concurrently more than once.
+        """
+        self._check_process()
+        self._defer_uploads = True
+
+    def start_uploads(self, uploaded_files: list[RcloneUploadedFile]):
+        """
+        Start uploading files recorded elsewhere (e.g., by a Task generation
+        process), unless they've already been uploaded (or are being
+        uploaded).
+        """
+        for uploaded_file in uploaded_files:
+            self._start_upload(uploaded_file)
+
+    def _upload_rclone_file(
+        self, local_file: str, rclone_upload_path: str
+    ) -> RcloneUploadedFile:
+        """
+        Start uploading a DataClient inputs file, unless it has already been
+        uploaded (or is being uploaded) to the same location.
+        """
+        if not exists(Path(self._files_directory, local_file)):
             raise FileNotFoundError(
                 f"File '{Path(self._files_directory) / local_file}' does not exist "
                 "and cannot be uploaded"
             )
 
         rclone_uploaded_file = RcloneUploadedFile(local_file, rclone_upload_path)
-        if rclone_uploaded_file in self._rcloned_files:
-            # Duplicate
-            return
-
-        if not ARGS_PARSER.dry_run:
-            try:
-                self._upload_rclone_file_core(rclone_uploaded_file)
-            except Exception as e:
-                raise RuntimeError(
-                    f"Unable to upload '{local_file}' -> '{rclone_upload_path}': {e}"
+        self._start_upload(rclone_uploaded_file)
+        return rclone_uploaded_file
+
+    def _start_upload(self, rclone_uploaded_file: RcloneUploadedFile):
+        self._check_process()
+        with self._lock:
+            if rclone_uploaded_file in self._rcloned_file_set:
+                # Duplicate
+                return
+            self._rcloned_file_set.add(rclone_uploaded_file)
+            self._rcloned_files.append(rclone_uploaded_file)
+
+            if self._defer_uploads:
+                return
+
+            if not ARGS_PARSER.dry_run:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=max(1, self._upload_threads),
+                        thread_name_prefix="yd-upload",
+                    )
+                self._uploads[rclone_uploaded_file] = self._executor.submit(
+                    self._upload_rclone_file_core, rclone_uploaded_file
                 )
-        else:
-            print_info(
-                f"Dry-run: Would upload '{local_file}' -> "
-                f"'{self._bucket_and_prefix(rclone_uploaded_file)}'"
-            )
+                return
 
-        self._rcloned_files.append(rclone_uploaded_file)
+        print_info(
+            f"Dry-run: Would upload '{rclone_uploaded_file.local_file_path}' -> "
+            f"'{self._bucket_and_prefix(rclone_uploaded_file)}'"
+        )
 
-        chdir(self._working_directory)
+    def _check_process(self):
+        """
+        In a forked Task generation process, discard the parent's upload
+        threads and any uploads that were still in progress when the process
+        was forked, so that they're repeated if required.
+        """
+        if self._pid == getpid():
+            return
+        self._pid = getpid()
+        self._lock = Lock()
+        self._executor = None
+        incomplete = [
+            rcloned_file
+            for rcloned_file, upload in self._uploads.items()
+            if not upload.done()
+        ]
+        for rcloned_file in incomplete:
+            del self._uploads[rcloned_file]
+            self._rcloned_file_set.discard(rcloned_file)
+            self._rcloned_files.remove(rcloned_file)
+        self._remote_listings = {
+            key: listing
+            for key, listing in self._remote_listings.items()
+            if listing.done()
+        }
 
     def _upload_rclone_file_core(self, rclone_upload_file: RcloneUploadedFile):
         """
-        Core upload method for a single file.
+        Core upload method for a single file. Unless overwriting, the file is
+        skipped if the remote copy has the same content.
         """
         remote_name, config_section, remote_path = self._parse_rclone_connection_string(
             rclone_upload_file.upload_file_path
         )
 
-        # Auto-downloads rclone binary if missing (~20-40 MB, only once)
-        rclone = make_rclone(
-            Config(config_section) if config_section is not None else None
-        )
+        rclone = get_rclone_backend(remote_name, config_section)
 
         remote_dest = f"{remote_name}:{remote_path}"
 
-        if not ARGS_PARSER.overwrite and rclone.exists(remote_dest):
-            print_info(
-                f"Skipping upload of '{rclone_upload_file.local_file_path}'"
-                f" (already exists at '{self._bucket_and_prefix(rclone_upload_file)}')"
+        local_file = Path(
+            self._files_directory, rclone_upload_file.local_file_path
+        ).resolve()
+        # The local file is only hashed if it may be skipped, or if the
+        # upload will be recorded in the manifest
+        local = previous = None
+        if not ARGS_PARSER.overwrite:
+            remote_entry = self._remote_file_entry(
+                rclone, remote_name, config_section, remote_path
             )
-            return
+            if remote_entry is not None or self._manifest_filename is not None:
+                destination = manifest_destination(
+                    remote_name, config_section, remote_path
+                )
+                previous = self._manifest_get(str(local_file), destination)
+                local = local_file_entry(str(local_file), destination, previous)
+            if (
+                local is not None
+                and remote_entry is not None
+                and remote_copy_is_unchanged(local, remote_entry, previous)
+            ):
+                print_info(
+                    f"Skipping upload of '{rclone_upload_file.local_file_path}'"
+                    " (unchanged at "
+                    f"'{self._bucket_and_prefix(rclone_upload_file)}')"
+                )
+                local.remote_size = remote_entry.get("Size")
+                local.remote_hash = (remote_entry.get("Hashes") or {}).get("md5")
+                self._manifest_put(local)
+                return
 
-        local_file = Path(rclone_upload_file.local_file_path).resolve()
         print_info(
             f"Uploading '{rclone_upload_file.local_file_path}' → "
             f"'{self._bucket_and_prefix(rclone_upload_file)}'"
         )
 
-        result = rclone.copy_to(
-            src=str(local_file),
-            dst=remote_dest,
-            other_args=[],
-        )
+        result = rclone.copy_file(src=str(local_file), dst=remote_dest)
 
         if result.returncode != 0:
             raise RuntimeError(f"Upload failed: {result.stderr}")
 
+        if local is not None:
+            local.remote_size = local.size
+            self._manifest_put(local)
+
+    def _remote_file_entry(
+        self,
+        rclone: RcloneBackend,
+        remote_name: str,
+        config_section: str | None,
+        remote_path: str,
+    ) -> dict | None:
+        """
+        Return the 'lsjson' entry (with its MD5 hash, if available) for a
+        remote file, or None if it doesn't exist, using a single listing of
+        its directory that's shared by all the uploads to that directory.
+        """
+        # Keep any leading '/' of an absolute path (e.g., for 'local' or
+        # 'sftp' remotes)
+        directory, separator, name = remote_path.rstrip("/").rpartition("/")
+        if separator and not directory:
+            directory = "/"
+        key = (remote_name, config_section, directory)
+        with self._lock:
+            listing = self._remote_listings.get(key)
+            list_directory = listing is None
+            if listing is None:
+                listing = self._remote_listings[key] = Future()
+        if list_directory:
+            try:
+                entries = rclone.list_json(
+                    f"{remote_name}:{directory}", files_only=True, hashes=True
+                )
+            except Exception as e:
+                listing.set_exception(e)
+                raise
+            # A directory that can't be listed doesn't exist yet
+            listing.set_result({entry["Name"]: entry for entry in entries or []})
+        return listing.result().get(name)
+
+    def _get_manifest(self) -> UploadManifest | None:
+        """
+        The upload manifest, opened on first use, or None if it's not in use.
+        """
+        with self._lock:
+            if self._manifest is None and self._manifest_filename is not None:
+                try:
+                    self._manifest = UploadManifest(self._manifest_filename)
+                except sqlite3.Error as e:
+                    self._disable_manifest(e)
+            return self._manifest
+
+    def _manifest_get(
+        self, local_path: str, destination: str
+    ) -> UploadManifestEntry | None:
+        manifest = self._get_manifest()
+        if manifest is None:
+            return None
+        try:
+            return manifest.get(local_path, destination)
+        except sqlite3.Error as e:
+            self._disable_manifest(e)
+            return None
+
+    def _manifest_put(self, entry: UploadManifestEntry):
+        manifest = self._get_manifest()
+        if manifest is None:
+            return
+        try:
+            manifest.put(entry)
+        except sqlite3.Error as e:
+            self._disable_manifest(e)
+
+    def _disable_manifest(self, error: sqlite3.Error):
+        """
+        Stop using the upload manifest for the rest of this invocation.
+        """
+        if self._manifest_filename is not None:
+            print_warning(
+                f"Unable to use upload manifest '{self._manifest_filename}' "
+                f"(disabling): {error}"
+            )
+        self._manifest_filename = None
+        self._manifest = None
+
     def delete(self):
         """
-        Delete all files that have been rcloned. Note: can't delete
+        Delete all files that have been rcloned, once any uploads in
+        progress have concluded. Note: can't delete
         a list of files in one rclone-api call because they may be
         stored in different places. This can be optimised later by
         grouping into batches of files with the same connection info.
         """
+        self._check_process()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
         for rcloned_file in self._rcloned_files:
+            upload = self._uploads.get(rcloned_file)
+            if upload is not None and upload.cancelled():
+                continue
             self._delete_rcloned_file(rcloned_file.upload_file_path)
 
         self._rcloned_files = []
+        self._rcloned_file_set = set()
+        self._uploads = {}
 
     def _delete_rcloned_file(self, conn_str: str):
         """
@@ -427,10 +1026,7 @@ class RcloneUploadedFiles:
             conn_str
         )
 
-        # Auto-downloads rclone binary if missing (~20-40 MB, only once)
-        rclone = make_rclone(
-            Config(config_section) if config_section is not None else None
-        )
+        rclone = get_rclone_backend(remote_name, config_section)
 
         rcloned_file = f"{remote_name}:{remote_path}"
         print_info(f"Deleting rcloned file '{rcloned_file}'")
@@ -438,7 +1034,7 @@ class RcloneUploadedFiles:
             print_warning(f"Rcloned file does not exist: '{rcloned_file}'")
             return
 
-        result = rclone.delete_files([rcloned_file])
+        result = rclone.delete_file(rcloned_file)
 
         if result.returncode != 0:
             print_error(
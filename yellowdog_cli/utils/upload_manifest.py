@@ -0,0 +1,201 @@
+"""
+A manifest of the Data Client input files uploaded by yd-submit, so that
+re-submissions can skip files that haven't changed.
+
+Each entry, keyed by local path and remote destination, records the size,
+modification time and MD5 hash of the local file when it was uploaded (or
+found to be unchanged), with the size and hash of the remote copy. A local
+file whose size and modification time still match isn't read again to hash
+it, and a remote copy without a reported hash can be compared with the
+content previously uploaded to it.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from time import time
+
+from yellowdog_cli.utils.misc_utils import get_cache_dir
+from yellowdog_cli.utils.settings import (
+    UPLOAD_MANIFEST_DB_TIMEOUT,
+    UPLOAD_MANIFEST_HASH_CHUNK_SIZE,
+    UPLOAD_MANIFEST_MOD_TIME_TOLERANCE,
+)
+
+
+@dataclass
+class UploadManifestEntry:
+    """
+    The state of a local file, and of its remote copy, when last uploaded or
+    found to be unchanged.
+    """
+
+    local_path: str
+    destination: str
+    size: int
+    mtime_ns: int
+    content_hash: str  # MD5, hex
+    remote_size: int | None = None
+    remote_hash: str | None = None  # MD5, hex, where reported by the remote
+
+
+class UploadManifest:
+    """
+    A persistent record of uploaded files, keyed by local path and remote
+    destination. A connection is made for each operation, so the manifest
+    can be used from several threads and from forked processes.
+    """
+
+    def __init__(self, filename: str):
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        self._filename = filename
+        with self._connect() as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS uploads (local_path TEXT, "
+                "destination TEXT, size INTEGER, mtime_ns INTEGER, "
+                "content_hash TEXT, remote_size INTEGER, remote_hash TEXT, "
+                "updated REAL, PRIMARY KEY (local_path, destination))"
+            )
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        return closing(
+            sqlite3.connect(self._filename, timeout=UPLOAD_MANIFEST_DB_TIMEOUT)
+        )
+
+    def get(self, local_path: str, destination: str) -> UploadManifestEntry | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT size, mtime_ns, content_hash, remote_size, remote_hash "
+                "FROM uploads WHERE local_path = ? AND destination = ?",
+                (local_path, destination),
+            ).fetchone()
+        return (
+            None if row is None else UploadManifestEntry(local_path, destination, *row)
+        )
+
+    def put(self, entry: UploadManifestEntry):
+        with self._connect() as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.local_path,
+                    entry.destination,
+                    entry.size,
+                    entry.mtime_ns,
+                    entry.content_hash,
+                    entry.remote_size,
+                    entry.remote_hash,
+                    time(),
+                ),
+            )
+
+
+def get_upload_manifest_filename() -> str:
+    """
+    The location of the manifest, in the user's cache directory.
+    """
+    return os.path.join(get_cache_dir(), "upload-manifest.sqlite3")
+
+
+def file_md5(filename: str) -> str:
+    """
+    Return the MD5 hash of a file's contents, as used by rclone.
+    """
+    md5 = hashlib.md5(usedforsecurity=False)
+    with open(filename, "rb") as f:
+        while chunk := f.read(UPLOAD_MANIFEST_HASH_CHUNK_SIZE):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def manifest_destination(
+    remote_name: str, config_section: str | None, remote_path: str
+) -> str:
+    """
+    The manifest's key for a remote destination. An inline remote
+    configuration is represented by its hash, so that no credentials it
+    contains are stored.
+    """
+    destination = f"{remote_name}:{remote_path}"
+    if config_section is None:
+        return destination
+    return f"{destination}#{hashlib.sha256(config_section.encode()).hexdigest()[:16]}"
+
+
+def local_file_entry(
+    local_path: str, destination: str, previous: UploadManifestEntry | None
+) -> UploadManifestEntry:
+    """
+    Describe the current state of a local file. Its content hash is taken
+    from the previous manifest entry if the file's size and modification
+    time are unchanged, and is otherwise calculated.
+    """
+    stat = os.stat(local_path)
+    if (
+        previous is not None
+        and previous.size == stat.st_size
+        and previous.mtime_ns == stat.st_mtime_ns
+    ):
+        content_hash = previous.content_hash
+    else:
+        content_hash = file_md5(local_path)
+    return UploadManifestEntry(
+        local_path, destination, stat.st_size, stat.st_mtime_ns, content_hash
+    )
+
+
+_MOD_TIME_PATTERN = re.compile(
+    r"(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(\.\d+)?(Z|[+-]\d\d:\d\d)"
+)
+
+
+def parse_mod_time(mod_time: str) -> float | None:
+    """
+    Parse an rclone 'ModTime' (RFC 3339, with up to nanosecond precision)
+    as a POSIX timestamp.
+    """
+    match = _MOD_TIME_PATTERN.fullmatch(mod_time)
+    if match is None:
+        return None
+    seconds, fraction, zone = match.groups()
+    timestamp = datetime.fromisoformat(
+        seconds + ("+00:00" if zone == "Z" else zone)
+    ).timestamp()
+    return timestamp + (float(fraction) if fraction else 0.0)
+
+
+def remote_copy_is_unchanged(
+    local: UploadManifestEntry,
+    remote_entry: dict,
+    previous: UploadManifestEntry | None,
+) -> bool:
+    """
+    Whether a remote object (an 'rclone lsjson' entry) has the same content
+    as the local file. MD5 hashes are compared where the remote reports
+    them. Otherwise, the object is unchanged if the local file's content was
+    previously uploaded to it and its size hasn't changed, or, with no
+    previous upload, if its size and modification time match, as rclone
+    checks by default.
+    """
+    if remote_entry.get("Size") != local.size:
+        return False
+    remote_hash = (remote_entry.get("Hashes") or {}).get("md5")
+    if remote_hash:
+        return remote_hash.lower() == local.content_hash
+    if previous is not None:
+        return (
+            previous.content_hash == local.content_hash
+            and previous.remote_size == local.size
+        )
+    remote_mod_time = parse_mod_time(remote_entry.get("ModTime", ""))
+    return (
+        remote_mod_time is not None
+        and abs(remote_mod_time - local.mtime_ns / 1e9)
+        <= UPLOAD_MANIFEST_MOD_TIME_TOLERANCE
+    )
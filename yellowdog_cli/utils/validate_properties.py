@@ -5,6 +5,7 @@ Validate property dictionaries.
 from copy import deepcopy
 from dataclasses import dataclass
 
+from yellowdog_cli.utils.csv_data import CSVTaskList
 from yellowdog_cli.utils.printing import print_error
 from yellowdog_cli.utils.property_names import *
 
@@ -39,7 +40,7 @@ DEPRECATED_KEYS = [
 EXCLUDED_KEYS = [ENV, VARIABLES, INSTANCE_TAGS, TASK_DATA_INPUTS, TASK_DATA_OUTPUTS]
 
 
-def _get_keys(data: dict | list) -> list[str]:
+def _get_keys(data: dict | list | CSVTaskList) -> list[str]:
     """
     Recursively walk a dictionary or list collecting keys.
     Exclude dictionaries with user-specified keys.
@@ -61,7 +62,10 @@ def _get_keys(data: dict | list) -> list[str]:
                     errors = True
             keys.append(key_to_add)
 
-            if isinstance(value, (dict, list)) and key not in EXCLUDED_KEYS:
+            if (
+                isinstance(value, (dict, list, CSVTaskList))
+                and key not in EXCLUDED_KEYS
+            ):
                 keys += _get_keys(value)
 
     if errors:
@@ -72,4 +76,7 @@ def _get_keys(data: dict | list) -> list[str]:
             if isinstance(element, dict):
                 keys += _get_keys(element)
 
+    elif isinstance(data, CSVTaskList):
+        keys += _get_keys(data.task_prototype)
+
     return keys
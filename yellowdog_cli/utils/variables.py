@@ -6,7 +6,13 @@ import os
 import re
 import sys
 import tempfile
+from collections import ChainMap
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from getpass import getuser
 from json import loads as json_loads
 from random import randint
@@ -41,6 +47,7 @@ from yellowdog_cli.utils.settings import (
     VAR_CLOSING_DELIMITER,
     VAR_DEFAULT_SEPARATOR,
     VAR_OPENING_DELIMITER,
+    VAR_TEMPLATE_CACHE_SIZE,
     VAR_UNSET_SUFFIX,
     WP_VARIABLES_POSTFIX,
     WP_VARIABLES_PREFIX,
@@ -107,6 +114,12 @@ if subs_list:
 
 del subs_list
 
+# Substitutions scoped to the current context, layered over
+# VARIABLE_SUBSTITUTIONS; see substitution_scope()
+_SCOPED_SUBSTITUTIONS: ContextVar[dict | None] = ContextVar(
+    "scoped_substitutions", default=None
+)
+
 
 def add_substitutions_without_overwriting(subs: dict):
     """
@@ -139,22 +152,56 @@ def add_substitutions_without_overwriting(subs: dict):
 def add_or_update_substitution(key: str, value: str):
     """
     Add a substitution to the dictionary, overwriting existing values.
+    Inside a substitution_scope(), the substitution is added to the scope.
+    """
+    scoped_substitutions = _SCOPED_SUBSTITUTIONS.get()
+    if scoped_substitutions is None:
+        VARIABLE_SUBSTITUTIONS[key] = str(value)
+    else:
+        scoped_substitutions[key] = str(value)
+
+
+@contextmanager
+def substitution_scope() -> Iterator[None]:
+    """
+    Context manager within which add_or_update_substitution() affects only
+    the current context (thread or asyncio task). Scoped substitutions take
+    precedence over VARIABLE_SUBSTITUTIONS and are discarded on exit, which
+    allows e.g. Tasks to be generated concurrently.
+    """
+    parent_substitutions = _SCOPED_SUBSTITUTIONS.get()
+    token = _SCOPED_SUBSTITUTIONS.set(
+        {} if parent_substitutions is None else dict(parent_substitutions)
+    )
+    try:
+        yield
+    finally:
+        _SCOPED_SUBSTITUTIONS.reset(token)
+
+
+def _current_substitutions() -> Mapping:
     """
-    VARIABLE_SUBSTITUTIONS[key] = str(value)
+    The substitutions visible in the current context: any scoped
+    substitutions layered over VARIABLE_SUBSTITUTIONS.
+    """
+    scoped_substitutions = _SCOPED_SUBSTITUTIONS.get()
+    if not scoped_substitutions:
+        return VARIABLE_SUBSTITUTIONS
+    return ChainMap(scoped_substitutions, VARIABLE_SUBSTITUTIONS)
 
 
 def get_user_variable(variable_name: str) -> str | None:
     """
     Get the value of a variable.
     """
-    return VARIABLE_SUBSTITUTIONS.get(variable_name)
+    return _current_substitutions().get(variable_name)
 
 
 def get_all_user_variables() -> dict:
     """
     Return all the user variables. Copy to avoid amendment.
     """
-    return deepcopy(VARIABLE_SUBSTITUTIONS)
+    return deepcopy(dict(_current_substitutions()))
 
 
 def process_variable_substitutions_insitu(
@@ -217,6 +264,76 @@ def process_variable_substitutions_insitu(
     return data
 
 
+class SubstitutionPrototype:
+    """
+    A dict or list (e.g., a Task specification) analysed once for variable
+    substitutions. Each render() is equivalent to applying
+    process_variable_substitutions_insitu() to a deep copy, but only the
+    paths that contain variables are rebuilt: subtrees without variables are
+    shared between renders and with the original data, so callers must copy
+    any part of a render that they modify.
+    """
+
+    def __init__(self, data: dict | list, prefix: str = "", postfix: str = ""):
+        self._data = data
+        self._variable_paths = self._compile(data, prefix, postfix)
+
+    def render(self) -> dict | list:
+        """
+        Render the data using the current variable substitutions.
+        """
+        if self._variable_paths is None:
+            return self._data
+        return self._render(self._data, self._variable_paths)
+
+    @staticmethod
+    def _compile(data: dict | list, prefix: str, postfix: str) -> list | None:
+        """
+        Return a list of (key, prefix, postfix, child_paths) for the entries
+        of 'data' that contain variables, where 'child_paths' is None for
+        strings. Returns None if there are no variables.
+        """
+        variable_paths = []
+        items = data.items() if isinstance(data, dict) else enumerate(data)
+        for key_, value_ in items:
+            if isinstance(value_, str):
+                # Require the use of post/prefix only for userData in TOML
+                key_prefix, key_postfix = (
+                    (WP_VARIABLES_PREFIX, WP_VARIABLES_POSTFIX)
+                    if isinstance(data, dict) and key_ == USERDATA
+                    else (prefix, postfix)
+                )
+                if (
+                    key_prefix + VAR_OPENING_DELIMITER in value_
+                    and VAR_CLOSING_DELIMITER + key_postfix in value_
+                ):
+                    variable_paths.append((key_, key_prefix, key_postfix, None))
+            elif isinstance(value_, dict) or isinstance(value_, list):
+                child_paths = SubstitutionPrototype._compile(value_, prefix, postfix)
+                if child_paths is not None:
+                    variable_paths.append((key_, prefix, postfix, child_paths))
+        return variable_paths or None
+
+    @staticmethod
+    def _render(data: dict | list, variable_paths: list) -> dict | list:
+        rendered: dict | list = dict(data) if isinstance(data, dict) else list(data)
+        keys_to_delete = []
+        for key_, prefix, postfix, child_paths in variable_paths:
+            if child_paths is not None:
+                rendered[key_] = SubstitutionPrototype._render(data[key_], child_paths)
+                continue
+            result = process_variable_substitutions(
+                data[key_], prefix=prefix, postfix=postfix
+            )
+            if result is _UNSET:
+                keys_to_delete.append(key_)
+            else:
+                rendered[key_] = result
+        for key_ in reversed(keys_to_delete):
+            del rendered[key_]
+        return rendered
+
+
 def process_variable_substitutions(
     input_string: str | int | bool | float | list | dict | None,
     prefix: str = "",
@@ -226,81 +343,259 @@ def process_variable_substitutions(
     Process type-tagged and non-type-tagged variables, returning the required
     type if there's a type-tagged variable at the start of the input string.
     Non-string, non-None values are returned unchanged.
+
+    Each distinct input string is parsed once (see _compile_template) and
+    the cached result is rendered against the current substitutions.
     """
     if input_string is None:
         return None
     if not isinstance(input_string, str):
         return input_string
 
+    if not (
+        prefix + VAR_OPENING_DELIMITER in input_string
+        and VAR_CLOSING_DELIMITER + postfix in input_string
+    ):
+        return input_string  # Nothing to process
+
+    segments = _compile_template(input_string, prefix, postfix)
+    substitutions = _current_substitutions()
+    rendered_segments: list[str] = []
+
+    for segment in segments:
+        if isinstance(segment, str):  # No variable to process
+            rendered_segments.append(segment)
+            continue
+
+        element_processed = segment.render(substitutions)
+
+        if element_processed is _UNSET:
+            return _UNSET  # type: ignore
+
+        if element_processed == segment.untyped_element:  # No variable processing
+            rendered_segments.append(segment.element)
+            continue
+
+        if segment.type_tag == "":  # Variable(s) processed, but no type tag
+            rendered_segments.append(cast(str, element_processed))
+            continue
+
+        if len(segments) == 1:
+            # The first and only element has a type tag:
+            # immediately return the type matching the tag
+            return process_typed_variable_substitution(
+                segment.type_tag, cast(str, element_processed)
+            )
+
+        # Just append the type as a string
+        rendered_segments.append(
+            str(
+                process_typed_variable_substitution(
+                    segment.type_tag, cast(str, element_processed)
+                )
+            )
+        )
+
+    return "".join(rendered_segments)
+
+
+# Kinds of compiled template element
+_ELEMENT_PLAIN = 0  # '{{varname}}'
+_ELEMENT_DEFAULT = 1  # '{{varname:=default}}'
+_ELEMENT_ENV = 2  # '{{env:VARNAME}}' or '{{env:VARNAME:=default}}'
+_ELEMENT_UNSET = 3  # '{{varname::}}'
+_ELEMENT_FALLBACK = 4  # Nested or unusual; use process_untyped_variable_substitutions()
+
+
+@dataclass(frozen=True)
+class _TemplateElement:
+    """
+    A single delimited element of a template string, parsed once.
+    """
+
+    element: str  # The original element, including any type tag
+    untyped_element: str  # The element with its type tag removed
+    type_tag: str
+    opening_delimiter: str
+    closing_delimiter: str
+    kind: int
+    name: str = ""  # Variable name to look up
+    default: str | None = None
+    error: str | None = None  # Raised if the element is rendered as a default
+
+    def render(self, substitutions: Mapping) -> str:
+        """
+        Render the element against the supplied substitutions. Returns the
+        untyped element unchanged if there is nothing to substitute, or
+        _UNSET if the property should be removed.
+        """
+        if self.kind == _ELEMENT_FALLBACK:
+            return self._render_fallback()
+
+        if self.kind == _ELEMENT_UNSET:
+            if self.name in substitutions:
+                return self._checked(str(substitutions[self.name]))
+            if self.name.startswith(ENV_VAR_SUB_PREFIX):
+                env_value = os.getenv(self.name[len(ENV_VAR_SUB_PREFIX) :])
+                if env_value is not None:
+                    return self._checked(env_value)
+            return _UNSET  # type: ignore
+
+        # An exact match on the whole of the element's contents takes
+        # precedence over env/default processing
+        inner = self.untyped_element[
+            len(self.opening_delimiter) : -len(self.closing_delimiter)
+        ]
+        if inner in substitutions:
+            return self._checked(str(substitutions[inner]))
+
+        if self.error is not None:
+            raise ValueError(self.error)
+
+        if self.kind == _ELEMENT_PLAIN:
+            return self.untyped_element
+
+        if self.kind == _ELEMENT_ENV:
+            env_value = os.getenv(self.name)
+            if env_value is not None:
+                return self._checked(env_value)
+            return self.untyped_element if self.default is None else self.default
+
+        # _ELEMENT_DEFAULT
+        if self.name in substitutions:
+            return self._checked(str(substitutions[self.name]))
+        return cast(str, self.default)
+
+    def _checked(self, value: str) -> str:
+        """
+        Substituted values that themselves contain delimiters are subject to
+        further processing: defer to the general algorithm in that case.
+        """
+        if VAR_OPENING_DELIMITER in value or VAR_CLOSING_DELIMITER in value:
+            return self._render_fallback()
+        return value
+
+    def _render_fallback(self) -> str:
+        return cast(
+            str,
+            process_untyped_variable_substitutions(
+                self.untyped_element, self.opening_delimiter, self.closing_delimiter
+            ),
+        )
+
+
+@lru_cache(maxsize=VAR_TEMPLATE_CACHE_SIZE)
+def _compile_template(
+    input_string: str, prefix: str, postfix: str
+) -> tuple[str | _TemplateElement, ...]:
+    """
+    Split a template string into its literal text and delimited elements,
+    classifying each element so that it can be rendered using dictionary
+    lookups alone.
+    """
     opening_delimiter = prefix + VAR_OPENING_DELIMITER
     closing_delimiter = VAR_CLOSING_DELIMITER + postfix
 
-    if not (opening_delimiter in input_string and closing_delimiter in input_string):
-        return input_string  # Nothing to process
-
-    return_str = ""
+    # Type tags include their ':' terminator (e.g. 'num:'), so the lookahead
+    # only needs TYPE_TAG_DEFAULT_GUARD ('=') — the character after ':' that
+    # distinguishes ':=' (default separator) from a type tag.
+    # This prevents '{{num:=default}}' from being treated as a typed variable.
+    type_tag_regex = re.compile(
+        f"^{opening_delimiter}({NUMBER_TYPE_TAG}|{BOOL_TYPE_TAG}"
+        f"|{TABLE_TYPE_TAG}|{ARRAY_TYPE_TAG}|{FORMAT_NAME_TYPE_TAG})"
+        f"(?!{TYPE_TAG_DEFAULT_GUARD})"
+    )
 
-    # Loop through the delimited elements in the input string
-    elements = split_delimited_string(
+    segments: list[str | _TemplateElement] = []
+    for element in split_delimited_string(
         input_string, opening_delimiter, closing_delimiter
-    )
-    for index, element in enumerate(elements):
+    ):
         if not (
             element.startswith(opening_delimiter)
             and element.endswith(closing_delimiter)
-        ):  # No variable to process; just reinsert the element
-            return_str += element
+        ):
+            segments.append(element)
             continue
 
-        # Type tags include their ':' terminator (e.g. 'num:'), so the lookahead
-        # only needs TYPE_TAG_DEFAULT_GUARD ('=') — the character after ':' that
-        # distinguishes ':=' (default separator) from a type tag.
-        # This prevents '{{num:=default}}' from being treated as a typed variable.
-        m = re.match(
-            f"^{opening_delimiter}({NUMBER_TYPE_TAG}|{BOOL_TYPE_TAG}"
-            f"|{TABLE_TYPE_TAG}|{ARRAY_TYPE_TAG}|{FORMAT_NAME_TYPE_TAG})"
-            f"(?!{TYPE_TAG_DEFAULT_GUARD})",
-            element,
-        )
+        m = type_tag_regex.match(element)
         type_tag = m.group(0).replace(opening_delimiter, "") if m is not None else ""
-
-        element_minus_type_tag = (
+        untyped_element = (
             element.replace(opening_delimiter + type_tag, opening_delimiter)
             if type_tag != ""
             else element
         )
-
-        element_processed = process_untyped_variable_substitutions(
-            element_minus_type_tag, opening_delimiter, closing_delimiter
+        segments.append(
+            _compile_element(
+                element, untyped_element, type_tag, opening_delimiter, closing_delimiter
+            )
         )
-        assert (
-            element_processed is not None or element_processed is _UNSET
-        )  # element_minus_type_tag is always str
 
-        if element_processed is _UNSET:
-            return _UNSET  # type: ignore
+    return tuple(segments)
 
-        if element_processed == element_minus_type_tag:  # No variable processing
-            return_str += element
-            continue
 
-        if type_tag == "":  # Variable(s) processed, but no type tag
-            return_str += cast(str, element_processed)
-            continue
+def _compile_element(
+    element: str,
+    untyped_element: str,
+    type_tag: str,
+    opening_delimiter: str,
+    closing_delimiter: str,
+) -> _TemplateElement:
+    """
+    Classify a delimited element. Elements with nested or stray delimiter
+    characters, or line breaks, are left to the general algorithm.
+    """
+    compiled = partial(
+        _TemplateElement,
+        element,
+        untyped_element,
+        type_tag,
+        opening_delimiter,
+        closing_delimiter,
+    )
 
-        if index == 0 and len(elements) == 1:
-            # The first and only element has a type tag:
-            # immediately return the type matching the tag
-            return process_typed_variable_substitution(
-                type_tag, cast(str, element_processed)
+    inner = untyped_element[len(opening_delimiter) : -len(closing_delimiter)]
+    if (
+        not untyped_element.startswith(opening_delimiter)
+        or len(untyped_element) < len(opening_delimiter) + len(closing_delimiter)
+        or any(
+            char in inner
+            for char in f"{VAR_OPENING_DELIMITER}{VAR_CLOSING_DELIMITER}\n"
+        )
+    ):
+        return compiled(kind=_ELEMENT_FALLBACK)
+
+    if inner.endswith(VAR_UNSET_SUFFIX):
+        return compiled(kind=_ELEMENT_UNSET, name=inner[: -len(VAR_UNSET_SUFFIX)])
+
+    if inner.startswith(ENV_VAR_SUB_PREFIX):
+        var_name = inner[len(ENV_VAR_SUB_PREFIX) :]
+        if VAR_DEFAULT_SEPARATOR not in var_name:
+            return compiled(kind=_ELEMENT_ENV, name=var_name)
+        split_result = var_name.split(VAR_DEFAULT_SEPARATOR)
+        if split_result[0] == "" or len(split_result) != 2:
+            return compiled(
+                kind=_ELEMENT_ENV,
+                error=f"Malformed '<variable>:=<default>' substitution: '{var_name}'",
             )
+        return compiled(
+            kind=_ELEMENT_ENV, name=split_result[0], default=split_result[1]
+        )
 
-        # Just append the type as a string
-        return_str += str(
-            process_typed_variable_substitution(type_tag, cast(str, element_processed))
+    if VAR_DEFAULT_SEPARATOR in inner:
+        variable_default = inner.split(VAR_DEFAULT_SEPARATOR)
+        if variable_default[0] == "" or len(variable_default) != 2:
+            return compiled(
+                kind=_ELEMENT_DEFAULT,
+                error=(
+                    "Malformed '<variable>:=<default>' substitution: "
+                    f"'{untyped_element}'"
+                ),
+            )
+        return compiled(
+            kind=_ELEMENT_DEFAULT, name=variable_default[0], default=variable_default[1]
         )
 
-    return return_str
+    return compiled(kind=_ELEMENT_PLAIN, name=inner)
 
 
 def process_untyped_variable_substitutions(
@@ -337,6 +632,8 @@ def process_untyped_variable_substitutions(
     if input_string is None:
         return None
 
+    substitutions = _current_substitutions()
+
     # Check if there are inner variables
     undelimited_input_string = remove_outer_delimiters(
         input_string, opening_delimiter, closing_delimiter
@@ -370,8 +667,8 @@ def process_untyped_variable_substitutions(
         bare_name = remove_outer_delimiters(s, opening_delimiter, closing_delimiter)[
             : -len(VAR_UNSET_SUFFIX)
         ]
-        if bare_name in VARIABLE_SUBSTITUTIONS:
-            s = str(VARIABLE_SUBSTITUTIONS[bare_name])
+        if bare_name in substitutions:
+            s = str(substitutions[bare_name])
         elif bare_name.startswith(ENV_VAR_SUB_PREFIX):
             env_value = os.getenv(bare_name[len(ENV_VAR_SUB_PREFIX) :])
             if env_value is not None:
@@ -383,7 +680,7 @@ def process_untyped_variable_substitutions(
 
     # Perform initial substitutions from the substitutions dictionary; this
     # will not substitute variables that have default values
-    for substitution, value in VARIABLE_SUBSTITUTIONS.items():
+    for substitution, value in substitutions.items():
         s = s.replace(
             f"{opening_delimiter}{substitution}{closing_delimiter}", str(value)
         )
@@ -449,7 +746,7 @@ def process_untyped_variable_substitutions(
 
     # Repeat substitutions from the substitutions dictionary, now that defaults
     # have been removed
-    for substitution, value in VARIABLE_SUBSTITUTIONS.items():
+    for substitution, value in substitutions.items():
         s = s.replace(
             f"{opening_delimiter}{substitution}{closing_delimiter}", str(value)
         )
@@ -5,15 +5,31 @@ for all commands.
 
 import os
 from sys import exit
+from threading import Lock
+from typing import Any
 
 from pypac import pac_context_for_url
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from yellowdog_client import PlatformClient
 from yellowdog_client.model import ApiKey, ServicesSchema
 
 from yellowdog_cli.utils.args import ARGS_PARSER
 from yellowdog_cli.utils.config_types import ConfigCommon
 from yellowdog_cli.utils.load_config import load_config_common
-from yellowdog_cli.utils.printing import print_error, print_info
+from yellowdog_cli.utils.printing import close_output_file, print_error, print_info
+from yellowdog_cli.utils.rclone_daemon import close_rclone_daemon
+from yellowdog_cli.utils.resolution_cache import (
+    close_resolution_cache,
+    open_resolution_cache,
+)
+from yellowdog_cli.utils.settings import (
+    HTTP_MAX_RETRIES,
+    HTTP_MIN_POOL_SIZE,
+    HTTP_RETRY_BACKOFF_FACTOR,
+    HTTP_RETRY_STATUS_CODES,
+)
 
 CONFIG_COMMON: ConfigCommon = load_config_common()
 CLIENT = PlatformClient.create(
@@ -21,6 +37,68 @@ CLIENT = PlatformClient.create(
     ApiKey(CONFIG_COMMON.key, CONFIG_COMMON.secret),
 )
 
+# Session shared by all direct REST API calls, created on first use
+_REST_SESSION: Session | None = None
+_REST_SESSION_POOL_SIZE = 0
+_REST_SESSION_LOCK = Lock()
+
+
+def get_rest_session(pool_size: int = HTTP_MIN_POOL_SIZE) -> Session:
+    """
+    Return the process-wide session for direct REST API calls, which keeps
+    connections alive between calls and carries the authorisation header.
+    Its connection pool is enlarged if 'pool_size' concurrent connections
+    are required.
+
+    Failed connections are retried for all requests; 'Retry-After' and
+    error status codes are retried only for idempotent requests, so POSTs
+    are never repeated once sent.
+    """
+    global _REST_SESSION, _REST_SESSION_POOL_SIZE
+    with _REST_SESSION_LOCK:
+        if _REST_SESSION is None:
+            _REST_SESSION = Session()
+            _REST_SESSION.headers["Authorization"] = (
+                f"yd-key {CONFIG_COMMON.key}:{CONFIG_COMMON.secret}"
+            )
+        if pool_size > _REST_SESSION_POOL_SIZE:
+            # Passed as a mapping, because urllib3 1.x's class decorator hides
+            # Retry's parameters from type checkers
+            retry_options: dict[str, Any] = {
+                "total": HTTP_MAX_RETRIES,
+                "backoff_factor": HTTP_RETRY_BACKOFF_FACTOR,
+                "status_forcelist": HTTP_RETRY_STATUS_CODES,
+                "respect_retry_after_header": True,
+                "raise_on_status": False,
+            }
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_size,
+                max_retries=Retry(**retry_options),
+            )
+            replaced_adapters = {
+                _REST_SESSION.adapters[prefix] for prefix in ("https://", "http://")
+            }
+            _REST_SESSION.mount("https://", adapter)
+            _REST_SESSION.mount("http://", adapter)
+            _REST_SESSION_POOL_SIZE = pool_size
+            # Release the connection pools of the smaller adapters
+            for replaced_adapter in replaced_adapters:
+                replaced_adapter.close()
+        return _REST_SESSION
+
+
+def close_rest_session():
+    """
+    Close the REST API session, if it was used.
+    """
+    global _REST_SESSION, _REST_SESSION_POOL_SIZE
+    with _REST_SESSION_LOCK:
+        if _REST_SESSION is not None:
+            _REST_SESSION.close()
+        _REST_SESSION = None
+        _REST_SESSION_POOL_SIZE = 0
+
 
 def dry_run() -> bool:
     """
@@ -54,12 +132,23 @@ def set_proxy():
         print_info(f"Using {proxy_var}={https_proxy}")
 
 
+def start_resolution_cache():
+    """
+    Use the persistent name -> ID resolution cache, if enabled.
+    """
+    if CONFIG_COMMON.resolution_cache:
+        open_resolution_cache(
+            CONFIG_COMMON.url, CONFIG_COMMON.key, CONFIG_COMMON.namespace
+        )
+
+
 def main_wrapper(func):
     def wrapper():
         if not ARGS_PARSER.debug:
             exit_code = 0
             try:
                 set_proxy()
+                start_resolution_cache()
                 func()
             except Exception as e:
                 if "MissingPermissionException" in str(e):
@@ -82,17 +171,26 @@ def main_wrapper(func):
                 exit_code = 1
             finally:
                 CLIENT.close()
+                close_rest_session()
+                close_resolution_cache()
+                close_rclone_daemon()
+                close_output_file()
                 if exit_code == 0 and not ARGS_PARSER.print_pid:
                     print_info("Done")
                 exit(exit_code)
         else:
             try:
                 set_proxy()
+                start_resolution_cache()
                 func()
                 if not ARGS_PARSER.print_pid:
                     print_info("Done")
                 exit(0)
             finally:
                 CLIENT.close()
+                close_rest_session()
+                close_resolution_cache()
+                close_rclone_daemon()
+                close_output_file()
 
     return wrapper